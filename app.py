@@ -17,15 +17,13 @@ if 'scroll_to_top_tab4' not in st.session_state:
 if 'scroll_to_top_tab5' not in st.session_state:
     st.session_state.scroll_to_top_tab5 = False
 
-# 데이터베이스 자동 초기화 (최초 실행 시)
-if 'db_initialized' not in st.session_state:
-    try:
-        from modules.database import init_database
-        init_database()
-        st.session_state.db_initialized = True
-    except Exception:
-        # 초기화 실패해도 계속 진행 (get_connection에서 재시도)
-        st.session_state.db_initialized = True
+# 데이터베이스 자동 초기화 (서버 프로세스당 한 번)
+try:
+    from modules.cache import ensure_database
+    ensure_database()
+except Exception:
+    # 초기화 실패해도 계속 진행 (get_connection에서 재시도)
+    pass
 
 # 페이지 설정
 st.set_page_config(
@@ -97,6 +95,59 @@ with st.sidebar:
         except Exception as e:
             st.error(f"오류 발생: {e}")
 
+# 백그라운드 수집 작업 (스크립트 실행과 분리, 진행도는 jobs 테이블에서 조회)
+from modules.jobs import ACTIVE_STATUSES, submit_job, get_job, get_active_job, get_latest_job, list_jobs
+from modules.feed_state import get_feed_fetch_stats
+
+
+@st.fragment(run_every=1.0)
+def job_progress_fragment(job_id):
+    """실행 중인 작업의 진행도를 1초마다 갱신 (끝나면 전체 화면을 다시 그려 결과와 목록 갱신)"""
+    job = get_job(job_id)
+    if job is None or job["status"] not in ACTIVE_STATUSES:
+        st.rerun()
+    current, total = job["progress_current"], job["progress_total"]
+    progress = min(current / total, 1.0) if total > 0 else 0
+    if job["status"] == "queued":
+        text = "대기 중..."
+    else:
+        text = f"{job['message'] or '진행 중'} ({current}/{total}) - {int(progress * 100)}%"
+    st.progress(progress, text=f"⏳ {job['label']}: {text}")
+
+
+def start_job(job_type, params=None):
+    """작업 시작 (같은 작업이 이미 진행 중이면 그 작업의 진행 상황을 표시)"""
+    job_id, created = submit_job(job_type, params)
+    if not created:
+        st.info("이미 진행 중인 작업이 있어 해당 작업의 진행 상황을 표시합니다.")
+    st.session_state[f"job_watch_{job_type}"] = job_id
+
+
+def show_job_status(job_type):
+    """진행 중인 작업은 진행도를, 이 세션에서 지켜본 작업이 끝났으면 결과를 표시"""
+    watch_key = f"job_watch_{job_type}"
+    job = get_latest_job(job_type)
+    if job is None:
+        return
+    if job["status"] in ACTIVE_STATUSES:
+        st.session_state[watch_key] = job["id"]
+        job_progress_fragment(job["id"])
+    elif st.session_state.get(watch_key) == job["id"]:
+        del st.session_state[watch_key]
+        if job["status"] == "done":
+            result = job["result"] or {}
+            collected, saved = result.get("collected", 0), result.get("saved", 0)
+            if collected > 0 or job_type != "papers":
+                st.success(f"✅ {job['label']} 완료: {collected}개 수집, {saved}개 저장")
+            else:
+                st.warning("⚠️ 수집된 논문이 없습니다. 키워드를 확인해주세요.")
+        else:
+            error = job["error"] or ""
+            st.error(f"❌ 오류 발생: {error.splitlines()[0] if error else '알 수 없는 오류'}")
+            if error:
+                st.code(error)
+
+
 # 메인 콘텐츠 영역
 # 0. 통합 대시보드
 if selected_menu == "🏠 대시보드":
@@ -105,53 +156,36 @@ if selected_menu == "🏠 대시보드":
     
     try:
         from modules.database import get_connection, init_database
+        from modules.cache import get_dashboard_snapshot
         from datetime import datetime, timedelta
-        import json
-        from collections import Counter
         import pandas as pd
         
         # 데이터베이스 초기화 확인 (최초 실행 시)
         try:
-            conn = get_connection()
-            conn.close()
+            get_connection()
         except:
             # 초기화 실패 시 명시적으로 초기화
             init_database()
         
-        conn = get_connection()
-        cursor = conn.cursor()
+        end_date = datetime.now().strftime("%Y-%m-%d")
+        start_date = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
+        
+        # 대시보드 조회 결과 (뉴스/논문이 저장되거나 삭제될 때만 다시 조회)
+        snapshot = get_dashboard_snapshot(end_date, start_date)
+        today_news = snapshot["today_news"]
+        today_papers = snapshot["today_papers"]
         
         # 오늘의 주요 이슈 (뉴스 + 논문 통합)
         st.subheader("🔥 오늘의 주요 이슈")
         
-        end_date = datetime.now().strftime("%Y-%m-%d")
-        
-        # 오늘 수집된 뉴스
-        cursor.execute("""
-            SELECT title, url, date, keywords FROM articles
-            WHERE date = ?
-            ORDER BY created_at DESC
-            LIMIT 10
-        """, (end_date,))
-        today_news = cursor.fetchall()
-        
-        # 오늘 수집된 논문
-        cursor.execute("""
-            SELECT title, url, date, keywords FROM papers
-            WHERE date = ?
-            ORDER BY created_at DESC
-            LIMIT 10
-        """, (end_date,))
-        today_papers = cursor.fetchall()
-        
         if today_news or today_papers:
             col1, col2 = st.columns(2)
-            
+        
             with col1:
                 st.markdown("**📰 오늘의 뉴스**")
                 for title, url, date, _ in today_news[:5]:
                     st.markdown(f"- [{title[:50]}{'...' if len(title) > 50 else ''}]({url})")
-            
+        
             with col2:
                 st.markdown("**📚 오늘의 논문**")
                 for title, url, date, _ in today_papers[:5]:
@@ -164,24 +198,8 @@ if selected_menu == "🏠 대시보드":
         # 최근 7일 트렌드
         st.subheader("📈 최근 7일 트렌드")
         
-        start_date = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
-        
-        # 날짜별 뉴스/논문 개수
-        cursor.execute("""
-            SELECT date, COUNT(*) FROM articles
-            WHERE date >= ?
-            GROUP BY date
-            ORDER BY date
-        """, (start_date,))
-        news_trend = {date: count for date, count in cursor.fetchall()}
-        
-        cursor.execute("""
-            SELECT date, COUNT(*) FROM papers
-            WHERE date >= ?
-            GROUP BY date
-            ORDER BY date
-        """, (start_date,))
-        paper_trend = {date: count for date, count in cursor.fetchall()}
+        news_trend = snapshot["news_trend"]
+        paper_trend = snapshot["paper_trend"]
         
         # 트렌드 데이터프레임 생성
         trend_dates = []
@@ -208,35 +226,8 @@ if selected_menu == "🏠 대시보드":
         # 키워드 클라우드 (상위 키워드)
         st.subheader("🏷️ 주요 키워드")
         
-        # 뉴스 키워드
-        cursor.execute("""
-            SELECT keywords FROM articles
-            WHERE date >= ? AND keywords IS NOT NULL
-        """, (start_date,))
-        
-        all_keywords = []
-        for row in cursor.fetchall():
-            try:
-                keywords = json.loads(row[0]) if row[0] else []
-                all_keywords.extend(keywords)
-            except:
-                pass
-        
-        # 논문 키워드
-        cursor.execute("""
-            SELECT keywords FROM papers
-            WHERE date >= ? AND keywords IS NOT NULL
-        """, (start_date,))
-        
-        for row in cursor.fetchall():
-            try:
-                keywords = json.loads(row[0]) if row[0] else []
-                all_keywords.extend(keywords)
-            except:
-                pass
-        
-        keyword_counter = Counter(all_keywords)
-        top_keywords = keyword_counter.most_common(10)
+        # 뉴스 + 논문 키워드 빈도 상위 10개
+        top_keywords = snapshot["top_keywords"]
         
         if top_keywords:
             keyword_tags = " ".join([f"`{kw} ({count})`" for kw, count in top_keywords])
@@ -244,8 +235,6 @@ if selected_menu == "🏠 대시보드":
         else:
             st.info("📭 키워드 데이터가 없습니다.")
         
-        conn.close()
-        
     except Exception as e:
         st.error(f"❌ 대시보드 로드 실패: {e}")
         import traceback
@@ -255,171 +244,121 @@ if selected_menu == "🏠 대시보드":
 elif selected_menu == "📰 트랜드 레이더":
     st.header("📰 트랜드 레이더")
     
-    # 뉴스 수집 버튼
+    # 뉴스 수집 버튼 (수집은 백그라운드 작업으로 실행)
+    active_news_job = get_active_job("news")
     col1, col2 = st.columns([3, 1])
     with col1:
         st.markdown("미국과 한국의 심리 관련 뉴스를 수집하고 AI로 분석합니다.")
     with col2:
         col_btn1, col_btn2 = st.columns([1, 1])
         with col_btn1:
-            if st.button("🔄 뉴스 수집 (20건)", type="primary", key="news_collect_20"):
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-                try:
-                    from modules.news_collector import collect_and_analyze_news
-                    
-                    def update_progress(current, total, message):
-                        progress = current / total if total > 0 else 0
-                        progress_bar.progress(progress)
-                        status_text.text(f"{message} ({current}/{total}) - {int(progress * 100)}%")
-                    
-                    # 한국 뉴스 키워드 (개선: 인지행동치료, 정신분석, 집단상담 추가)
-                    kr_keywords = ["정신건강", "심리건강", "마음건강", "심리상담", "심리학이론", "심리학", "정신건강증진", 
-                                   "우울증", "불안장애", "트라우마", "상담심리", "임상심리", "인지행동치료", "정신분석", "집단상담"]
-                    # 미국 뉴스 키워드 (명시적 영어 키워드)
-                    us_keywords = ["mental health", "psychology", "counseling psychology", "clinical psychology", 
-                                   "depression", "anxiety", "trauma", "psychotherapy", "cognitive behavioral therapy", 
-                                   "psychoanalysis", "group therapy", "mental wellness"]
-                    
-                    collected, saved = collect_and_analyze_news(
-                        keywords=kr_keywords + us_keywords,
-                        countries=["KR", "US"],
-                        max_per_keyword=20,
-                        progress_callback=update_progress
-                    )
-                    progress_bar.progress(1.0)
-                    status_text.text(f"✅ 수집 완료: {collected}개 수집, {saved}개 저장")
-                    st.success(f"✅ 수집 완료: {collected}개 수집, {saved}개 저장")
-                except Exception as e:
-                    st.error(f"❌ 오류 발생: {e}")
-                    import traceback
-                    st.code(traceback.format_exc())
+            if st.button("🔄 뉴스 수집 (20건)", type="primary", key="news_collect_20", disabled=active_news_job is not None):
+                # 한국 뉴스 키워드 (개선: 인지행동치료, 정신분석, 집단상담 추가)
+                kr_keywords = ["정신건강", "심리건강", "마음건강", "심리상담", "심리학이론", "심리학", "정신건강증진", 
+                               "우울증", "불안장애", "트라우마", "상담심리", "임상심리", "인지행동치료", "정신분석", "집단상담"]
+                # 미국 뉴스 키워드 (명시적 영어 키워드)
+                us_keywords = ["mental health", "psychology", "counseling psychology", "clinical psychology", 
+                               "depression", "anxiety", "trauma", "psychotherapy", "cognitive behavioral therapy", 
+                               "psychoanalysis", "group therapy", "mental wellness"]
+                
+                start_job("news", {
+                    "keywords": kr_keywords + us_keywords,
+                    "countries": ["KR", "US"],
+                    "max_per_keyword": 20,
+                })
         
         with col_btn2:
-            if st.button("➕ 추가 수집 (10건)", type="secondary", key="news_add_10"):
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-                try:
-                    from modules.news_collector import collect_and_analyze_news
-                    
-                    def update_progress(current, total, message):
-                        progress = current / total if total > 0 else 0
-                        progress_bar.progress(progress)
-                        status_text.text(f"{message} ({current}/{total}) - {int(progress * 100)}%")
-                    
-                    # 한국 뉴스 키워드 (개선: 인지행동치료, 정신분석, 집단상담 추가)
-                    kr_keywords = ["정신건강", "심리건강", "마음건강", "심리상담", "심리학이론", "심리학", "정신건강증진", 
-                                   "우울증", "불안장애", "트라우마", "상담심리", "임상심리", "인지행동치료", "정신분석", "집단상담"]
-                    # 미국 뉴스 키워드 (명시적 영어 키워드)
-                    us_keywords = ["mental health", "psychology", "counseling psychology", "clinical psychology", 
-                                   "depression", "anxiety", "trauma", "psychotherapy", "cognitive behavioral therapy", 
-                                   "psychoanalysis", "group therapy", "mental wellness"]
-                    
-                    collected, saved = collect_and_analyze_news(
-                        keywords=kr_keywords + us_keywords,
-                        countries=["KR", "US"],
-                        max_per_keyword=10,
-                        progress_callback=update_progress
-                    )
-                    progress_bar.progress(1.0)
-                    status_text.text(f"✅ 추가 수집 완료: {collected}개 수집, {saved}개 저장")
-                    st.success(f"✅ 추가 수집 완료: {collected}개 수집, {saved}개 저장")
-                except Exception as e:
-                    st.error(f"❌ 오류 발생: {e}")
-                    import traceback
-                    st.code(traceback.format_exc())
+            if st.button("➕ 추가 수집 (10건)", type="secondary", key="news_add_10", disabled=active_news_job is not None):
+                # 한국 뉴스 키워드 (개선: 인지행동치료, 정신분석, 집단상담 추가)
+                kr_keywords = ["정신건강", "심리건강", "마음건강", "심리상담", "심리학이론", "심리학", "정신건강증진", 
+                               "우울증", "불안장애", "트라우마", "상담심리", "임상심리", "인지행동치료", "정신분석", "집단상담"]
+                # 미국 뉴스 키워드 (명시적 영어 키워드)
+                us_keywords = ["mental health", "psychology", "counseling psychology", "clinical psychology", 
+                               "depression", "anxiety", "trauma", "psychotherapy", "cognitive behavioral therapy", 
+                               "psychoanalysis", "group therapy", "mental wellness"]
+                
+                start_job("news", {
+                    "keywords": kr_keywords + us_keywords,
+                    "countries": ["KR", "US"],
+                    "max_per_keyword": 10,
+                })
+    
+    show_job_status("news")
     
     # 뉴스 목록 표시
     st.divider()
     
     try:
-        from modules.database import get_connection
+        from modules.database import db_connection
+        from modules.search import build_search_clause, fetch_snippets
+        from modules.keywords import build_keyword_filter
+        from modules.queries import archive_order_by, build_archive_query
+        from modules.cache import get_cached_keyword_options
         import json
         
-        conn = get_connection()
-        cursor = conn.cursor()
+        with db_connection() as conn:
+            cursor = conn.cursor()
         
-        # 검색 및 필터 기능
-        col1, col2, col3 = st.columns([2, 1, 1])
+            # 검색 및 필터 기능
+            col1, col2, col3 = st.columns([2, 1, 1])
         
-        with col1:
-            search_query = st.text_input("🔍 검색", placeholder="제목, 요약, 키워드로 검색...", key="news_search")
+            with col1:
+                search_query = st.text_input("🔍 검색", placeholder="제목, 요약, 본문, 키워드로 검색...", key="news_search")
         
-        with col2:
-            sort_option = st.selectbox("정렬", ["최신순", "오래된순", "평점 높은순", "평점 낮은순"], key="news_sort")
+            with col2:
+                sort_options = ["최신순", "오래된순", "평점 높은순", "평점 낮은순"]
+                if search_query:
+                    sort_options.insert(0, "관련도순")
+                sort_option = st.selectbox("정렬", sort_options, key="news_sort")
         
-        with col3:
-            country_filter = st.selectbox("국가", ["전체", "한국", "미국"], key="news_country")
+            with col3:
+                country_filter = st.selectbox("국가", ["전체", "한국", "미국"], key="news_country")
         
-        # 키워드 필터 (해시태그)
-        cursor.execute("SELECT DISTINCT keywords FROM articles WHERE keywords IS NOT NULL AND keywords != ''")
-        all_keywords = set()
-        for row in cursor.fetchall():
-            try:
-                keywords = json.loads(row[0]) if row[0] else []
-                all_keywords.update(keywords)
-            except:
-                pass
+            # 키워드 필터 (해시태그)
+            all_keywords = get_cached_keyword_options("articles")
         
-        if all_keywords:
-            selected_keywords = st.multiselect("🏷️ 키워드 필터", sorted(all_keywords), key="news_keywords")
-        else:
-            selected_keywords = []
-        
-        # SQL 쿼리 구성
-        where_conditions = []
-        params = []
-        
-        # 검색 조건
-        if search_query:
-            where_conditions.append("(title LIKE ? OR content_summary LIKE ? OR keywords LIKE ?)")
-            search_param = f"%{search_query}%"
-            params.extend([search_param, search_param, search_param])
-        
-        # 국가 필터
-        if country_filter != "전체":
-            where_conditions.append("country = ?")
-            params.append("KR" if country_filter == "한국" else "US")
-        
-        # 키워드 필터
-        if selected_keywords:
-            keyword_conditions = []
-            for keyword in selected_keywords:
-                keyword_conditions.append("keywords LIKE ?")
-                params.append(f'%"{keyword}"%')
-            where_conditions.append(f"({' OR '.join(keyword_conditions)})")
-        
-        where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
-        
-        # 정렬
-        if sort_option == "최신순":
-            order_by = "created_at DESC"
-        elif sort_option == "오래된순":
-            order_by = "created_at ASC"
-        elif sort_option == "평점 높은순":
-            order_by = "validity_score DESC, created_at DESC"
-        else:  # 평점 낮은순
-            order_by = "validity_score ASC, created_at DESC"
-        
-        # 페이지네이션
-        page_size = 20
-        page = st.number_input("페이지", min_value=1, value=1, step=1, key="news_page")
-        offset = (page - 1) * page_size
-        
-        # 뉴스 조회
-        query = f"""
-            SELECT id, date, title, url, content_summary, keywords, validity_score, country
-            FROM articles
-            WHERE {where_clause}
-            ORDER BY {order_by}
-            LIMIT ? OFFSET ?
-        """
-        params.extend([page_size, offset])
-        
-        cursor.execute(query, params)
-        
-        articles = cursor.fetchall()
-        conn.close()
+            if all_keywords:
+                selected_keywords = st.multiselect("🏷️ 키워드 필터", all_keywords, key="news_keywords")
+            else:
+                selected_keywords = []
+        
+            # SQL 쿼리 구성
+            where_conditions = []
+            params = []
+        
+            # 검색 조건 (FTS 인덱스 조인, 2글자 검색어는 단어 색인, FTS가 없으면 LIKE)
+            search = build_search_clause(conn, "articles", search_query) if search_query else None
+            if search and search["where"]:
+                where_conditions.append(search["where"])
+                params.extend(search["where_params"])
+        
+            # 국가 필터
+            if country_filter != "전체":
+                where_conditions.append("country = ?")
+                params.append("KR" if country_filter == "한국" else "US")
+        
+            # 키워드 필터
+            if selected_keywords:
+                keyword_condition, keyword_params = build_keyword_filter("articles", selected_keywords)
+                where_conditions.append(keyword_condition)
+                params.extend(keyword_params)
+        
+            # 정렬
+            order_by = archive_order_by("articles", sort_option, search)
+        
+            # 페이지네이션
+            page_size = 20
+            page = st.number_input("페이지", min_value=1, value=1, step=1, key="news_page")
+            offset = (page - 1) * page_size
+        
+            # 뉴스 조회
+            query = build_archive_query("articles", where_conditions, order_by, search["join"] if search else "")
+            params = (search["join_params"] if search else []) + params + [page_size, offset]
+        
+            cursor.execute(query, params)
+        
+            articles = cursor.fetchall()
+            snippets = fetch_snippets(conn, "articles", search_query, [row[0] for row in articles]) if search_query else {}
         
         if articles:
             st.markdown(f"<h4 style='font-size: 16px; margin-bottom: 10px;'>📄 뉴스 목록 (총 {len(articles)}개 표시)</h4>", unsafe_allow_html=True)
@@ -441,6 +380,9 @@ elif selected_menu == "📰 트랜드 레이더":
                         st.markdown(f"<h5 style='font-size: 14px; font-weight: bold; margin-bottom: 5px;'>{title}</h5>", unsafe_allow_html=True)
                         st.markdown(f"<p style='font-size: 11px; color: #666; margin-bottom: 5px;'>📅 {date} | 🌍 {country} | ⭐ {score}/5</p>", unsafe_allow_html=True)
                         
+                        if article_id in snippets:
+                            st.markdown(f"<p style='font-size: 12px; margin-bottom: 5px;'>🔎 {snippets[article_id]}</p>", unsafe_allow_html=True)
+                        
                         if summary:
                             st.markdown(f"<p style='font-size: 12px; margin-bottom: 5px;'><strong>요약:</strong> {summary[:150]}{'...' if len(summary) > 150 else ''}</p>", unsafe_allow_html=True)
                         
@@ -485,87 +427,47 @@ elif selected_menu == "📰 트랜드 레이더":
 elif selected_menu == "📚 아카이브":
     st.header("📚 아카데믹 아카이브")
     
+    # 논문 수집 버튼 (수집은 백그라운드 작업으로 실행)
+    active_paper_job = get_active_job("papers")
     col1, col2 = st.columns([3, 1])
     with col1:
         st.markdown("심리학 관련 논문을 수집하고 AI로 요약합니다.")
     with col2:
         col_btn1, col_btn2 = st.columns([1, 1])
         with col_btn1:
-            if st.button("🔄 논문 수집 (10건)", type="primary", key="paper_collect_10"):
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-                try:
-                    from modules.paper_collector import collect_and_analyze_papers
-                    
-                    def update_progress(current, total, message):
-                        progress = current / total if total > 0 else 0
-                        progress_bar.progress(progress)
-                        status_text.text(f"{message} ({current}/{total}) - {int(progress * 100)}%")
-                    
-                    # 논문 키워드 (개선: 하위 분야 추가, 한국어 키워드 추가)
-                    paper_keywords = ["psychology", "counseling psychology", "clinical psychology", "mental health",
-                                     "cognitive psychology", "developmental psychology", "social psychology",
-                                     "심리학", "상담심리", "인지행동", "정신건강"]
-                    
-                    collected, saved = collect_and_analyze_papers(
-                        keywords=paper_keywords,
-                        sources=["arxiv"],
-                        max_per_keyword=10,
-                        progress_callback=update_progress
-                    )
-                    progress_bar.progress(1.0)
-                    if collected > 0:
-                        status_text.text(f"✅ 수집 완료: {collected}개 수집, {saved}개 저장")
-                        st.success(f"✅ 수집 완료: {collected}개 수집, {saved}개 저장")
-                    else:
-                        status_text.text("⚠️ 수집된 논문이 없습니다.")
-                        st.warning("⚠️ 수집된 논문이 없습니다. 키워드를 확인해주세요.")
-                except Exception as e:
-                    st.error(f"❌ 오류 발생: {e}")
-                    import traceback
-                    st.code(traceback.format_exc())
+            if st.button("🔄 논문 수집 (10건)", type="primary", key="paper_collect_10", disabled=active_paper_job is not None):
+                # 논문 키워드 (개선: 하위 분야 추가, 한국어 키워드 추가)
+                paper_keywords = ["psychology", "counseling psychology", "clinical psychology", "mental health",
+                                 "cognitive psychology", "developmental psychology", "social psychology",
+                                 "심리학", "상담심리", "인지행동", "정신건강"]
+                
+                start_job("papers", {
+                    "keywords": paper_keywords,
+                    "sources": ["arxiv"],
+                    "max_per_keyword": 10,
+                })
         
         with col_btn2:
-            if st.button("➕ 추가 수집 (10건)", type="secondary", key="paper_add_10"):
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-                try:
-                    from modules.paper_collector import collect_and_analyze_papers
-                    
-                    def update_progress(current, total, message):
-                        progress = current / total if total > 0 else 0
-                        progress_bar.progress(progress)
-                        status_text.text(f"{message} ({current}/{total}) - {int(progress * 100)}%")
-                    
-                    # 논문 키워드 (개선: 하위 분야 추가, 한국어 키워드 추가)
-                    paper_keywords = ["psychology", "counseling psychology", "clinical psychology", "mental health",
-                                     "cognitive psychology", "developmental psychology", "social psychology",
-                                     "심리학", "상담심리", "인지행동", "정신건강"]
-                    
-                    collected, saved = collect_and_analyze_papers(
-                        keywords=paper_keywords,
-                        sources=["arxiv"],
-                        max_per_keyword=10,
-                        progress_callback=update_progress
-                    )
-                    progress_bar.progress(1.0)
-                    if collected > 0:
-                        status_text.text(f"✅ 추가 수집 완료: {collected}개 수집, {saved}개 저장")
-                        st.success(f"✅ 추가 수집 완료: {collected}개 수집, {saved}개 저장")
-                    else:
-                        status_text.text("⚠️ 수집된 논문이 없습니다.")
-                        st.warning("⚠️ 수집된 논문이 없습니다.")
-                except Exception as e:
-                    st.error(f"❌ 오류 발생: {e}")
-                    import traceback
-                    st.code(traceback.format_exc())
+            if st.button("➕ 추가 수집 (10건)", type="secondary", key="paper_add_10", disabled=active_paper_job is not None):
+                # 논문 키워드 (개선: 하위 분야 추가, 한국어 키워드 추가)
+                paper_keywords = ["psychology", "counseling psychology", "clinical psychology", "mental health",
+                                 "cognitive psychology", "developmental psychology", "social psychology",
+                                 "심리학", "상담심리", "인지행동", "정신건강"]
+                
+                start_job("papers", {
+                    "keywords": paper_keywords,
+                    "sources": ["arxiv"],
+                    "max_per_keyword": 10,
+                })
+    
+    show_job_status("papers")
     
     # 연구 동향 분석
     st.divider()
     st.subheader("📊 연구 동향 분석")
     
     try:
-        from modules.dashboard_utils import get_paper_trend_data
+        from modules.cache import get_paper_trend_data
         import pandas as pd
         
         # 키워드별 트렌드 그래프
@@ -591,78 +493,68 @@ elif selected_menu == "📚 아카이브":
     st.divider()
     
     try:
-        from modules.database import get_connection
+        from modules.database import db_connection
+        from modules.search import build_search_clause, fetch_snippets
+        from modules.keywords import build_keyword_filter
+        from modules.queries import archive_order_by, build_archive_query
+        from modules.cache import get_cached_keyword_options
         import json
         
-        conn = get_connection()
-        cursor = conn.cursor()
+        with db_connection() as conn:
+            cursor = conn.cursor()
         
-        # 검색 및 필터 기능
-        col1, col2 = st.columns([2, 1])
+            # 검색 및 필터 기능
+            col1, col2 = st.columns([2, 1])
         
-        with col1:
-            search_query = st.text_input("🔍 검색", placeholder="제목, 저자, 키워드로 검색...", key="paper_search")
+            with col1:
+                search_query = st.text_input("🔍 검색", placeholder="제목, 저자, 초록, 키워드로 검색...", key="paper_search")
         
-        with col2:
-            sort_option = st.selectbox("정렬", ["최신순", "오래된순"], key="paper_sort")
+            with col2:
+                sort_options = ["최신순", "오래된순"]
+                if search_query:
+                    sort_options.insert(0, "관련도순")
+                sort_option = st.selectbox("정렬", sort_options, key="paper_sort")
         
-        # 키워드 필터
-        cursor.execute("SELECT DISTINCT keywords FROM papers WHERE keywords IS NOT NULL AND keywords != ''")
-        all_keywords = set()
-        for row in cursor.fetchall():
-            try:
-                keywords = json.loads(row[0]) if row[0] else []
-                all_keywords.update(keywords)
-            except:
-                pass
+            # 키워드 필터
+            all_keywords = get_cached_keyword_options("papers")
         
-        if all_keywords:
-            selected_keywords = st.multiselect("🏷️ 키워드 필터", sorted(all_keywords), key="paper_keywords")
-        else:
-            selected_keywords = []
-        
-        # SQL 쿼리 구성
-        where_conditions = []
-        params = []
-        
-        # 검색 조건
-        if search_query:
-            where_conditions.append("(title LIKE ? OR authors LIKE ? OR keywords LIKE ?)")
-            search_param = f"%{search_query}%"
-            params.extend([search_param, search_param, search_param])
-        
-        # 키워드 필터
-        if selected_keywords:
-            keyword_conditions = []
-            for keyword in selected_keywords:
-                keyword_conditions.append("keywords LIKE ?")
-                params.append(f'%"{keyword}"%')
-            where_conditions.append(f"({' OR '.join(keyword_conditions)})")
-        
-        where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
-        
-        # 정렬
-        order_by = "created_at DESC" if sort_option == "최신순" else "created_at ASC"
-        
-        # 페이지네이션
-        page_size = 20
-        page = st.number_input("페이지", min_value=1, value=1, step=1, key="paper_page")
-        offset = (page - 1) * page_size
-        
-        # 논문 조회
-        query = f"""
-            SELECT id, date, title, authors, journal, url, abstract, summary, keywords, category
-            FROM papers
-            WHERE {where_clause}
-            ORDER BY {order_by}
-            LIMIT ? OFFSET ?
-        """
-        params.extend([page_size, offset])
-        
-        cursor.execute(query, params)
-        
-        papers = cursor.fetchall()
-        conn.close()
+            if all_keywords:
+                selected_keywords = st.multiselect("🏷️ 키워드 필터", all_keywords, key="paper_keywords")
+            else:
+                selected_keywords = []
+        
+            # SQL 쿼리 구성
+            where_conditions = []
+            params = []
+        
+            # 검색 조건 (FTS 인덱스 조인, 2글자 검색어는 단어 색인, FTS가 없으면 LIKE)
+            search = build_search_clause(conn, "papers", search_query) if search_query else None
+            if search and search["where"]:
+                where_conditions.append(search["where"])
+                params.extend(search["where_params"])
+        
+            # 키워드 필터
+            if selected_keywords:
+                keyword_condition, keyword_params = build_keyword_filter("papers", selected_keywords)
+                where_conditions.append(keyword_condition)
+                params.extend(keyword_params)
+        
+            # 정렬
+            order_by = archive_order_by("papers", sort_option, search)
+        
+            # 페이지네이션
+            page_size = 20
+            page = st.number_input("페이지", min_value=1, value=1, step=1, key="paper_page")
+            offset = (page - 1) * page_size
+        
+            # 논문 조회
+            query = build_archive_query("papers", where_conditions, order_by, search["join"] if search else "")
+            params = (search["join_params"] if search else []) + params + [page_size, offset]
+        
+            cursor.execute(query, params)
+        
+            papers = cursor.fetchall()
+            snippets = fetch_snippets(conn, "papers", search_query, [row[0] for row in papers]) if search_query else {}
         
         if papers:
             st.markdown(f"<h4 style='font-size: 16px; margin-bottom: 10px;'>📄 논문 목록 (총 {len(papers)}개 표시)</h4>", unsafe_allow_html=True)
@@ -686,6 +578,9 @@ elif selected_menu == "📚 아카이브":
                     # 메타 정보
                     st.markdown(f"<p style='font-size: 11px; color: #666; margin-bottom: 5px;'>📅 {date} | 📖 {journal} | 🏷️ {category}</p>", unsafe_allow_html=True)
                     
+                    if paper_id in snippets:
+                        st.markdown(f"<p style='font-size: 12px; margin-bottom: 5px;'>🔎 {snippets[paper_id]}</p>", unsafe_allow_html=True)
+                    
                     # 핵심 키워드 해시태그로 표시
                     if keywords:
                         keyword_tags_html = " ".join([f"<span style='background-color: #e0e0e0; padding: 2px 8px; border-radius: 12px; font-size: 10px; margin-right: 5px; display: inline-block;'>#{k}</span>" for k in keywords[:5]])
@@ -765,14 +660,9 @@ elif selected_menu == "✨ 팩토리":
     with col1:
         st.subheader("📰 뉴스 선택")
         try:
-            from modules.database import get_connection
-            import json
+            from modules.cache import get_recent_items
             
-            conn = get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT id, title, content_summary FROM articles ORDER BY created_at DESC LIMIT 20")
-            news_items = cursor.fetchall()
-            conn.close()
+            news_items = get_recent_items("articles", 20)
             
             selected_news = []
             for item in news_items:
@@ -785,11 +675,7 @@ elif selected_menu == "✨ 팩토리":
     with col2:
         st.subheader("📚 논문 선택")
         try:
-            conn = get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT id, title, abstract FROM papers ORDER BY created_at DESC LIMIT 20")
-            paper_items = cursor.fetchall()
-            conn.close()
+            paper_items = get_recent_items("papers", 20)
             
             selected_papers = []
             for item in paper_items:
@@ -816,7 +702,7 @@ elif selected_menu == "✨ 팩토리":
             st.warning("콘텐츠를 선택해주세요.")
         else:
             try:
-                from modules.ai_engine import get_model
+                from modules.ai_engine import get_model, generate_text
                 
                 # 진행도 표시
                 progress_bar = st.progress(0)
@@ -887,23 +773,23 @@ elif selected_menu == "✨ 팩토리":
                 status_text.text("AI 모델 초기화 중... (30%)")
                 progress_bar.progress(0.3)
                 
-                # 모델 자동 선택 (404 에러 방지)
-                model = get_model()  # 사용 가능한 모델 자동 선택
+                # 모델 자동 선택 (프로세스 단위 캐시, 404 시 자동 재해석)
+                get_model()
                 
                 status_text.text("콘텐츠 생성 중... (60%)")
                 progress_bar.progress(0.6)
                 
                 prompt = prompts.get(template, prompts["블로그 포스트"])
-                response = model.generate_content(
+                generated_content = generate_text(
                     prompt,
-                    generation_config={"temperature": 0.7, "max_output_tokens": 2000}
-                )
+                    generation_config={"temperature": 0.7, "max_output_tokens": 2000},
+                    task="factory",
+                    use_cache=False  # 버튼을 누를 때마다 새로운 콘텐츠 생성
+                ).strip()
                 
                 status_text.text("콘텐츠 생성 완료... (90%)")
                 progress_bar.progress(0.9)
                 
-                generated_content = response.text.strip()
-                
                 progress_bar.progress(1.0)
                 status_text.text("완료! (100%)")
                 
@@ -920,19 +806,17 @@ elif selected_menu == "✨ 팩토리":
                     with col_save2:
                         if st.button("💾 저장", key="save_content_btn"):
                             try:
-                                from modules.database import get_connection
+                                from modules.database import db_connection
                                 import json
                                 
                                 source_ids = json.dumps([n["id"] for n in selected_news] + [p["id"] for p in selected_papers])
                                 
-                                conn = get_connection()
-                                cursor = conn.cursor()
-                                cursor.execute("""
-                                    INSERT INTO generated_content (content_type, title, content, source_ids)
-                                    VALUES (?, ?, ?, ?)
-                                """, (template, content_title, generated_content, source_ids))
-                                conn.commit()
-                                conn.close()
+                                with db_connection() as conn:
+                                    cursor = conn.cursor()
+                                    cursor.execute("""
+                                        INSERT INTO generated_content (content_type, title, content, source_ids)
+                                        VALUES (?, ?, ?, ?)
+                                    """, (template, content_title, generated_content, source_ids))
                                 
                                 st.success("✅ 콘텐츠가 저장되었습니다!")
                             except Exception as e:
@@ -975,19 +859,11 @@ elif selected_menu == "💾 내 콘텐츠":
     with tab1:
         st.subheader("생성된 콘텐츠")
         try:
-            from modules.database import get_connection
+            from modules.database import db_connection
+            from modules.cache import get_generated_contents
             from datetime import datetime
             
-            conn = get_connection()
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, content_type, title, content, created_at
-                FROM generated_content
-                ORDER BY created_at DESC
-            """)
-            
-            contents = cursor.fetchall()
-            conn.close()
+            contents = get_generated_contents()
             
             if contents:
                 for content_id, content_type, title, content, created_at in contents:
@@ -1007,11 +883,9 @@ elif selected_menu == "💾 내 콘텐츠":
                         with col2:
                             if st.button("🗑️ 삭제", key=f"delete_{content_id}"):
                                 try:
-                                    conn = get_connection()
-                                    cursor = conn.cursor()
-                                    cursor.execute("DELETE FROM generated_content WHERE id = ?", (content_id,))
-                                    conn.commit()
-                                    conn.close()
+                                    with db_connection() as conn:
+                                        cursor = conn.cursor()
+                                        cursor.execute("DELETE FROM generated_content WHERE id = ?", (content_id,))
                                     st.success("✅ 삭제되었습니다!")
                                     st.rerun()
                                 except Exception as e:
@@ -1035,20 +909,16 @@ elif selected_menu == "🗑️ 수집 내용 관리":
     # 뉴스 삭제 섹션
     st.subheader("📰 뉴스 삭제")
     try:
-        from modules.database import get_connection
+        from modules.database import db_connection
+        from modules.queries import MANAGE_ITEMS
         import json
         
-        conn = get_connection()
-        cursor = conn.cursor()
+        with db_connection() as conn:
+            cursor = conn.cursor()
         
-        # 뉴스 목록 조회
-        cursor.execute("""
-            SELECT id, date, title, url, country, validity_score
-            FROM articles
-            ORDER BY created_at DESC
-        """)
-        news_items = cursor.fetchall()
-        conn.close()
+            # 뉴스 목록 조회
+            cursor.execute(MANAGE_ITEMS["articles"])
+            news_items = cursor.fetchall()
         
         if news_items:
             st.markdown(f"**총 {len(news_items)}개의 뉴스가 있습니다.**")
@@ -1071,12 +941,10 @@ elif selected_menu == "🗑️ 수집 내용 관리":
                 with col1:
                     if st.button("✅ 선택한 뉴스 삭제", type="primary", key="delete_news_btn"):
                         try:
-                            conn = get_connection()
-                            cursor = conn.cursor()
-                            placeholders = ",".join(["?" for _ in selected_news_ids])
-                            cursor.execute(f"DELETE FROM articles WHERE id IN ({placeholders})", selected_news_ids)
-                            conn.commit()
-                            conn.close()
+                            with db_connection() as conn:
+                                cursor = conn.cursor()
+                                placeholders = ",".join(["?" for _ in selected_news_ids])
+                                cursor.execute(f"DELETE FROM articles WHERE id IN ({placeholders})", selected_news_ids)
                             st.success(f"✅ {len(selected_news_ids)}개의 뉴스가 삭제되었습니다.")
                             st.rerun()
                         except Exception as e:
@@ -1095,17 +963,12 @@ elif selected_menu == "🗑️ 수집 내용 관리":
     # 논문 삭제 섹션
     st.subheader("📚 논문 삭제")
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        # 논문 목록 조회
-        cursor.execute("""
-            SELECT id, date, title, journal, category
-            FROM papers
-            ORDER BY created_at DESC
-        """)
-        paper_items = cursor.fetchall()
-        conn.close()
+        with db_connection() as conn:
+            cursor = conn.cursor()
+        
+            # 논문 목록 조회
+            cursor.execute(MANAGE_ITEMS["papers"])
+            paper_items = cursor.fetchall()
         
         if paper_items:
             st.markdown(f"**총 {len(paper_items)}개의 논문이 있습니다.**")
@@ -1128,12 +991,10 @@ elif selected_menu == "🗑️ 수집 내용 관리":
                 with col1:
                     if st.button("✅ 선택한 논문 삭제", type="primary", key="delete_paper_btn"):
                         try:
-                            conn = get_connection()
-                            cursor = conn.cursor()
-                            placeholders = ",".join(["?" for _ in selected_paper_ids])
-                            cursor.execute(f"DELETE FROM papers WHERE id IN ({placeholders})", selected_paper_ids)
-                            conn.commit()
-                            conn.close()
+                            with db_connection() as conn:
+                                cursor = conn.cursor()
+                                placeholders = ",".join(["?" for _ in selected_paper_ids])
+                                cursor.execute(f"DELETE FROM papers WHERE id IN ({placeholders})", selected_paper_ids)
                             st.success(f"✅ {len(selected_paper_ids)}개의 논문이 삭제되었습니다.")
                             st.rerun()
                         except Exception as e:
@@ -1173,11 +1034,9 @@ elif selected_menu == "🗑️ 수집 내용 관리":
     with col1:
         if st.button("🗑️ 모든 뉴스 삭제", type="secondary", key="delete_all_news_btn"):
             try:
-                conn = get_connection()
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM articles")
-                conn.commit()
-                conn.close()
+                with db_connection() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute("DELETE FROM articles")
                 st.success("✅ 모든 뉴스가 삭제되었습니다.")
                 st.rerun()
             except Exception as e:
@@ -1186,11 +1045,9 @@ elif selected_menu == "🗑️ 수집 내용 관리":
     with col2:
         if st.button("🗑️ 모든 논문 삭제", type="secondary", key="delete_all_paper_btn"):
             try:
-                conn = get_connection()
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM papers")
-                conn.commit()
-                conn.close()
+                with db_connection() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute("DELETE FROM papers")
                 st.success("✅ 모든 논문이 삭제되었습니다.")
                 st.rerun()
             except Exception as e:
@@ -1200,46 +1057,34 @@ elif selected_menu == "🗑️ 수집 내용 관리":
 elif selected_menu == "📈 경제 흐름 파악":
     st.header("📈 경제 흐름 파악")
     
+    # 경제 뉴스 수집 버튼 (수집은 백그라운드 작업으로 실행)
+    active_economy_job = get_active_job("economy")
     col1, col2 = st.columns([3, 1])
     with col1:
         st.markdown("거시경제, 산업 분석, 글로벌 시황 정보를 수집하고 분석합니다.")
     with col2:
-        if st.button("🔄 경제 흐름 파악하기", type="primary", key="economy_collect_btn"):
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-                try:
-                    from modules.economy_collector import collect_economy_news
-                    
-                    def update_progress(current, total, message):
-                        progress = current / total if total > 0 else 0
-                        progress_bar.progress(progress)
-                        status_text.text(f"{message} ({current}/{total}) - {int(progress * 100)}%")
-                    
-                    collected, saved = collect_economy_news(progress_callback=update_progress)
-                    progress_bar.progress(0.9)
-                    status_text.text(f"✅ 수집 완료: {collected}개 수집, {saved}개 저장")
-                    
-                    
-                    progress_bar.progress(1.0)
-                except Exception as e:
-                    st.error(f"❌ 오류 발생: {e}")
-                    import traceback
-                    st.code(traceback.format_exc())
-        
+        if st.button("🔄 경제 흐름 파악하기", type="primary", key="economy_collect_btn", disabled=active_economy_job is not None):
+            start_job("economy")
+    
+    show_job_status("economy")
     
     # 경제 흐름 대시보드
     st.divider()
     st.subheader("📊 경제 흐름 대시보드")
     
     try:
-        from modules.dashboard_utils import get_category_summary, get_trend_data, get_top_issues
+        from modules.cache import get_economy_overview, get_top_issues
         import pandas as pd
         
+        # 카테고리별 요약 + 7일 추이 (전체 카테고리를 한 번에 집계)
+        overview = get_economy_overview(["거시경제", "산업분석", "글로벌시황"], days=7)
+        empty_summary = {"count": 0, "keywords": [], "trend": "❌ 오류", "trend_data": []}
+        
         # 카테고리별 요약 카드
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            macro_summary = get_category_summary("거시경제", days=7)
+            macro_summary = overview.get("거시경제", empty_summary)
             st.markdown(f"""
             <div style='padding: 15px; background-color: #f0f7ff; border-radius: 10px; border-left: 4px solid #4CAF50;'>
                 <h4 style='margin: 0 0 10px 0;'>📊 거시경제</h4>
@@ -1250,7 +1095,7 @@ elif selected_menu == "📈 경제 흐름 파악":
             """, unsafe_allow_html=True)
         
         with col2:
-            industry_summary = get_category_summary("산업분석", days=7)
+            industry_summary = overview.get("산업분석", empty_summary)
             st.markdown(f"""
             <div style='padding: 15px; background-color: #fff7f0; border-radius: 10px; border-left: 4px solid #FF9800;'>
                 <h4 style='margin: 0 0 10px 0;'>🏭 산업분석</h4>
@@ -1261,7 +1106,7 @@ elif selected_menu == "📈 경제 흐름 파악":
             """, unsafe_allow_html=True)
         
         with col3:
-            global_summary = get_category_summary("글로벌시황", days=7)
+            global_summary = overview.get("글로벌시황", empty_summary)
             st.markdown(f"""
             <div style='padding: 15px; background-color: #f0fff0; border-radius: 10px; border-left: 4px solid #2196F3;'>
                 <h4 style='margin: 0 0 10px 0;'>🌍 글로벌시황</h4>
@@ -1293,9 +1138,9 @@ elif selected_menu == "📈 경제 흐름 파악":
         # 날짜별 트렌드 그래프
         st.subheader("📈 최근 7일간 트렌드")
         
-        macro_trend = get_trend_data("거시경제", days=7)
-        industry_trend = get_trend_data("산업분석", days=7)
-        global_trend = get_trend_data("글로벌시황", days=7)
+        macro_trend = overview.get("거시경제", empty_summary)["trend_data"]
+        industry_trend = overview.get("산업분석", empty_summary)["trend_data"]
+        global_trend = overview.get("글로벌시황", empty_summary)["trend_data"]
         
         if macro_trend or industry_trend or global_trend:
             trend_df = pd.DataFrame({
@@ -1342,26 +1187,20 @@ elif selected_menu == "📈 경제 흐름 파악":
     """, unsafe_allow_html=True)
     
     try:
-        from modules.database import get_connection
+        from modules.database import db_connection
+        from modules.queries import ECONOMY_PERIOD
         from datetime import datetime, timedelta
         
-        conn = get_connection()
-        cursor = conn.cursor()
+        with db_connection() as conn:
+            cursor = conn.cursor()
         
-        # 최근 7일간의 경제 뉴스 조회
-        end_date = datetime.now().strftime("%Y-%m-%d")
-        start_date = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
+            # 최근 7일간의 경제 뉴스 조회
+            end_date = datetime.now().strftime("%Y-%m-%d")
+            start_date = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
         
-        cursor.execute("""
-            SELECT date, title, category, source, url
-            FROM economy_news
-            WHERE date BETWEEN ? AND ?
-            ORDER BY date DESC, created_at DESC
-            LIMIT 200
-        """, (start_date, end_date))
+            cursor.execute(ECONOMY_PERIOD, (start_date, end_date))
         
-        news_list = cursor.fetchall()
-        conn.close()
+            news_list = cursor.fetchall()
         
         if news_list:
             # 표 데이터 준비
@@ -1407,80 +1246,76 @@ elif selected_menu == "📈 경제 흐름 파악":
     st.divider()
     
     try:
-        from modules.database import get_connection
+        from modules.database import db_connection
+        from modules.search import build_search_clause, fetch_snippets
+        from modules.queries import archive_order_by, build_archive_query, source_filter
+        from modules.cache import get_economy_sources
         import json
         
-        conn = get_connection()
-        cursor = conn.cursor()
+        with db_connection() as conn:
+            cursor = conn.cursor()
         
-        # 검색 및 필터 기능
-        col1, col2, col3 = st.columns([2, 1, 1])
+            # 검색 및 필터 기능
+            col1, col2, col3 = st.columns([2, 1, 1])
         
-        with col1:
-            search_query = st.text_input("🔍 검색", placeholder="제목, 요약, 키워드로 검색...", key="economy_search")
+            with col1:
+                search_query = st.text_input("🔍 검색", placeholder="제목, 요약, 본문, 키워드로 검색...", key="economy_search")
         
-        with col2:
-            sort_option = st.selectbox("정렬", ["최신순", "오래된순"], key="economy_sort")
+            with col2:
+                sort_options = ["최신순", "오래된순"]
+                if search_query:
+                    sort_options.insert(0, "관련도순")
+                sort_option = st.selectbox("정렬", sort_options, key="economy_sort")
         
-        with col3:
-            category_filter = st.selectbox("카테고리", ["전체", "거시경제", "산업분석", "글로벌시황"], key="economy_category")
+            with col3:
+                category_filter = st.selectbox("카테고리", ["전체", "거시경제", "산업분석", "글로벌시황"], key="economy_category")
         
-        # 소스 필터
-        cursor.execute("SELECT DISTINCT source FROM economy_news WHERE source IS NOT NULL")
-        all_sources = [row[0] for row in cursor.fetchall() if row[0]]
+            # 소스 필터
+            all_sources = get_economy_sources()
         
-        if all_sources:
-            selected_sources = st.multiselect("📊 소스 필터", sorted(all_sources), key="economy_sources")
-        else:
-            selected_sources = []
-        
-        # SQL 쿼리 구성
-        where_conditions = []
-        params = []
-        
-        # 검색 조건
-        if search_query:
-            where_conditions.append("(title LIKE ? OR content_summary LIKE ? OR keywords LIKE ?)")
-            search_param = f"%{search_query}%"
-            params.extend([search_param, search_param, search_param])
-        
-        # 카테고리 필터
-        if category_filter != "전체":
-            where_conditions.append("category = ?")
-            params.append(category_filter)
-        
-        # 소스 필터
-        if selected_sources:
-            source_conditions = []
-            for source in selected_sources:
-                source_conditions.append("source = ?")
-                params.append(source)
-            where_conditions.append(f"({' OR '.join(source_conditions)})")
-        
-        where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
-        
-        # 정렬
-        order_by = "created_at DESC" if sort_option == "최신순" else "created_at ASC"
-        
-        # 페이지네이션
-        page_size = 20
-        page = st.number_input("페이지", min_value=1, value=1, step=1, key="economy_page")
-        offset = (page - 1) * page_size
-        
-        # 경제 뉴스 조회
-        query = f"""
-            SELECT id, date, title, url, content_summary, keywords, source, category
-            FROM economy_news
-            WHERE {where_clause}
-            ORDER BY {order_by}
-            LIMIT ? OFFSET ?
-        """
-        params.extend([page_size, offset])
-        
-        cursor.execute(query, params)
-        
-        economy_items = cursor.fetchall()
-        conn.close()
+            if all_sources:
+                selected_sources = st.multiselect("📊 소스 필터", all_sources, key="economy_sources")
+            else:
+                selected_sources = []
+        
+            # SQL 쿼리 구성
+            where_conditions = []
+            params = []
+        
+            # 검색 조건 (FTS 인덱스 조인, 2글자 검색어는 단어 색인, FTS가 없으면 LIKE)
+            search = build_search_clause(conn, "economy_news", search_query) if search_query else None
+            if search and search["where"]:
+                where_conditions.append(search["where"])
+                params.extend(search["where_params"])
+        
+            # 카테고리 필터
+            if category_filter != "전체":
+                where_conditions.append("category = ?")
+                params.append(category_filter)
+        
+            # 소스 필터
+            if selected_sources:
+                source_condition, source_params = source_filter(selected_sources)
+                where_conditions.append(source_condition)
+                params.extend(source_params)
+        
+            # 정렬
+            order_by = archive_order_by("economy_news", sort_option, search)
+        
+            # 페이지네이션
+            page_size = 20
+            page = st.number_input("페이지", min_value=1, value=1, step=1, key="economy_page")
+            offset = (page - 1) * page_size
+        
+            # 경제 뉴스 조회
+            query = build_archive_query("economy_news", where_conditions, order_by,
+                                        search["join"] if search else "")
+            params = (search["join_params"] if search else []) + params + [page_size, offset]
+        
+            cursor.execute(query, params)
+        
+            economy_items = cursor.fetchall()
+            snippets = fetch_snippets(conn, "economy_news", search_query, [row[0] for row in economy_items]) if search_query else {}
         
         if economy_items:
             st.markdown(f"<h4 style='font-size: 16px; margin-bottom: 10px;'>📄 경제 정보 목록 (총 {len(economy_items)}개 표시)</h4>", unsafe_allow_html=True)
@@ -1502,6 +1337,9 @@ elif selected_menu == "📈 경제 흐름 파악":
                         st.markdown(f"<h5 style='font-size: 14px; font-weight: bold; margin-bottom: 5px;'>{title}</h5>", unsafe_allow_html=True)
                         st.markdown(f"<p style='font-size: 11px; color: #666; margin-bottom: 5px;'>📅 {date} | 📊 {source} | 🏷️ {category}</p>", unsafe_allow_html=True)
                         
+                        if item_id in snippets:
+                            st.markdown(f"<p style='font-size: 12px; margin-bottom: 5px;'>🔎 {snippets[item_id]}</p>", unsafe_allow_html=True)
+                        
                         if summary:
                             st.markdown(f"<p style='font-size: 12px; margin-bottom: 5px;'><strong>요약:</strong> {summary[:150]}{'...' if len(summary) > 150 else ''}</p>", unsafe_allow_html=True)
                         
@@ -1562,7 +1400,8 @@ elif selected_menu == "🧪 테스트":
         try:
             from modules.news_collector import collect_and_analyze_news
             from modules.paper_collector import collect_and_analyze_papers
-            from modules.database import get_connection
+            from modules.database import db_connection
+            from modules.queries import LATEST_ARTICLES_BY_COUNTRY, LATEST_ARXIV_PAPERS, LATEST_PAPERS
             
             def update_progress(current, total, message):
                 progress = current / total if total > 0 else 0
@@ -1581,17 +1420,10 @@ elif selected_menu == "🧪 테스트":
             
             # 최근 수집된 한국 뉴스 가져오기
             if saved_kr > 0:
-                conn = get_connection()
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT id, title, date, country, url, content_summary, keywords, validity_score
-                    FROM articles
-                    WHERE country = 'KR'
-                    ORDER BY created_at DESC
-                    LIMIT 1
-                """)
-                test_results["kr_news"] = cursor.fetchall()
-                conn.close()
+                with db_connection() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute(LATEST_ARTICLES_BY_COUNTRY, ("KR",))
+                    test_results["kr_news"] = cursor.fetchall()
             
             # 2. 외국 뉴스 1개 수집
             status_text.text("외국 뉴스 수집 중... (2/4)")
@@ -1605,17 +1437,10 @@ elif selected_menu == "🧪 테스트":
             
             # 최근 수집된 외국 뉴스 가져오기
             if saved_us > 0:
-                conn = get_connection()
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT id, title, date, country, url, content_summary, keywords, validity_score
-                    FROM articles
-                    WHERE country = 'US'
-                    ORDER BY created_at DESC
-                    LIMIT 1
-                """)
-                test_results["us_news"] = cursor.fetchall()
-                conn.close()
+                with db_connection() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute(LATEST_ARTICLES_BY_COUNTRY, ("US",))
+                    test_results["us_news"] = cursor.fetchall()
             
             # 3. 논문 수집
             status_text.text("논문 수집 중... (3/4)")
@@ -1629,29 +1454,16 @@ elif selected_menu == "🧪 테스트":
             
             # 최근 수집된 논문 가져오기
             if saved_papers > 0:
-                conn = get_connection()
-                cursor = conn.cursor()
-                try:
-                    cursor.execute("""
-                        SELECT id, title, date, journal, url, abstract, keywords
-                        FROM papers
-                        WHERE (journal LIKE '%arXiv%' OR journal LIKE '%arxiv%' OR url LIKE '%arxiv%')
-                        ORDER BY created_at DESC
-                        LIMIT 2
-                    """)
-                    test_results["papers"] = cursor.fetchall()
-                except Exception as e:
-                    # 에러 발생 시 더 간단한 쿼리로 재시도
-                    logger.error(f"논문 조회 실패: {e}")
-                    cursor.execute("""
-                        SELECT id, title, date, journal, url, abstract, keywords
-                        FROM papers
-                        ORDER BY created_at DESC
-                        LIMIT 2
-                    """)
-                    test_results["papers"] = cursor.fetchall()
-                finally:
-                    conn.close()
+                with db_connection() as conn:
+                    cursor = conn.cursor()
+                    try:
+                        cursor.execute(LATEST_ARXIV_PAPERS)
+                        test_results["papers"] = cursor.fetchall()
+                    except Exception as e:
+                        # 에러 발생 시 더 간단한 쿼리로 재시도
+                        logger.error(f"논문 조회 실패: {e}")
+                        cursor.execute(LATEST_PAPERS)
+                        test_results["papers"] = cursor.fetchall()
             
             progress_bar.progress(1.0)
             status_text.text("✅ 테스트 수집 완료!")
@@ -1761,6 +1573,48 @@ elif selected_menu == "⚙️ 설정":
     - 📈 **경제 흐름 파악**: 경제 정보 수집 및 분석
     - 🗑️ **수집 내용 관리**: 수집된 뉴스 및 논문 관리
     """)
+    
+    # 최근 백그라운드 수집 작업
+    st.subheader("🕒 최근 수집 작업")
+    recent_jobs = list_jobs(20)
+    if recent_jobs:
+        st.dataframe([
+            {
+                "ID": job["id"],
+                "작업": job["label"],
+                "상태": job["status"],
+                "진행": f"{job['progress_current']}/{job['progress_total']}",
+                "결과": (f"{job['result'].get('collected', 0)}개 수집, {job['result'].get('saved', 0)}개 저장"
+                        if job["result"] and "collected" in job["result"]
+                        else (job["error"] or job["message"] or "").split("\n")[0]),
+                "시작": job["started_at"] or job["created_at"],
+                "종료": job["finished_at"] or "",
+            }
+            for job in recent_jobs
+        ], hide_index=True)
+    else:
+        st.info("📭 실행된 작업이 없습니다.")
+    
+    # 피드 조건부 요청 통계 (ETag/Last-Modified로 304를 받아 아낀 전송량)
+    with st.expander("📡 피드 요청 통계"):
+        feed_stats = get_feed_fetch_stats()
+        if feed_stats:
+            total_saved = sum(row["bytes_saved"] for row in feed_stats)
+            total_downloaded = sum(row["bytes_downloaded"] for row in feed_stats)
+            st.caption(f"받은 데이터 {total_downloaded / 1024:,.0f}KB, 304 응답으로 아낀 데이터 {total_saved / 1024:,.0f}KB")
+            st.dataframe([
+                {
+                    "피드": row["url"],
+                    "요청": row["fetches"],
+                    "변경 없음(304)": row["not_modified"],
+                    "받은 KB": round(row["bytes_downloaded"] / 1024, 1),
+                    "아낀 KB": round(row["bytes_saved"] / 1024, 1),
+                    "마지막 요청": row["updated_at"],
+                }
+                for row in feed_stats
+            ], hide_index=True)
+        else:
+            st.info("아직 조건부 요청 기록이 없습니다.")
 
 # 8. 초기화
 elif selected_menu == "🗄️ 초기화":
@@ -1,6 +1,6 @@
 """
 논문 수집 스크립트 (독립 실행)
-Windows 작업 스케줄러에서 실행하거나 수동으로 실행 가능
+수동 1회 실행용 (주기 실행은 python -m modules.scheduler 데몬 사용)
 """
 
 import sys
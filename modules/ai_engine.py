@@ -5,11 +5,15 @@ Google Gemini API를 사용하여 텍스트 요약, 평가, 키워드 추출 등
 
 import os
 import json
+import time
 import logging
-from typing import Dict, List, Optional
+import threading
+from typing import Dict, List, Optional, Tuple
 import google.generativeai as genai
 from dotenv import load_dotenv
 
+from modules import llm_cache, rate_limiter
+
 # 환경 변수 로드
 load_dotenv()
 
@@ -17,6 +21,20 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 모델 핸들 캐시 설정 (프로세스 단위로 한 번 해석한 모델을 재사용)
+MODEL_CACHE_TTL = int(os.getenv("GEMINI_MODEL_CACHE_TTL", "21600"))  # 초 (기본 6시간)
+_DEFAULT_MODEL_KEY = "__default__"
+
+_model_lock = threading.Lock()
+_model_cache: Dict[str, tuple] = {}  # {모델 키: (모델, 해석 시각)}
+_model_stats = {"resolutions": 0, "invalidations": 0}
+
+# 모델별 토큰 한도 (모델 목록 조회 시 갱신, 조회 실패 시 기본값 사용)
+DEFAULT_INPUT_TOKEN_LIMIT = 32768
+DEFAULT_OUTPUT_TOKEN_LIMIT = 8192
+_model_limits: Dict[str, tuple] = {}  # {모델 이름: (입력 토큰 한도, 출력 토큰 한도)}
+
+
 # Gemini API 클라이언트 초기화
 def init_gemini_client():
     """Gemini API 클라이언트 초기화"""
@@ -39,8 +57,8 @@ def init_gemini_client():
     return genai
 
 
-def get_model(model_name: str = None):
-    """Gemini 모델 반환"""
+def _resolve_model(model_name: str = None):
+    """모델 목록을 조회하여 사용 가능한 Gemini 모델을 해석 (네트워크 호출 발생)"""
     try:
         client = init_gemini_client()
         
@@ -50,6 +68,11 @@ def get_model(model_name: str = None):
             for model in genai.list_models():
                 if 'generateContent' in model.supported_generation_methods:
                     available_models.append(model.name)
+                    # 배치 크기 계산용 입력/출력 토큰 한도 기록
+                    _model_limits[model.name] = (
+                        getattr(model, "input_token_limit", None) or DEFAULT_INPUT_TOKEN_LIMIT,
+                        getattr(model, "output_token_limit", None) or DEFAULT_OUTPUT_TOKEN_LIMIT
+                    )
             logger.info(f"사용 가능한 모델: {available_models[:5]}...")
         except Exception as e:
             logger.warning(f"모델 목록 조회 실패: {e}")
@@ -104,6 +127,169 @@ def get_model(model_name: str = None):
         raise
 
 
+def get_model(model_name: str = None):
+    """
+    Gemini 모델 반환 (프로세스 단위 캐시)
+    
+    최초 호출 시에만 클라이언트 초기화 및 모델 목록 조회를 수행하고,
+    이후에는 MODEL_CACHE_TTL 동안 캐시된 모델 핸들을 재사용
+    
+    Args:
+        model_name: 모델 이름 (None이면 기본 후보 목록에서 자동 선택)
+    
+    Returns:
+        GenerativeModel 인스턴스
+    """
+    cache_key = model_name or _DEFAULT_MODEL_KEY
+    
+    cached = _model_cache.get(cache_key)
+    if cached and time.monotonic() - cached[1] < MODEL_CACHE_TTL:
+        return cached[0]
+    
+    with _model_lock:
+        # 대기 중 다른 스레드가 이미 해석했을 수 있으므로 재확인
+        cached = _model_cache.get(cache_key)
+        if cached and time.monotonic() - cached[1] < MODEL_CACHE_TTL:
+            return cached[0]
+        
+        model = _resolve_model(model_name)
+        _model_cache[cache_key] = (model, time.monotonic())
+        _model_stats["resolutions"] += 1
+        logger.info(f"모델 핸들 캐시 갱신: {getattr(model, 'model_name', model_name)} (누적 해석 {_model_stats['resolutions']}회)")
+        return model
+
+
+def invalidate_model(model_name: str = None):
+    """
+    캐시된 모델 핸들 무효화 (404 등으로 모델이 더 이상 유효하지 않을 때)
+    
+    Args:
+        model_name: 무효화할 모델 이름 (None이면 기본 모델)
+    """
+    cache_key = model_name or _DEFAULT_MODEL_KEY
+    with _model_lock:
+        if _model_cache.pop(cache_key, None) is not None:
+            _model_stats["invalidations"] += 1
+            logger.warning(f"모델 핸들 캐시 무효화: {cache_key}")
+
+
+def get_model_stats() -> Dict:
+    """모델 해석/무효화 횟수 반환 (실행당 1회 해석 여부 확인용)"""
+    with _model_lock:
+        return dict(_model_stats)
+
+
+def get_model_limits(model_name: str = None) -> Tuple[int, int]:
+    """
+    현재 모델의 (입력 토큰 한도, 출력 토큰 한도) 반환
+    
+    Args:
+        model_name: 모델 이름 (None이면 기본 모델)
+    """
+    model = get_model(model_name)
+    name = getattr(model, "model_name", model_name) or ""
+    if not name.startswith("models/"):
+        name = f"models/{name}"
+    return _model_limits.get(name, (DEFAULT_INPUT_TOKEN_LIMIT, DEFAULT_OUTPUT_TOKEN_LIMIT))
+
+
+def get_ai_stats() -> Dict:
+    """모델 해석, 응답 캐시, 호출 제한(대기 시간) 통계를 한 번에 반환"""
+    return {
+        "model": get_model_stats(),
+        "cache": llm_cache.get_stats(),
+        "rate_limit": rate_limiter.get_limiter().get_stats(),
+    }
+
+
+def _is_model_not_found(error: Exception) -> bool:
+    """모델 미존재(404) 오류인지 확인"""
+    if getattr(error, "code", None) == 404:
+        return True
+    message = str(error)
+    return "404" in message and ("not found" in message.lower() or "model" in message.lower())
+
+
+def generate_text(prompt: str, generation_config: Optional[Dict] = None, model_name: str = None,
+                  task: str = "generic", use_cache: bool = True, refresh_cache: bool = False) -> str:
+    """
+    캐시된 모델 핸들로 텍스트 생성 (응답 캐시 경유)
+    
+    동일한 작업/모델/생성 설정/프롬프트 조합은 llm_cache에서 바로 반환하고,
+    실제 API 호출은 rate_limiter의 공유 한도를 거쳐 수행.
+    모델 미존재(404) 오류가 발생하면 모델 캐시를 무효화하여
+    다음 호출(재시도)에서 모델을 다시 해석하도록 함
+    
+    Args:
+        prompt: 프롬프트
+        generation_config: 생성 설정
+        model_name: 모델 이름 (None이면 기본 모델)
+        task: 프롬프트 템플릿 식별자 (캐시 키 및 TTL 결정용)
+        use_cache: 응답 캐시 사용 여부
+        refresh_cache: 캐시를 읽지 않고 새로 생성한 응답으로 덮어쓸지 여부 (재시도용)
+    
+    Returns:
+        생성된 텍스트
+    """
+    model = get_model(model_name)
+    
+    cache_key = None
+    if use_cache and llm_cache.is_enabled():
+        cache_key = llm_cache.make_key(task, getattr(model, "model_name", model_name), generation_config, prompt)
+        if not refresh_cache:
+            cached = llm_cache.get(cache_key, task)
+            if cached is not None:
+                return cached
+    
+    # 프로세스 전체 RPM/TPM/동시 실행 한도 내에서 호출
+    limiter = rate_limiter.get_limiter()
+    estimated_tokens = rate_limiter.estimate_tokens(prompt, generation_config)
+    try:
+        with limiter.acquire(estimated_tokens):
+            response = model.generate_content(prompt, generation_config=generation_config)
+    except Exception as e:
+        if _is_model_not_found(e):
+            invalidate_model(model_name)
+        elif rate_limiter.is_rate_limit_error(e):
+            limiter.penalize(rate_limiter.parse_retry_after(e) or rate_limiter.DEFAULT_COOLDOWN)
+        raise
+    
+    usage = getattr(response, "usage_metadata", None)
+    limiter.record_usage(estimated_tokens, getattr(usage, "total_token_count", None))
+    
+    text = response.text
+    if cache_key:
+        llm_cache.put(cache_key, task, getattr(model, "model_name", model_name), text)
+    return text
+
+
+def _backoff(attempt: int, error: Exception):
+    """
+    재시도 전 대기
+    
+    쿼터 초과(429)는 generate_text에서 공유 제어기에 Retry-After 대기를 등록했으므로
+    다음 호출이 자동으로 대기하고, 그 외 오류는 지수 백오프로 대기
+    """
+    if rate_limiter.is_rate_limit_error(error):
+        return
+    time.sleep(rate_limiter.backoff_delay(attempt))
+
+
+def _extract_json(response_text: str):
+    """
+    응답 텍스트에서 JSON 블록을 추출하여 파싱 (```json ... ``` 형식일 수 있음)
+    
+    Raises:
+        json.JSONDecodeError: JSON 파싱 실패 시
+    """
+    if "```json" in response_text:
+        response_text = response_text.split("```json")[1].split("```")[0].strip()
+    elif "```" in response_text:
+        response_text = response_text.split("```")[1].split("```")[0].strip()
+    
+    return json.loads(response_text)
+
+
 def translate_title(title: str, max_retries: int = 3) -> str:
     """
     제목을 한국어로 번역
@@ -124,15 +310,16 @@ def translate_title(title: str, max_retries: int = 3) -> str:
     
     for attempt in range(max_retries):
         try:
-            model = get_model()
-            response = model.generate_content(
+            response_text = generate_text(
                 prompt,
                 generation_config={
                     "temperature": 0.2,
                     "max_output_tokens": 200,
-                }
+                },
+                task="translate_title",
+                refresh_cache=attempt > 0
             )
-            translated = response.text.strip()
+            translated = response_text.strip()
             if translated and len(translated) > 5:
                 logger.info("제목 번역 완료")
                 return translated
@@ -142,8 +329,7 @@ def translate_title(title: str, max_retries: int = 3) -> str:
             logger.warning(f"제목 번역 실패 (시도 {attempt + 1}/{max_retries}): {e}")
             if attempt == max_retries - 1:
                 return title
-            import time
-            time.sleep(2 ** attempt)
+            _backoff(attempt, e)
 
 
 def generate_summary(text: str, max_retries: int = 3) -> str:
@@ -166,15 +352,16 @@ def generate_summary(text: str, max_retries: int = 3) -> str:
     
     for attempt in range(max_retries):
         try:
-            model = get_model()
-            response = model.generate_content(
+            response_text = generate_text(
                 prompt,
                 generation_config={
                     "temperature": 0.3,
                     "max_output_tokens": 300,
-                }
+                },
+                task="generate_summary",
+                refresh_cache=attempt > 0
             )
-            summary = response.text.strip()
+            summary = response_text.strip()
             if summary and len(summary) > 10:  # 최소 길이 체크
                 logger.info("요약 생성 완료")
                 return summary
@@ -187,8 +374,7 @@ def generate_summary(text: str, max_retries: int = 3) -> str:
                 lines = text.split('\n')[:3]
                 fallback_summary = ' '.join([line.strip() for line in lines if line.strip()])[:200]
                 return fallback_summary if fallback_summary else "요약을 생성할 수 없습니다."
-            import time
-            time.sleep(2 ** attempt)  # 지수 백오프
+            _backoff(attempt, e)
 
 
 def generate_news_summary_korean(text: str, max_retries: int = 3) -> str:
@@ -211,15 +397,16 @@ def generate_news_summary_korean(text: str, max_retries: int = 3) -> str:
     
     for attempt in range(max_retries):
         try:
-            model = get_model()
-            response = model.generate_content(
+            response_text = generate_text(
                 prompt,
                 generation_config={
                     "temperature": 0.3,
                     "max_output_tokens": 200,
-                }
+                },
+                task="generate_news_summary_korean",
+                refresh_cache=attempt > 0
             )
-            summary = response.text.strip()
+            summary = response_text.strip()
             if summary and len(summary) > 20:
                 logger.info("한국어 요약 생성 완료")
                 return summary
@@ -229,8 +416,7 @@ def generate_news_summary_korean(text: str, max_retries: int = 3) -> str:
             logger.warning(f"한국어 요약 생성 실패 (시도 {attempt + 1}/{max_retries}): {e}")
             if attempt == max_retries - 1:
                 return text[:100] + "..." if len(text) > 100 else text
-            import time
-            time.sleep(2 ** attempt)
+            _backoff(attempt, e)
 
 
 def translate_abstract(abstract: str, max_retries: int = 3) -> str:
@@ -253,15 +439,16 @@ def translate_abstract(abstract: str, max_retries: int = 3) -> str:
     
     for attempt in range(max_retries):
         try:
-            model = get_model()
-            response = model.generate_content(
+            response_text = generate_text(
                 prompt,
                 generation_config={
                     "temperature": 0.2,
                     "max_output_tokens": 2000,
-                }
+                },
+                task="translate_abstract",
+                refresh_cache=attempt > 0
             )
-            translated = response.text.strip()
+            translated = response_text.strip()
             if translated and len(translated) > 50:
                 logger.info("Abstract 번역 완료")
                 return translated
@@ -271,8 +458,7 @@ def translate_abstract(abstract: str, max_retries: int = 3) -> str:
             logger.warning(f"Abstract 번역 실패 (시도 {attempt + 1}/{max_retries}): {e}")
             if attempt == max_retries - 1:
                 return abstract
-            import time
-            time.sleep(2 ** attempt)
+            _backoff(attempt, e)
 
 
 def evaluate_article(text: str, max_retries: int = 3) -> Dict:
@@ -310,25 +496,21 @@ def evaluate_article(text: str, max_retries: int = 3) -> Dict:
     
     for attempt in range(max_retries):
         try:
-            model = get_model()
-            response = model.generate_content(
+            response_text = generate_text(
                 prompt,
                 generation_config={
                     "temperature": 0.2,
                     "max_output_tokens": 200,
-                }
+                },
+                task="evaluate_article",
+                refresh_cache=attempt > 0
             )
             
             # JSON 파싱 시도
-            response_text = response.text.strip()
-            
-            # JSON 블록 추출 (```json ... ``` 형식일 수 있음)
-            if "```json" in response_text:
-                response_text = response_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in response_text:
-                response_text = response_text.split("```")[1].split("```")[0].strip()
+            response_text = response_text.strip()
             
-            result = json.loads(response_text)
+            # JSON 블록 추출 및 파싱
+            result = _extract_json(response_text)
             
             # 점수 검증
             score = int(result.get("score", 3))
@@ -349,8 +531,7 @@ def evaluate_article(text: str, max_retries: int = 3) -> Dict:
             logger.warning(f"평가 실패 (시도 {attempt + 1}/{max_retries}): {e}")
             if attempt == max_retries - 1:
                 return {"score": 3, "reason": "평가 중 오류 발생"}
-            import time
-            time.sleep(2 ** attempt)
+            _backoff(attempt, e)
 
 
 def extract_keywords(text: str, max_keywords: int = 5, max_retries: int = 3) -> List[str]:
@@ -377,24 +558,20 @@ def extract_keywords(text: str, max_keywords: int = 5, max_retries: int = 3) ->
     
     for attempt in range(max_retries):
         try:
-            model = get_model()
-            response = model.generate_content(
+            response_text = generate_text(
                 prompt,
                 generation_config={
                     "temperature": 0.3,
                     "max_output_tokens": 200,
-                }
+                },
+                task="extract_keywords",
+                refresh_cache=attempt > 0
             )
             
-            response_text = response.text.strip()
-            
-            # JSON 블록 추출
-            if "```json" in response_text:
-                response_text = response_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in response_text:
-                response_text = response_text.split("```")[1].split("```")[0].strip()
+            response_text = response_text.strip()
             
-            result = json.loads(response_text)
+            # JSON 블록 추출 및 파싱
+            result = _extract_json(response_text)
             keywords = result.get("keywords", [])
             
             # 최대 개수 제한
@@ -412,8 +589,7 @@ def extract_keywords(text: str, max_keywords: int = 5, max_retries: int = 3) ->
             logger.warning(f"키워드 추출 실패 (시도 {attempt + 1}/{max_retries}): {e}")
             if attempt == max_retries - 1:
                 return []
-            import time
-            time.sleep(2 ** attempt)
+            _backoff(attempt, e)
 
 
 def summarize_paper(abstract: str, max_retries: int = 3) -> Dict:
@@ -447,24 +623,20 @@ def summarize_paper(abstract: str, max_retries: int = 3) -> Dict:
     
     for attempt in range(max_retries):
         try:
-            model = get_model()
-            response = model.generate_content(
+            response_text = generate_text(
                 prompt,
                 generation_config={
                     "temperature": 0.2,
                     "max_output_tokens": 500,
-                }
+                },
+                task="summarize_paper",
+                refresh_cache=attempt > 0
             )
             
-            response_text = response.text.strip()
+            response_text = response_text.strip()
             
-            # JSON 블록 추출
-            if "```json" in response_text:
-                response_text = response_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in response_text:
-                response_text = response_text.split("```")[1].split("```")[0].strip()
-            
-            result = json.loads(response_text)
+            # JSON 블록 추출 및 파싱
+            result = _extract_json(response_text)
             
             logger.info("논문 요약 완료")
             return {
@@ -491,8 +663,439 @@ def summarize_paper(abstract: str, max_retries: int = 3) -> Dict:
                     "result": "",
                     "implication": ""
                 }
-            import time
-            time.sleep(2 ** attempt)
+            _backoff(attempt, e)
+
+
+# analyze_article 요약 형식별 지시문 및 최대 출력 토큰
+SUMMARY_STYLES = {
+    "korean_brief": ("외국 뉴스 기사를 한국어로 100자 내외로 간략히 요약 (핵심 내용만 간결하게)", 200),
+    "three_lines": ("기사를 3줄로 요약 (각 줄은 핵심 내용을 간결하게)", 300),
+}
+
+
+def _fallback_summary(text: str, summary_style: str) -> str:
+    """요약 생성 실패 시 사용할 기본 요약 (기존 요약 함수들의 폴백과 동일)"""
+    if summary_style == "korean_brief":
+        return text[:100] + "..." if len(text) > 100 else text
+    lines = text.split('\n')[:3]
+    fallback_summary = ' '.join([line.strip() for line in lines if line.strip()])[:200]
+    return fallback_summary if fallback_summary else "요약을 생성할 수 없습니다."
+
+
+def _validate_analysis(result, translate: bool, summary_style: Optional[str],
+                       evaluate: bool, max_keywords: int) -> Tuple[Dict, List[str]]:
+    """
+    analyze_article 응답을 스키마에 맞게 검증
+    
+    Returns:
+        (검증을 통과한 필드 딕셔너리, 검증 실패한 필드 이름 리스트)
+    """
+    if not isinstance(result, dict):
+        raise ValueError("응답이 JSON 객체가 아닙니다.")
+    
+    valid = {}
+    invalid = []
+    
+    if translate:
+        title_translated = result.get("title_translated")
+        if isinstance(title_translated, str) and len(title_translated.strip()) > 5:
+            valid["title_translated"] = title_translated.strip()
+        else:
+            invalid.append("title_translated")
+    
+    if summary_style:
+        summary = result.get("summary")
+        min_length = 20 if summary_style == "korean_brief" else 10
+        if isinstance(summary, list):
+            summary = "\n".join(str(line) for line in summary)
+        if isinstance(summary, str) and len(summary.strip()) > min_length:
+            valid["summary"] = summary.strip()
+        else:
+            invalid.append("summary")
+    
+    if evaluate:
+        try:
+            score = int(result.get("score"))
+        except (TypeError, ValueError):
+            score = None
+        if score is not None and 1 <= score <= 5:
+            valid["score"] = score
+            reason = result.get("reason")
+            valid["reason"] = reason.strip() if isinstance(reason, str) and reason.strip() else "평가 완료"
+        else:
+            invalid.append("score")
+    
+    keywords = result.get("keywords")
+    if isinstance(keywords, list):
+        keywords = [str(k).strip() for k in keywords if str(k).strip()]
+    if keywords:
+        valid["keywords"] = keywords[:max_keywords]
+    else:
+        invalid.append("keywords")
+    
+    return valid, invalid
+
+
+def _analysis_spec(translate: bool, summary_style: Optional[str], evaluate: bool,
+                   max_keywords: int) -> Tuple[str, str, int]:
+    """
+    분석 요청 필드 구성
+    
+    Returns:
+        (작업 지시문, JSON 필드 스키마, 기사 1건당 최대 출력 토큰)
+    """
+    if summary_style and summary_style not in SUMMARY_STYLES:
+        raise ValueError(f"지원하지 않는 요약 형식입니다: {summary_style}")
+    
+    instructions = []
+    schema_lines = []
+    max_output_tokens = 200  # 키워드
+    if translate:
+        instructions.append("제목을 한국어로 번역")
+        schema_lines.append('    "title_translated": "번역된 제목"')
+        max_output_tokens += 200
+    if summary_style:
+        style_instruction, style_tokens = SUMMARY_STYLES[summary_style]
+        instructions.append(style_instruction)
+        schema_lines.append('    "summary": "요약"')
+        max_output_tokens += style_tokens
+    if evaluate:
+        instructions.append("""사회과학 논문의 신뢰도 및 타당도 평가 기준에 따라 1~5점으로 평가
+   - 과학적 연구가 이루어졌는지 / 근거보다는 일반상식에 바탕하는지
+   - 연구가 타당한지 / 경험 및 선행보고가 충분한지
+   - 저명학회지에 게재 가능한 수준의 근거기반 논리인지""")
+        schema_lines.append('    "score": 1~5 사이의 정수')
+        schema_lines.append('    "reason": "평가 근거를 간단히 설명"')
+        max_output_tokens += 200
+    instructions.append(f"핵심 키워드를 {max_keywords}개 추출")
+    schema_lines.append('    "keywords": ["키워드1", "키워드2", ...]')
+    
+    instruction_text = "\n".join(f"{idx}. {inst}" for idx, inst in enumerate(instructions, 1))
+    schema_text = ",\n".join(schema_lines)
+    return instruction_text, schema_text, max_output_tokens
+
+
+def analyze_article(text: str, title: str = "", translate: bool = False, summary_style: Optional[str] = None,
+                    evaluate: bool = True, max_keywords: int = 5, max_retries: int = 3) -> Dict:
+    """
+    기사 분석 (제목 번역, 요약, 전문성 평가, 키워드 추출)을 한 번의 요청으로 수행
+    
+    translate_title / generate_news_summary_korean / generate_summary /
+    evaluate_article / extract_keywords 를 각각 호출하는 대신 본문을 한 번만 보내고
+    구조화된 JSON 응답을 받음. 응답 중 일부 필드만 잘못된 경우 해당 필드만
+    개별 함수로 다시 요청하고, 요청 자체가 실패하면 필드별 기본값을 사용
+    
+    Args:
+        text: 기사 본문 (2000자 이내 권장)
+        title: 기사 원제목 (번역 대상, 분석 시 참고용)
+        translate: 제목 한국어 번역 여부
+        summary_style: 요약 형식 ("korean_brief", "three_lines", None이면 요약 안 함)
+        evaluate: 전문성 평가 (1~5점) 수행 여부
+        max_keywords: 추출할 키워드 개수
+        max_retries: 최대 재시도 횟수
+    
+    Returns:
+        {
+            "title_translated": str,
+            "summary": str,
+            "score": int,
+            "reason": str,
+            "keywords": List[str]
+        } 형태의 딕셔너리 (요청하지 않은 필드는 빈 값)
+    """
+    instruction_text, schema_text, max_output_tokens = _analysis_spec(translate, summary_style, evaluate, max_keywords)
+    
+    prompt = f"""다음 뉴스 기사에 대해 아래 작업을 모두 수행해주세요.
+
+{instruction_text}
+
+제목:
+{title}
+
+기사 내용:
+{text}
+
+다음 JSON 형식으로만 응답해주세요:
+{{
+{schema_text}
+}}"""
+    
+    analysis = {
+        "title_translated": "",
+        "summary": "",
+        "score": 3,
+        "reason": "",
+        "keywords": []
+    }
+    
+    for attempt in range(max_retries):
+        try:
+            response_text = generate_text(
+                prompt,
+                generation_config={
+                    "temperature": 0.2,
+                    "max_output_tokens": max_output_tokens,
+                },
+                task="analyze_article",
+                refresh_cache=attempt > 0
+            )
+            result = _extract_json(response_text.strip())
+            valid, invalid = _validate_analysis(result, translate, summary_style, evaluate, max_keywords)
+            analysis.update(valid)
+            
+            # 필드별 폴백: 잘못된 필드만 개별 함수로 다시 요청
+            if "title_translated" in invalid:
+                analysis["title_translated"] = translate_title(title, max_retries=1) if title else ""
+            if "summary" in invalid:
+                if summary_style == "korean_brief":
+                    analysis["summary"] = generate_news_summary_korean(text, max_retries=1)
+                else:
+                    analysis["summary"] = generate_summary(text, max_retries=1)
+            if "score" in invalid:
+                evaluation = evaluate_article(text, max_retries=1)
+                analysis["score"] = evaluation["score"]
+                analysis["reason"] = evaluation["reason"]
+            if "keywords" in invalid:
+                analysis["keywords"] = extract_keywords(text, max_keywords=max_keywords, max_retries=1) or []
+            
+            if invalid:
+                logger.warning(f"기사 분석 일부 필드 폴백 처리: {invalid}")
+            logger.info(f"기사 통합 분석 완료: {analysis['score']}점, 키워드 {len(analysis['keywords'])}개")
+            return analysis
+        except Exception as e:
+            logger.warning(f"기사 통합 분석 실패 (시도 {attempt + 1}/{max_retries}): {e}")
+            if attempt == max_retries - 1:
+                break
+            _backoff(attempt, e)
+    
+    # 전체 실패 시 필드별 기본값 사용
+    if translate:
+        analysis["title_translated"] = title
+    if summary_style:
+        analysis["summary"] = _fallback_summary(text, summary_style)
+    if evaluate:
+        analysis["reason"] = "평가 중 오류 발생"
+    return analysis
+
+
+# 배치 요청 설정
+BATCH_MAX_ITEMS = int(os.getenv("GEMINI_BATCH_MAX_ITEMS", "15"))  # 응답 품질 유지를 위한 배치당 최대 항목 수
+BATCH_CONTEXT_RATIO = 0.5  # 입력 토큰 한도 중 배치 입력에 사용할 비율
+BATCH_OUTPUT_RATIO = 0.8  # 출력 토큰 한도 중 배치 출력에 사용할 비율
+
+
+def _plan_batches(items: List[Dict], item_output_tokens: int, model_name: str = None) -> List[List[Dict]]:
+    """
+    모델의 입력/출력 토큰 한도에 맞춰 항목을 배치로 나눔
+    
+    Args:
+        items: {"id", "title", "text"} 딕셔너리 리스트
+        item_output_tokens: 항목 1건당 최대 출력 토큰
+        model_name: 모델 이름
+    
+    Returns:
+        배치 리스트
+    """
+    input_limit, output_limit = get_model_limits(model_name)
+    input_budget = int(input_limit * BATCH_CONTEXT_RATIO)
+    max_items = max(1, min(BATCH_MAX_ITEMS, int(output_limit * BATCH_OUTPUT_RATIO) // item_output_tokens))
+    
+    batches = []
+    current = []
+    current_tokens = 0
+    for item in items:
+        item_tokens = rate_limiter.estimate_tokens(item.get("title", "") + item.get("text", ""))
+        if current and (len(current) >= max_items or current_tokens + item_tokens > input_budget):
+            batches.append(current)
+            current = []
+            current_tokens = 0
+        current.append(item)
+        current_tokens += item_tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _analyze_batch(batch: List[Dict], translate: bool, summary_style: Optional[str], evaluate: bool,
+                   max_keywords: int, refresh_cache: bool = False) -> Tuple[Dict[str, Dict], List[Dict]]:
+    """
+    배치 1개를 한 번의 요청으로 분석
+    
+    Returns:
+        (검증을 통과한 {id: 분석 결과}, 응답이 없거나 잘못된 항목 리스트)
+    """
+    instruction_text, schema_text, item_output_tokens = _analysis_spec(translate, summary_style, evaluate, max_keywords)
+    
+    articles_text = "\n\n".join(
+        f"[ID: {item['id']}]\n제목: {item.get('title', '')}\n내용:\n{item.get('text', '')}"
+        for item in batch
+    )
+    schema_text = "\n".join("    " + line for line in schema_text.split("\n"))
+    
+    prompt = f"""다음 {len(batch)}개의 기사 각각에 대해 아래 작업을 모두 수행해주세요.
+
+{instruction_text}
+
+기사 목록:
+{articles_text}
+
+각 기사마다 하나의 객체를 담은 JSON 배열로만 응답해주세요. id는 기사 목록의 ID를 그대로 사용하세요:
+[
+    {{
+        "id": "기사 ID",
+{schema_text}
+    }}
+]"""
+    
+    response_text = generate_text(
+        prompt,
+        generation_config={
+            "temperature": 0.2,
+            "max_output_tokens": item_output_tokens * len(batch) + 100,
+        },
+        task="analyze_article",
+        refresh_cache=refresh_cache
+    )
+    result = _extract_json(response_text.strip())
+    if isinstance(result, dict):
+        result = result.get("items") or result.get("results") or [result]
+    if not isinstance(result, list):
+        raise ValueError("응답이 JSON 배열이 아닙니다.")
+    
+    responses = {str(entry.get("id")): entry for entry in result if isinstance(entry, dict)}
+    
+    analyses = {}
+    failed = []
+    for item in batch:
+        entry = responses.get(str(item["id"]))
+        if entry is None:
+            failed.append(item)
+            continue
+        valid, invalid = _validate_analysis(entry, translate, summary_style, evaluate, max_keywords)
+        if invalid:
+            failed.append(item)
+            continue
+        analysis = {"title_translated": "", "summary": "", "score": 3, "reason": "", "keywords": []}
+        analysis.update(valid)
+        analyses[str(item["id"])] = analysis
+    return analyses, failed
+
+
+def analyze_articles_batch(items: List[Dict], translate: bool = False, summary_style: Optional[str] = None,
+                           evaluate: bool = True, max_keywords: int = 5, progress_callback=None) -> Dict[str, Dict]:
+    """
+    여러 기사를 배치 요청으로 분석 (analyze_article의 다건 버전)
+    
+    항목들을 모델의 토큰 한도에 맞는 배치로 묶어 배치당 한 번만 요청하고,
+    응답에서 빠졌거나 잘못된 항목은 배치를 반으로 나눠 재요청.
+    1건까지 나눠도 실패하면 analyze_article의 필드별 폴백을 사용
+    
+    Args:
+        items: [{"id": 고유 ID, "title": 제목, "text": 본문}, ...]
+        translate: 제목 한국어 번역 여부
+        summary_style: 요약 형식 ("korean_brief", "three_lines", None이면 요약 안 함)
+        evaluate: 전문성 평가 수행 여부
+        max_keywords: 추출할 키워드 개수
+        progress_callback: 항목 처리 완료 시 호출 (완료된 항목 수를 인자로 전달)
+    
+    Returns:
+        {id: analyze_article과 같은 형태의 분석 결과}
+    """
+    if not items:
+        return {}
+    
+    _, _, item_output_tokens = _analysis_spec(translate, summary_style, evaluate, max_keywords)
+    pending = _plan_batches(items, item_output_tokens)
+    logger.info(f"배치 분석 시작: {len(items)}개 항목, {len(pending)}개 배치")
+    
+    results = {}
+    split_batches = set()  # 재요청 중인 배치 (캐시된 잘못된 응답을 다시 읽지 않도록)
+    rate_limit_retries = 0
+    while pending:
+        batch = pending.pop(0)
+        batch_ids = tuple(str(item["id"]) for item in batch)
+        
+        if len(batch) == 1 and batch_ids in split_batches:
+            # 단건까지 나눠도 실패한 항목은 단일 분석(필드별 폴백 포함)으로 처리
+            item = batch[0]
+            results[batch_ids[0]] = analyze_article(
+                item.get("text", ""),
+                title=item.get("title", ""),
+                translate=translate,
+                summary_style=summary_style,
+                evaluate=evaluate,
+                max_keywords=max_keywords
+            )
+            if progress_callback:
+                progress_callback(1)
+            continue
+        
+        try:
+            analyses, failed = _analyze_batch(
+                batch, translate, summary_style, evaluate, max_keywords,
+                refresh_cache=batch_ids in split_batches
+            )
+        except Exception as e:
+            logger.warning(f"배치 분석 실패 ({len(batch)}개 항목): {e}")
+            if rate_limiter.is_rate_limit_error(e) and rate_limit_retries < 3:
+                # 쿼터 초과는 분할하지 않고 대기 후 같은 배치로 재요청
+                rate_limit_retries += 1
+                pending.insert(0, batch)
+                continue
+            analyses, failed = {}, batch
+        
+        results.update(analyses)
+        if progress_callback and analyses:
+            progress_callback(len(analyses))
+        
+        if failed:
+            logger.info(f"배치 부분 실패: {len(failed)}/{len(batch)}개 항목 재요청")
+            if len(failed) == 1:
+                halves = [failed]
+            else:
+                middle = len(failed) // 2
+                halves = [failed[:middle], failed[middle:]]
+            for half in reversed(halves):
+                split_batches.add(tuple(str(item["id"]) for item in half))
+                pending.insert(0, half)
+    
+    logger.info(f"배치 분석 완료: {len(results)}개 항목")
+    return results
+
+
+def extract_keywords_batch(items: List[Dict], max_keywords: int = 5, progress_callback=None) -> Dict[str, List[str]]:
+    """
+    여러 텍스트의 키워드를 배치 요청으로 추출
+    
+    Args:
+        items: [{"id": 고유 ID, "title": 제목, "text": 본문}, ...]
+        max_keywords: 항목당 추출할 키워드 개수
+        progress_callback: 항목 처리 완료 시 호출 (완료된 항목 수를 인자로 전달)
+    
+    Returns:
+        {id: 키워드 리스트}
+    """
+    analyses = analyze_articles_batch(items, evaluate=False, max_keywords=max_keywords,
+                                      progress_callback=progress_callback)
+    return {item_id: analysis["keywords"] for item_id, analysis in analyses.items()}
+
+
+def evaluate_articles_batch(items: List[Dict], progress_callback=None) -> Dict[str, Dict]:
+    """
+    여러 기사의 전문성 평가를 배치 요청으로 수행
+    
+    Args:
+        items: [{"id": 고유 ID, "title": 제목, "text": 본문}, ...]
+        progress_callback: 항목 처리 완료 시 호출 (완료된 항목 수를 인자로 전달)
+    
+    Returns:
+        {id: {"score": int, "reason": str, "keywords": List[str]}}
+    """
+    analyses = analyze_articles_batch(items, evaluate=True, progress_callback=progress_callback)
+    return {
+        item_id: {"score": a["score"], "reason": a["reason"], "keywords": a["keywords"]}
+        for item_id, a in analyses.items()
+    }
 
 
 # 테스트 코드
@@ -0,0 +1,388 @@
+"""
+비동기 수집 엔진
+aiohttp 공유 연결 풀 하나로 RSS 피드, 기사 본문, API 응답을 동시에 가져오고
+블로킹 작업(LLM 호출, DB 조회, HTML 파싱)은 스레드로 넘겨 이벤트 루프를 막지 않음
+"""
+
+import os
+import copy
+import time
+import random
+import asyncio
+import logging
+import threading
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Mapping, Optional, Tuple
+from urllib.parse import urlparse
+
+import aiohttp
+import feedparser
+
+from modules.feed_state import FeedValidators
+from modules.host_scheduler import (
+    GLOBAL_LIMIT, MAX_PER_HOST, THROTTLE_STATUSES, HostScheduler, parse_retry_after
+)
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+REQUEST_TIMEOUT = 15  # 초
+CONNECT_TIMEOUT = 5   # 초 (연결 수립까지, 응답을 기다리는 시간과 별도)
+
+# 유휴 연결 유지 시간 (초, 같은 호스트에 다시 요청할 때 TCP/TLS 연결 재사용)
+KEEPALIVE_TIMEOUT = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "60"))
+
+# 응답 본문 최대 크기 (압축 해제 후 바이트, 넘으면 그 지점에서 읽기 중단)
+MAX_RESPONSE_BYTES = int(os.getenv("HTTP_MAX_RESPONSE_BYTES", str(10 * 1024 * 1024)))
+READ_CHUNK_SIZE = 64 * 1024
+
+# 재시도하는 4xx 상태 코드 (나머지 4xx는 재시도해도 결과가 같으므로 중단)
+RETRY_CLIENT_STATUSES = {408, 429}
+
+# User-Agent 설정 (스크래핑 시 필요)
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+
+def backoff_delay(retry_delay: float, attempt: int) -> float:
+    """재시도 대기 시간 (지수 증가 + 무작위 지터로 여러 요청이 동시에 재시도하지 않게 함)"""
+    return retry_delay * (2 ** attempt) * random.uniform(0.5, 1.5)
+
+
+class Fetcher:
+    """공유 세션 위에서 호스트별 스케줄러(동시 요청 수/초당 요청 수 자동 조절)를 거쳐 URL을 가져오는 클라이언트"""
+
+    def __init__(self, session: aiohttp.ClientSession, validators: Optional[FeedValidators] = None):
+        self.session = session
+        self.validators = validators
+        self.scheduler = HostScheduler()
+        self.stats = {"requests": 0, "failures": 0, "bytes": 0, "not_modified": 0, "bytes_saved": 0,
+                      "truncated": 0}
+
+    def with_validators(self, validators: Optional[FeedValidators]) -> "Fetcher":
+        """
+        세션/호스트 스케줄러/통계는 공유하고 검증값 저장소만 다른 Fetcher (수집 실행별 조건부 요청용)
+
+        Args:
+            validators: 이 실행에서 쓸 검증값 저장소 (None이면 조건부 요청 안 함)
+        """
+        fetcher = copy.copy(self)
+        fetcher.validators = validators
+        return fetcher
+
+    async def get_bytes(self, url: str, params: Optional[Dict] = None, max_retries: int = 2,
+                        retry_delay: float = 1.0, timeout: float = REQUEST_TIMEOUT,
+                        max_bytes: int = MAX_RESPONSE_BYTES) -> Optional[bytes]:
+        """
+        URL 응답 본문을 바이트로 가져오기
+
+        Args:
+            url: 요청 URL
+            params: 쿼리 파라미터
+            max_retries: 최대 시도 횟수
+            retry_delay: 재시도 전 대기 시간 (초)
+            timeout: 요청 제한 시간 (초)
+            max_bytes: 읽을 최대 바이트 수 (넘는 부분은 버림)
+
+        Returns:
+            응답 본문 (실패 시 None)
+        """
+        response = await self.request(url, params=params, max_retries=max_retries,
+                                      retry_delay=retry_delay, timeout=timeout, max_bytes=max_bytes)
+        return response[1] if response else None
+
+    async def request(self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None,
+                      max_retries: int = 2, retry_delay: float = 1.0,
+                      timeout: float = REQUEST_TIMEOUT,
+                      max_bytes: int = MAX_RESPONSE_BYTES) -> Optional[Tuple[int, bytes, Mapping]]:
+        """
+        GET 요청 후 (상태 코드, 본문, 응답 헤더) 반환 (304 등 3xx 응답도 그대로 반환, 헤더 키는 대소문자 무시)
+
+        Args:
+            url: 요청 URL
+            params: 쿼리 파라미터
+            headers: 추가 요청 헤더
+            max_retries: 최대 시도 횟수
+            retry_delay: 재시도 전 대기 시간 (초)
+            timeout: 요청 제한 시간 (초)
+            max_bytes: 읽을 최대 바이트 수 (넘는 부분은 버림)
+
+        Returns:
+            (상태 코드, 본문, 응답 헤더) (실패 시 None)
+        """
+        response = await self._send(url, params, headers, max_retries, retry_delay, timeout, max_bytes)
+        return response[:3] if response else None
+
+    async def resolve(self, url: str, max_retries: int = 2,
+                      timeout: float = REQUEST_TIMEOUT,
+                      max_bytes: int = MAX_RESPONSE_BYTES) -> Optional[Tuple[str, bytes]]:
+        """
+        리다이렉트를 따라간 최종 URL과 응답 본문 반환 (리다이렉트 URL 해석용)
+
+        Args:
+            url: 요청 URL
+            max_retries: 최대 시도 횟수
+            timeout: 요청 제한 시간 (초)
+            max_bytes: 읽을 최대 바이트 수 (넘는 부분은 버림)
+
+        Returns:
+            (최종 URL, 본문) (실패 시 None)
+        """
+        response = await self._send(url, None, None, max_retries, 1.0, timeout, max_bytes)
+        return (response[3], response[1]) if response else None
+
+    async def _send(self, url: str, params: Optional[Dict], headers: Optional[Dict], max_retries: int,
+                    retry_delay: float, timeout: float,
+                    max_bytes: int = MAX_RESPONSE_BYTES) -> Optional[Tuple[int, bytes, Mapping, str]]:
+        host = urlparse(url).hostname or ""
+        for attempt in range(max_retries):
+            status = None
+            async with self.scheduler.slot(host) as state:
+                started = time.monotonic()
+                retry_after = None
+                try:
+                    self.stats["requests"] += 1
+                    async with self.session.get(
+                        url, params=params, headers=headers,
+                        timeout=aiohttp.ClientTimeout(total=timeout, connect=min(CONNECT_TIMEOUT, timeout))
+                    ) as response:
+                        status = response.status
+                        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                        response.raise_for_status()
+                        data = await self._read_limited(response, url, max_bytes)
+                        response_headers = response.headers.copy()
+                        final_url = str(response.url)
+                    state.record(status, time.monotonic() - started, size=len(data))
+                    self.stats["bytes"] += len(data)
+                    return status, data, response_headers, final_url
+                except aiohttp.ClientResponseError as e:
+                    state.record(e.status, time.monotonic() - started, retry_after)
+                    # 4xx는 재시도해도 결과가 같으므로 중단 (408/429 제외)
+                    if 400 <= e.status < 500 and e.status not in RETRY_CLIENT_STATUSES:
+                        logger.warning(f"요청 실패 ({e.status}): {url}")
+                        break
+                    logger.warning(f"요청 실패 (시도 {attempt + 1}/{max_retries}): {url} - {e}")
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    state.record(None, time.monotonic() - started)
+                    logger.warning(f"요청 실패 (시도 {attempt + 1}/{max_retries}): {url} - {e!r}")
+
+            # 429/503은 스케줄러가 호스트를 Retry-After만큼 막으므로 따로 대기하지 않음
+            if attempt < max_retries - 1 and status not in THROTTLE_STATUSES:
+                await asyncio.sleep(backoff_delay(retry_delay, attempt))
+
+        self.stats["failures"] += 1
+        return None
+
+    async def _read_limited(self, response: aiohttp.ClientResponse, url: str, max_bytes: int) -> bytes:
+        """
+        응답 본문을 조각 단위로 읽다가 max_bytes를 넘으면 연결을 닫고 그때까지 읽은 부분만 반환
+        (gzip/br 응답은 aiohttp가 압축을 풀면서 넘겨주므로 압축 해제 후 크기 기준)
+        """
+        chunks = []
+        size = 0
+        async for chunk in response.content.iter_chunked(READ_CHUNK_SIZE):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > max_bytes:
+                self.stats["truncated"] += 1
+                logger.warning(f"응답이 너무 커서 {max_bytes}바이트에서 읽기 중단: {url}")
+                response.close()
+                return b"".join(chunks)[:max_bytes]
+        return b"".join(chunks)
+
+    def log_stats(self, top: int = 10):
+        """HTTP 통계와 요청이 많은 호스트의 현재 한도 로그 출력"""
+        logger.info(f"HTTP 통계: {self.stats}")
+        hosts = list(self.scheduler.snapshot().items())[:top]
+        if hosts:
+            logger.info("호스트별 요청 통계: " + ", ".join(f"{host} {stats}" for host, stats in hosts))
+
+    async def get_feed(self, url: str, **kwargs) -> feedparser.FeedParserDict:
+        """
+        RSS/Atom 피드를 가져와 파싱 (실패 시 항목이 없는 피드 반환)
+
+        검증값 저장소가 있으면 저장된 ETag/Last-Modified로 조건부 요청을 보내고,
+        304(변경 없음)이면 본문 없이 항목이 없는 피드를 반환 (status=304)
+
+        Args:
+            url: 피드 URL
+
+        Returns:
+            feedparser 파싱 결과
+        """
+        headers = None
+        if self.validators is not None:
+            if not self.validators.loaded:
+                await asyncio.to_thread(self.validators.load)
+            headers = self.validators.request_headers(url)
+
+        response = await self.request(url, headers=headers, **kwargs)
+        if response is None:
+            return feedparser.FeedParserDict(entries=[], bozo=1, bozo_exception="fetch failed")
+
+        status, data, response_headers = response
+        if status == 304 and self.validators is not None:
+            saved = self.validators.record_not_modified(url)
+            self.stats["not_modified"] += 1
+            self.stats["bytes_saved"] += saved
+            logger.info(f"피드 변경 없음 (304, {saved:,}바이트 절약): {url}")
+            return feedparser.FeedParserDict(entries=[], bozo=0, status=304)
+
+        if self.validators is not None:
+            self.validators.record_response(url, response_headers.get("ETag"),
+                                            response_headers.get("Last-Modified"), len(data))
+        return await asyncio.to_thread(feedparser.parse, data)
+
+
+def create_session() -> aiohttp.ClientSession:
+    """
+    수집용 공유 세션 생성 (호스트별 연결 풀과 keep-alive로 TCP/TLS 연결 재사용,
+    gzip/deflate 응답은 자동 해제, brotli 패키지가 설치되어 있으면 br도 요청)
+    """
+    connector = aiohttp.TCPConnector(limit=GLOBAL_LIMIT, limit_per_host=MAX_PER_HOST, ttl_dns_cache=300,
+                                     keepalive_timeout=KEEPALIVE_TIMEOUT)
+    return aiohttp.ClientSession(connector=connector, headers=HEADERS)
+
+
+@asynccontextmanager
+async def open_fetcher(conditional: bool = False):
+    """
+    수집 작업 전체에서 공유할 연결 풀과 Fetcher 생성
+
+    상주 이벤트 루프(SharedLoop) 위에서 실행 중이면 새로 만들지 않고 그 루프의 연결 풀을 재사용
+    (검증값 저장소는 공유하지 않고 호출마다 새로 만듦)
+
+    Args:
+        conditional: 피드를 ETag/Last-Modified 조건부 요청으로 가져올지 여부
+            (수집 결과 저장에 성공한 뒤에만 fetcher.validators.save()로 검증값을 기록해야 함,
+            저장이 실패했는데 기록하면 다음 수집이 304를 받아 저장하지 못한 항목을 다시 읽지 않음)
+    """
+    validators = FeedValidators() if conditional else None
+    shared = _shared_fetchers.get(asyncio.get_running_loop())
+    if shared is not None:
+        yield shared.with_validators(validators)
+        return
+
+    async with create_session() as session:
+        fetcher = Fetcher(session, validators)
+        try:
+            yield fetcher
+        finally:
+            fetcher.log_stats()
+
+
+# 상주 이벤트 루프별 공유 Fetcher (open_fetcher가 재사용)
+_shared_fetchers: Dict[asyncio.AbstractEventLoop, Fetcher] = {}
+_shared_loop = None
+
+
+class SharedLoop:
+    """
+    상주 프로세스(스케줄러 데몬)용 이벤트 루프 스레드
+
+    루프와 연결 풀(Fetcher)을 프로세스 수명 동안 유지하여 실행마다 세션 생성,
+    DNS 조회, TLS 연결을 반복하지 않도록 함. install() 후에는 run()이 이 루프로 코루틴을 보냄
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="shared-loop", daemon=True)
+        self.thread.start()
+        self.fetcher: Optional[Fetcher] = None
+        self._session = self.submit(self._open_session())
+
+    async def _open_session(self):
+        session = create_session()
+        self.fetcher = Fetcher(session)
+        _shared_fetchers[self.loop] = self.fetcher
+        return session
+
+    def submit(self, coro):
+        """코루틴을 상주 루프에서 실행하고 결과를 기다림 (다른 스레드에서 호출)"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def install(self):
+        """이 프로세스의 run()이 상주 루프를 사용하도록 등록"""
+        global _shared_loop
+        _shared_loop = self
+        return self
+
+    def close(self):
+        """등록 해제 후 연결 풀과 루프 종료"""
+        global _shared_loop
+        if _shared_loop is self:
+            _shared_loop = None
+        _shared_fetchers.pop(self.loop, None)
+        if self.fetcher:
+            self.fetcher.log_stats()
+        self.submit(self._session.close())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+
+def run(coro):
+    """
+    동기 코드에서 코루틴을 실행하고 결과 반환 (collect_* 동기 진입점용)
+
+    상주 루프가 등록되어 있으면 그 루프에서 실행하고,
+    호출 스레드에 이미 실행 중인 이벤트 루프가 있으면 별도 스레드에서 실행
+    """
+    shared = _shared_loop
+    if shared is not None:
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is not shared.loop:
+            return shared.submit(coro)
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+async def _call_with_fetcher(func, *args, **kwargs):
+    async with open_fetcher() as fetcher:
+        return await func(fetcher, *args, **kwargs)
+
+
+def run_with_fetcher(func, *args, **kwargs):
+    """
+    새 Fetcher를 열어 async 함수 func(fetcher, *args, **kwargs)를 동기적으로 실행
+
+    Args:
+        func: 첫 번째 인자로 Fetcher를 받는 async 함수
+
+    Returns:
+        func의 반환값
+    """
+    return run(_call_with_fetcher(func, *args, **kwargs))
+
+
+def threadsafe_callback(callback):
+    """
+    워커 스레드에서 호출되어도 이벤트 루프 스레드에서 실행되도록 콜백을 감쌈
+    (Streamlit 진행도 콜백은 스크립트 스레드에서 호출되어야 함)
+
+    Args:
+        callback: 원래 콜백 (None 가능)
+
+    Returns:
+        감싼 콜백 (callback이 None이면 None)
+    """
+    if callback is None:
+        return None
+    loop = asyncio.get_running_loop()
+
+    def wrapper(*args):
+        loop.call_soon_threadsafe(callback, *args)
+
+    return wrapper
@@ -0,0 +1,183 @@
+"""
+화면 데이터 캐시 모듈
+Streamlit 재실행마다 반복되는 조회를 st.cache_data로 메모리에 보관하고,
+테이블별 데이터 버전(data_versions)을 캐시 키에 포함하여 저장/삭제 즉시 새로 조회
+"""
+
+import os
+import logging
+from typing import Dict, List, Tuple
+
+import streamlit as st
+
+from modules.database import db_connection, get_data_versions, init_database
+from modules.jobs import recover_interrupted_jobs
+from modules.keywords import get_keyword_options, get_top_keywords
+from modules.queries import (
+    DAILY_COUNTS, ECONOMY_SOURCES, GENERATED_CONTENTS, RECENT_ITEM_COLUMNS, TODAY_ITEMS, recent_items_query
+)
+from modules import dashboard_utils
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 버전이 바뀌지 않아도 이 시간(초)이 지나면 다시 조회 (날짜 경계, 외부 변경 대비)
+CACHE_TTL = int(os.getenv("UI_CACHE_TTL", "600"))
+
+
+@st.cache_resource(show_spinner=False)
+def ensure_database() -> bool:
+    """서버 프로세스당 한 번만 데이터베이스 디렉토리/테이블 초기화 (실패하면 다음 실행에서 재시도)"""
+    init_database()
+    # 재시작 전에 끊긴 작업이 수집 버튼을 막지 않도록 정리
+    recover_interrupted_jobs()
+    return True
+
+
+def data_version(*tables: str) -> Tuple[int, ...]:
+    """
+    캐시 키로 쓸 테이블별 데이터 버전 (매 재실행마다 기본 키 조회 한 번)
+
+    Args:
+        tables: 조회에 쓰이는 테이블 이름
+
+    Returns:
+        테이블 순서대로의 버전 튜플
+    """
+    try:
+        versions = get_data_versions()
+    except Exception as e:
+        logger.error(f"데이터 버전 조회 실패: {e}")
+        return (-1,) * len(tables)
+    return tuple(versions.get(table, 0) for table in tables)
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _dashboard_snapshot(today: str, start_date: str, version: Tuple[int, ...]) -> Dict:
+    with db_connection() as conn:
+        cursor = conn.cursor()
+
+        # 오늘 수집된 뉴스/논문
+        cursor.execute(TODAY_ITEMS["articles"], (today,))
+        today_news = cursor.fetchall()
+
+        cursor.execute(TODAY_ITEMS["papers"], (today,))
+        today_papers = cursor.fetchall()
+
+        # 날짜별 뉴스/논문 개수 (일별 집계 테이블)
+        cursor.execute(DAILY_COUNTS, (start_date,))
+        news_trend, paper_trend = {}, {}
+        for item_type, date, count in cursor.fetchall():
+            (news_trend if item_type == "articles" else paper_trend)[date] = count
+
+        # 뉴스 + 논문 키워드 빈도 상위 10개
+        top_keywords = get_top_keywords(conn, ["articles", "papers"], start_date, limit=10)
+
+    return {
+        "today_news": today_news,
+        "today_papers": today_papers,
+        "news_trend": news_trend,
+        "paper_trend": paper_trend,
+        "top_keywords": top_keywords,
+    }
+
+
+def get_dashboard_snapshot(today: str, start_date: str) -> Dict:
+    """
+    통합 대시보드 데이터 (오늘의 뉴스/논문, 날짜별 개수, 상위 키워드)
+
+    Args:
+        today: 오늘 날짜 (YYYY-MM-DD)
+        start_date: 추이 시작 날짜 (YYYY-MM-DD)
+
+    Returns:
+        {"today_news", "today_papers", "news_trend", "paper_trend", "top_keywords"}
+    """
+    return _dashboard_snapshot(today, start_date, data_version("articles", "papers"))
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _keyword_options(item_type: str, version: Tuple[int, ...]) -> List[str]:
+    with db_connection() as conn:
+        return get_keyword_options(conn, item_type)
+
+
+def get_cached_keyword_options(item_type: str) -> List[str]:
+    """키워드 필터 선택지 (articles/papers/economy_news)"""
+    return _keyword_options(item_type, data_version(item_type))
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _economy_sources(version: Tuple[int, ...]) -> List[str]:
+    with db_connection() as conn:
+        rows = conn.execute(ECONOMY_SOURCES).fetchall()
+    return sorted(row[0] for row in rows if row[0])
+
+
+def get_economy_sources() -> List[str]:
+    """경제 뉴스 출처 필터 선택지"""
+    return _economy_sources(data_version("economy_news"))
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _recent_items(table: str, limit: int, version: Tuple[int, ...]) -> List[Tuple]:
+    with db_connection() as conn:
+        return conn.execute(recent_items_query(table), (limit,)).fetchall()
+
+
+def get_recent_items(table: str, limit: int = 20) -> List[Tuple]:
+    """
+    최근 수집 항목 (팩토리 선택 목록)
+
+    Args:
+        table: RECENT_ITEM_COLUMNS 중 하나
+        limit: 최대 개수
+
+    Returns:
+        [(id, title, 요약 또는 초록), ...]
+    """
+    if table not in RECENT_ITEM_COLUMNS:
+        raise ValueError(f"지원하지 않는 테이블: {table}")
+    return _recent_items(table, limit, data_version(table))
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _generated_contents(version: Tuple[int, ...]) -> List[Tuple]:
+    with db_connection() as conn:
+        return conn.execute(GENERATED_CONTENTS).fetchall()
+
+
+def get_generated_contents() -> List[Tuple]:
+    """저장된 생성 콘텐츠 목록 (최신순)"""
+    return _generated_contents(data_version("generated_content"))
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _economy_overview(categories: Tuple[str, ...], days: int, version: Tuple[int, ...]) -> Dict[str, Dict]:
+    return dashboard_utils.get_economy_overview(list(categories), days)
+
+
+def get_economy_overview(categories: List[str], days: int = 7) -> Dict[str, Dict]:
+    """dashboard_utils.get_economy_overview 캐시 버전"""
+    return _economy_overview(tuple(categories), days, data_version("economy_news"))
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _top_issues(category: str, limit: int, version: Tuple[int, ...]) -> List[Dict]:
+    return dashboard_utils.get_top_issues(category, limit)
+
+
+def get_top_issues(category: str = None, limit: int = 5) -> List[Dict]:
+    """dashboard_utils.get_top_issues 캐시 버전"""
+    return _top_issues(category, limit, data_version("economy_news"))
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _paper_trend_data(days: int, version: Tuple[int, ...]) -> Dict[str, List[Tuple[str, int]]]:
+    return dashboard_utils.get_paper_trend_data(days)
+
+
+def get_paper_trend_data(days: int = 30) -> Dict[str, List[Tuple[str, int]]]:
+    """dashboard_utils.get_paper_trend_data 캐시 버전"""
+    return _paper_trend_data(days, data_version("papers"))
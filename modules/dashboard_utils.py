@@ -3,16 +3,141 @@
 트렌드 분석, 통계 계산 등 대시보드에 필요한 함수들
 """
 
-import json
 from datetime import datetime, timedelta
-from typing import List, Dict, Tuple
-from collections import Counter
-from modules.database import get_connection
+from typing import List, Dict, Optional, Tuple
+from modules.database import db_connection
+from modules.keywords import get_keyword_trends
+from modules.queries import CATEGORY_KEYWORDS, category_counts_query, top_issues_query
+
+# 경제 대시보드 카테고리 (표시 순서)
+ECONOMY_CATEGORIES = ["거시경제", "산업분석", "글로벌시황"]
+
+
+def date_range(days: int, end: Optional[datetime] = None) -> List[str]:
+    """
+    end(기본 오늘)까지 최근 days일 날짜 목록
+    
+    Args:
+        days: 일수
+        end: 마지막 날짜
+    
+    Returns:
+        ["YYYY-MM-DD", ...] (오래된 날짜부터)
+    """
+    end = end or datetime.now()
+    return [(end - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(days - 1, -1, -1)]
+
+
+def zero_fill(counts: Dict[str, int], dates: List[str]) -> List[Tuple[str, int]]:
+    """날짜별 개수를 dates 순서로 펼치고 빠진 날짜는 0으로 채움"""
+    return [(date, counts.get(date, 0)) for date in dates]
+
+
+def aggregate_category_counts(conn, table: str, start_date: str, end_date: str,
+                              group_column: str = "category") -> Dict[str, Dict[Optional[str], int]]:
+    """
+    (그룹, 날짜)별 개수를 일별 집계(daily_stats)에서 GROUP BY 한 번으로 조회
+    
+    원본 행이 아니라 (날짜, 카테고리, 국가)당 한 행만 읽으므로 비용은 일수에 비례하고,
+    start_date 이전 날짜는 None 버킷 하나로 합산하므로 "이전 전체" 비교에 추가 쿼리가 필요 없음
+    
+    Args:
+        conn: 데이터베이스 연결
+        table: 집계할 테이블 (daily_stats.item_type)
+        start_date: 날짜별로 나눌 시작 날짜 (포함)
+        end_date: 마지막 날짜 (포함)
+        group_column: 그룹 컬럼 ("category" 또는 "country")
+    
+    Returns:
+        {그룹: {날짜 또는 None: 개수}}
+    """
+    rows = conn.execute(category_counts_query(group_column), (table, end_date))
+    counts: Dict[str, Dict[Optional[str], int]] = {}
+    for group, date, count in rows:
+        day = date if date >= start_date else None
+        by_date = counts.setdefault(group, {})
+        by_date[day] = by_date.get(day, 0) + count
+    return counts
+
+
+def aggregate_category_keywords(conn, start_date: str, end_date: str, top_n: int = 3) -> Dict[str, List[str]]:
+    """
+    경제 뉴스 카테고리별 상위 키워드를 일별 키워드 집계(daily_keyword_stats)에서 한 번에 조회
+    
+    Args:
+        conn: 데이터베이스 연결
+        start_date: 시작 날짜 (포함)
+        end_date: 마지막 날짜 (포함)
+        top_n: 카테고리별 최대 개수
+    
+    Returns:
+        {카테고리: [키워드, ...]} (빈도 순)
+    """
+    rows = conn.execute(CATEGORY_KEYWORDS, (start_date, end_date, top_n))
+    keywords: Dict[str, List[str]] = {}
+    for category, name in rows:
+        keywords.setdefault(category, []).append(name)
+    return keywords
+
+
+def _trend_label(recent_count: int, old_count: int) -> str:
+    """최근 건수와 이전 건수 비교 문구"""
+    if old_count > 0:
+        trend_diff = recent_count - old_count
+        if trend_diff > 0:
+            return f"📈 +{trend_diff}건"
+        elif trend_diff < 0:
+            return f"📉 {trend_diff}건"
+        return "➡️ 동일"
+    return "📊 신규"
+
+
+def get_economy_overview(categories: List[str] = None, days: int = 7, top_n: int = 3) -> Dict[str, Dict]:
+    """
+    경제 대시보드 카테고리별 요약 + 날짜별 추이 (쿼리 2개로 전체 카테고리 계산)
+    
+    Args:
+        categories: 카테고리 목록 (None이면 ECONOMY_CATEGORIES)
+        days: 조회할 일수
+        top_n: 카테고리별 주요 키워드 수
+    
+    Returns:
+        {카테고리: {"count": int, "keywords": List[str], "trend": str, "trend_data": [(날짜, 개수), ...]}}
+    """
+    categories = categories or ECONOMY_CATEGORIES
+    now = datetime.now()
+    end_date = now.strftime("%Y-%m-%d")
+    start_date = (now - timedelta(days=days)).strftime("%Y-%m-%d")
+    # 전일 대비 비교 (최근 3일 vs 그 이전 전체)
+    three_days_ago = (now - timedelta(days=3)).strftime("%Y-%m-%d")
+    window_start = min(start_date, three_days_ago)
+    trend_dates = date_range(days, now)
+    
+    try:
+        with db_connection() as conn:
+            counts = aggregate_category_counts(conn, "economy_news", window_start, end_date)
+            keywords = aggregate_category_keywords(conn, start_date, end_date, top_n)
+    except Exception as e:
+        return {}
+    
+    overview = {}
+    for category in categories:
+        by_date = counts.get(category, {})
+        dated = {day: count for day, count in by_date.items() if day is not None}
+        recent_count = sum(count for day, count in dated.items() if day >= three_days_ago)
+        old_count = by_date.get(None, 0) + sum(count for day, count in dated.items() if day < three_days_ago)
+        overview[category] = {
+            "count": sum(count for day, count in dated.items() if day >= start_date),
+            "keywords": keywords.get(category, []),
+            "trend": _trend_label(recent_count, old_count),
+            "trend_data": zero_fill(dated, trend_dates),
+        }
+    return overview
 
 
 def get_category_summary(category: str, days: int = 7) -> Dict:
     """
-    카테고리별 요약 정보 계산
+    카테고리별 요약 정보 계산 (여러 카테고리를 표시할 때는 get_economy_overview 한 번 호출 권장)
     
     Args:
         category: 카테고리명
@@ -21,73 +146,10 @@ def get_category_summary(category: str, days: int = 7) -> Dict:
     Returns:
         {"count": int, "keywords": List[str], "trend": str}
     """
-    try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        end_date = datetime.now().strftime("%Y-%m-%d")
-        start_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
-        
-        # 해당 카테고리 뉴스 개수
-        cursor.execute("""
-            SELECT COUNT(*) FROM economy_news
-            WHERE category = ? AND date BETWEEN ? AND ?
-        """, (category, start_date, end_date))
-        count = cursor.fetchone()[0]
-        
-        # 전일 대비 비교 (최근 3일)
-        three_days_ago = (datetime.now() - timedelta(days=3)).strftime("%Y-%m-%d")
-        cursor.execute("""
-            SELECT COUNT(*) FROM economy_news
-            WHERE category = ? AND date BETWEEN ? AND ?
-        """, (category, three_days_ago, end_date))
-        recent_count = cursor.fetchone()[0]
-        
-        cursor.execute("""
-            SELECT COUNT(*) FROM economy_news
-            WHERE category = ? AND date < ?
-        """, (category, three_days_ago))
-        old_count = cursor.fetchone()[0]
-        
-        # 트렌드 계산
-        if old_count > 0:
-            trend_diff = recent_count - old_count
-            if trend_diff > 0:
-                trend = f"📈 +{trend_diff}건"
-            elif trend_diff < 0:
-                trend = f"📉 {trend_diff}건"
-            else:
-                trend = "➡️ 동일"
-        else:
-            trend = "📊 신규"
-        
-        # 주요 키워드 추출
-        cursor.execute("""
-            SELECT keywords FROM economy_news
-            WHERE category = ? AND date BETWEEN ? AND ? AND keywords IS NOT NULL
-        """, (category, start_date, end_date))
-        
-        all_keywords = []
-        for row in cursor.fetchall():
-            try:
-                keywords = json.loads(row[0]) if row[0] else []
-                all_keywords.extend(keywords)
-            except:
-                pass
-        
-        # 키워드 빈도수 계산
-        keyword_counter = Counter(all_keywords)
-        top_keywords = [kw for kw, _ in keyword_counter.most_common(3)]
-        
-        conn.close()
-        
-        return {
-            "count": count,
-            "keywords": top_keywords,
-            "trend": trend
-        }
-    except Exception as e:
+    summary = get_economy_overview([category], days).get(category)
+    if summary is None:
         return {"count": 0, "keywords": [], "trend": "❌ 오류"}
+    return {"count": summary["count"], "keywords": summary["keywords"], "trend": summary["trend"]}
 
 
 def get_trend_data(category: str, days: int = 7) -> List[Tuple[str, int]]:
@@ -99,28 +161,10 @@ def get_trend_data(category: str, days: int = 7) -> List[Tuple[str, int]]:
         days: 조회할 일수
     
     Returns:
-        [(날짜, 개수), ...] 리스트
+        [(날짜, 개수), ...] 리스트 (오래된 날짜부터)
     """
-    try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        end_date = datetime.now()
-        trend_data = []
-        
-        for i in range(days):
-            date = (end_date - timedelta(days=i)).strftime("%Y-%m-%d")
-            cursor.execute("""
-                SELECT COUNT(*) FROM economy_news
-                WHERE category = ? AND date = ?
-            """, (category, date))
-            count = cursor.fetchone()[0]
-            trend_data.append((date, count))
-        
-        conn.close()
-        return list(reversed(trend_data))  # 오래된 날짜부터
-    except Exception as e:
-        return []
+    summary = get_economy_overview([category], days).get(category)
+    return summary["trend_data"] if summary else []
 
 
 def get_top_issues(category: str = None, limit: int = 5) -> List[Dict]:
@@ -135,53 +179,18 @@ def get_top_issues(category: str = None, limit: int = 5) -> List[Dict]:
         [{"title": str, "url": str, "date": str, "keyword_count": int}, ...]
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        end_date = datetime.now().strftime("%Y-%m-%d")
-        start_date = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
-        
-        if category:
-            cursor.execute("""
-                SELECT title, url, date, keywords FROM economy_news
-                WHERE category = ? AND date BETWEEN ? AND ?
-                ORDER BY created_at DESC
-            """, (category, start_date, end_date))
-        else:
-            cursor.execute("""
-                SELECT title, url, date, keywords FROM economy_news
-                WHERE date BETWEEN ? AND ?
-                ORDER BY created_at DESC
-            """, (start_date, end_date))
-        
-        all_news = cursor.fetchall()
-        
-        # 키워드 빈도수 기반으로 중요도 계산
-        scored_news = []
-        for title, url, date, keywords_json in all_news:
-            try:
-                keywords = json.loads(keywords_json) if keywords_json else []
-                # 제목에 포함된 키워드 수로 중요도 계산
-                keyword_count = len(keywords)
-                # 제목 길이도 고려 (너무 짧거나 길면 감점)
-                title_score = 1.0 if 20 <= len(title) <= 100 else 0.8
-                score = keyword_count * title_score
-                
-                scored_news.append({
-                    "title": title,
-                    "url": url,
-                    "date": date,
-                    "keyword_count": keyword_count,
-                    "score": score
-                })
-            except:
-                pass
-        
-        # 점수 순으로 정렬
-        scored_news.sort(key=lambda x: x["score"], reverse=True)
-        
-        conn.close()
-        return scored_news[:limit]
+        with db_connection() as conn:
+            end_date = datetime.now().strftime("%Y-%m-%d")
+            start_date = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
+            
+            # 키워드 수 x 제목 길이 가중치(너무 짧거나 길면 감점)로 점수 계산 후 상위 limit개만 조회
+            params = [start_date, end_date] + ([category] if category else []) + [limit]
+            rows = conn.execute(top_issues_query(bool(category)), params).fetchall()
+        
+        return [
+            {"title": title, "url": url, "date": date, "keyword_count": keyword_count, "score": score}
+            for title, url, date, keyword_count, score in rows
+        ]
     except Exception as e:
         return []
 
@@ -197,41 +206,9 @@ def get_news_trend_data(days: int = 7) -> Dict[str, List[Tuple[str, int]]]:
         {"키워드": [(날짜, 개수), ...], ...}
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        end_date = datetime.now()
-        start_date = (end_date - timedelta(days=days)).strftime("%Y-%m-%d")
-        
-        # 모든 키워드 수집
-        cursor.execute("""
-            SELECT keywords, date FROM articles
-            WHERE date >= ? AND keywords IS NOT NULL
-        """, (start_date,))
-        
-        keyword_dates = {}
-        for keywords_json, date in cursor.fetchall():
-            try:
-                keywords = json.loads(keywords_json) if keywords_json else []
-                for keyword in keywords:
-                    if keyword not in keyword_dates:
-                        keyword_dates[keyword] = []
-                    keyword_dates[keyword].append(date)
-            except:
-                pass
-        
-        # 날짜별로 그룹화
-        trend_data = {}
-        for keyword, dates in keyword_dates.items():
-            date_counter = Counter(dates)
-            trend_list = []
-            for i in range(days):
-                check_date = (end_date - timedelta(days=i)).strftime("%Y-%m-%d")
-                count = date_counter.get(check_date, 0)
-                trend_list.append((check_date, count))
-            trend_data[keyword] = list(reversed(trend_list))
+        with db_connection() as conn:
+            trend_data = get_keyword_trends(conn, "articles", days)
         
-        conn.close()
         return trend_data
     except Exception as e:
         return {}
@@ -248,41 +225,9 @@ def get_paper_trend_data(days: int = 30) -> Dict[str, List[Tuple[str, int]]]:
         {"키워드": [(날짜, 개수), ...], ...}
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        end_date = datetime.now()
-        start_date = (end_date - timedelta(days=days)).strftime("%Y-%m-%d")
-        
-        # 모든 키워드 수집
-        cursor.execute("""
-            SELECT keywords, date FROM papers
-            WHERE date >= ? AND keywords IS NOT NULL
-        """, (start_date,))
-        
-        keyword_dates = {}
-        for keywords_json, date in cursor.fetchall():
-            try:
-                keywords = json.loads(keywords_json) if keywords_json else []
-                for keyword in keywords:
-                    if keyword not in keyword_dates:
-                        keyword_dates[keyword] = []
-                    keyword_dates[keyword].append(date)
-            except:
-                pass
-        
-        # 날짜별로 그룹화
-        trend_data = {}
-        for keyword, dates in keyword_dates.items():
-            date_counter = Counter(dates)
-            trend_list = []
-            for i in range(days):
-                check_date = (end_date - timedelta(days=i)).strftime("%Y-%m-%d")
-                count = date_counter.get(check_date, 0)
-                trend_list.append((check_date, count))
-            trend_data[keyword] = list(reversed(trend_list))
+        with db_connection() as conn:
+            trend_data = get_keyword_trends(conn, "papers", days)
         
-        conn.close()
         return trend_data
     except Exception as e:
         return {}
@@ -5,12 +5,25 @@ SQLite 데이터베이스 초기화 및 관리
 
 import sqlite3
 import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Dict, Iterable, List, Set
 
 # 데이터베이스 파일 경로
 DB_DIR = Path("data")
 DB_FILE = DB_DIR / "psyinsight.db"
 
+# 연결 설정 (잠금 대기 시간, 페이지 캐시, 메모리 맵 크기)
+BUSY_TIMEOUT_MS = int(os.getenv("DB_BUSY_TIMEOUT_MS", "30000"))
+CACHE_SIZE_KB = int(os.getenv("DB_CACHE_SIZE_KB", "20000"))
+MMAP_SIZE = int(os.getenv("DB_MMAP_SIZE", str(256 * 1024 * 1024)))
+
+# 스레드별 연결 풀 (같은 스레드에서는 연결 하나를 재사용)
+_local = threading.local()
+_schema_lock = threading.Lock()
+_schema_ready = False
+
 
 def init_database():
     """데이터베이스 디렉토리 및 파일 초기화"""
@@ -18,34 +31,159 @@ def init_database():
     DB_DIR.mkdir(exist_ok=True)
     
     # 데이터베이스 연결 및 테이블 생성
-    conn = get_connection()
-    create_tables(conn)
-    conn.close()
+    with db_connection() as conn:
+        create_tables(conn)
     print(f"데이터베이스 초기화 완료: {DB_FILE}")
 
 
-def get_connection():
-    """데이터베이스 연결 반환 (디렉토리 및 테이블 자동 생성)"""
+def _open_connection() -> sqlite3.Connection:
+    """새 연결을 열고 WAL 모드 및 성능 관련 PRAGMA 적용"""
     # 디렉토리가 없으면 생성
     DB_DIR.mkdir(exist_ok=True)
     
-    # 데이터베이스 연결
-    conn = sqlite3.connect(DB_FILE)
-    
-    # 테이블이 없으면 생성 (최초 실행 시)
-    try:
+    conn = sqlite3.connect(DB_FILE, timeout=BUSY_TIMEOUT_MS / 1000)
+    conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+    # WAL: 읽기와 쓰기가 서로 막지 않고, 커밋 시 fsync 횟수 감소
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(f"PRAGMA cache_size=-{CACHE_SIZE_KB}")
+    conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    return conn
+
+
+def _ensure_schema(conn: sqlite3.Connection):
+    """프로세스당 한 번만 테이블 존재 여부 확인 (없으면 생성) 및 마이그레이션 적용"""
+    global _schema_ready
+    if _schema_ready:
+        return
+    with _schema_lock:
+        if _schema_ready:
+            return
+        # 테이블이 없으면 생성 (최초 실행 시)
         cursor = conn.cursor()
         cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='articles'")
         if cursor.fetchone() is None:
-            # 테이블이 없으면 생성
             create_tables(conn)
-    except:
-        # 오류 발생 시에도 테이블 생성 시도
-        create_tables(conn)
+        migrate(conn)
+        _schema_ready = True
+
+
+def get_connection() -> sqlite3.Connection:
+    """
+    현재 스레드의 풀 연결 반환 (디렉토리 및 테이블 자동 생성)
+    
+    연결은 스레드 안에서 재사용되므로 close()하지 말고 db_connection()을 사용할 것
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        try:
+            conn.execute("SELECT 1")
+            return conn
+        except sqlite3.ProgrammingError:
+            # 외부에서 닫힌 연결은 새로 연다
+            conn = None
     
+    conn = _open_connection()
+    _ensure_schema(conn)
+    _local.conn = conn
+    _local.depth = 0
     return conn
 
 
+@contextmanager
+def db_connection():
+    """
+    풀 연결을 빌려 쓰는 컨텍스트 매니저
+    
+    블록이 정상 종료되면 커밋, 예외가 발생하면 롤백하고 예외를 다시 발생시킴.
+    중첩해서 사용하면 가장 바깥 블록에서만 커밋/롤백함
+    
+    사용 예:
+        with db_connection() as conn:
+            conn.execute("INSERT INTO ...")
+    """
+    conn = get_connection()
+    _local.depth += 1
+    try:
+        yield conn
+    except BaseException:
+        if _local.depth == 1:
+            conn.rollback()
+        raise
+    else:
+        if _local.depth == 1:
+            conn.commit()
+    finally:
+        _local.depth -= 1
+
+
+def close_connection():
+    """현재 스레드의 풀 연결 닫기"""
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        conn.close()
+        _local.conn = None
+
+
+# URL 중복 체크 대상 테이블 (테이블 이름은 SQL에 직접 들어가므로 화이트리스트로 제한)
+URL_TABLES = ("articles", "papers", "economy_news")
+
+# IN 절 하나에 넣을 최대 파라미터 수 (SQLite 기본 제한 999보다 작게)
+URL_CHUNK_SIZE = 500
+
+
+def find_existing_urls(table: str, urls: Iterable[str]) -> Set[str]:
+    """
+    이미 저장된 URL 집합 조회 (청크 단위 IN 쿼리, url UNIQUE 인덱스 사용)
+    
+    Args:
+        table: URL_TABLES 중 하나
+        urls: 확인할 URL 목록
+    
+    Returns:
+        DB에 이미 존재하는 URL 집합
+    """
+    if table not in URL_TABLES:
+        raise ValueError(f"URL 중복 체크를 지원하지 않는 테이블: {table}")
+    
+    urls = list({url for url in urls if url})
+    existing = set()
+    with db_connection() as conn:
+        for start in range(0, len(urls), URL_CHUNK_SIZE):
+            chunk = urls[start:start + URL_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(f"SELECT url FROM {table} WHERE url IN ({placeholders})", chunk)
+            existing.update(row[0] for row in rows)
+    return existing
+
+
+def filter_new_items(table: str, items: List[Dict], url_key: str = "url") -> List[Dict]:
+    """
+    수집 배치에서 중복 항목 제거 (배치 내부 중복 + DB에 이미 있는 URL)
+    
+    Args:
+        table: URL_TABLES 중 하나
+        items: 수집된 항목 리스트
+        url_key: URL이 들어 있는 키
+    
+    Returns:
+        새 URL을 가진 항목만 (처음 등장한 순서 유지)
+    """
+    existing = find_existing_urls(table, (item.get(url_key, "") for item in items))
+    
+    new_items = []
+    seen = set()
+    for item in items:
+        url = item.get(url_key, "")
+        if url in existing or url in seen:
+            continue
+        if url:
+            seen.add(url)
+        new_items.append(item)
+    return new_items
+
+
 def create_tables(conn):
     """필요한 테이블 생성"""
     cursor = conn.cursor()
@@ -145,8 +283,658 @@ def create_tables(conn):
     
     conn.commit()
     print("테이블 생성 완료")
+    
+    migrate(conn)
+
+
+# 전문 검색(FTS5) 대상: 테이블 -> (색인 컬럼, bm25 컬럼 가중치)
+# trigram 토크나이저는 공백 없이 붙는 한국어 조사/어미와 관계없이 3글자 이상 부분 문자열을 찾음
+FTS_TABLES = {
+    "articles": (("title", "content_summary", "full_text", "keywords"), (10.0, 4.0, 1.0, 6.0)),
+    "papers": (("title", "authors", "abstract", "summary", "keywords"), (10.0, 3.0, 2.0, 4.0, 6.0)),
+    "economy_news": (("title", "content_summary", "full_text", "keywords"), (10.0, 4.0, 1.0, 6.0)),
+}
+
+# trigram 토크나이저 최소 SQLite 버전
+FTS_MIN_SQLITE_VERSION = (3, 34, 0)
+
+# 단어 색인: trigram으로 찾을 수 없는 2글자 검색어(우울, 금리 등)를 단어 접두사로 찾는 unicode61 색인
+# (테이블 이름 접미사, FTS5 옵션)
+FTS_WORD_SUFFIX = "words"
+FTS_WORD_OPTIONS = "tokenize='unicode61 remove_diacritics 2', prefix='1 2'"
+
+
+def _create_fts_index(conn: sqlite3.Connection, table: str, fts: str, options: str):
+    """원본 테이블을 content로 참조하는 FTS5 테이블 하나와 동기화 트리거를 만들고 기존 행을 색인"""
+    columns, weights = FTS_TABLES[table]
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    conn.execute(f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+            {column_list}, content='{table}', content_rowid='id', {options}
+        )
+    """)
+    
+    # 원본 테이블 변경 시 색인 동기화 (is_saved 등 색인 외 컬럼 변경은 무시)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN
+            INSERT INTO {fts} (rowid, {column_list}) VALUES (new.id, {new_values});
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN
+            INSERT INTO {fts} ({fts}, rowid, {column_list}) VALUES ('delete', old.id, {old_values});
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {column_list} ON {table} BEGIN
+            INSERT INTO {fts} ({fts}, rowid, {column_list}) VALUES ('delete', old.id, {old_values});
+            INSERT INTO {fts} (rowid, {column_list}) VALUES (new.id, {new_values});
+        END
+    """)
+    
+    # rank 컬럼이 가중치를 적용한 bm25를 쓰도록 설정 (제목 일치를 본문 일치보다 우선)
+    conn.execute(f"INSERT INTO {fts} ({fts}, rank) VALUES ('rank', ?)",
+                 (f"bm25({', '.join(str(weight) for weight in weights)})",))
+    conn.execute(f"INSERT INTO {fts} ({fts}) VALUES ('rebuild')")
+
+
+def create_fts_tables(conn: sqlite3.Connection) -> bool:
+    """
+    원본 테이블을 content로 참조하는 FTS5 trigram 테이블과 동기화 트리거를 만들고 기존 행을 색인
+    
+    Args:
+        conn: 데이터베이스 연결
+    
+    Returns:
+        생성 여부 (SQLite가 FTS5 trigram을 지원하지 않으면 False, 검색은 LIKE로 동작)
+    """
+    if sqlite3.sqlite_version_info < FTS_MIN_SQLITE_VERSION:
+        print(f"⚠️ SQLite {sqlite3.sqlite_version}는 FTS5 trigram을 지원하지 않아 전문 검색 인덱스를 건너뜁니다.")
+        return False
+    
+    for table in FTS_TABLES:
+        try:
+            _create_fts_index(conn, table, f"{table}_fts", "tokenize='trigram'")
+        except sqlite3.OperationalError as e:
+            print(f"⚠️ FTS5 사용 불가, 전문 검색 인덱스를 건너뜁니다: {e}")
+            return False
+    return True
+
+
+def create_word_fts_tables(conn: sqlite3.Connection) -> bool:
+    """
+    짧은 검색어용 FTS5 단어(unicode61) 테이블과 동기화 트리거를 만들고 기존 행을 색인
+    
+    Args:
+        conn: 데이터베이스 연결
+    
+    Returns:
+        생성 여부 (FTS5를 쓸 수 없으면 False, 짧은 검색어는 LIKE로 동작)
+    """
+    for table in FTS_TABLES:
+        try:
+            _create_fts_index(conn, table, f"{table}_{FTS_WORD_SUFFIX}", FTS_WORD_OPTIONS)
+        except sqlite3.OperationalError as e:
+            print(f"⚠️ FTS5 사용 불가, 단어 검색 인덱스를 건너뜁니다: {e}")
+            return False
+    return True
+
+
+def rebuild_fts_tables(conn: sqlite3.Connection) -> bool:
+    """FTS5 테이블(trigram, 단어)이 없으면 만들고 원본 테이블 기준으로 전체 재색인"""
+    created = create_fts_tables(conn)
+    created = create_word_fts_tables(conn) and created
+    conn.commit()
+    return created
+
+
+# 정규화된 키워드 대상 테이블 (item_keywords.item_type 값으로 테이블 이름 사용)
+KEYWORD_TABLES = URL_TABLES
+
+
+def _keyword_values_sql(column: str) -> str:
+    """JSON 문자열 키워드 컬럼을 펼치는 json_each 식 (잘못된 JSON/NULL은 빈 배열로 취급)"""
+    return f"json_each(CASE WHEN json_valid({column}) THEN {column} ELSE '[]' END)"
+
+
+def create_keyword_tables(conn: sqlite3.Connection):
+    """
+    keywords 사전 테이블과 item_keywords 연결 테이블 생성, 동기화 트리거 생성 및 기존 행 백필
+    
+    원본 테이블의 keywords(JSON 문자열) 컬럼은 그대로 두고, 트리거가 같은 트랜잭션에서
+    item_keywords를 갱신하므로 수집기/쓰기 스레드 코드는 바꿀 필요 없음
+    
+    Args:
+        conn: 데이터베이스 연결
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS keywords (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS item_keywords (
+            item_type TEXT NOT NULL,
+            item_id INTEGER NOT NULL,
+            keyword_id INTEGER NOT NULL REFERENCES keywords (id),
+            date DATE NOT NULL,
+            PRIMARY KEY (item_type, item_id, keyword_id)
+        ) WITHOUT ROWID
+    """)
+    # 키워드 필터 (키워드 -> 항목), 기간별 키워드 집계 (날짜 -> 키워드)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_item_keywords_keyword ON item_keywords (item_type, keyword_id, date)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_item_keywords_date ON item_keywords (item_type, date, keyword_id)")
+    
+    for table in KEYWORD_TABLES:
+        new_values = _keyword_values_sql("new.keywords")
+        insert_new = f"""
+            INSERT OR IGNORE INTO keywords (name)
+                SELECT trim(value) FROM {new_values} WHERE type = 'text' AND trim(value) != '';
+            INSERT OR IGNORE INTO item_keywords (item_type, item_id, keyword_id, date)
+                SELECT '{table}', new.id, k.id, new.date
+                FROM {new_values} AS j JOIN keywords AS k ON k.name = trim(j.value)
+                WHERE j.type = 'text';
+        """
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_keywords_ai AFTER INSERT ON {table} BEGIN
+                {insert_new}
+            END
+        """)
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_keywords_ad AFTER DELETE ON {table} BEGIN
+                DELETE FROM item_keywords WHERE item_type = '{table}' AND item_id = old.id;
+            END
+        """)
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_keywords_au AFTER UPDATE OF keywords, date ON {table} BEGIN
+                DELETE FROM item_keywords WHERE item_type = '{table}' AND item_id = old.id;
+                {insert_new}
+            END
+        """)
+        
+        # 기존 행 백필
+        row_values = _keyword_values_sql("t.keywords")
+        conn.execute(f"""
+            INSERT OR IGNORE INTO keywords (name)
+            SELECT DISTINCT trim(j.value) FROM {table} AS t, {row_values} AS j
+            WHERE j.type = 'text' AND trim(j.value) != ''
+        """)
+        conn.execute(f"""
+            INSERT OR IGNORE INTO item_keywords (item_type, item_id, keyword_id, date)
+            SELECT '{table}', t.id, k.id, t.date
+            FROM {table} AS t, {row_values} AS j JOIN keywords AS k ON k.name = trim(j.value)
+            WHERE j.type = 'text'
+        """)
+
+
+# 롤업 테이블의 국가 컬럼이 있는 테이블 (나머지는 빈 문자열로 집계)
+ROLLUP_COUNTRY_TABLES = ("articles",)
+
+
+def _fill_item_keywords(conn: sqlite3.Connection, table: str):
+    """원본 테이블의 JSON 키워드로 item_keywords 행 생성 (백필/복구용)"""
+    row_values = _keyword_values_sql("t.keywords")
+    conn.execute(f"""
+        INSERT OR IGNORE INTO keywords (name)
+        SELECT DISTINCT trim(j.value) FROM {table} AS t, {row_values} AS j
+        WHERE j.type = 'text' AND trim(j.value) != ''
+    """)
+    conn.execute(f"""
+        INSERT OR IGNORE INTO item_keywords (item_type, item_id, keyword_id, date, category)
+        SELECT '{table}', t.id, k.id, t.date, COALESCE(t.category, '')
+        FROM {table} AS t, {row_values} AS j JOIN keywords AS k ON k.name = trim(j.value)
+        WHERE j.type = 'text'
+    """)
+
+
+def create_rollup_tables(conn: sqlite3.Connection):
+    """
+    일별 집계 테이블(daily_stats, daily_keyword_stats)과 증분 갱신 트리거 생성
+    
+    원본 테이블 트리거가 daily_stats를, item_keywords 트리거가 daily_keyword_stats를
+    저장과 같은 트랜잭션에서 +1/-1 하므로 대시보드는 원본 대신 일 단위 행만 읽으면 됨.
+    카테고리별 키워드 집계를 위해 item_keywords에 category 컬럼을 추가하고 키워드 트리거를 다시 만듦
+    
+    Args:
+        conn: 데이터베이스 연결
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS daily_stats (
+            item_type TEXT NOT NULL,
+            date DATE NOT NULL,
+            category TEXT NOT NULL DEFAULT '',
+            country TEXT NOT NULL DEFAULT '',
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (item_type, date, category, country)
+        ) WITHOUT ROWID
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS daily_keyword_stats (
+            item_type TEXT NOT NULL,
+            date DATE NOT NULL,
+            category TEXT NOT NULL DEFAULT '',
+            keyword_id INTEGER NOT NULL REFERENCES keywords (id),
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (item_type, date, category, keyword_id)
+        ) WITHOUT ROWID
+    """)
+    
+    # item_keywords에 카테고리 추가 (기존 행은 아래에서 다시 채움)
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(item_keywords)")]
+    if "category" not in columns:
+        conn.execute("ALTER TABLE item_keywords ADD COLUMN category TEXT NOT NULL DEFAULT ''")
+    
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS item_keywords_stats_ai AFTER INSERT ON item_keywords BEGIN
+            INSERT INTO daily_keyword_stats (item_type, date, category, keyword_id, count)
+            VALUES (new.item_type, new.date, new.category, new.keyword_id, 1)
+            ON CONFLICT (item_type, date, category, keyword_id) DO UPDATE SET count = count + 1;
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS item_keywords_stats_ad AFTER DELETE ON item_keywords BEGIN
+            UPDATE daily_keyword_stats SET count = count - 1
+            WHERE item_type = old.item_type AND date = old.date AND category = old.category AND keyword_id = old.keyword_id;
+            DELETE FROM daily_keyword_stats
+            WHERE item_type = old.item_type AND date = old.date AND category = old.category AND keyword_id = old.keyword_id
+              AND count <= 0;
+        END
+    """)
+    
+    for table in KEYWORD_TABLES:
+        country_new = "COALESCE(new.country, '')" if table in ROLLUP_COUNTRY_TABLES else "''"
+        country_old = "COALESCE(old.country, '')" if table in ROLLUP_COUNTRY_TABLES else "''"
+        watched = "date, category, country" if table in ROLLUP_COUNTRY_TABLES else "date, category"
+        increment = f"""
+            INSERT INTO daily_stats (item_type, date, category, country, count)
+            VALUES ('{table}', new.date, COALESCE(new.category, ''), {country_new}, 1)
+            ON CONFLICT (item_type, date, category, country) DO UPDATE SET count = count + 1;
+        """
+        old_key = (f"item_type = '{table}' AND date = old.date AND category = COALESCE(old.category, '') "
+                   f"AND country = {country_old}")
+        decrement = f"""
+            UPDATE daily_stats SET count = count - 1 WHERE {old_key};
+            DELETE FROM daily_stats WHERE {old_key} AND count <= 0;
+        """
+        conn.execute(f"CREATE TRIGGER IF NOT EXISTS {table}_stats_ai AFTER INSERT ON {table} BEGIN {increment} END")
+        conn.execute(f"CREATE TRIGGER IF NOT EXISTS {table}_stats_ad AFTER DELETE ON {table} BEGIN {decrement} END")
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_stats_au AFTER UPDATE OF {watched} ON {table} BEGIN
+                {decrement}
+                {increment}
+            END
+        """)
+        
+        # 키워드 트리거를 category 포함 버전으로 교체
+        new_values = _keyword_values_sql("new.keywords")
+        insert_new = f"""
+            INSERT OR IGNORE INTO keywords (name)
+                SELECT trim(value) FROM {new_values} WHERE type = 'text' AND trim(value) != '';
+            INSERT OR IGNORE INTO item_keywords (item_type, item_id, keyword_id, date, category)
+                SELECT '{table}', new.id, k.id, new.date, COALESCE(new.category, '')
+                FROM {new_values} AS j JOIN keywords AS k ON k.name = trim(j.value)
+                WHERE j.type = 'text';
+        """
+        conn.execute(f"DROP TRIGGER IF EXISTS {table}_keywords_ai")
+        conn.execute(f"DROP TRIGGER IF EXISTS {table}_keywords_au")
+        conn.execute(f"CREATE TRIGGER {table}_keywords_ai AFTER INSERT ON {table} BEGIN {insert_new} END")
+        conn.execute(f"""
+            CREATE TRIGGER {table}_keywords_au AFTER UPDATE OF keywords, date, category ON {table} BEGIN
+                DELETE FROM item_keywords WHERE item_type = '{table}' AND item_id = old.id;
+                {insert_new}
+            END
+        """)
+    
+    rebuild_rollups(conn)
+
+
+def rebuild_rollups(conn: sqlite3.Connection):
+    """
+    item_keywords와 일별 집계 테이블을 원본 테이블 기준으로 다시 계산 (백필 및 불일치 복구)
+    
+    Args:
+        conn: 데이터베이스 연결 (커밋은 호출자가 처리)
+    """
+    conn.execute("DELETE FROM item_keywords")
+    for table in KEYWORD_TABLES:
+        _fill_item_keywords(conn, table)
+    
+    # 위 INSERT가 트리거로 누적한 값을 버리고 GROUP BY 결과로 다시 채움
+    conn.execute("DELETE FROM daily_stats")
+    conn.execute("DELETE FROM daily_keyword_stats")
+    for table in KEYWORD_TABLES:
+        country = "COALESCE(country, '')" if table in ROLLUP_COUNTRY_TABLES else "''"
+        conn.execute(f"""
+            INSERT INTO daily_stats (item_type, date, category, country, count)
+            SELECT '{table}', date, COALESCE(category, ''), {country}, COUNT(*)
+            FROM {table}
+            GROUP BY date, COALESCE(category, ''), {country}
+        """)
+    conn.execute("""
+        INSERT INTO daily_keyword_stats (item_type, date, category, keyword_id, count)
+        SELECT item_type, date, category, keyword_id, COUNT(*)
+        FROM item_keywords
+        GROUP BY item_type, date, category, keyword_id
+    """)
+
+
+# 데이터 버전을 관리하는 테이블 (화면 캐시 무효화 기준)
+VERSIONED_TABLES = ("articles", "papers", "economy_news", "economy_reports", "generated_content", "bookmarks")
+
+
+def create_data_versions(conn: sqlite3.Connection):
+    """
+    테이블별 데이터 버전 카운터와, 행이 추가/수정/삭제될 때마다 버전을 올리는 트리거 생성
+    
+    저장 경로(쓰기 스레드, 삭제 버튼, 다른 프로세스의 수집 작업)와 관계없이 커밋과 함께 버전이 바뀌므로
+    화면 캐시는 버전을 키에 포함하기만 하면 됨
+    
+    Args:
+        conn: 데이터베이스 연결
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS data_versions (
+            name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    for table in VERSIONED_TABLES:
+        conn.execute("INSERT OR IGNORE INTO data_versions (name, version) VALUES (?, 0)", (table,))
+        for event, suffix in (("INSERT", "ai"), ("UPDATE", "au"), ("DELETE", "ad")):
+            conn.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {table}_version_{suffix} AFTER {event} ON {table} BEGIN
+                    UPDATE data_versions SET version = version + 1 WHERE name = '{table}';
+                END
+            """)
+
+
+def get_data_versions(conn: sqlite3.Connection = None) -> Dict[str, int]:
+    """
+    테이블별 현재 데이터 버전
+    
+    Args:
+        conn: 데이터베이스 연결 (없으면 현재 스레드의 풀 연결)
+    
+    Returns:
+        {테이블 이름: 버전}
+    """
+    conn = conn or get_connection()
+    return dict(conn.execute("SELECT name, version FROM data_versions"))
+
+
+# 원래 URL(original_url)을 함께 저장하는 테이블 (url에는 정규 URL 저장)
+ORIGINAL_URL_TABLES = ("articles", "economy_news")
+
+
+def add_original_url_columns(conn: sqlite3.Connection):
+    """
+    정규 URL로 중복을 제거하는 테이블에 원래 URL 컬럼 추가 (이미 있으면 건너뜀)
+    
+    Args:
+        conn: 데이터베이스 연결
+    """
+    for table in ORIGINAL_URL_TABLES:
+        columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        if "original_url" not in columns:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN original_url TEXT")
+
+
+def add_job_heartbeat_column(conn: sqlite3.Connection):
+    """
+    jobs 테이블에 작업자 생존 신호(updated_at) 컬럼 추가 (이미 있으면 건너뜀)
+    
+    Args:
+        conn: 데이터베이스 연결
+    """
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+    if "updated_at" not in columns:
+        # ALTER TABLE ADD COLUMN은 CURRENT_TIMESTAMP 기본값을 허용하지 않음 (비어 있으면 started_at/created_at 사용)
+        conn.execute("ALTER TABLE jobs ADD COLUMN updated_at TIMESTAMP")
+
+
+# 스키마 마이그레이션 목록: (버전, 설명, [SQL 문 또는 conn을 받는 함수])
+# PRAGMA user_version에 마지막으로 적용한 버전을 기록하고, 그보다 높은 버전만 순서대로 한 번씩 적용
+MIGRATIONS = [
+    (1, "조회 패턴에 맞춘 보조 인덱스", [
+        # 대시보드: 오늘/최근 N일 (date 조건 + created_at 정렬, date별 집계)
+        "CREATE INDEX IF NOT EXISTS idx_articles_date_created ON articles (date, created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_papers_date_created ON papers (date, created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_economy_news_date_created ON economy_news (date, created_at)",
+        # 아카이브/콘텐츠 팩토리: 최신순/오래된순 목록
+        "CREATE INDEX IF NOT EXISTS idx_articles_created ON articles (created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_papers_created ON papers (created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_economy_news_created ON economy_news (created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_generated_content_created ON generated_content (created_at)",
+        # 트렌드 레이더: 국가 필터, 평점순 정렬
+        "CREATE INDEX IF NOT EXISTS idx_articles_country_created ON articles (country, created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_articles_score_created ON articles (validity_score, created_at)",
+        # 이메일 요약: 오늘 기사 평점순
+        "CREATE INDEX IF NOT EXISTS idx_articles_date_score ON articles (date, validity_score)",
+        # 경제 탭/dashboard_utils: 카테고리별 기간 조회, 출처 필터
+        "CREATE INDEX IF NOT EXISTS idx_economy_news_category_date ON economy_news (category, date)",
+        "CREATE INDEX IF NOT EXISTS idx_economy_news_category_created ON economy_news (category, created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_economy_news_source ON economy_news (source)",
+    ]),
+    (2, "FTS5 전문 검색 인덱스", [
+        create_fts_tables,
+    ]),
+    (3, "정규화된 키워드 테이블", [
+        create_keyword_tables,
+    ]),
+    (4, "일별 집계 롤업 테이블", [
+        create_rollup_tables,
+    ]),
+    (5, "화면 캐시용 데이터 버전", [
+        create_data_versions,
+    ]),
+    (6, "백그라운드 작업 테이블", [
+        """
+        CREATE TABLE IF NOT EXISTS jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            job_type TEXT NOT NULL,
+            params TEXT,
+            status TEXT NOT NULL DEFAULT 'queued',
+            progress_current INTEGER NOT NULL DEFAULT 0,
+            progress_total INTEGER NOT NULL DEFAULT 0,
+            message TEXT,
+            result TEXT,
+            error TEXT,
+            worker TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            started_at TIMESTAMP,
+            finished_at TIMESTAMP
+        )
+        """,
+        # 같은 종류의 작업은 대기/실행 중인 것이 하나만 있도록 보장 (프로세스가 여러 개여도 적용)
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_active ON jobs (job_type) WHERE status IN ('queued', 'running')",
+        "CREATE INDEX IF NOT EXISTS idx_jobs_type ON jobs (job_type)",
+    ]),
+    (7, "스케줄러 실행 상태", [
+        # 일정별 마지막으로 처리한 예정 시각 (재시작 시 놓친 실행 판단용)
+        """
+        CREATE TABLE IF NOT EXISTS scheduler_state (
+            name TEXT PRIMARY KEY,
+            last_run TIMESTAMP NOT NULL,
+            last_job_id INTEGER,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+    ]),
+    (8, "피드별 증분 수집 워터마크", [
+        # (소스, 키워드, 국가)별 마지막으로 본 최신 항목 (국가가 없는 소스는 '')
+        """
+        CREATE TABLE IF NOT EXISTS feed_state (
+            source TEXT NOT NULL,
+            keyword TEXT NOT NULL,
+            country TEXT NOT NULL DEFAULT '',
+            last_published TEXT NOT NULL,
+            last_id TEXT,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (source, keyword, country)
+        ) WITHOUT ROWID
+        """,
+    ]),
+    (9, "피드 조건부 요청 검증값", [
+        # URL별 ETag/Last-Modified와 조건부 요청 통계 (304로 아낀 바이트 수는 직전 본문 크기 기준)
+        """
+        CREATE TABLE IF NOT EXISTS feed_validators (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            last_modified TEXT,
+            content_length INTEGER NOT NULL DEFAULT 0,
+            fetches INTEGER NOT NULL DEFAULT 0,
+            not_modified INTEGER NOT NULL DEFAULT 0,
+            bytes_downloaded INTEGER NOT NULL DEFAULT 0,
+            bytes_saved INTEGER NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+    ]),
+    (10, "유사 중복 기사 지문 색인", [
+        # 항목별 SimHash 지문 (canonical_url이 있으면 그 항목의 유사 중복으로 분석/저장을 건너뜀)
+        """
+        CREATE TABLE IF NOT EXISTS fingerprints (
+            item_type TEXT NOT NULL,
+            url TEXT NOT NULL,
+            simhash INTEGER NOT NULL,
+            canonical_url TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (item_type, url)
+        ) WITHOUT ROWID
+        """,
+        # 대표 항목 지문을 16비트씩 나눈 밴드 색인 (밴드 하나라도 같으면 후보)
+        """
+        CREATE TABLE IF NOT EXISTS fingerprint_bands (
+            item_type TEXT NOT NULL,
+            band INTEGER NOT NULL,
+            value INTEGER NOT NULL,
+            url TEXT NOT NULL,
+            PRIMARY KEY (item_type, band, value, url)
+        ) WITHOUT ROWID
+        """,
+    ]),
+    (11, "Google News URL 해석 캐시와 원래 URL 컬럼", [
+        # Google News 기사 URL(파라미터 제외) -> 언론사 정규 URL (NULL이면 해석 실패, 일정 시간 후 재시도)
+        """
+        CREATE TABLE IF NOT EXISTS url_resolutions (
+            url TEXT PRIMARY KEY,
+            canonical_url TEXT,
+            method TEXT,
+            resolved_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        add_original_url_columns,
+    ]),
+    (12, "트렌드 레이더 국가 필터 + 평점순 정렬 인덱스", [
+        "CREATE INDEX IF NOT EXISTS idx_articles_country_score_created ON articles (country, validity_score, created_at)",
+    ]),
+    (13, "짧은 검색어용 FTS5 단어 색인", [
+        create_word_fts_tables,
+    ]),
+    (14, "작업 생존 신호 컬럼", [
+        add_job_heartbeat_column,
+    ]),
+    (15, "관련도순 피드에서 이미 본 항목", [
+        # Google News 검색 피드처럼 날짜순이 아닌 피드는 발행 시각 워터마크 대신 본 항목 ID로 새 항목 판단
+        """
+        CREATE TABLE IF NOT EXISTS feed_seen (
+            source TEXT NOT NULL,
+            keyword TEXT NOT NULL,
+            country TEXT NOT NULL DEFAULT '',
+            item_id TEXT NOT NULL,
+            seen_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (source, keyword, country, item_id)
+        ) WITHOUT ROWID
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_feed_seen_seen_at ON feed_seen (seen_at)",
+    ]),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """현재 DB에 적용된 마이그레이션 버전"""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """
+    아직 적용되지 않은 마이그레이션을 버전 순서대로 적용
+    
+    Args:
+        conn: 데이터베이스 연결
+    
+    Returns:
+        적용 후 스키마 버전
+    """
+    current = get_schema_version(conn)
+    for version, description, steps in MIGRATIONS:
+        if version <= current:
+            continue
+        try:
+            for step in steps:
+                if callable(step):
+                    step(conn)
+                else:
+                    conn.execute(step)
+            conn.execute(f"PRAGMA user_version = {version}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        print(f"마이그레이션 적용: v{version} {description}")
+        current = version
+    return current
+
+
+def check_query_plans(conn: sqlite3.Connection = None) -> List[str]:
+    """
+    화면에서 실행하는 쿼리(modules.queries.plan_checks)가 인덱스를 사용하는지 EXPLAIN QUERY PLAN으로 확인
+    
+    Args:
+        conn: 점검할 연결 (없으면 현재 스레드의 풀 연결)
+    
+    Returns:
+        문제 목록 (비어 있으면 모두 통과)
+    """
+    from modules.queries import explain_problems, plan_checks
+    
+    conn = conn or get_connection()
+    problems = []
+    for description, query, params, allow_temp_sort in plan_checks(conn):
+        for detail in explain_problems(conn, query, params, allow_temp_sort):
+            problems.append(f"{description}: {detail}")
+    return problems
 
 
 if __name__ == "__main__":
+    import sys
+    
+    if "--check-plans" in sys.argv:
+        # 인덱스 회귀 점검 (문제가 있으면 종료 코드 1)
+        problems = check_query_plans()
+        for problem in problems:
+            print(f"❌ {problem}")
+        print(f"쿼리 플랜 점검: 문제 {len(problems)}건")
+        sys.exit(1 if problems else 0)
+    
+    if "--rebuild-fts" in sys.argv:
+        # 전문 검색 인덱스 재생성 (SQLite 업그레이드 후 또는 색인 불일치 시)
+        with db_connection() as conn:
+            rebuilt = rebuild_fts_tables(conn)
+        print("전문 검색 인덱스 재색인 완료" if rebuilt else "전문 검색 인덱스를 만들 수 없습니다.")
+        sys.exit(0 if rebuilt else 1)
+    
+    if "--rebuild-rollups" in sys.argv:
+        # 일별 집계 재계산 (백필 및 불일치 복구)
+        with db_connection() as conn:
+            rebuild_rollups(conn)
+        print("일별 집계 재계산 완료")
+        sys.exit(0)
+    
     # 직접 실행 시 데이터베이스 초기화
     init_database()
@@ -0,0 +1,237 @@
+"""
+데이터베이스 일괄 쓰기 모듈
+수집 작업자가 넘긴 레코드를 단일 쓰기 스레드가 모아서 한 트랜잭션으로 저장
+"""
+
+import os
+import time
+import queue
+import atexit
+import sqlite3
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Dict, List
+
+from modules.database import db_connection
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 배치 크기와 최대 대기 시간 (둘 중 먼저 도달하는 조건에서 커밋)
+WRITE_BATCH_SIZE = int(os.getenv("DB_WRITE_BATCH_SIZE", "200"))
+WRITE_FLUSH_INTERVAL = float(os.getenv("DB_WRITE_FLUSH_INTERVAL", "0.5"))
+
+# 테이블별 INSERT 대상 컬럼 (url은 UNIQUE 정규 URL, 충돌 시 무시)
+TABLE_COLUMNS = {
+    "articles": ("date", "category", "title", "url", "original_url", "content_summary",
+                 "full_text", "keywords", "validity_score", "country"),
+    "papers": ("date", "title", "authors", "journal", "url",
+               "abstract", "summary", "keywords", "category"),
+    "economy_news": ("date", "category", "title", "url", "original_url", "content_summary",
+                     "full_text", "keywords", "source"),
+}
+
+# INSERT ... RETURNING 지원 여부 (SQLite 3.35 이상)
+HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+_FLUSH = object()  # 대기 중인 레코드를 즉시 커밋하라는 신호
+
+
+class BatchWriter:
+    """큐에 쌓인 레코드를 테이블별 executemany로 일괄 저장하는 단일 쓰기 스레드"""
+
+    def __init__(self, batch_size: int = WRITE_BATCH_SIZE, flush_interval: float = WRITE_FLUSH_INTERVAL):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.thread = None
+        self.stats = {"batches": 0, "submitted": 0, "inserted": 0, "ignored": 0, "failed": 0}
+
+    def _ensure_started(self):
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+                self.thread.start()
+
+    def submit(self, table: str, record: Dict) -> Future:
+        """
+        레코드 저장 요청 (즉시 반환)
+
+        Args:
+            table: TABLE_COLUMNS 중 하나
+            record: 컬럼 이름을 키로 하는 딕셔너리
+
+        Returns:
+            저장 결과 Future (새로 저장되면 True, URL 중복으로 무시되면 False, 저장 실패면 예외)
+        """
+        if table not in TABLE_COLUMNS:
+            raise ValueError(f"일괄 저장을 지원하지 않는 테이블: {table}")
+        future = Future()
+        self._ensure_started()
+        self.queue.put((table, record, future))
+        return future
+
+    def flush(self, timeout: float = None):
+        """지금까지 요청된 레코드가 모두 커밋될 때까지 대기"""
+        future = Future()
+        self._ensure_started()
+        self.queue.put((_FLUSH, None, future))
+        future.result(timeout=timeout)
+
+    def _run(self):
+        while True:
+            pending = [self.queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+
+            # 배치 크기 또는 대기 시간에 도달할 때까지 모으기 (flush 신호가 오면 즉시 커밋)
+            while pending[-1][0] is not _FLUSH and len(pending) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    pending.append(self.queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            records = [entry for entry in pending if entry[0] is not _FLUSH]
+            if records:
+                self._write(records)
+            for entry in pending:
+                if entry[0] is _FLUSH:
+                    entry[2].set_result(True)
+
+    def _write(self, records: List):
+        """레코드를 테이블별로 나눠 한 트랜잭션에서 저장하고 Future에 결과 설정"""
+        by_table = {}
+        for table, record, future in records:
+            by_table.setdefault(table, []).append((record, future))
+
+        try:
+            with db_connection() as conn:
+                results = {}
+                for table, entries in by_table.items():
+                    results[table] = self._insert_many(conn, table, [record for record, _ in entries])
+        except Exception as e:
+            # 배치 전체가 실패하면 한 건씩 다시 시도하여 문제 레코드만 실패 처리
+            logger.error(f"일괄 저장 실패, 한 건씩 재시도: {e}")
+            for table, entries in by_table.items():
+                for record, future in entries:
+                    self._write_single(table, record, future)
+            return
+
+        inserted = sum(len(urls) for urls in results.values())
+        for table, entries in by_table.items():
+            inserted_urls = results[table]
+            for record, future in entries:
+                # 같은 정규 URL이 배치에 여러 번 있으면 첫 레코드만 저장된 것으로 처리
+                url = record.get("url")
+                future.set_result(url in inserted_urls)
+                inserted_urls.discard(url)
+
+        with self.lock:
+            self.stats["batches"] += 1
+            self.stats["submitted"] += len(records)
+            self.stats["inserted"] += inserted
+            self.stats["ignored"] += len(records) - inserted
+        logger.info(f"일괄 저장 완료: {len(records)}건 중 {inserted}건 저장")
+
+    def _insert_many(self, conn, table: str, records: List[Dict]) -> set:
+        """
+        INSERT ... ON CONFLICT(url) DO NOTHING 실행
+
+        SQLite 3.35 이상이면 RETURNING으로 실제로 저장된 URL만 돌려받고, 이전 버전이면
+        BEGIN IMMEDIATE로 쓰기 잠금을 먼저 잡은 뒤 최대 id를 읽음 (다른 프로세스의 쓰기 스레드가
+        그 사이에 커밋한 행을 이번 배치의 저장 결과로 세지 않도록)
+
+        Returns:
+            새로 저장된 URL 집합
+        """
+        columns = TABLE_COLUMNS[table]
+        placeholders = ", ".join("?" * len(columns))
+        sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders}) ON CONFLICT(url) DO NOTHING"
+        rows = [tuple(record.get(column) for column in columns) for record in records]
+
+        if HAS_RETURNING:
+            inserted = set()
+            for row in rows:
+                # executemany는 RETURNING 결과를 돌려주지 않으므로 같은 트랜잭션에서 한 건씩 실행
+                returned = conn.execute(f"{sql} RETURNING url", row).fetchone()
+                if returned:
+                    inserted.add(returned[0])
+            return inserted
+
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        max_id = conn.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}").fetchone()[0]
+        conn.executemany(sql, rows)
+        return {row[0] for row in conn.execute(f"SELECT url FROM {table} WHERE id > ?", (max_id,))}
+
+    def _write_single(self, table: str, record: Dict, future: Future):
+        try:
+            with db_connection() as conn:
+                inserted = bool(self._insert_many(conn, table, [record]))
+            future.set_result(inserted)
+            with self.lock:
+                self.stats["submitted"] += 1
+                self.stats["inserted" if inserted else "ignored"] += 1
+        except Exception as e:
+            logger.error(f"저장 실패 ({table}): {(record.get('title') or '')[:50]} - {e}")
+            future.set_exception(e)
+            with self.lock:
+                self.stats["submitted"] += 1
+                self.stats["failed"] += 1
+
+    def get_stats(self) -> Dict:
+        """배치 수, 요청/저장/중복 무시/실패 건수 반환"""
+        with self.lock:
+            return dict(self.stats)
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_writer() -> BatchWriter:
+    """프로세스 전체에서 공유하는 쓰기 스레드 반환"""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = BatchWriter()
+                atexit.register(_writer.flush, 10)
+    return _writer
+
+
+def write_records(table: str, records: List[Dict]) -> int:
+    """
+    여러 레코드를 저장하고 커밋될 때까지 대기
+
+    Args:
+        table: TABLE_COLUMNS 중 하나
+        records: 컬럼 이름을 키로 하는 딕셔너리 리스트
+
+    Returns:
+        새로 저장된 레코드 수 (URL 중복은 제외)
+
+    Raises:
+        RuntimeError: 저장에 실패한 레코드가 있으면 (나머지 레코드는 저장된 상태)
+    """
+    writer = get_writer()
+    futures = [writer.submit(table, record) for record in records]
+    writer.flush()
+    inserted = 0
+    errors = []
+    for future in futures:
+        error = future.exception()
+        if error is not None:
+            errors.append(error)
+        elif future.result():
+            inserted += 1
+    if errors:
+        raise RuntimeError(
+            f"{table} 저장 실패 {len(errors)}건 (저장 {inserted}건): {errors[0]}"
+        ) from errors[0]
+    return inserted
@@ -3,77 +3,190 @@
 거시경제, 산업 분석, 글로벌 시황 정보 수집
 """
 
-import requests
-from bs4 import BeautifulSoup
 import logging
 from datetime import datetime
 from typing import List, Dict, Optional
-import time
 import json
-import feedparser
-from concurrent.futures import ThreadPoolExecutor, as_completed
-
-from modules.ai_engine import generate_summary, extract_keywords, get_model
-from modules.database import get_connection
+import asyncio
+import urllib.parse
+
+from modules.ai_engine import analyze_article, analyze_articles_batch, generate_text, get_ai_stats
+from modules.async_engine import Fetcher, open_fetcher, run, run_with_fetcher, threadsafe_callback
+from modules.database import db_connection, filter_new_items
+from modules.db_writer import get_writer, write_records
+from modules.feed_state import FeedWatermarks
+from modules.near_duplicates import NearDuplicateIndex
+from modules.url_resolver import canonicalize_items_async
+from modules import page_cache, scraper
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# User-Agent 설정
-HEADERS = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# Google News RSS 기반 경제 정보 소스
+# (query: 기본 검색어, fallback_query: 결과가 없을 때 사용할 단순 검색어)
+ECONOMY_FEEDS = {
+    "bok": {
+        "query": "한국은행 OR BOK OR 한국은행 금리 OR 한국은행 통화정책",
+        "fallback_query": "한국은행",
+        "country": "KR",
+        "source": "한국은행 (Google News)",
+        "category": "거시경제",
+        "label": "한국은행 관련 뉴스",
+    },
+    "kdi": {
+        "query": "KDI OR 한국개발연구원",
+        "fallback_query": "KDI",
+        "country": "KR",
+        "source": "KDI (Google News)",
+        "category": "거시경제",
+        "label": "KDI 관련 뉴스",
+    },
+    "hankyung": {
+        "query": "한경 OR 한경컨센서스 OR 한경증권",
+        "fallback_query": "한경",
+        "country": "KR",
+        "source": "한경 컨센서스 (Google News)",
+        "category": "산업분석",
+        "label": "한경 컨센서스",
+    },
+    "naver": {
+        "query": "경제 OR 금융 OR 증권 OR 시장",
+        "fallback_query": "경제",
+        "country": "KR",
+        "source": "네이버 금융 (Google News)",
+        "category": "산업분석",
+        "label": "네이버 금융 관련 뉴스",
+    },
+    "investing": {
+        "query": "economy OR fed OR rate OR gdp OR inflation OR market",
+        "fallback_query": "economy",
+        "country": "US",
+        "source": "Investing.com (Google News)",
+        "category": "글로벌시황",
+        "label": "글로벌 경제 뉴스",
+    },
+    "kcif": {
+        "query": "국제금융센터 OR KCIF OR 글로벌 금융",
+        "fallback_query": "글로벌 금융",
+        "country": "KR",
+        "source": "국제금융센터 (Google News)",
+        "category": "글로벌시황",
+        "label": "국제금융센터 관련 뉴스",
+    },
 }
 
+# 일일 경제 뉴스 키워드 (개선: 산업별, 기업 분석 키워드 추가)
+DAILY_ECONOMY_KEYWORDS = ["경제", "금리", "통화정책", "증시", "주식", "경제동향", "거시경제", "실물경제", "부동산", "경제정책",
+                          "반도체", "바이오", "금융", "은행", "증권", "경제지표"]
 
-def fetch_bok_reports(max_results: int = 10) -> List[Dict]:
+
+def google_news_rss_url(query: str, country: str = "KR") -> str:
     """
-    한국은행 이슈노트 및 경제전망 수집
-    Google News RSS를 통해 한국은행 관련 뉴스 수집
+    검색어로 Google News RSS URL 생성
+    
+    Args:
+        query: 검색어
+        country: 국가 코드 (KR, US)
+    
+    Returns:
+        RSS Feed URL
     """
-    reports = []
-    try:
-        # Google News RSS를 통한 한국은행 관련 뉴스 수집
-        import urllib.parse
-        query = urllib.parse.quote("한국은행 OR BOK OR 한국은행 금리 OR 한국은행 통화정책")
-        rss_url = f"https://news.google.com/rss/search?q={query}&hl=ko&gl=KR&ceid=KR:ko"
+    quoted = urllib.parse.quote(query)
+    if country == "US":
+        return f"https://news.google.com/rss/search?q={quoted}&hl=en&gl=US&ceid=US:en"
+    return f"https://news.google.com/rss/search?q={quoted}&hl=ko&gl=KR&ceid=KR:ko"
+
+
+def parse_feed_entries(feed, max_results: int, source: str, category: str,
+                       watermarks: Optional[FeedWatermarks] = None, keyword: str = "", country: str = "") -> List[Dict]:
+    """
+    RSS 항목을 경제 뉴스 딕셔너리로 변환
+    
+    Args:
+        feed: feedparser 파싱 결과
+        max_results: 최대 항목 수
+        source: 출처 이름
+        category: 카테고리
+        watermarks: 피드 워터마크 (주면 이전 수집에서 본 항목은 건너뜀)
+        keyword: 워터마크 키 (피드 키 또는 검색어)
+        country: 워터마크 국가 코드
+    
+    Returns:
+        경제 뉴스 딕셔너리 리스트
+    """
+    entries = feed.entries[:max_results]
+    if watermarks is not None:
+        entries = watermarks.take_new_entries(feed.entries, keyword, country, max_results)
+    
+    items = []
+    for entry in entries:
+        title = entry.get("title", "").replace(" - Google 뉴스", "").replace(" - Google News", "").strip()
+        url = entry.get("link", "")
         
-        feed = feedparser.parse(rss_url)
+        if title and url:
+            # 날짜 파싱
+            try:
+                from dateutil import parser as date_parser
+                pub_date = date_parser.parse(entry.get("published", "")).strftime("%Y-%m-%d")
+            except Exception:
+                pub_date = datetime.now().strftime("%Y-%m-%d")
+            
+            items.append({
+                "title": title,
+                "url": url,
+                "source": source,
+                "category": category,
+                "date": pub_date
+            })
+    return items
+
+
+async def fetch_economy_feed_async(fetcher: Fetcher, feed_key: str, max_results: int = 20,
+                                   watermarks: Optional[FeedWatermarks] = None) -> List[Dict]:
+    """
+    ECONOMY_FEEDS에 정의된 소스 하나를 수집 (결과가 없으면 단순 검색어로 재시도)
+    
+    Args:
+        fetcher: 공유 연결 풀 Fetcher
+        feed_key: ECONOMY_FEEDS 키
+        max_results: 최대 수집 개수
+        watermarks: 피드 워터마크 (주면 이전 수집 이후 항목만)
+    
+    Returns:
+        경제 뉴스 딕셔너리 리스트
+    """
+    spec = ECONOMY_FEEDS[feed_key]
+    items = []
+    try:
+        feed = await fetcher.get_feed(google_news_rss_url(spec["query"], spec["country"]))
         
-        if not feed.entries:
-            logger.warning(f"한국은행 RSS 피드가 비어있음: {feed.get('bozo_exception', 'Unknown error')}")
+        if not feed.entries and feed.get("status") != 304:
+            logger.warning(f"{spec['label']} RSS 피드가 비어있음: {feed.get('bozo_exception', 'Unknown error')}")
             # 대체 방법: 더 간단한 검색어 사용
-            rss_url = "https://news.google.com/rss/search?q=한국은행&hl=ko&gl=KR&ceid=KR:ko"
-            feed = feedparser.parse(rss_url)
+            feed = await fetcher.get_feed(google_news_rss_url(spec["fallback_query"], spec["country"]))
         
-        for entry in feed.entries[:max_results]:
-            title = entry.get("title", "").replace(" - Google 뉴스", "").replace(" - Google News", "").strip()
-            url = entry.get("link", "")
-            
-            if title and url:
-                # 날짜 파싱
-                try:
-                    from dateutil import parser as date_parser
-                    pub_date = date_parser.parse(entry.get("published", "")).strftime("%Y-%m-%d")
-                except:
-                    pub_date = datetime.now().strftime("%Y-%m-%d")
-                
-                reports.append({
-                    "title": title,
-                    "url": url,
-                    "source": "한국은행 (Google News)",
-                    "category": "거시경제",
-                    "date": pub_date
-                })
-        
-        logger.info(f"한국은행 관련 뉴스 {len(reports)}개 수집")
+        items = parse_feed_entries(feed, max_results, spec["source"], spec["category"],
+                                   watermarks, feed_key, spec["country"])
+        # Google News 리다이렉트 URL을 언론사 URL로 해석
+        await canonicalize_items_async(fetcher, items)
+        logger.info(f"{spec['label']} {len(items)}개 수집")
         
     except Exception as e:
-        logger.error(f"한국은행 뉴스 수집 실패: {e}")
+        logger.error(f"{spec['label']} 수집 실패: {e}")
         import traceback
         logger.error(traceback.format_exc())
     
-    return reports
+    return items
+
+
+def fetch_bok_reports(max_results: int = 10) -> List[Dict]:
+    """
+    한국은행 이슈노트 및 경제전망 수집
+    Google News RSS를 통해 한국은행 관련 뉴스 수집
+    """
+    return run_with_fetcher(fetch_economy_feed_async, "bok", max_results)
 
 
 def fetch_kdi_reports(max_results: int = 10) -> List[Dict]:
@@ -81,47 +194,7 @@ def fetch_kdi_reports(max_results: int = 10) -> List[Dict]:
     KDI 경제동향 수집
     Google News RSS를 통해 KDI 관련 뉴스 수집
     """
-    reports = []
-    try:
-        # Google News RSS를 통한 KDI 관련 뉴스 수집
-        import urllib.parse
-        query = urllib.parse.quote("KDI OR 한국개발연구원")
-        rss_url = f"https://news.google.com/rss/search?q={query}&hl=ko&gl=KR&ceid=KR:ko"
-        
-        feed = feedparser.parse(rss_url)
-        
-        if not feed.entries:
-            logger.warning(f"KDI RSS 피드가 비어있음")
-            rss_url = "https://news.google.com/rss/search?q=KDI&hl=ko&gl=KR&ceid=KR:ko"
-            feed = feedparser.parse(rss_url)
-        
-        for entry in feed.entries[:max_results]:
-            title = entry.get("title", "").replace(" - Google 뉴스", "").replace(" - Google News", "").strip()
-            url = entry.get("link", "")
-            
-            if title and url:
-                try:
-                    from dateutil import parser as date_parser
-                    pub_date = date_parser.parse(entry.get("published", "")).strftime("%Y-%m-%d")
-                except:
-                    pub_date = datetime.now().strftime("%Y-%m-%d")
-                
-                reports.append({
-                    "title": title,
-                    "url": url,
-                    "source": "KDI (Google News)",
-                    "category": "거시경제",
-                    "date": pub_date
-                })
-        
-        logger.info(f"KDI 관련 뉴스 {len(reports)}개 수집")
-        
-    except Exception as e:
-        logger.error(f"KDI 뉴스 수집 실패: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
-    
-    return reports
+    return run_with_fetcher(fetch_economy_feed_async, "kdi", max_results)
 
 
 def fetch_hankyung_consensus(max_results: int = 20) -> List[Dict]:
@@ -129,47 +202,7 @@ def fetch_hankyung_consensus(max_results: int = 20) -> List[Dict]:
     한경 컨센서스 리포트 수집
     Google News를 통해 한경 관련 뉴스 수집
     """
-    reports = []
-    try:
-        # Google News RSS를 통한 한경 관련 뉴스 수집
-        import urllib.parse
-        query = urllib.parse.quote("한경 OR 한경컨센서스 OR 한경증권")
-        rss_url = f"https://news.google.com/rss/search?q={query}&hl=ko&gl=KR&ceid=KR:ko"
-        
-        feed = feedparser.parse(rss_url)
-        
-        if not feed.entries:
-            logger.warning(f"한경 RSS 피드가 비어있음")
-            rss_url = "https://news.google.com/rss/search?q=한경&hl=ko&gl=KR&ceid=KR:ko"
-            feed = feedparser.parse(rss_url)
-        
-        for entry in feed.entries[:max_results]:
-            title = entry.get("title", "").replace(" - Google 뉴스", "").replace(" - Google News", "").strip()
-            url = entry.get("link", "")
-            
-            if title and url:
-                try:
-                    from dateutil import parser as date_parser
-                    pub_date = date_parser.parse(entry.get("published", "")).strftime("%Y-%m-%d")
-                except:
-                    pub_date = datetime.now().strftime("%Y-%m-%d")
-                
-                reports.append({
-                    "title": title,
-                    "url": url,
-                    "source": "한경 컨센서스 (Google News)",
-                    "category": "산업분석",
-                    "date": pub_date
-                })
-        
-        logger.info(f"한경 컨센서스 {len(reports)}개 수집")
-        
-    except Exception as e:
-        logger.error(f"한경 컨센서스 수집 실패: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
-    
-    return reports
+    return run_with_fetcher(fetch_economy_feed_async, "hankyung", max_results)
 
 
 def fetch_naver_finance(max_results: int = 20) -> List[Dict]:
@@ -177,47 +210,7 @@ def fetch_naver_finance(max_results: int = 20) -> List[Dict]:
     네이버 금융 리서치 수집
     Google News RSS를 통해 경제/금융 뉴스 수집
     """
-    reports = []
-    try:
-        # Google News RSS를 통한 경제/금융 뉴스 수집
-        import urllib.parse
-        query = urllib.parse.quote("경제 OR 금융 OR 증권 OR 시장")
-        rss_url = f"https://news.google.com/rss/search?q={query}&hl=ko&gl=KR&ceid=KR:ko"
-        
-        feed = feedparser.parse(rss_url)
-        
-        if not feed.entries:
-            logger.warning(f"네이버 금융 RSS 피드가 비어있음")
-            rss_url = "https://news.google.com/rss/search?q=경제&hl=ko&gl=KR&ceid=KR:ko"
-            feed = feedparser.parse(rss_url)
-        
-        for entry in feed.entries[:max_results]:
-            title = entry.get("title", "").replace(" - Google 뉴스", "").replace(" - Google News", "").strip()
-            url = entry.get("link", "")
-            
-            if title and url:
-                try:
-                    from dateutil import parser as date_parser
-                    pub_date = date_parser.parse(entry.get("published", "")).strftime("%Y-%m-%d")
-                except:
-                    pub_date = datetime.now().strftime("%Y-%m-%d")
-                
-                reports.append({
-                    "title": title,
-                    "url": url,
-                    "source": "네이버 금융 (Google News)",
-                    "category": "산업분석",
-                    "date": pub_date
-                })
-        
-        logger.info(f"네이버 금융 관련 뉴스 {len(reports)}개 수집")
-        
-    except Exception as e:
-        logger.error(f"네이버 금융 수집 실패: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
-    
-    return reports
+    return run_with_fetcher(fetch_economy_feed_async, "naver", max_results)
 
 
 def fetch_investing_news(max_results: int = 20) -> List[Dict]:
@@ -225,255 +218,131 @@ def fetch_investing_news(max_results: int = 20) -> List[Dict]:
     Investing.com 뉴스 수집
     Google News RSS를 통해 글로벌 경제 뉴스 수집
     """
-    news_list = []
-    try:
-        # Google News RSS를 통한 글로벌 경제 뉴스 수집
-        import urllib.parse
-        query = urllib.parse.quote("economy OR fed OR rate OR gdp OR inflation OR market")
-        rss_url = f"https://news.google.com/rss/search?q={query}&hl=en&gl=US&ceid=US:en"
-        
-        feed = feedparser.parse(rss_url)
-        
-        if not feed.entries:
-            logger.warning(f"글로벌 경제 RSS 피드가 비어있음")
-            rss_url = "https://news.google.com/rss/search?q=economy&hl=en&gl=US&ceid=US:en"
-            feed = feedparser.parse(rss_url)
-        
-        for entry in feed.entries[:max_results]:
-            title = entry.get("title", "").replace(" - Google News", "").strip()
-            url = entry.get("link", "")
-            
-            if title and url:
-                try:
-                    from dateutil import parser as date_parser
-                    pub_date = date_parser.parse(entry.get("published", "")).strftime("%Y-%m-%d")
-                except:
-                    pub_date = datetime.now().strftime("%Y-%m-%d")
-                
-                news_list.append({
-                    "title": title,
-                    "url": url,
-                    "source": "Investing.com (Google News)",
-                    "category": "글로벌시황",
-                    "date": pub_date
-                })
-        
-        logger.info(f"글로벌 경제 뉴스 {len(news_list)}개 수집")
-        
-    except Exception as e:
-        logger.error(f"글로벌 경제 뉴스 수집 실패: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
-    
-    return news_list
+    return run_with_fetcher(fetch_economy_feed_async, "investing", max_results)
 
 
-def fetch_daily_economy_news(max_results: int = 30) -> List[Dict]:
+def fetch_kcif_news(max_results: int = 20) -> List[Dict]:
     """
-    일일 경제 뉴스 수집 (Google News RSS)
-    오늘 날짜의 경제 관련 뉴스 수집
+    국제금융센터 일일 브리핑 수집
+    Google News RSS를 통해 국제금융센터 관련 뉴스 수집
     """
-    news_list = []
-    try:
-        # Google News RSS를 통한 일일 경제 뉴스 수집
-        import urllib.parse
-        # 경제 뉴스 키워드 (개선: 산업별, 기업 분석 키워드 추가)
-        keywords = ["경제", "금리", "통화정책", "증시", "주식", "경제동향", "거시경제", "실물경제", "부동산", "경제정책",
-                   "반도체", "바이오", "금융", "은행", "증권", "경제지표"]
-        today = datetime.now().strftime("%Y-%m-%d")
-        
-        for keyword in keywords:
-            query = urllib.parse.quote(keyword)
-            rss_url = f"https://news.google.com/rss/search?q={query}&hl=ko&gl=KR&ceid=KR:ko"
-            
-            feed = feedparser.parse(rss_url)
-            
-            if not feed.entries:
-                logger.warning(f"{keyword} RSS 피드가 비어있음")
-                continue
-            
-            for entry in feed.entries[:max_results//len(keywords)]:
-                title = entry.get("title", "").replace(" - Google 뉴스", "").replace(" - Google News", "").strip()
-                url = entry.get("link", "")
-                
-                if title and url and title not in [n.get("title") for n in news_list]:
-                    try:
-                        from dateutil import parser as date_parser
-                        pub_date = date_parser.parse(entry.get("published", "")).strftime("%Y-%m-%d")
-                    except:
-                        pub_date = today
-                    
-                    news_list.append({
-                        "title": title,
-                        "url": url,
-                        "source": "일일 경제 뉴스",
-                        "category": "거시경제",
-                        "date": pub_date
-                    })
-            
-            time.sleep(0.3)  # API 호출 간격
-        
-        logger.info(f"일일 경제 뉴스 {len(news_list)}개 수집")
-        
-    except Exception as e:
-        logger.error(f"일일 경제 뉴스 수집 실패: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
-    
-    return news_list
+    return run_with_fetcher(fetch_economy_feed_async, "kcif", max_results)
 
 
-def fetch_kcif_news(max_results: int = 20) -> List[Dict]:
+async def fetch_daily_economy_news_async(fetcher: Fetcher, max_results: int = 30,
+                                         watermarks: Optional[FeedWatermarks] = None) -> List[Dict]:
     """
-    국제금융센터 일일 브리핑 수집
-    Google News RSS를 통해 국제금융센터 관련 뉴스 수집
+    일일 경제 뉴스 수집 (키워드별 RSS를 동시에 요청)
+    
+    Args:
+        fetcher: 공유 연결 풀 Fetcher
+        max_results: 최대 수집 개수 (키워드별로 균등 배분)
+        watermarks: 피드 워터마크 (주면 이전 수집 이후 항목만)
+    
+    Returns:
+        경제 뉴스 딕셔너리 리스트 (제목 기준 중복 제거)
     """
     news_list = []
     try:
-        # Google News RSS를 통한 국제금융센터 관련 뉴스 수집
-        import urllib.parse
-        query = urllib.parse.quote("국제금융센터 OR KCIF OR 글로벌 금융")
-        rss_url = f"https://news.google.com/rss/search?q={query}&hl=ko&gl=KR&ceid=KR:ko"
-        
-        feed = feedparser.parse(rss_url)
-        
-        if not feed.entries:
-            logger.warning(f"국제금융센터 RSS 피드가 비어있음")
-            rss_url = "https://news.google.com/rss/search?q=글로벌+금융&hl=ko&gl=KR&ceid=KR:ko"
-            feed = feedparser.parse(rss_url)
+        per_keyword = max_results // len(DAILY_ECONOMY_KEYWORDS)
+        feeds = await asyncio.gather(*(
+            fetcher.get_feed(google_news_rss_url(keyword))
+            for keyword in DAILY_ECONOMY_KEYWORDS
+        ))
         
-        for entry in feed.entries[:max_results]:
-            title = entry.get("title", "").replace(" - Google 뉴스", "").replace(" - Google News", "").strip()
-            url = entry.get("link", "")
+        seen_titles = set()
+        for keyword, feed in zip(DAILY_ECONOMY_KEYWORDS, feeds):
+            if not feed.entries:
+                if feed.get("status") != 304:
+                    logger.warning(f"{keyword} RSS 피드가 비어있음")
+                continue
             
-            if title and url:
-                try:
-                    from dateutil import parser as date_parser
-                    pub_date = date_parser.parse(entry.get("published", "")).strftime("%Y-%m-%d")
-                except:
-                    pub_date = datetime.now().strftime("%Y-%m-%d")
-                
-                news_list.append({
-                    "title": title,
-                    "url": url,
-                    "source": "국제금융센터 (Google News)",
-                    "category": "글로벌시황",
-                    "date": pub_date
-                })
-        
-        logger.info(f"국제금융센터 관련 뉴스 {len(news_list)}개 수집")
+            for item in parse_feed_entries(feed, per_keyword, "일일 경제 뉴스", "거시경제",
+                                           watermarks, keyword, "KR"):
+                if item["title"] not in seen_titles:
+                    seen_titles.add(item["title"])
+                    news_list.append(item)
+        
+        # Google News 리다이렉트 URL을 언론사 URL로 해석
+        await canonicalize_items_async(fetcher, news_list)
+        logger.info(f"일일 경제 뉴스 {len(news_list)}개 수집")
         
     except Exception as e:
-        logger.error(f"국제금융센터 뉴스 수집 실패: {e}")
+        logger.error(f"일일 경제 뉴스 수집 실패: {e}")
         import traceback
         logger.error(traceback.format_exc())
     
     return news_list
 
 
-def scrape_content(url: str, max_retries: int = 2) -> Optional[str]:
+def fetch_daily_economy_news(max_results: int = 30) -> List[Dict]:
     """
-    웹페이지 본문 스크래핑
-    
-    Args:
-        url: 웹페이지 URL
-        max_retries: 최대 재시도 횟수
-    
-    Returns:
-        본문 텍스트 (실패 시 None)
+    일일 경제 뉴스 수집 (Google News RSS)
+    오늘 날짜의 경제 관련 뉴스 수집
     """
-    for attempt in range(max_retries):
-        try:
-            response = requests.get(url, headers=HEADERS, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 본문 추출 시도
-            content = None
-            for tag in ['article', 'div[class*="article"]', 'div[class*="content"]', 'main']:
-                elements = soup.select(tag)
-                if elements:
-                    content = ' '.join([elem.get_text(strip=True) for elem in elements])
-                    if len(content) > 200:
-                        break
-            
-            if not content or len(content) < 200:
-                paragraphs = soup.find_all('p')
-                content = ' '.join([p.get_text(strip=True) for p in paragraphs])
-            
-            if content and len(content) > 100:
-                return content[:5000]  # 최대 5000자
-            else:
-                return None
-                
-        except Exception as e:
-            logger.warning(f"본문 스크래핑 실패 (시도 {attempt + 1}/{max_retries}): {e}")
-            if attempt < max_retries - 1:
-                time.sleep(2)
-            else:
-                return None
-    
-    return None
+    return run_with_fetcher(fetch_daily_economy_news_async, max_results)
 
 
 def check_duplicate(url: str) -> bool:
     """URL 중복 체크"""
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT id FROM economy_news WHERE url = ?", (url,))
-        result = cursor.fetchone()
-        conn.close()
+        with db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT id FROM economy_news WHERE url = ?", (url,))
+            result = cursor.fetchone()
         return result is not None
     except Exception as e:
         logger.error(f"중복 체크 실패: {e}")
         return False
 
 
+def economy_news_record(news_data: Dict) -> Dict:
+    """경제 뉴스 데이터를 economy_news 테이블 레코드로 변환"""
+    return {
+        "date": news_data.get("date", datetime.now().strftime("%Y-%m-%d")),
+        "category": news_data.get("category", "경제"),
+        "title": news_data.get("title", ""),
+        "url": news_data.get("url", ""),
+        "original_url": news_data.get("original_url") or news_data.get("url", ""),
+        "content_summary": news_data.get("content_summary", ""),
+        "full_text": news_data.get("full_text", ""),
+        "keywords": json.dumps(news_data.get("keywords", []), ensure_ascii=False),
+        "source": news_data.get("source", "")
+    }
+
+
 def save_economy_news_to_db(news_data: Dict) -> bool:
-    """경제 뉴스를 데이터베이스에 저장"""
+    """경제 뉴스를 데이터베이스에 저장 (쓰기 스레드가 다른 요청과 묶어서 커밋, URL 중복이면 False)"""
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        date_str = news_data.get("date", datetime.now().strftime("%Y-%m-%d"))
-        
-        cursor.execute("""
-            INSERT INTO economy_news (
-                date, category, title, url, content_summary, 
-                full_text, keywords, source
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            date_str,
-            news_data.get("category", "경제"),
-            news_data.get("title", ""),
-            news_data.get("url", ""),
-            news_data.get("content_summary", ""),
-            news_data.get("full_text", ""),
-            json.dumps(news_data.get("keywords", []), ensure_ascii=False),
-            news_data.get("source", "")
-        ))
-        
-        conn.commit()
-        conn.close()
-        logger.info(f"경제 뉴스 저장 완료: {news_data.get('title', '')[:50]}")
-        return True
+        if get_writer().submit("economy_news", economy_news_record(news_data)).result():
+            logger.info(f"경제 뉴스 저장 완료: {news_data.get('title', '')[:50]}")
+            return True
+        return False
         
     except Exception as e:
         logger.error(f"경제 뉴스 저장 실패: {e}")
         return False
 
 
-def process_single_economy_item(item: Dict) -> Optional[Dict]:
+def save_economy_news_batch_to_db(news_list: List[Dict]) -> int:
+    """여러 경제 뉴스를 한 트랜잭션으로 저장하고 새로 저장된 개수 반환 (저장 실패 시 예외를 그대로 전달)"""
+    try:
+        return write_records("economy_news", [economy_news_record(news) for news in news_list])
+    except Exception as e:
+        logger.error(f"경제 뉴스 일괄 저장 실패: {e}")
+        raise
+
+
+def prepare_single_economy_item(item: Dict, duplicates: NearDuplicateIndex = None) -> Optional[Dict]:
     """
-    단일 경제 뉴스 처리 함수 (병렬 처리용)
+    단일 경제 뉴스의 AI 분석 전 단계 처리 (중복 체크, 본문 스크래핑, 유사 중복 감지)
     
     Args:
         item: 경제 뉴스 딕셔너리
+        duplicates: 유사 중복 색인 (없으면 URL 중복만 확인)
     
     Returns:
-        처리된 뉴스 데이터 (실패 시 None)
+        {"item": 경제 뉴스 딕셔너리, "full_text": 본문} (중복 또는 유사 중복이면 None)
     """
     url = item.get("url", "")
     
@@ -483,155 +352,261 @@ def process_single_economy_item(item: Dict) -> Optional[Dict]:
         return None
     
     # 본문 스크래핑
-    full_text = scrape_content(url)
+    full_text = scraper.scrape(url, retry_delay=2)
     if not full_text:
         full_text = item.get("title", "")
     
-    # AI 분석
-    try:
-        # 요약 생성 (3줄)
-        summary = generate_summary(full_text[:2000])
-        if not summary or len(summary) > 200:
-            summary = summary[:200] + "..." if summary and len(summary) > 200 else (item.get('title', '')[:100] + "...")
-        
-        # 키워드 추출
-        keywords_list = extract_keywords(full_text[:2000], max_keywords=5)
-        
-    except Exception as e:
-        logger.error(f"AI 분석 실패: {e}")
+    # 이미 본 기사와 거의 같으면 AI 분석 전에 건너뜀
+    if duplicates is not None and duplicates.check(url, item.get("title", ""), full_text):
+        return None
+    
+    return {"item": item, "full_text": full_text}
+
+
+async def prepare_single_economy_item_async(fetcher: Fetcher, item: Dict,
+                                            duplicates: NearDuplicateIndex = None) -> Optional[Dict]:
+    """
+    단일 경제 뉴스의 AI 분석 전 단계 처리 (비동기 버전, URL 중복은 filter_new_items로 미리 제거된 상태)
+    
+    Args:
+        fetcher: 공유 연결 풀 Fetcher
+        item: 경제 뉴스 딕셔너리
+        duplicates: 유사 중복 색인 (없으면 감지하지 않음)
+    
+    Returns:
+        {"item": 경제 뉴스 딕셔너리, "full_text": 본문} (유사 중복이면 None)
+    """
+    url = item.get("url", "")
+    
+    # 본문 스크래핑
+    full_text = await scraper.scrape_async(fetcher, url, retry_delay=2)
+    if not full_text:
+        full_text = item.get("title", "")
+    
+    # 이미 본 기사와 거의 같으면 AI 분석 전에 건너뜀
+    if duplicates is not None and await asyncio.to_thread(duplicates.check, url, item.get("title", ""), full_text):
+        return None
+    
+    return {"item": item, "full_text": full_text}
+
+
+def build_economy_news_data(item: Dict, full_text: str, analysis: Optional[Dict]) -> Dict:
+    """
+    AI 분석 결과(3줄 요약, 키워드)로 저장할 경제 뉴스 데이터 구성
+    
+    Args:
+        item: 경제 뉴스 딕셔너리
+        full_text: 본문
+        analysis: analyze_article 형태의 분석 결과 (실패 시 None)
+    
+    Returns:
+        경제 뉴스 데이터 딕셔너리
+    """
+    if analysis is None:
+        logger.error(f"AI 분석 결과 없음, 기본값으로 저장: {item.get('title', '')[:50]}")
         summary = item.get('title', '')[:100] + "..."
         keywords_list = []
+    else:
+        summary = analysis.get("summary", "")
+        if not summary or len(summary) > 200:
+            summary = summary[:200] + "..." if summary and len(summary) > 200 else (item.get('title', '')[:100] + "...")
+        keywords_list = analysis.get("keywords", [])
     
-    # 데이터베이스에 저장
-    news_data = {
+    return {
         "date": datetime.now().strftime("%Y-%m-%d"),
         "category": item.get("category", "경제"),
         "title": item.get("title", ""),
-        "url": url,
+        "url": item.get("url", ""),
+        "original_url": item.get("original_url", item.get("url", "")),
         "content_summary": summary,
         "full_text": full_text[:5000],
         "keywords": keywords_list,
         "source": item.get("source", "")
     }
+
+
+def process_single_economy_item(item: Dict) -> Optional[Dict]:
+    """
+    단일 경제 뉴스 처리 함수 (스크래핑 → AI 분석 → 저장을 한 건씩 수행)
+    
+    Args:
+        item: 경제 뉴스 딕셔너리
+    
+    Returns:
+        처리된 뉴스 데이터 (실패 시 None)
+    """
+    duplicates = NearDuplicateIndex("economy_news")
+    prepared = prepare_single_economy_item(item, duplicates)
+    if not prepared:
+        duplicates.save()
+        return None
+    
+    full_text = prepared["full_text"]
+    try:
+        # 3줄 요약과 키워드를 한 번의 요청으로 처리
+        analysis = analyze_article(
+            full_text[:2000],
+            title=item.get("title", ""),
+            summary_style="three_lines",
+            evaluate=False
+        )
+    except Exception as e:
+        logger.error(f"AI 분석 실패: {e}")
+        analysis = None
     
+    news_data = build_economy_news_data(item, full_text, analysis)
     if save_economy_news_to_db(news_data):
+        duplicates.save()
         return news_data
     
     return None
 
 
-def collect_economy_news(progress_callback=None):
+async def collect_economy_news_async(progress_callback=None):
     """
-    경제 흐름 정보 수집 메인 함수 (병렬 처리 최적화)
+    경제 흐름 정보 수집 (비동기 파이프라인)
+    
+    모든 소스의 RSS와 기사 본문을 공유 연결 풀로 동시에 요청하고,
+    AI 분석은 배치 단위로 스레드에서 수행
     
     Args:
-        progress_callback: 진행도 콜백 함수
+        progress_callback: 진행도 콜백 함수 (이벤트 루프 스레드에서 호출됨)
     """
-    logger.info("=== 경제 흐름 정보 수집 시작 (병렬 처리) ===")
+    logger.info("=== 경제 흐름 정보 수집 시작 (비동기 처리) ===")
     
     total_collected = 0
     total_saved = 0
     
-    all_items = []
-    
-    # 1. 거시경제 및 정책
-    logger.info("거시경제 정보 수집 중...")
-    if progress_callback:
-        progress_callback(1, 6, "거시경제 정보 수집 중...")
-    
-    bok_reports = fetch_bok_reports(max_results=15)
-    all_items.extend(bok_reports)
-    time.sleep(0.3)
-    
-    kdi_reports = fetch_kdi_reports(max_results=15)
-    all_items.extend(kdi_reports)
-    time.sleep(0.3)
-    
-    # 2. 산업 및 기업 분석
-    logger.info("산업 분석 정보 수집 중...")
-    if progress_callback:
-        progress_callback(2, 6, "산업 분석 정보 수집 중...")
-    
-    hankyung_reports = fetch_hankyung_consensus(max_results=20)
-    all_items.extend(hankyung_reports)
-    time.sleep(0.3)
-    
-    naver_reports = fetch_naver_finance(max_results=20)
-    all_items.extend(naver_reports)
-    time.sleep(0.3)
-    
-    # 3. 글로벌 시황 및 뉴스
-    logger.info("글로벌 시황 정보 수집 중...")
-    if progress_callback:
-        progress_callback(3, 6, "글로벌 시황 정보 수집 중...")
-    
-    investing_news = fetch_investing_news(max_results=20)
-    all_items.extend(investing_news)
-    time.sleep(0.3)
-    
-    kcif_news = fetch_kcif_news(max_results=20)
-    all_items.extend(kcif_news)
-    time.sleep(0.3)
+    watermarks = await asyncio.to_thread(FeedWatermarks, "economy")
+    duplicates = NearDuplicateIndex("economy_news")
     
-    # 4. 일일 경제 뉴스 추가 수집 (Google News)
-    logger.info("일일 경제 뉴스 수집 중...")
-    if progress_callback:
-        progress_callback(3, 6, "일일 경제 뉴스 수집 중...")
-    
-    daily_economy_news = fetch_daily_economy_news(max_results=30)
-    all_items.extend(daily_economy_news)
-    time.sleep(0.3)
-    
-    # 전체 작업량 계산
-    total_work = len(all_items)
-    processed_count = 0
-    
-    logger.info(f"총 {total_work}개 항목 수집 완료. 병렬 처리 시작...")
-    
-    if total_work == 0:
-        logger.warning("수집된 항목이 없습니다. RSS 피드 확인이 필요합니다.")
+    async with open_fetcher(conditional=True) as fetcher:
+        # 1~3. 거시경제, 산업 분석, 글로벌 시황, 일일 경제 뉴스 (모든 소스 동시 요청, 이전 수집 이후 항목만, 바뀌지 않은 피드는 304)
+        logger.info("거시경제, 산업 분석, 글로벌 시황 정보 수집 중...")
         if progress_callback:
-            progress_callback(6, 6, "수집된 항목이 없습니다.")
-        return 0, 0
-    
-    if progress_callback:
-        progress_callback(4, 6, f"항목 분석 준비 중... ({total_work}개 항목)")
-    
-    # 병렬 처리 (최대 5개 스레드 동시 실행)
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        # 모든 항목에 대해 병렬 처리 시작
-        future_to_item = {
-            executor.submit(process_single_economy_item, item): item 
-            for item in all_items
-        }
-        
-        # 완료된 작업부터 처리
-        for future in as_completed(future_to_item):
-            processed_count += 1
-            item = future_to_item[future]
-            
+            progress_callback(1, 6, "경제 정보 피드 수집 중...")
+        
+        results = await asyncio.gather(
+            fetch_economy_feed_async(fetcher, "bok", 15, watermarks),
+            fetch_economy_feed_async(fetcher, "kdi", 15, watermarks),
+            fetch_economy_feed_async(fetcher, "hankyung", 20, watermarks),
+            fetch_economy_feed_async(fetcher, "naver", 20, watermarks),
+            fetch_economy_feed_async(fetcher, "investing", 20, watermarks),
+            fetch_economy_feed_async(fetcher, "kcif", 20, watermarks),
+            fetch_daily_economy_news_async(fetcher, 30, watermarks),
+        )
+        fetched_items = [item for items in results for item in items]
+        
+        if not fetched_items:
+            logger.warning("새로 수집된 항목이 없습니다. (이전 수집 이후 새 기사가 없거나 RSS 피드 확인 필요)")
+            await asyncio.to_thread(fetcher.validators.save)
+            if progress_callback:
+                progress_callback(6, 6, "수집된 항목이 없습니다.")
+            return 0, 0
+        
+        # 배치 전체 중복 제거 (배치 내부 + DB, 한 번의 집합 쿼리) 후 새 URL만 처리
+        all_items = await asyncio.to_thread(filter_new_items, "economy_news", fetched_items)
+        
+        # 전체 작업량 계산
+        total_work = len(all_items)
+        processed_count = 0
+        
+        logger.info(f"총 {len(fetched_items)}개 항목 수집 완료 (중복 {len(fetched_items) - total_work}개 제외). 비동기 처리 시작...")
+        
+        if total_work == 0:
+            logger.info("새로운 항목이 없습니다.")
+            await asyncio.to_thread(watermarks.save)
+            await asyncio.to_thread(fetcher.validators.save)
+            if progress_callback:
+                progress_callback(6, 6, "새로운 항목이 없습니다.")
+            return 0, 0
+        
+        if progress_callback:
+            progress_callback(4, 6, f"항목 분석 준비 중... ({total_work}개 항목)")
+        
+        async def prepare(item: Dict) -> Optional[Dict]:
             try:
-                result = future.result()
-                if result:
-                    total_collected += 1
-                    total_saved += 1
-                    
-                    # 진행도 업데이트
-                    if progress_callback:
-                        progress = 4 + (processed_count / total_work * 2) if total_work > 0 else 4
-                        progress_callback(min(progress, 6), 6, 
-                                        f"처리 중... ({processed_count}/{total_work}) - {total_saved}개 저장됨")
+                return await prepare_single_economy_item_async(fetcher, item, duplicates)
             except Exception as e:
                 logger.error(f"경제 뉴스 처리 실패: {item.get('title', '')[:50]} - {e}")
-                if progress_callback:
-                    progress = 4 + (processed_count / total_work * 2) if total_work > 0 else 4
-                    progress_callback(min(progress, 6), 6, 
-                                    f"처리 중... ({processed_count}/{total_work})")
+                return None
+        
+        # 1단계: 본문 스크래핑 및 유사 중복 감지 (동시 실행, 호스트별 동시 요청 수 제한)
+        prepared_list = []
+        for future in asyncio.as_completed([prepare(item) for item in all_items]):
+            prepared = await future
+            processed_count += 1
+            if prepared:
+                prepared_list.append(prepared)
+            
+            # 진행도 업데이트 (4 → 5)
+            if progress_callback:
+                progress = 4 + (processed_count / total_work)
+                progress_callback(min(progress, 6), 6,
+                                f"본문 수집 중... ({processed_count}/{total_work})")
+    
+    # 2단계: 배치 AI 분석 (3줄 요약 + 키워드, 여러 항목을 한 번의 요청으로 분석)
+    analyzed_count = 0
+    
+    def on_analyzed(count):
+        nonlocal analyzed_count
+        analyzed_count += count
+        # 진행도 업데이트 (5 → 6)
+        if progress_callback and prepared_list:
+            progress = 5 + (analyzed_count / len(prepared_list))
+            progress_callback(min(progress, 6), 6,
+                            f"AI 분석 중... ({analyzed_count}/{len(prepared_list)})")
+    
+    items = [
+        {"id": str(idx), "title": prepared["item"].get("title", ""), "text": prepared["full_text"][:2000]}
+        for idx, prepared in enumerate(prepared_list)
+    ]
+    analyses = {}
+    if items:
+        try:
+            analyses = await asyncio.to_thread(
+                analyze_articles_batch, items,
+                summary_style="three_lines", evaluate=False,
+                progress_callback=threadsafe_callback(on_analyzed)
+            )
+        except Exception as e:
+            logger.error(f"AI 배치 분석 실패: {e}")
+    
+    # 3단계: 일괄 저장 (쓰기 스레드가 한 트랜잭션으로 커밋)
+    news_list = [
+        build_economy_news_data(prepared["item"], prepared["full_text"], analyses.get(str(idx)))
+        for idx, prepared in enumerate(prepared_list)
+    ]
+    total_saved = save_economy_news_batch_to_db(news_list)
+    total_collected = total_saved
+    
+    # 저장에 성공한 뒤에만 워터마크/피드 검증값/유사 중복 색인 갱신
+    # (저장이 실패하면 예외가 전달되어 아래를 건너뛰므로 다음 수집에서 같은 항목을 다시 읽음)
+    await asyncio.to_thread(watermarks.save)
+    await asyncio.to_thread(fetcher.validators.save)
+    await asyncio.to_thread(duplicates.save)
+    
+    if progress_callback:
+        progress_callback(6, 6, f"처리 완료 - {total_saved}개 저장됨")
     
     logger.info(f"=== 경제 흐름 정보 수집 완료: {total_collected}개 수집, {total_saved}개 저장 ===")
+    logger.info(f"유사 중복 통계: {duplicates.stats}")
+    logger.info(f"AI 엔진 통계: {get_ai_stats()}")
+    logger.info(f"페이지 캐시 통계: {page_cache.get_stats()}")
+    logger.info(f"본문 추출 통계: {scraper.get_stats()}")
     return total_collected, total_saved
 
 
+def collect_economy_news(progress_callback=None):
+    """
+    경제 흐름 정보 수집 메인 함수 (비동기 파이프라인의 동기 래퍼)
+    
+    Args:
+        progress_callback: 진행도 콜백 함수
+    """
+    return run(collect_economy_news_async(progress_callback))
+
+
 def check_report_exists(date: str) -> bool:
     """
     해당 날짜의 보고서가 이미 생성되었는지 확인
@@ -643,11 +618,10 @@ def check_report_exists(date: str) -> bool:
         보고서 존재 여부
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT id FROM economy_reports WHERE date = ?", (date,))
-        result = cursor.fetchone()
-        conn.close()
+        with db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT id FROM economy_reports WHERE date = ?", (date,))
+            result = cursor.fetchone()
         return result is not None
     except Exception as e:
         logger.error(f"보고서 존재 확인 실패: {e}")
@@ -668,21 +642,19 @@ def save_report_to_db(date: str, report_text: str, news_count: int, used_news_id
         저장 성공 여부
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
+        with db_connection() as conn:
+            cursor = conn.cursor()
         
-        # 사용된 뉴스 ID를 JSON으로 저장
-        used_ids_json = json.dumps(used_news_ids or [], ensure_ascii=False)
+            # 사용된 뉴스 ID를 JSON으로 저장
+            used_ids_json = json.dumps(used_news_ids or [], ensure_ascii=False)
         
-        # 기존 보고서가 있으면 업데이트, 없으면 삽입
-        cursor.execute("""
-            INSERT OR REPLACE INTO economy_reports 
-            (date, report_text, news_count, used_news_ids, updated_at)
-            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-        """, (date, report_text, news_count, used_ids_json))
+            # 기존 보고서가 있으면 업데이트, 없으면 삽입
+            cursor.execute("""
+                INSERT OR REPLACE INTO economy_reports 
+                (date, report_text, news_count, used_news_ids, updated_at)
+                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+            """, (date, report_text, news_count, used_ids_json))
         
-        conn.commit()
-        conn.close()
         logger.info(f"보고서 저장 완료: {date} (뉴스 {news_count}개 사용)")
         return True
     except Exception as e:
@@ -701,11 +673,10 @@ def get_report_from_db(date: str) -> Optional[Dict]:
         {"report_text": str, "used_news_ids": List[int]} 또는 None
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT report_text, used_news_ids FROM economy_reports WHERE date = ?", (date,))
-        result = cursor.fetchone()
-        conn.close()
+        with db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT report_text, used_news_ids FROM economy_reports WHERE date = ?", (date,))
+            result = cursor.fetchone()
         
         if result:
             report_text, used_ids_json = result
@@ -731,21 +702,20 @@ def get_unused_news_ids(date: str) -> List[int]:
         사용되지 않은 뉴스 ID 리스트
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
+        with db_connection() as conn:
+            cursor = conn.cursor()
         
-        # 해당 날짜의 모든 뉴스 ID 조회
-        cursor.execute("SELECT id FROM economy_news WHERE date = ?", (date,))
-        all_news_ids = [row[0] for row in cursor.fetchall()]
+            # 해당 날짜의 모든 뉴스 ID 조회
+            cursor.execute("SELECT id FROM economy_news WHERE date = ?", (date,))
+            all_news_ids = [row[0] for row in cursor.fetchall()]
         
-        # 보고서에 사용된 뉴스 ID 조회
-        report_data = get_report_from_db(date)
-        used_ids = report_data.get("used_news_ids", []) if report_data else []
+            # 보고서에 사용된 뉴스 ID 조회
+            report_data = get_report_from_db(date)
+            used_ids = report_data.get("used_news_ids", []) if report_data else []
         
-        # 사용되지 않은 뉴스 ID
-        unused_ids = [nid for nid in all_news_ids if nid not in used_ids]
+            # 사용되지 않은 뉴스 ID
+            unused_ids = [nid for nid in all_news_ids if nid not in used_ids]
         
-        conn.close()
         return unused_ids
     except Exception as e:
         logger.error(f"미사용 뉴스 ID 조회 실패: {e}")
@@ -769,19 +739,18 @@ def generate_daily_economy_report(date: str = None, force_regenerate: bool = Fal
         date = datetime.now().strftime("%Y-%m-%d")
     
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
+        with db_connection() as conn:
+            cursor = conn.cursor()
         
-        # 해당 날짜의 모든 경제 뉴스 조회 (ID 포함)
-        cursor.execute("""
-            SELECT id, title, content_summary, category, source, keywords
-            FROM economy_news
-            WHERE date = ?
-            ORDER BY created_at DESC
-        """, (date,))
+            # 해당 날짜의 모든 경제 뉴스 조회 (ID 포함)
+            cursor.execute("""
+                SELECT id, title, content_summary, category, source, keywords
+                FROM economy_news
+                WHERE date = ?
+                ORDER BY created_at DESC
+            """, (date,))
         
-        all_news = cursor.fetchall()
-        conn.close()
+            all_news = cursor.fetchall()
         
         if not all_news:
             logger.warning(f"{date} 날짜의 경제 뉴스가 없습니다.")
@@ -891,16 +860,15 @@ def generate_daily_economy_report(date: str = None, force_regenerate: bool = Fal
         
         # AI 모델을 사용하여 보고서 생성
         try:
-            model = get_model()
-            response = model.generate_content(
+            report = generate_text(
                 report_prompt,
                 generation_config={
                     "temperature": 0.7,
                     "max_output_tokens": 3000,
-                }
-            )
-            
-            report = response.text.strip()
+                },
+                task="economy_report",
+                refresh_cache=force_regenerate
+            ).strip()
             logger.info(f"일일 경제 종합 보고서 생성 완료: {len(report)}자 (뉴스 {len(all_news)}개 사용)")
             
             # 보고서를 데이터베이스에 저장 (사용된 뉴스 ID 포함)
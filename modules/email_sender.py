@@ -140,3 +140,56 @@ def send_news_summary(news_list: List[Dict], max_retries: int = 3) -> bool:
     except Exception as e:
         logger.error(f"이메일 발송 중 오류: {e}")
         return False
+
+
+def get_digest_news(date: str = None, limit: int = 20) -> List[Dict]:
+    """
+    이메일 다이제스트에 넣을 뉴스 조회 (해당 날짜 기사, 평점순)
+    
+    Args:
+        date: 기사 날짜 (None이면 오늘)
+        limit: 최대 개수
+    
+    Returns:
+        send_news_summary에 넘길 뉴스 딕셔너리 리스트
+    """
+    from modules.database import db_connection
+    from modules.queries import DIGEST_ARTICLES
+    
+    date = date or datetime.now().strftime("%Y-%m-%d")
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(DIGEST_ARTICLES, (date, limit))
+        rows = cursor.fetchall()
+    
+    return [
+        {
+            "date": row[0],
+            "title": row[1],
+            "url": row[2],
+            "content_summary": row[3],
+            "validity_score": row[4],
+            "country": row[5]
+        }
+        for row in rows
+    ]
+
+
+def send_daily_digest(date: str = None, limit: int = 20) -> Dict:
+    """
+    해당 날짜 뉴스 헤드라인 다이제스트 발송
+    
+    Args:
+        date: 기사 날짜 (None이면 오늘)
+        limit: 최대 뉴스 개수
+    
+    Returns:
+        {"news": 뉴스 개수, "sent": 발송 여부}
+    """
+    news_list = get_digest_news(date, limit)
+    if not news_list:
+        logger.info("발송할 뉴스가 없습니다.")
+        return {"news": 0, "sent": False}
+    
+    logger.info(f"이메일 발송 시작: {len(news_list)}개 뉴스")
+    return {"news": len(news_list), "sent": send_news_summary(news_list)}
@@ -0,0 +1,317 @@
+"""
+피드 상태 모듈
+(소스, 키워드, 국가)별로 마지막으로 본 가장 최신 항목의 발행 시각/ID를 feed_state 테이블에 기록하여
+다음 수집에서 이미 본 항목 이전까지만 읽도록 하고(날짜순 피드), 관련도순 피드는 본 항목 ID를
+feed_seen 테이블에 기록하여 처음 보는 항목만 고름. 피드 URL별 ETag/Last-Modified를
+feed_validators 테이블에 기록하여 바뀌지 않은 피드는 304 응답으로 건너뜀
+"""
+
+import time
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from modules.database import db_connection
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 발행 시각 저장 형식 (UTC, 문자열 비교로 선후 판단)
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+# 관련도순 피드에서 본 항목 ID 보관 기간 (일, 지난 항목이 다시 나오면 URL 중복 제거가 걸러냄)
+FEED_SEEN_DAYS = 30
+
+
+def entry_timestamp(entry) -> Optional[str]:
+    """
+    feedparser 항목의 발행 시각을 UTC 타임스탬프 문자열로 변환
+
+    Args:
+        entry: feedparser 항목
+
+    Returns:
+        "YYYY-MM-DDTHH:MM:SSZ" (발행 시각이 없으면 None)
+    """
+    parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+    if not parsed:
+        return None
+    return time.strftime(TIMESTAMP_FORMAT, parsed)
+
+
+class FeedWatermarks:
+    """
+    한 번의 수집 실행에서 쓰는 소스별 워터마크
+
+    실행 시작 시 저장된 워터마크를 읽고, 실행 중 관측한 최신 항목은 observe()로 모았다가
+    저장에 성공한 뒤에만 save()로 기록 (실행이 중간에 실패하면 워터마크를 올리지 않음)
+
+    발행 시각 워터마크(is_seen/observe)는 날짜순 피드(arXiv, PubMed)에만 맞으므로,
+    관련도순인 Google News 검색 피드는 take_new_entries()가 본 항목 ID로 새 항목을 고름
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        self.observed: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        self.new_ids: Dict[Tuple[str, str], set] = {}
+        with db_connection() as conn:
+            rows = conn.execute(
+                "SELECT keyword, country, last_published, last_id FROM feed_state WHERE source = ?", (source,)
+            ).fetchall()
+            seen_rows = conn.execute(
+                "SELECT keyword, country, item_id FROM feed_seen WHERE source = ?", (source,)
+            ).fetchall()
+        self.saved: Dict[Tuple[str, str], Tuple[str, str]] = {
+            (keyword, country): (last_published, last_id) for keyword, country, last_published, last_id in rows
+        }
+        self.seen_ids: Dict[Tuple[str, str], set] = {}
+        for keyword, country, item_id in seen_rows:
+            self.seen_ids.setdefault((keyword, country), set()).add(item_id)
+
+    def get(self, keyword: str, country: str = "") -> Optional[Tuple[str, str]]:
+        """저장된 워터마크 (last_published, last_id), 없으면 None"""
+        return self.saved.get((keyword, country or ""))
+
+    def is_seen(self, keyword: str, country: str, published: Optional[str], item_id: str = "") -> bool:
+        """
+        이전 수집에서 이미 본 항목인지 (워터마크보다 오래됐거나 워터마크 항목 자체)
+
+        발행 시각이 워터마크와 같은 다른 항목은 새 항목으로 취급 (URL 중복 제거가 최종 판단)
+
+        Args:
+            keyword: 검색 키워드
+            country: 국가 코드 (없으면 "")
+            published: 항목 발행 시각 (TIMESTAMP_FORMAT 또는 같은 형식으로 비교 가능한 문자열)
+            item_id: 항목 ID (URL, arXiv ID, PMID 등)
+        """
+        watermark = self.get(keyword, country)
+        if watermark is None or not published:
+            return False
+        last_published, last_id = watermark
+        return published < last_published or (bool(item_id) and item_id == last_id)
+
+    def observe(self, keyword: str, country: str, published: Optional[str], item_id: str = ""):
+        """수집한 항목을 기록하여 가장 최신 항목을 새 워터마크 후보로 유지"""
+        if not published:
+            return
+        key = (keyword, country or "")
+        current = self.observed.get(key)
+        if current is None or published > current[0]:
+            self.observed[key] = (published, item_id)
+
+    def take_new_entries(self, entries, keyword: str, country: str, limit: int) -> list:
+        """
+        관련도순 RSS 항목 중 이전 수집에서 본 항목(ID = 링크)을 건너뛰고 새 항목을 limit개까지 고름
+
+        Google News 검색 피드는 관련도순이라 발행 시각으로 거르면 나중에 검색 결과에 올라온 기사와
+        limit에 밀려 못 가져온 기사를 놓치므로, 발행 시각과 관계없이 처음 보는 링크만 고름
+
+        Args:
+            entries: feedparser 항목 리스트 (피드 순서)
+            keyword: 검색 키워드
+            country: 국가 코드
+            limit: 최대 개수
+
+        Returns:
+            새 항목 리스트 (피드 순서 유지)
+        """
+        key = (keyword, country or "")
+        seen = self.seen_ids.get(key, set())
+        new_ids = self.new_ids.setdefault(key, set())
+        taken = []
+        for entry in entries:
+            if len(taken) >= limit:
+                break
+            link = entry.get("link", "")
+            if link and (link in seen or link in new_ids):
+                continue
+            taken.append(entry)
+            if link:
+                new_ids.add(link)
+            self.observe(keyword, country, entry_timestamp(entry), link)
+        return taken
+
+    def save(self) -> int:
+        """
+        관측한 워터마크(기존 값보다 최신이거나, 발행 시각이 같고 새로 본 항목인 경우에만 갱신)와
+        관련도순 피드에서 새로 본 항목 ID 기록 (FEED_SEEN_DAYS보다 오래된 ID는 정리)
+
+        Returns:
+            갱신한 (키워드, 국가) 수
+        """
+        if not self.observed and not any(self.new_ids.values()):
+            return 0
+        try:
+            with db_connection() as conn:
+                conn.executemany("""
+                    INSERT OR IGNORE INTO feed_seen (source, keyword, country, item_id) VALUES (?, ?, ?, ?)
+                """, [
+                    (self.source, keyword, country, item_id)
+                    for (keyword, country), item_ids in self.new_ids.items()
+                    for item_id in item_ids
+                ])
+                conn.execute(
+                    f"DELETE FROM feed_seen WHERE seen_at < datetime('now', '-{FEED_SEEN_DAYS} days')"
+                )
+                before = conn.total_changes
+                conn.executemany("""
+                    INSERT INTO feed_state (source, keyword, country, last_published, last_id, updated_at)
+                    VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                    ON CONFLICT(source, keyword, country) DO UPDATE SET
+                        last_published = excluded.last_published,
+                        last_id = excluded.last_id,
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE excluded.last_published > feed_state.last_published
+                       OR (excluded.last_published = feed_state.last_published
+                           AND excluded.last_id IS NOT feed_state.last_id)
+                """, [
+                    (self.source, keyword, country, published, item_id)
+                    for (keyword, country), (published, item_id) in self.observed.items()
+                ])
+                updated = conn.total_changes - before
+        except Exception as e:
+            logger.error(f"피드 워터마크 저장 실패 ({self.source}): {e}")
+            return 0
+        for key, value in self.observed.items():
+            if key not in self.saved or value[0] >= self.saved[key][0]:
+                self.saved[key] = value
+        self.observed.clear()
+        for key, item_ids in self.new_ids.items():
+            self.seen_ids.setdefault(key, set()).update(item_ids)
+        self.new_ids.clear()
+        logger.info(f"피드 워터마크 갱신: {self.source} {updated}개")
+        return updated
+
+
+class FeedValidators:
+    """
+    피드 URL별 ETag/Last-Modified 저장소 (Fetcher.get_feed의 조건부 요청용)
+
+    저장된 검증값은 처음 필요할 때 한 번에 읽고, 새 검증값과 요청 통계는 pending에만 모아 두었다가
+    수집 결과 저장에 성공한 뒤에만 save()로 기록 (실행이 실패하면 다음 수집에서 본문을 다시 받음).
+    저장 전의 새 검증값이 다른 실행의 요청에 쓰이지 않도록 수집 실행마다 새로 만들어 사용
+    """
+
+    def __init__(self):
+        self.loaded = False
+        self.validators: Dict[str, Dict] = {}
+        self.pending: Dict[str, Dict] = {}
+        self.lock = threading.Lock()
+
+    def load(self):
+        """저장된 검증값 읽기 (이미 읽었으면 무시)"""
+        if self.loaded:
+            return
+        with db_connection() as conn:
+            rows = conn.execute("SELECT url, etag, last_modified, content_length FROM feed_validators").fetchall()
+        with self.lock:
+            for url, etag, last_modified, content_length in rows:
+                self.validators.setdefault(url, {
+                    "etag": etag, "last_modified": last_modified, "content_length": content_length
+                })
+            self.loaded = True
+
+    def request_headers(self, url: str) -> Dict[str, str]:
+        """조건부 요청 헤더 (저장된 검증값이 없으면 빈 딕셔너리)"""
+        validator = self.validators.get(url)
+        headers = {}
+        if validator and validator["etag"]:
+            headers["If-None-Match"] = validator["etag"]
+        if validator and validator["last_modified"]:
+            headers["If-Modified-Since"] = validator["last_modified"]
+        return headers
+
+    def _pending(self, url: str) -> Dict:
+        return self.pending.setdefault(url, {
+            "update": False, "fetches": 0, "not_modified": 0, "bytes_downloaded": 0, "bytes_saved": 0
+        })
+
+    def record_response(self, url: str, etag: Optional[str], last_modified: Optional[str], size: int):
+        """200 응답의 검증값과 받은 바이트 수 기록"""
+        with self.lock:
+            pending = self._pending(url)
+            pending.update(update=True, etag=etag, last_modified=last_modified, content_length=size)
+            pending["fetches"] += 1
+            pending["bytes_downloaded"] += size
+
+    def record_not_modified(self, url: str) -> int:
+        """
+        304 응답 기록
+
+        Returns:
+            아낀 바이트 수 (직전에 받은 본문 크기)
+        """
+        with self.lock:
+            saved = self.validators.get(url, {}).get("content_length") or 0
+            pending = self._pending(url)
+            pending["fetches"] += 1
+            pending["not_modified"] += 1
+            pending["bytes_saved"] += saved
+        return saved
+
+    def save(self) -> int:
+        """
+        모아 둔 검증값과 통계 저장
+
+        Returns:
+            기록한 URL 수
+        """
+        with self.lock:
+            pending, self.pending = self.pending, {}
+            rows = []
+            for url, stats in pending.items():
+                validator = stats if stats["update"] else self.validators.get(url, {})
+                rows.append((
+                    url, validator.get("etag"), validator.get("last_modified"), validator.get("content_length") or 0,
+                    int(stats["update"]), stats["fetches"], stats["not_modified"],
+                    stats["bytes_downloaded"], stats["bytes_saved"]
+                ))
+        if not rows:
+            return 0
+        try:
+            with db_connection() as conn:
+                conn.executemany("""
+                    INSERT INTO feed_validators
+                        (url, etag, last_modified, content_length, fetches, not_modified, bytes_downloaded, bytes_saved)
+                    VALUES (?1, ?2, ?3, ?4, ?6, ?7, ?8, ?9)
+                    ON CONFLICT(url) DO UPDATE SET
+                        etag = CASE WHEN ?5 THEN excluded.etag ELSE etag END,
+                        last_modified = CASE WHEN ?5 THEN excluded.last_modified ELSE last_modified END,
+                        content_length = CASE WHEN ?5 THEN excluded.content_length ELSE content_length END,
+                        fetches = fetches + excluded.fetches,
+                        not_modified = not_modified + excluded.not_modified,
+                        bytes_downloaded = bytes_downloaded + excluded.bytes_downloaded,
+                        bytes_saved = bytes_saved + excluded.bytes_saved,
+                        updated_at = CURRENT_TIMESTAMP
+                """, rows)
+        except Exception as e:
+            logger.error(f"피드 검증값 저장 실패: {e}")
+            return 0
+        # 저장이 끝난 검증값만 이후 조건부 요청에 사용
+        with self.lock:
+            for url, stats in pending.items():
+                if stats["update"]:
+                    self.validators[url] = {key: stats[key] for key in ("etag", "last_modified", "content_length")}
+        return len(rows)
+
+
+def get_feed_fetch_stats(limit: int = 100) -> List[Dict]:
+    """
+    피드별 조건부 요청 통계 (아낀 바이트 수가 많은 순)
+
+    Args:
+        limit: 최대 개수
+
+    Returns:
+        [{"url", "fetches", "not_modified", "bytes_downloaded", "bytes_saved", "updated_at"}, ...]
+    """
+    with db_connection() as conn:
+        rows = conn.execute("""
+            SELECT url, fetches, not_modified, bytes_downloaded, bytes_saved, updated_at
+            FROM feed_validators
+            ORDER BY bytes_saved DESC, url
+            LIMIT ?
+        """, (limit,)).fetchall()
+    keys = ("url", "fetches", "not_modified", "bytes_downloaded", "bytes_saved", "updated_at")
+    return [dict(zip(keys, row)) for row in rows]
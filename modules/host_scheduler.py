@@ -0,0 +1,225 @@
+"""
+호스트별 요청 스케줄러 모듈
+같은 언론사/API 서버에 요청이 몰리지 않도록 호스트마다 동시 요청 수와 초당 요청 수(토큰 버킷)를 제한하고,
+응답 결과에 따라 한도를 AIMD 방식으로 조절 (성공하면 조금씩 늘리고 429/5xx/지연이면 절반으로 줄임,
+403/404 같은 나머지 4xx는 요청 자체의 문제이므로 한도를 바꾸지 않음)
+
+한도가 찬 호스트의 요청만 대기하고 다른 호스트의 요청은 계속 진행하며, 전체 동시 요청 수도 제한
+"""
+
+import os
+import time
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 전체 동시 요청 수, 호스트당 동시 요청 수 상한, 호스트당 초당 요청 수
+GLOBAL_LIMIT = int(os.getenv("HTTP_MAX_CONNECTIONS", "32"))
+MAX_PER_HOST = int(os.getenv("HTTP_MAX_PER_HOST", "4"))
+HOST_RATE = float(os.getenv("HTTP_HOST_RATE", "4"))
+
+# 호스트별 예외 (API 이용 정책이 엄격한 곳): 호스트 -> (동시 요청 수 상한, 초당 요청 수)
+HOST_POLICIES = {
+    "export.arxiv.org": (1, 2.0),
+    "eutils.ncbi.nlm.nih.gov": (3, 3.0),
+}
+
+# 한도 조절 (감소 후 다시 줄이기까지 최소 간격, 느린 응답 판단 기준)
+MIN_RATE = 0.2
+DECREASE_COOLDOWN = 1.0
+SLOW_FACTOR = 3.0       # 평균 응답 시간의 N배 이상이면 느린 응답
+SLOW_FLOOR = 2.0        # 단, 이 시간(초) 이상인 경우만
+LATENCY_SMOOTHING = 0.2
+
+# 서버가 Retry-After 없이 막을 때 기본 대기 시간 (초), 최대 대기 시간
+DEFAULT_BACKOFF = 5.0
+MAX_BACKOFF = 120.0
+
+# 한도를 줄이는 응답 상태 코드
+THROTTLE_STATUSES = {429, 503}
+
+
+class HostState:
+    """호스트 하나의 동시 요청 한도, 토큰 버킷, 응답 통계"""
+
+    def __init__(self, host: str):
+        max_limit, base_rate = HOST_POLICIES.get(host, (MAX_PER_HOST, HOST_RATE))
+        self.host = host
+        self.max_limit = max_limit
+        self.limit = float(max(1, (max_limit + 1) // 2))  # 절반에서 시작해 성공하면 상한까지 증가
+        self.base_rate = base_rate
+        self.rate = base_rate
+        self.tokens = self.limit
+        self.last_refill = time.monotonic()
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        self.last_decrease = 0.0
+        self.latency: Optional[float] = None
+        self.condition = asyncio.Condition()
+        self.stats = {"requests": 0, "throttled": 0, "errors": 0, "client_errors": 0, "slow": 0, "waits": 0,
+                      "bytes": 0}
+
+    def _refill(self, now: float):
+        burst = max(1.0, self.limit)
+        self.tokens = min(burst, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    def wait_time(self, now: float) -> Optional[float]:
+        """
+        지금 요청할 수 있으면 0, 시간이 지나면 가능하면 대기 시간(초), 진행 중인 요청이 끝나야 하면 None
+        """
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        if self.in_flight >= int(self.limit):
+            return None
+        self._refill(now)
+        if self.tokens < 1.0:
+            return (1.0 - self.tokens) / self.rate
+        return 0.0
+
+    def _decrease(self, now: float, factor: float = 0.5) -> bool:
+        if now - self.last_decrease < DECREASE_COOLDOWN:
+            return False
+        self.last_decrease = now
+        self.limit = max(1.0, self.limit * factor)
+        self.rate = max(MIN_RATE, self.rate * factor)
+        return True
+
+    def record(self, status: Optional[int], latency: float, retry_after: Optional[float] = None, size: int = 0):
+        """
+        응답 결과로 한도 조절
+
+        Args:
+            status: HTTP 상태 코드 (연결 실패/시간 초과면 None)
+            latency: 응답 시간 (초)
+            retry_after: 서버가 요청한 대기 시간 (초)
+            size: 받은 본문 크기 (바이트)
+        """
+        now = time.monotonic()
+        self.stats["requests"] += 1
+        self.stats["bytes"] += size
+        if status in THROTTLE_STATUSES:
+            self.stats["throttled"] += 1
+            self.blocked_until = max(self.blocked_until, now + min(retry_after or DEFAULT_BACKOFF, MAX_BACKOFF))
+            if self._decrease(now):
+                logger.warning(f"요청 제한 감지 ({status}), 한도 축소: {self.host} "
+                               f"동시 {int(self.limit)}개, 초당 {self.rate:.2f}회")
+            return
+        if status is None or status >= 500:
+            self.stats["errors"] += 1
+            self._decrease(now)
+            return
+        if status >= 400:
+            # 나머지 4xx는 서버 상태와 무관하므로 성공으로 세지 않고 한도/응답 시간도 그대로 둠
+            self.stats["client_errors"] += 1
+            return
+
+        slow = (
+            self.latency is not None
+            and latency >= SLOW_FLOOR
+            and latency >= self.latency * SLOW_FACTOR
+        )
+        self.latency = latency if self.latency is None else (
+            self.latency + LATENCY_SMOOTHING * (latency - self.latency)
+        )
+        if slow:
+            self.stats["slow"] += 1
+            self._decrease(now, 0.75)
+            return
+
+        # 덧셈 증가: 한도만큼 성공하면 동시 요청 수 +1, 초당 요청 수는 기본값까지 천천히 회복
+        self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+        self.rate = min(self.base_rate, self.rate + self.base_rate * 0.05)
+
+    def snapshot(self) -> Dict:
+        return {
+            **self.stats,
+            "limit": int(self.limit),
+            "rate": round(self.rate, 2),
+            "avg_latency": round(self.latency, 3) if self.latency is not None else None,
+        }
+
+
+class HostScheduler:
+    """이벤트 루프 하나(Fetcher 하나)에서 쓰는 호스트별 요청 스케줄러"""
+
+    def __init__(self, global_limit: int = GLOBAL_LIMIT):
+        self.hosts: Dict[str, HostState] = {}
+        self.global_semaphore = asyncio.Semaphore(global_limit)
+
+    def state(self, host: str) -> HostState:
+        state = self.hosts.get(host)
+        if state is None:
+            state = HostState(host)
+            self.hosts[host] = state
+        return state
+
+    async def _acquire(self, state: HostState):
+        async with state.condition:
+            waited = False
+            while True:
+                now = time.monotonic()
+                wait = state.wait_time(now)
+                if wait == 0.0:
+                    state.tokens -= 1.0
+                    state.in_flight += 1
+                    break
+                waited = True
+                try:
+                    # 한도가 차 있으면 진행 중인 요청이 끝날 때까지, 토큰/차단 대기면 그 시간만큼 대기
+                    await asyncio.wait_for(state.condition.wait(), wait)
+                except asyncio.TimeoutError:
+                    pass
+            if waited:
+                state.stats["waits"] += 1
+
+    async def _release(self, state: HostState):
+        async with state.condition:
+            state.in_flight -= 1
+            state.condition.notify_all()
+
+    @asynccontextmanager
+    async def slot(self, host: str):
+        """
+        호스트 한도와 전체 한도 안에서 요청 하나를 실행할 자리 확보
+
+        사용 예:
+            async with scheduler.slot(host) as state:
+                ... 요청 ...
+                state.record(status, latency)
+        """
+        state = self.state(host)
+        await self._acquire(state)
+        try:
+            async with self.global_semaphore:
+                yield state
+        finally:
+            await self._release(state)
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """호스트별 현재 한도와 통계 (요청 수가 많은 순)"""
+        return dict(sorted(
+            ((host, state.snapshot()) for host, state in self.hosts.items()),
+            key=lambda item: -item[1]["requests"]
+        ))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로 변환"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        from email.utils import parsedate_to_datetime
+        from datetime import datetime, timezone
+        delay = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, delay)
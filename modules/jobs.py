@@ -0,0 +1,316 @@
+"""
+백그라운드 작업 모듈
+수집 작업을 Streamlit 스크립트 스레드 밖의 작업자 스레드에서 실행하고,
+상태/진행도/결과를 jobs 테이블에 기록하여 어느 세션에서든 조회할 수 있게 함
+"""
+
+import os
+import json
+import time
+import socket
+import logging
+import sqlite3
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from modules.database import db_connection
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 동시에 실행할 작업 수 (작업 종류별로는 항상 하나)
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+
+# 진행도 기록 최소 간격 (초, 콜백이 잦아도 DB 쓰기는 이 간격으로 제한)
+PROGRESS_WRITE_INTERVAL = 0.5
+
+# 작업자 생존 신호(updated_at) 갱신 간격 (초, 진행도 콜백이 없는 긴 단계에서도 갱신)
+HEARTBEAT_INTERVAL = 30
+
+# 생존 신호가 이보다 오래 끊긴 대기/실행 중 작업은 호스트/PID와 관계없이 실패로 정리 (분)
+JOB_STALE_MINUTES = int(os.getenv("JOB_STALE_MINUTES", "10"))
+
+# 조회 함수에서 중단된 작업 정리를 다시 시도하는 최소 간격 (초)
+RECOVERY_CHECK_INTERVAL = 30
+
+ACTIVE_STATUSES = ("queued", "running")
+
+# 이 프로세스를 식별하는 작업자 이름 (중단된 작업 정리용)
+WORKER_NAME = f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _run_news(params: Dict, progress_callback: Callable) -> Dict:
+    from modules.news_collector import collect_and_analyze_news
+    collected, saved = collect_and_analyze_news(progress_callback=progress_callback, **params)
+    return {"collected": collected, "saved": saved}
+
+
+def _run_papers(params: Dict, progress_callback: Callable) -> Dict:
+    from modules.paper_collector import collect_and_analyze_papers
+    collected, saved = collect_and_analyze_papers(progress_callback=progress_callback, **params)
+    return {"collected": collected, "saved": saved}
+
+
+def _run_economy(params: Dict, progress_callback: Callable) -> Dict:
+    from modules.economy_collector import collect_economy_news
+    collected, saved = collect_economy_news(progress_callback=progress_callback, **params)
+    return {"collected": collected, "saved": saved}
+
+
+def _run_economy_report(params: Dict, progress_callback: Callable) -> Dict:
+    from modules.economy_collector import generate_daily_economy_report
+    progress_callback(0, 1, "경제 보고서 생성 중...")
+    report = generate_daily_economy_report(**params)
+    progress_callback(1, 1, "경제 보고서 생성 완료" if report else "보고서를 만들 경제 뉴스가 없습니다.")
+    return {"generated": report is not None}
+
+
+def _run_digest(params: Dict, progress_callback: Callable) -> Dict:
+    from modules.email_sender import send_daily_digest
+    progress_callback(0, 1, "이메일 다이제스트 발송 중...")
+    result = send_daily_digest(**params)
+    progress_callback(1, 1, f"뉴스 {result['news']}개" + (" 발송 완료" if result["sent"] else " (발송 안 함)"))
+    return result
+
+
+# 작업 종류 -> (표시 이름, 실행 함수(params, progress_callback) -> 결과 딕셔너리)
+JOB_TYPES = {
+    "news": ("뉴스 수집", _run_news),
+    "papers": ("논문 수집", _run_papers),
+    "economy": ("경제 뉴스 수집", _run_economy),
+    "economy_report": ("경제 보고서 생성", _run_economy_report),
+    "digest": ("이메일 다이제스트", _run_digest),
+}
+
+_executor = None
+_executor_lock = threading.Lock()
+_heartbeat_thread = None
+_heartbeat_stop = threading.Event()
+_last_recovery = float("-inf")
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def recover_interrupted_jobs() -> int:
+    """
+    중단된 대기/실행 중 작업을 실패로 정리
+    같은 호스트에서 이미 종료된 프로세스가 남긴 작업과, 생존 신호가 JOB_STALE_MINUTES 넘게
+    끊긴 작업(다른 호스트/컨테이너 포함)이 대상
+
+    Returns:
+        정리한 작업 수
+    """
+    global _last_recovery
+    _last_recovery = time.monotonic()
+    host = socket.gethostname()
+    recovered = 0
+    with db_connection() as conn:
+        rows = conn.execute(f"""
+            SELECT id, worker,
+                   COALESCE(updated_at, started_at, created_at) < datetime('now', '-{JOB_STALE_MINUTES} minutes')
+            FROM jobs WHERE status IN ('queued', 'running')
+        """).fetchall()
+        for job_id, worker, stale in rows:
+            worker_host, _, pid = (worker or "").rpartition(":")
+            if stale:
+                error = f"작업자 응답이 {JOB_STALE_MINUTES}분 넘게 없어 중단됨"
+            elif worker_host == host and pid.isdigit() and not _pid_alive(int(pid)):
+                error = "작업 프로세스가 종료되어 중단됨"
+            else:
+                continue
+            cursor = conn.execute("""
+                UPDATE jobs SET status = 'failed', error = ?, finished_at = CURRENT_TIMESTAMP
+                WHERE id = ? AND status IN ('queued', 'running')
+            """, (error, job_id))
+            recovered += cursor.rowcount
+            logger.warning(f"중단된 작업 정리: #{job_id} ({worker}) - {error}")
+    return recovered
+
+
+def _maybe_recover_interrupted_jobs():
+    """조회 경로용: RECOVERY_CHECK_INTERVAL마다 한 번만 중단된 작업 정리"""
+    if time.monotonic() - _last_recovery < RECOVERY_CHECK_INTERVAL:
+        return
+    try:
+        recover_interrupted_jobs()
+    except Exception as e:
+        logger.error(f"중단된 작업 정리 실패: {e}")
+
+
+def _heartbeat_loop():
+    """이 프로세스가 맡은 대기/실행 중 작업의 생존 신호를 주기적으로 갱신"""
+    while not _heartbeat_stop.wait(HEARTBEAT_INTERVAL):
+        try:
+            with db_connection() as conn:
+                conn.execute("""
+                    UPDATE jobs SET updated_at = CURRENT_TIMESTAMP
+                    WHERE worker = ? AND status IN ('queued', 'running')
+                """, (WORKER_NAME,))
+        except Exception as e:
+            logger.error(f"작업 생존 신호 기록 실패: {e}")
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor, _heartbeat_thread
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                recover_interrupted_jobs()
+                _executor = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix="job")
+                if _heartbeat_thread is None or not _heartbeat_thread.is_alive():
+                    _heartbeat_stop.clear()
+                    _heartbeat_thread = threading.Thread(
+                        target=_heartbeat_loop, name="job-heartbeat", daemon=True
+                    )
+                    _heartbeat_thread.start()
+    return _executor
+
+
+def _row_to_job(row: sqlite3.Row) -> Dict:
+    job = dict(row)
+    job["params"] = json.loads(job["params"]) if job.get("params") else {}
+    job["result"] = json.loads(job["result"]) if job.get("result") else None
+    job["label"] = JOB_TYPES.get(job["job_type"], (job["job_type"],))[0]
+    return job
+
+
+def _fetch_jobs(query: str, params: Tuple = ()) -> List[Dict]:
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
+        return [_row_to_job(row) for row in cursor.execute(query, params).fetchall()]
+
+
+def submit_job(job_type: str, params: Dict = None) -> Tuple[int, bool]:
+    """
+    작업을 대기열에 넣고 작업자 스레드에서 실행 (같은 종류의 작업이 이미 진행 중이면 새로 만들지 않음)
+
+    Args:
+        job_type: JOB_TYPES 중 하나
+        params: 실행 함수에 넘길 키워드 인자
+
+    Returns:
+        (작업 id, 새로 만들었는지 여부)
+    """
+    if job_type not in JOB_TYPES:
+        raise ValueError(f"알 수 없는 작업 종류: {job_type}")
+    params = params or {}
+    executor = _get_executor()
+
+    try:
+        with db_connection() as conn:
+            cursor = conn.execute(
+                "INSERT INTO jobs (job_type, params, status, worker, updated_at) "
+                "VALUES (?, ?, 'queued', ?, CURRENT_TIMESTAMP)",
+                (job_type, json.dumps(params, ensure_ascii=False), WORKER_NAME)
+            )
+            job_id = cursor.lastrowid
+    except sqlite3.IntegrityError:
+        # idx_jobs_active: 대기/실행 중인 같은 종류 작업이 있음
+        active = get_active_job(job_type)
+        if active:
+            logger.info(f"이미 진행 중인 작업 사용: #{active['id']} ({job_type})")
+            return active["id"], False
+        raise
+
+    executor.submit(_execute, job_id, job_type, params)
+    logger.info(f"작업 등록: #{job_id} ({job_type})")
+    return job_id, True
+
+
+def _execute(job_id: int, job_type: str, params: Dict):
+    """작업자 스레드에서 작업 실행 및 상태 기록"""
+    _, runner = JOB_TYPES[job_type]
+    with db_connection() as conn:
+        # 대기 중에 중단된 작업으로 정리되었으면 실행하지 않음
+        cursor = conn.execute("""
+            UPDATE jobs SET status = 'running', started_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ? AND status = 'queued'
+        """, (job_id,))
+    if cursor.rowcount == 0:
+        logger.warning(f"대기 상태가 아닌 작업은 실행하지 않음: #{job_id} ({job_type})")
+        return
+
+    last_write = 0.0
+
+    def progress_callback(current, total, message):
+        nonlocal last_write
+        now = time.monotonic()
+        if now - last_write < PROGRESS_WRITE_INTERVAL and current < total:
+            return
+        last_write = now
+        try:
+            with db_connection() as conn:
+                conn.execute("""
+                    UPDATE jobs SET progress_current = ?, progress_total = ?, message = ?,
+                                    updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                """, (current, total, message, job_id))
+        except Exception as e:
+            logger.error(f"진행도 기록 실패 (#{job_id}): {e}")
+
+    try:
+        result = runner(params, progress_callback)
+        with db_connection() as conn:
+            conn.execute("""
+                UPDATE jobs SET status = 'done', result = ?, finished_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """, (json.dumps(result, ensure_ascii=False), job_id))
+        logger.info(f"작업 완료: #{job_id} ({job_type}) {result}")
+    except Exception as e:
+        logger.error(f"작업 실패: #{job_id} ({job_type}) - {e}")
+        with db_connection() as conn:
+            conn.execute("""
+                UPDATE jobs SET status = 'failed', error = ?, finished_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """, (f"{e}\n\n{traceback.format_exc()}", job_id))
+
+
+def get_job(job_id: int) -> Optional[Dict]:
+    """작업 상태 조회 (없으면 None, 중단된 작업은 먼저 실패로 정리)"""
+    _maybe_recover_interrupted_jobs()
+    jobs = _fetch_jobs("SELECT * FROM jobs WHERE id = ?", (job_id,))
+    return jobs[0] if jobs else None
+
+
+def get_active_job(job_type: str) -> Optional[Dict]:
+    """대기/실행 중인 해당 종류 작업 (없으면 None, 중단된 작업은 먼저 실패로 정리)"""
+    _maybe_recover_interrupted_jobs()
+    jobs = _fetch_jobs(
+        "SELECT * FROM jobs WHERE job_type = ? AND status IN ('queued', 'running') ORDER BY id DESC LIMIT 1",
+        (job_type,)
+    )
+    return jobs[0] if jobs else None
+
+
+def get_latest_job(job_type: str) -> Optional[Dict]:
+    """해당 종류의 가장 최근 작업 (없으면 None, 중단된 작업은 먼저 실패로 정리)"""
+    _maybe_recover_interrupted_jobs()
+    jobs = _fetch_jobs("SELECT * FROM jobs WHERE job_type = ? ORDER BY id DESC LIMIT 1", (job_type,))
+    return jobs[0] if jobs else None
+
+
+def list_jobs(limit: int = 20) -> List[Dict]:
+    """최근 작업 목록 (최신순)"""
+    return _fetch_jobs("SELECT * FROM jobs ORDER BY id DESC LIMIT ?", (limit,))
+
+
+def shutdown():
+    """실행 중인 작업이 끝날 때까지 기다린 뒤 작업자 스레드 종료 (상주 프로세스 종료용)"""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+    _heartbeat_stop.set()
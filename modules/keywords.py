@@ -0,0 +1,117 @@
+"""
+키워드 조회 모듈
+정규화된 keywords/item_keywords 테이블로 키워드 필터, 상위 키워드, 키워드별 날짜 추이를 조회
+"""
+
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Tuple
+
+from modules.database import KEYWORD_TABLES
+
+# 필터 선택지: 해당 테이블 항목에 한 번 이상 쓰인 키워드 (파라미터: item_type)
+KEYWORD_OPTIONS = """
+    SELECT k.name FROM keywords AS k
+    WHERE EXISTS (SELECT 1 FROM item_keywords AS ik WHERE ik.item_type = ? AND ik.keyword_id = k.id)
+    ORDER BY k.name
+"""
+
+
+def _check_item_type(item_type: str):
+    if item_type not in KEYWORD_TABLES:
+        raise ValueError(f"키워드를 지원하지 않는 테이블: {item_type}")
+
+
+def get_keyword_options(conn: sqlite3.Connection, item_type: str) -> List[str]:
+    """
+    해당 테이블 항목에 한 번 이상 쓰인 키워드 목록 (필터 선택지용)
+
+    Args:
+        conn: 데이터베이스 연결
+        item_type: KEYWORD_TABLES 중 하나
+
+    Returns:
+        이름순 키워드 리스트
+    """
+    _check_item_type(item_type)
+    rows = conn.execute(KEYWORD_OPTIONS, (item_type,))
+    return [row[0] for row in rows]
+
+
+def build_keyword_filter(item_type: str, keywords: List[str], id_column: str = "id") -> Tuple[str, List]:
+    """
+    선택한 키워드 중 하나라도 가진 항목만 남기는 WHERE 조건 구성
+
+    Args:
+        item_type: KEYWORD_TABLES 중 하나
+        keywords: 선택한 키워드 리스트 (비어 있지 않아야 함)
+        id_column: 조건을 걸 항목 id 컬럼
+
+    Returns:
+        (조건 SQL, 파라미터 리스트)
+    """
+    _check_item_type(item_type)
+    placeholders = ", ".join("?" * len(keywords))
+    condition = (f"{id_column} IN (SELECT ik.item_id FROM item_keywords AS ik "
+                 f"JOIN keywords AS k ON k.id = ik.keyword_id "
+                 f"WHERE ik.item_type = ? AND k.name IN ({placeholders}))")
+    return condition, [item_type, *keywords]
+
+
+def get_top_keywords(conn: sqlite3.Connection, item_types: Iterable[str], start_date: str,
+                     limit: int = 10) -> List[Tuple[str, int]]:
+    """
+    기간 내 가장 많이 쓰인 키워드 (일별 키워드 집계에서 조회)
+
+    Args:
+        conn: 데이터베이스 연결
+        item_types: 집계할 테이블 목록
+        start_date: 시작 날짜 (YYYY-MM-DD, 포함)
+        limit: 최대 개수
+
+    Returns:
+        [(키워드, 항목 수), ...] (많은 순)
+    """
+    item_types = list(item_types)
+    for item_type in item_types:
+        _check_item_type(item_type)
+    placeholders = ", ".join("?" * len(item_types))
+    rows = conn.execute(f"""
+        SELECT k.name, SUM(s.count) AS cnt
+        FROM daily_keyword_stats AS s JOIN keywords AS k ON k.id = s.keyword_id
+        WHERE s.item_type IN ({placeholders}) AND s.date >= ?
+        GROUP BY s.keyword_id
+        ORDER BY cnt DESC, k.name
+        LIMIT ?
+    """, [*item_types, start_date, limit])
+    return [(name, count) for name, count in rows]
+
+
+def get_keyword_trends(conn: sqlite3.Connection, item_type: str, days: int) -> Dict[str, List[Tuple[str, int]]]:
+    """
+    키워드별 날짜 추이 (최근 days일, 항목이 없는 날은 0, 일별 키워드 집계에서 조회)
+
+    Args:
+        conn: 데이터베이스 연결
+        item_type: KEYWORD_TABLES 중 하나
+        days: 조회할 일수
+
+    Returns:
+        {"키워드": [(날짜, 개수), ...], ...} (오래된 날짜부터)
+    """
+    _check_item_type(item_type)
+    end_date = datetime.now()
+    start_date = (end_date - timedelta(days=days)).strftime("%Y-%m-%d")
+    dates = [(end_date - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(days - 1, -1, -1)]
+
+    counts: Dict[str, Dict[str, int]] = {}
+    rows = conn.execute("""
+        SELECT k.name, s.date, SUM(s.count)
+        FROM daily_keyword_stats AS s JOIN keywords AS k ON k.id = s.keyword_id
+        WHERE s.item_type = ? AND s.date >= ?
+        GROUP BY s.keyword_id, s.date
+    """, (item_type, start_date))
+    for name, date, count in rows:
+        counts.setdefault(name, {})[date] = count
+
+    return {name: [(date, by_date.get(date, 0)) for date in dates] for name, by_date in counts.items()}
@@ -0,0 +1,256 @@
+"""
+LLM 응답 캐시 모듈
+동일한 프롬프트에 대한 Gemini 응답을 디스크(SQLite)에 저장하여 재사용
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from modules.database import DB_DIR
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 캐시 파일 경로 (본 데이터베이스와 잠금을 공유하지 않도록 별도 파일 사용)
+CACHE_FILE = DB_DIR / "llm_cache.db"
+
+# 크기 제한 (초과 시 가장 오래 사용되지 않은 항목부터 삭제)
+MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "20000"))
+MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", str(200 * 1024 * 1024)))
+EVICTION_INTERVAL = 100  # 저장 N회마다 크기 제한 검사
+
+# 작업 유형별 TTL (초)
+DAY = 24 * 60 * 60
+TASK_TTLS = {
+    "translate_title": 90 * DAY,
+    "translate_abstract": 90 * DAY,
+    "generate_summary": 30 * DAY,
+    "generate_news_summary_korean": 30 * DAY,
+    "evaluate_article": 30 * DAY,
+    "extract_keywords": 30 * DAY,
+    "summarize_paper": 90 * DAY,
+    "analyze_article": 30 * DAY,
+    "economy_report": 1 * DAY,
+}
+DEFAULT_TTL = 7 * DAY
+
+# 환경 변수로 캐시 전체 우회 가능 (LLM_CACHE_BYPASS=1)
+CACHE_BYPASS = os.getenv("LLM_CACHE_BYPASS", "").lower() in ("1", "true", "yes")
+
+_local = threading.local()
+_stats_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "stores": 0, "expired": 0, "evictions": 0}
+_store_count = 0
+
+
+def _get_cache_connection() -> sqlite3.Connection:
+    """스레드별 캐시 DB 연결 반환 (최초 호출 시 테이블 생성)"""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        DB_DIR.mkdir(exist_ok=True)
+        conn = sqlite3.connect(CACHE_FILE, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                cache_key TEXT PRIMARY KEY,
+                task TEXT NOT NULL,
+                model_name TEXT,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_accessed REAL NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_last_accessed ON llm_cache (last_accessed)")
+        conn.commit()
+        _local.conn = conn
+    return conn
+
+
+def _increment(stat: str, amount: int = 1):
+    with _stats_lock:
+        _stats[stat] += amount
+
+
+def is_enabled() -> bool:
+    """캐시 사용 여부 (환경 변수 또는 bypass() 컨텍스트로 비활성화 가능)"""
+    return not CACHE_BYPASS and not getattr(_local, "bypass", False)
+
+
+@contextmanager
+def bypass():
+    """현재 스레드에서 캐시를 읽지도 저장하지도 않도록 우회"""
+    previous = getattr(_local, "bypass", False)
+    _local.bypass = True
+    try:
+        yield
+    finally:
+        _local.bypass = previous
+
+
+def make_key(task: str, model_name: str, generation_config: Optional[Dict], prompt: str) -> str:
+    """
+    캐시 키 생성 (작업 유형, 모델 이름, 생성 설정, 프롬프트의 해시)
+
+    Args:
+        task: 프롬프트 템플릿 식별자 (예: "translate_title")
+        model_name: 실제 사용된 모델 이름
+        generation_config: 생성 설정 딕셔너리
+        prompt: 입력 텍스트가 포함된 전체 프롬프트
+
+    Returns:
+        SHA-256 16진수 문자열
+    """
+    payload = json.dumps(
+        [task, model_name or "", generation_config or {}, prompt],
+        ensure_ascii=False,
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get(cache_key: str, task: str) -> Optional[str]:
+    """
+    캐시된 응답 조회 (TTL 만료 시 None)
+
+    Args:
+        cache_key: make_key()로 생성한 키
+        task: 작업 유형 (TTL 결정용)
+
+    Returns:
+        캐시된 응답 텍스트 (없거나 만료되면 None)
+    """
+    try:
+        conn = _get_cache_connection()
+        row = conn.execute(
+            "SELECT response, created_at FROM llm_cache WHERE cache_key = ?",
+            (cache_key,)
+        ).fetchone()
+
+        if row is None:
+            _increment("misses")
+            return None
+
+        response, created_at = row
+        now = time.time()
+        if now - created_at > TASK_TTLS.get(task, DEFAULT_TTL):
+            conn.execute("DELETE FROM llm_cache WHERE cache_key = ?", (cache_key,))
+            conn.commit()
+            _increment("expired")
+            _increment("misses")
+            return None
+
+        # LRU 갱신
+        conn.execute("UPDATE llm_cache SET last_accessed = ? WHERE cache_key = ?", (now, cache_key))
+        conn.commit()
+        _increment("hits")
+        return response
+    except Exception as e:
+        logger.warning(f"LLM 캐시 조회 실패: {e}")
+        _increment("misses")
+        return None
+
+
+def put(cache_key: str, task: str, model_name: str, response: str):
+    """
+    응답을 캐시에 저장 (기존 항목은 덮어씀)
+
+    Args:
+        cache_key: make_key()로 생성한 키
+        task: 작업 유형
+        model_name: 실제 사용된 모델 이름
+        response: 저장할 응답 텍스트
+    """
+    global _store_count
+
+    if not response:
+        return
+
+    try:
+        conn = _get_cache_connection()
+        now = time.time()
+        conn.execute("""
+            INSERT OR REPLACE INTO llm_cache
+            (cache_key, task, model_name, response, size, created_at, last_accessed)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (cache_key, task, model_name, response, len(response.encode("utf-8")), now, now))
+        conn.commit()
+        _increment("stores")
+
+        with _stats_lock:
+            _store_count += 1
+            should_evict = _store_count % EVICTION_INTERVAL == 0
+        if should_evict:
+            evict()
+    except Exception as e:
+        logger.warning(f"LLM 캐시 저장 실패: {e}")
+
+
+def evict() -> int:
+    """
+    크기 제한(항목 수, 바이트)을 초과하면 가장 오래 사용되지 않은 항목부터 삭제
+
+    Returns:
+        삭제된 항목 수
+    """
+    try:
+        conn = _get_cache_connection()
+        count, total_bytes = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache").fetchone()
+
+        removed = 0
+        if count > MAX_ENTRIES:
+            removed += conn.execute("""
+                DELETE FROM llm_cache WHERE cache_key IN (
+                    SELECT cache_key FROM llm_cache ORDER BY last_accessed ASC LIMIT ?
+                )
+            """, (count - MAX_ENTRIES,)).rowcount
+
+        if total_bytes > MAX_BYTES:
+            # 누적 크기가 제한 이하가 될 때까지 오래된 항목부터 삭제
+            excess = total_bytes - MAX_BYTES
+            freed = 0
+            stale_keys = []
+            for cache_key, size in conn.execute("SELECT cache_key, size FROM llm_cache ORDER BY last_accessed ASC"):
+                stale_keys.append((cache_key,))
+                freed += size
+                if freed >= excess:
+                    break
+            conn.executemany("DELETE FROM llm_cache WHERE cache_key = ?", stale_keys)
+            removed += len(stale_keys)
+
+        conn.commit()
+        if removed:
+            _increment("evictions", removed)
+            logger.info(f"LLM 캐시 정리: {removed}개 항목 삭제")
+        return removed
+    except Exception as e:
+        logger.warning(f"LLM 캐시 정리 실패: {e}")
+        return 0
+
+
+def clear(task: str = None):
+    """캐시 비우기 (task 지정 시 해당 작업 유형만)"""
+    conn = _get_cache_connection()
+    if task:
+        conn.execute("DELETE FROM llm_cache WHERE task = ?", (task,))
+    else:
+        conn.execute("DELETE FROM llm_cache")
+    conn.commit()
+
+
+def get_stats() -> Dict:
+    """캐시 적중/미스/저장/삭제 횟수 및 적중률 반환"""
+    with _stats_lock:
+        stats = dict(_stats)
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+    return stats
@@ -0,0 +1,241 @@
+"""
+유사 중복 기사 감지 모듈
+Google News는 같은 통신사 기사를 키워드/언론사별로 URL만 다르게 여러 번 돌려주므로,
+정규화한 제목+본문의 SimHash 지문을 밴드 색인(fingerprint_bands)으로 찾아
+이미 본 기사와 거의 같은 기사는 대표 항목에 연결하고 AI 분석/저장을 건너뜀
+"""
+
+import os
+import re
+import hashlib
+import logging
+import threading
+import unicodedata
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from modules.database import URL_TABLES, db_connection
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 지문 크기와 밴드 분할 (해밍 거리 MAX_DISTANCE 이하면 비둘기집 원리로 최소 한 밴드가 일치)
+SIMHASH_BITS = 64
+BANDS = 4
+BAND_BITS = SIMHASH_BITS // BANDS
+MAX_DISTANCE = BANDS - 1
+
+# 지문에 쓰는 본문 길이, 문자 n-gram 크기, 최소 길이 (너무 짧으면 오탐이 많아 감지하지 않음)
+FINGERPRINT_CHARS = 1500
+SHINGLE_SIZE = 4
+MIN_TEXT_LENGTH = 30
+
+# 이 기간(일) 안에 저장된 대표 항목과만 비교
+WINDOW_DAYS = int(os.getenv("NEAR_DUP_WINDOW_DAYS", "7"))
+
+# 환경 변수로 감지 끄기 가능 (NEAR_DUP_DISABLED=1)
+DISABLED = os.getenv("NEAR_DUP_DISABLED", "").lower() in ("1", "true", "yes")
+
+_NON_WORD = re.compile(r"[^\w]+")
+
+
+def normalize_text(text: str) -> str:
+    """유니코드 정규화, 소문자화, 문장부호 제거, 공백 정리"""
+    text = unicodedata.normalize("NFKC", text or "").lower()
+    return " ".join(_NON_WORD.sub(" ", text).split())
+
+
+def strip_source_suffix(title: str) -> str:
+    """Google News 제목 끝의 " - 언론사" 제거 (언론사마다 달라 지문을 흩뜨림)"""
+    head, sep, tail = (title or "").rpartition(" - ")
+    if sep and head and len(tail) <= 30:
+        return head
+    return title or ""
+
+
+def simhash(text: str) -> int:
+    """
+    문자 n-gram 빈도 가중치 SimHash
+
+    Args:
+        text: 정규화한 텍스트
+
+    Returns:
+        SIMHASH_BITS 비트 부호 없는 정수
+    """
+    weights = [0] * SIMHASH_BITS
+    shingles = Counter(text[i:i + SHINGLE_SIZE] for i in range(max(len(text) - SHINGLE_SIZE + 1, 1)))
+    for shingle, count in shingles.items():
+        # 프로세스마다 달라지는 hash() 대신 고정 해시 사용 (지문을 DB에 저장하므로)
+        value = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += count if value >> bit & 1 else -count
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def fingerprint(title: str, text: str) -> Optional[int]:
+    """
+    제목과 본문 앞부분으로 만든 지문 (텍스트가 너무 짧으면 None)
+
+    Args:
+        title: 제목
+        text: 본문 (스크래핑 실패 시 제목과 같을 수 있음)
+    """
+    title = strip_source_suffix(title)
+    if text and text != title:
+        combined = f"{title} {text[:FINGERPRINT_CHARS]}"
+    else:
+        combined = title
+    normalized = normalize_text(combined)
+    if len(normalized) < MIN_TEXT_LENGTH:
+        return None
+    return simhash(normalized)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """두 지문의 서로 다른 비트 수"""
+    return bin(a ^ b).count("1")
+
+
+def bands(value: int) -> List[int]:
+    """지문을 BAND_BITS 비트씩 나눈 밴드 값"""
+    mask = (1 << BAND_BITS) - 1
+    return [(value >> (band * BAND_BITS)) & mask for band in range(BANDS)]
+
+
+def _to_signed(value: int) -> int:
+    """SQLite INTEGER(부호 있는 64비트)에 저장할 수 있도록 변환"""
+    return value - (1 << SIMHASH_BITS) if value >= 1 << (SIMHASH_BITS - 1) else value
+
+
+def _to_unsigned(value: int) -> int:
+    return value + (1 << SIMHASH_BITS) if value < 0 else value
+
+
+class NearDuplicateIndex:
+    """
+    한 번의 수집 실행에서 쓰는 유사 중복 색인
+
+    check()는 저장된 대표 항목과 이번 실행에서 먼저 본 항목을 함께 비교하고,
+    새 지문과 중복 연결은 모아 두었다가 기사 저장에 성공한 뒤에만 save()로 기록
+    (저장이 실패한 실행에서 기록하면 없는 기사를 대표 항목으로 남겨 다음 수집에서 그 기사를 건너뜀)
+    """
+
+    def __init__(self, item_type: str):
+        if item_type not in URL_TABLES:
+            raise ValueError(f"유사 중복 감지를 지원하지 않는 테이블: {item_type}")
+        self.item_type = item_type
+        self.lock = threading.Lock()
+        # 이번 실행의 대표 항목 {url: 지문}, 중복 연결 {url: (지문, 대표 URL)}
+        self.pending: Dict[str, int] = {}
+        self.duplicates: Dict[str, Tuple[int, str]] = {}
+        self.stats = {"checked": 0, "duplicates": 0}
+
+    def _find_saved(self, conn, url: str, value: int) -> Optional[str]:
+        """저장된 대표 항목 중 가장 가까운 유사 중복의 URL (대표 항목이 삭제됐으면 제외)"""
+        # 이전 실행에서 이미 중복으로 연결된 URL
+        row = conn.execute(f"""
+            SELECT f.canonical_url FROM fingerprints AS f
+            JOIN {self.item_type} AS t ON t.url = f.canonical_url
+            WHERE f.item_type = ? AND f.url = ? AND f.canonical_url IS NOT NULL
+        """, (self.item_type, url)).fetchone()
+        if row:
+            return row[0]
+
+        conditions = " OR ".join("(b.band = ? AND b.value = ?)" for _ in range(BANDS))
+        params = [self.item_type]
+        for band, band_value in enumerate(bands(value)):
+            params.extend((band, band_value))
+        params.append(f"-{WINDOW_DAYS} days")
+        # CROSS JOIN: 항목 수와 관계없이 밴드 색인부터 조회하도록 조인 순서 고정
+        rows = conn.execute(f"""
+            SELECT DISTINCT f.url, f.simhash FROM fingerprint_bands AS b
+            CROSS JOIN fingerprints AS f ON f.item_type = b.item_type AND f.url = b.url
+            JOIN {self.item_type} AS t ON t.url = f.url
+            WHERE b.item_type = ? AND ({conditions})
+              AND f.created_at >= datetime('now', ?)
+        """, params).fetchall()
+        return self._closest(value, ((candidate, _to_unsigned(stored)) for candidate, stored in rows), url)
+
+    @staticmethod
+    def _closest(value: int, candidates, url: str) -> Optional[str]:
+        best = None
+        for candidate, stored in candidates:
+            if candidate == url:
+                continue
+            distance = hamming_distance(value, stored)
+            if distance <= MAX_DISTANCE and (best is None or distance < best[0]):
+                best = (distance, candidate)
+        return best[1] if best else None
+
+    def check(self, url: str, title: str, text: str) -> Optional[str]:
+        """
+        유사 중복 여부 확인 (중복이 아니면 이번 실행의 대표 항목으로 등록)
+
+        Args:
+            url: 항목 URL
+            title: 제목
+            text: 스크래핑한 본문
+
+        Returns:
+            유사 중복이면 대표 항목 URL, 아니면 None
+        """
+        if DISABLED or not url:
+            return None
+        value = fingerprint(title, text)
+        if value is None:
+            return None
+
+        # 같은 배치에서 거의 동시에 처리되는 중복이 둘 다 대표가 되지 않도록 조회와 등록을 묶음
+        with self.lock:
+            self.stats["checked"] += 1
+            canonical = self._closest(value, self.pending.items(), url)
+            if canonical is None:
+                try:
+                    with db_connection() as conn:
+                        canonical = self._find_saved(conn, url, value)
+                except Exception as e:
+                    logger.error(f"유사 중복 조회 실패: {e}")
+            if canonical is None:
+                self.pending[url] = value
+                return None
+            self.duplicates[url] = (value, canonical)
+            self.stats["duplicates"] += 1
+        logger.info(f"유사 중복 기사 건너뜀: {url} -> {canonical}")
+        return canonical
+
+    def save(self) -> int:
+        """
+        대표 항목 지문/밴드와 중복 연결 저장
+
+        Returns:
+            기록한 항목 수
+        """
+        with self.lock:
+            pending, self.pending = self.pending, {}
+            duplicates, self.duplicates = self.duplicates, {}
+        if not pending and not duplicates:
+            return 0
+        try:
+            with db_connection() as conn:
+                conn.executemany("""
+                    INSERT OR REPLACE INTO fingerprints (item_type, url, simhash, canonical_url)
+                    VALUES (?, ?, ?, ?)
+                """, [(self.item_type, url, _to_signed(value), None) for url, value in pending.items()] + [
+                    (self.item_type, url, _to_signed(value), canonical)
+                    for url, (value, canonical) in duplicates.items()
+                ])
+                conn.executemany("""
+                    INSERT OR IGNORE INTO fingerprint_bands (item_type, band, value, url)
+                    VALUES (?, ?, ?, ?)
+                """, [
+                    (self.item_type, band, band_value, url)
+                    for url, value in pending.items()
+                    for band, band_value in enumerate(bands(value))
+                ])
+        except Exception as e:
+            logger.error(f"유사 중복 지문 저장 실패 ({self.item_type}): {e}")
+            return 0
+        logger.info(f"유사 중복 색인 갱신: {self.item_type} 대표 {len(pending)}개, 중복 {len(duplicates)}개")
+        return len(pending) + len(duplicates)
@@ -3,66 +3,79 @@
 미국/한국 심리 관련 뉴스를 수집하고 분석
 """
 
-import feedparser
-import requests
-from bs4 import BeautifulSoup
 import logging
 from datetime import datetime
 from typing import List, Dict, Optional
-import time
 import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
 
-from modules.ai_engine import generate_summary, generate_news_summary_korean, translate_title, evaluate_article, extract_keywords
-from modules.database import get_connection
+from modules.ai_engine import analyze_article, analyze_articles_batch, get_ai_stats
+from modules.async_engine import Fetcher, open_fetcher, run, run_with_fetcher, threadsafe_callback
+from modules.database import db_connection, filter_new_items
+from modules.db_writer import get_writer, write_records
+from modules.feed_state import FeedWatermarks
+from modules.near_duplicates import NearDuplicateIndex
+from modules.url_resolver import canonicalize_items_async
+from modules import page_cache, scraper
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# User-Agent 설정 (스크래핑 시 필요)
-HEADERS = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-}
 
+def build_rss_url(keyword: str, country: str = "KR") -> str:
+    """
+    키워드와 국가로 Google News RSS URL 생성
+    
+    Args:
+        keyword: 검색 키워드
+        country: 국가 코드 (KR, US)
+    
+    Returns:
+        RSS Feed URL
+    """
+    # 한국 뉴스의 경우 더 구체적인 검색어 조합
+    if country == "KR":
+        # 심리/상담 관련 키워드만 필터링
+        search_query = keyword
+        # 제외 키워드 추가 (법률 상담, 디지털 상담 등 제외, 단 IT는 AI/뇌과학 관련이므로 제외하지 않음)
+        # 단, 심리학+AI, 뇌과학+AI는 제외하지 않음
+        if "상담" in keyword or "심리" in keyword:
+            search_query = f"{keyword} -법률 -법무 -디지털 -건설 -공제회 -IT"
+        return f"https://news.google.com/rss/search?q={search_query}&hl=ko&gl=KR&ceid=KR:ko"
+    # US
+    return f"https://news.google.com/rss/search?q={keyword}&hl=en&gl=US&ceid=US:en"
 
-def fetch_news_from_rss(keywords: List[str], country: str = "KR", max_results: int = 20) -> List[Dict]:
+
+async def fetch_news_from_rss_async(fetcher: Fetcher, keywords: List[str], country: str = "KR", max_results: int = 20,
+                                    watermarks: Optional[FeedWatermarks] = None) -> List[Dict]:
     """
-    Google News RSS Feed에서 뉴스 수집
+    Google News RSS Feed에서 뉴스 수집 (키워드별 피드를 동시에 요청)
     
     Args:
+        fetcher: 공유 연결 풀 Fetcher
         keywords: 검색 키워드 리스트
         country: 국가 코드 (KR, US)
         max_results: 최대 수집 개수
+        watermarks: 피드 워터마크 (주면 이전 수집에서 본 항목은 건너뜀)
     
     Returns:
-        뉴스 딕셔너리 리스트
+        뉴스 딕셔너리 리스트 (키워드 순서 유지, url은 언론사 정규 URL, original_url은 RSS 링크)
     """
-    all_news = []
-    
-    for keyword in keywords:
+    async def fetch_keyword(keyword: str) -> List[Dict]:
         try:
-            # 한국 뉴스의 경우 더 구체적인 검색어 조합
-            if country == "KR":
-                # 심리/상담 관련 키워드만 필터링
-                search_query = keyword
-                # 제외 키워드 추가 (법률 상담, 디지털 상담 등 제외, 단 IT는 AI/뇌과학 관련이므로 제외하지 않음)
-                # 단, 심리학+AI, 뇌과학+AI는 제외하지 않음
-                if "상담" in keyword or "심리" in keyword:
-                    search_query = f"{keyword} -법률 -법무 -디지털 -건설 -공제회 -IT"
-                rss_url = f"https://news.google.com/rss/search?q={search_query}&hl=ko&gl=KR&ceid=KR:ko"
-            else:  # US
-                rss_url = f"https://news.google.com/rss/search?q={keyword}&hl=en&gl=US&ceid=US:en"
-            
+            rss_url = build_rss_url(keyword, country)
             logger.info(f"RSS Feed 파싱 중: {keyword} ({country})")
             
             # RSS Feed 파싱
-            feed = feedparser.parse(rss_url)
+            feed = await fetcher.get_feed(rss_url)
             
-            # 정확히 max_results 개수만 가져오기
+            # 정확히 max_results 개수만 가져오기 (워터마크가 있으면 새 항목 중에서)
             entries = feed.entries[:max_results]
-            for entry in entries:
-                news_item = {
+            if watermarks is not None:
+                entries = watermarks.take_new_entries(feed.entries, keyword, country, max_results)
+            return [
+                {
                     "title": entry.get("title", ""),
                     "url": entry.get("link", ""),
                     "published": entry.get("published", ""),
@@ -70,71 +83,35 @@ def fetch_news_from_rss(keywords: List[str], country: str = "KR", max_results: i
                     "country": country,
                     "keyword": keyword
                 }
-                all_news.append(news_item)
-            
-            # 요청 간격 조절 (Rate limiting) - 병렬 처리로 인해 감소
-            time.sleep(0.3)
-            
+                for entry in entries
+            ]
         except Exception as e:
             logger.error(f"RSS Feed 파싱 실패 ({keyword}): {e}")
-            continue
+            return []
+    
+    results = await asyncio.gather(*(fetch_keyword(keyword) for keyword in keywords))
+    all_news = [news for news_list in results for news in news_list]
     
-    logger.info(f"총 {len(all_news)}개의 뉴스 수집 완료")
+    # Google News 리다이렉트 URL을 언론사 URL로 해석 (피드마다 다른 링크도 같은 기사면 같은 URL)
+    await canonicalize_items_async(fetcher, all_news)
+    
+    logger.info(f"총 {len(all_news)}개의 뉴스 수집 완료 ({country})")
     return all_news
 
 
-def scrape_article_content(url: str, max_retries: int = 2) -> Optional[str]:
+def fetch_news_from_rss(keywords: List[str], country: str = "KR", max_results: int = 20) -> List[Dict]:
     """
-    뉴스 기사 원문 스크래핑
+    Google News RSS Feed에서 뉴스 수집 (동기 래퍼)
     
     Args:
-        url: 기사 URL
-        max_retries: 최대 재시도 횟수
+        keywords: 검색 키워드 리스트
+        country: 국가 코드 (KR, US)
+        max_results: 최대 수집 개수
     
     Returns:
-        기사 본문 텍스트 (실패 시 None)
+        뉴스 딕셔너리 리스트
     """
-    for attempt in range(max_retries):
-        try:
-            response = requests.get(url, headers=HEADERS, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 본문 추출 시도 (다양한 태그 시도)
-            content = None
-            
-            # 일반적인 본문 태그들
-            for tag in ['article', 'div[class*="article"]', 'div[class*="content"]', 'main']:
-                elements = soup.select(tag)
-                if elements:
-                    content = ' '.join([elem.get_text(strip=True) for elem in elements])
-                    if len(content) > 200:  # 최소 길이 체크
-                        break
-            
-            # 위 방법이 실패하면 모든 p 태그 수집
-            if not content or len(content) < 200:
-                paragraphs = soup.find_all('p')
-                content = ' '.join([p.get_text(strip=True) for p in paragraphs])
-            
-            if content and len(content) > 100:
-                logger.info(f"기사 본문 추출 성공: {len(content)}자")
-                return content[:5000]  # 최대 5000자로 제한
-            else:
-                logger.warning(f"기사 본문이 너무 짧음: {url}")
-                return None
-                
-        except requests.exceptions.RequestException as e:
-            logger.warning(f"기사 스크래핑 실패 (시도 {attempt + 1}/{max_retries}): {e}")
-            if attempt < max_retries - 1:
-                time.sleep(1)
-            else:
-                return None
-        except Exception as e:
-            logger.error(f"기사 스크래핑 중 오류: {e}")
-            return None
-    
-    return None
+    return run_with_fetcher(fetch_news_from_rss_async, keywords, country, max_results)
 
 
 def check_duplicate(url: str) -> bool:
@@ -148,80 +125,90 @@ def check_duplicate(url: str) -> bool:
         중복이면 True, 아니면 False
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT id FROM articles WHERE url = ?", (url,))
-        result = cursor.fetchone()
-        conn.close()
+        with db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT id FROM articles WHERE url = ?", (url,))
+            result = cursor.fetchone()
         return result is not None
     except Exception as e:
         logger.error(f"중복 체크 실패: {e}")
         return False
 
 
+def article_record(article_data: Dict) -> Dict:
+    """
+    기사 데이터를 articles 테이블 레코드로 변환
+    
+    Args:
+        article_data: 기사 데이터 딕셔너리
+    
+    Returns:
+        컬럼 이름을 키로 하는 레코드
+    """
+    return {
+        # 날짜 파싱
+        "date": article_data.get("date", datetime.now().strftime("%Y-%m-%d")),
+        "category": article_data.get("category", "psychology"),
+        "title": article_data.get("title", ""),
+        "url": article_data.get("url", ""),
+        "original_url": article_data.get("original_url") or article_data.get("url", ""),
+        "content_summary": article_data.get("content_summary", ""),
+        "full_text": article_data.get("full_text", ""),
+        "keywords": json.dumps(article_data.get("keywords", []), ensure_ascii=False),
+        "validity_score": article_data.get("validity_score", 3),
+        "country": article_data.get("country", "KR")
+    }
+
+
 def save_article_to_db(article_data: Dict) -> bool:
     """
-    뉴스 기사를 데이터베이스에 저장
+    뉴스 기사를 데이터베이스에 저장 (쓰기 스레드가 다른 요청과 묶어서 커밋)
     
     Args:
         article_data: 기사 데이터 딕셔너리
     
     Returns:
-        저장 성공 여부
+        저장 성공 여부 (URL 중복이면 False)
     """
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        # 날짜 파싱
-        date_str = article_data.get("date", datetime.now().strftime("%Y-%m-%d"))
-        
-        cursor.execute("""
-            INSERT INTO articles (
-                date, category, title, url, content_summary, 
-                full_text, keywords, validity_score, country
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            date_str,
-            article_data.get("category", "psychology"),
-            article_data.get("title", ""),
-            article_data.get("url", ""),
-            article_data.get("content_summary", ""),
-            article_data.get("full_text", ""),
-            json.dumps(article_data.get("keywords", []), ensure_ascii=False),
-            article_data.get("validity_score", 3),
-            article_data.get("country", "KR")
-        ))
-        
-        conn.commit()
-        conn.close()
-        logger.info(f"기사 저장 완료: {article_data.get('title', '')[:50]}")
-        return True
+        if get_writer().submit("articles", article_record(article_data)).result():
+            logger.info(f"기사 저장 완료: {article_data.get('title', '')[:50]}")
+            return True
+        logger.info(f"이미 저장된 기사: {article_data.get('url', '')}")
+        return False
         
     except Exception as e:
         logger.error(f"기사 저장 실패: {e}")
         return False
 
 
-def process_single_news(news: Dict, country: str) -> Optional[Dict]:
+def save_articles_to_db(articles: List[Dict]) -> int:
     """
-    단일 뉴스 처리 함수 (병렬 처리용)
+    여러 뉴스 기사를 한 트랜잭션으로 저장
     
     Args:
-        news: 뉴스 딕셔너리
-        country: 국가 코드
+        articles: 기사 데이터 딕셔너리 리스트
     
     Returns:
-        처리된 기사 데이터 (실패 시 None)
-    """
-    url = news.get("url", "")
+        새로 저장된 기사 수 (중복뿐이면 0)
     
-    # 중복 체크 (먼저 수행하여 불필요한 처리 방지)
-    if check_duplicate(url):
-        logger.info(f"중복 기사 스킵: {url}")
-        return None
+    Raises:
+        Exception: 저장 실패 시 쓰기 스레드의 예외를 그대로 전달 (호출 측이 워터마크 등을 갱신하지 않도록)
+    """
+    try:
+        return write_records("articles", [article_record(article) for article in articles])
+    except Exception as e:
+        logger.error(f"기사 일괄 저장 실패: {e}")
+        raise
+
+
+def log_relevance(news: Dict):
+    """
+    제목 기반 관련성 확인 (관련성이 낮아도 스킵하지 않고 로그만 남김)
     
-    # 제목 기반 관련성 필터링 (스크래핑 전에 먼저 체크)
+    Args:
+        news: 뉴스 딕셔너리
+    """
     # 하지만 너무 엄격하게 필터링하지 않도록 키워드 확대
     title_lower = news.get("title", "").lower()
     relevant_keywords = [
@@ -234,38 +221,113 @@ def process_single_news(news: Dict, country: str) -> Optional[Dict]:
     # 관련성 체크는 경고만 하고 스킵하지 않음 (본문에서 확인 가능하도록)
     if not is_relevant:
         logger.info(f"관련성 낮은 뉴스 (제목만): {news.get('title', '')[:50]}")
-        # 스킵하지 않고 계속 진행 (본문에서 관련성 확인 가능)
+
+
+def prepare_single_news(news: Dict, duplicates: NearDuplicateIndex = None) -> Optional[Dict]:
+    """
+    단일 뉴스의 AI 분석 전 단계 처리 (중복 체크, 본문 스크래핑, 유사 중복 감지)
+    
+    Args:
+        news: 뉴스 딕셔너리
+        duplicates: 유사 중복 색인 (없으면 URL 중복만 확인)
+    
+    Returns:
+        {"news": 뉴스 딕셔너리, "full_text": 본문} (중복 또는 유사 중복이면 None)
+    """
+    url = news.get("url", "")
+    
+    # 중복 체크 (먼저 수행하여 불필요한 처리 방지)
+    if check_duplicate(url):
+        logger.info(f"중복 기사 스킵: {url}")
+        return None
+    
+    # 제목 기반 관련성 필터링 (스크래핑 전에 먼저 체크)
+    log_relevance(news)
     
     # 기사 본문 스크래핑
-    full_text = scrape_article_content(url)
+    full_text = scraper.scrape(url)
     if not full_text:
         logger.warning(f"본문 추출 실패, 제목만 저장: {url}")
         full_text = news.get("title", "")
     
-    # AI 분석
-    try:
-        title_original = news.get("title", "")
-        title_translated = ""
-        summary = ""
-        
+    # 이미 본 기사와 거의 같으면 AI 분석 전에 건너뜀
+    if duplicates is not None and duplicates.check(url, news.get("title", ""), full_text):
+        return None
+    
+    return {"news": news, "full_text": full_text}
+
+
+async def prepare_single_news_async(fetcher: Fetcher, news: Dict,
+                                    duplicates: NearDuplicateIndex = None) -> Optional[Dict]:
+    """
+    단일 뉴스의 AI 분석 전 단계 처리 (비동기 버전, URL 중복은 filter_new_items로 미리 제거된 상태)
+    
+    Args:
+        fetcher: 공유 연결 풀 Fetcher
+        news: 뉴스 딕셔너리
+        duplicates: 유사 중복 색인 (없으면 감지하지 않음)
+    
+    Returns:
+        {"news": 뉴스 딕셔너리, "full_text": 본문} (유사 중복이면 None)
+    """
+    url = news.get("url", "")
+    
+    # 제목 기반 관련성 필터링 (스크래핑 전에 먼저 체크)
+    log_relevance(news)
+    
+    # 기사 본문 스크래핑
+    full_text = await scraper.scrape_async(fetcher, url)
+    if not full_text:
+        logger.warning(f"본문 추출 실패, 제목만 저장: {url}")
+        full_text = news.get("title", "")
+    
+    # 이미 본 기사와 거의 같으면 AI 분석 전에 건너뜀
+    if duplicates is not None and await asyncio.to_thread(duplicates.check, url, news.get("title", ""), full_text):
+        return None
+    
+    return {"news": news, "full_text": full_text}
+
+
+def get_analysis_options(country: str) -> Dict:
+    """국가별 AI 분석 옵션 (외국 뉴스는 제목 번역 + 100자 수준 한국어 요약, 국내 뉴스는 요약 없음)"""
+    if country == "US":
+        return {"translate": True, "summary_style": "korean_brief"}
+    return {}
+
+
+def build_article_data(news: Dict, full_text: str, analysis: Optional[Dict], country: str) -> Dict:
+    """
+    AI 분석 결과로 저장할 기사 데이터 구성
+    
+    Args:
+        news: 뉴스 딕셔너리
+        full_text: 기사 본문
+        analysis: analyze_article 형태의 분석 결과 (실패 시 None)
+        country: 국가 코드
+    
+    Returns:
+        기사 데이터 딕셔너리
+    """
+    title_original = news.get("title", "")
+    
+    if analysis is None:
+        logger.error(f"AI 분석 결과 없음, 기본값으로 저장: {title_original[:50]}")
+        title_display = title_original
+        if country == "US":
+            summary = title_original[:100] + "..." if title_original else ""
+        else:
+            summary = ""
+        validity_score = 3
+        keywords_list = []
+    else:
         if country == "US":  # 외국 뉴스
-            # 제목 번역
-            try:
-                title_translated = translate_title(title_original)
-                logger.info(f"제목 번역 완료: {title_translated[:50]}")
-            except Exception as e:
-                logger.error(f"제목 번역 실패: {e}")
-                title_translated = title_original
+            title_translated = analysis.get("title_translated") or title_original
+            logger.info(f"제목 번역 완료: {title_translated[:50]}")
             
-            # 100자 수준 한국어 요약
-            try:
-                summary = generate_news_summary_korean(full_text[:2000])
-                if not summary or len(summary) > 150:
-                    summary = summary[:100] + "..." if summary and len(summary) > 100 else (title_translated[:100] + "...")
-                logger.info(f"요약 생성 완료: {summary[:50]}")
-            except Exception as e:
-                logger.error(f"요약 생성 실패: {e}")
-                summary = title_translated[:100] + "..." if len(title_translated) > 100 else title_translated
+            summary = analysis.get("summary", "")
+            if not summary or len(summary) > 150:
+                summary = summary[:100] + "..." if summary and len(summary) > 100 else (title_translated[:100] + "...")
+            logger.info(f"요약 생성 완료: {summary[:50]}")
             
             # 제목에 번역 병기
             if title_translated != title_original:
@@ -276,50 +338,120 @@ def process_single_news(news: Dict, country: str) -> Optional[Dict]:
             title_display = title_original
             summary = ""
         
-        # 전문성 평가
-        evaluation = evaluate_article(full_text[:2000])
-        validity_score = evaluation.get("score", 3)
-        
-        # 키워드 추출
-        keywords_list = extract_keywords(full_text[:2000], max_keywords=5)
-        
-    except Exception as e:
-        logger.error(f"AI 분석 실패: {e}")
-        title_display = news.get("title", "")
-        if country == "US":
-            summary = news.get('title', '')[:100] + "..." if news.get('title') else ""
-        else:
-            summary = ""
-        validity_score = 3
-        keywords_list = []
+        # 전문성 평가 및 키워드
+        validity_score = analysis.get("score", 3)
+        keywords_list = analysis.get("keywords", [])
     
-    # 데이터베이스에 저장
-    article_data = {
+    return {
         "date": datetime.now().strftime("%Y-%m-%d"),
         "category": news.get("keyword", "psychology"),
         "title": title_display,  # 번역 병기된 제목 저장
-        "url": url,
+        "url": news.get("url", ""),
+        "original_url": news.get("original_url", news.get("url", "")),
         "content_summary": summary,
         "full_text": full_text[:5000],
         "keywords": keywords_list,
         "validity_score": validity_score,
         "country": country
     }
+
+
+def process_single_news(news: Dict, country: str) -> Optional[Dict]:
+    """
+    단일 뉴스 처리 함수 (스크래핑 → AI 분석 → 저장을 한 건씩 수행)
+    
+    Args:
+        news: 뉴스 딕셔너리
+        country: 국가 코드
+    
+    Returns:
+        처리된 기사 데이터 (실패 시 None)
+    """
+    duplicates = NearDuplicateIndex("articles")
+    prepared = prepare_single_news(news, duplicates)
+    if not prepared:
+        duplicates.save()
+        return None
     
+    full_text = prepared["full_text"]
+    try:
+        analysis = analyze_article(full_text[:2000], title=news.get("title", ""), **get_analysis_options(country))
+    except Exception as e:
+        logger.error(f"AI 분석 실패: {e}")
+        analysis = None
+    
+    article_data = build_article_data(news, full_text, analysis, country)
     if save_article_to_db(article_data):
+        duplicates.save()
         return article_data
     
     return None
 
 
-def collect_and_analyze_news(keywords: List[str] = None, countries: List[str] = None, max_per_keyword: int = 10, progress_callback=None):
+def get_country_keywords(keywords: List[str], country: str) -> List[str]:
+    """
+    국가별 검색 키워드 선택 (같은 주제로 양쪽 모두 검색)
+    
+    Args:
+        keywords: 전체 검색 키워드 리스트
+        country: 국가 코드 (KR, US)
+    
+    Returns:
+        해당 국가에서 사용할 키워드 리스트
     """
-    뉴스 수집 및 AI 분석을 수행하는 메인 함수 (병렬 처리 최적화)
+    if country == "KR":
+        # 한국 뉴스: 한글 키워드 사용
+        country_keywords = [k for k in keywords if not k.isascii()]
+        # 한글 키워드가 없으면 영문 키워드를 한글로 변환하여 검색
+        if not country_keywords:
+            # 영문 키워드를 한글로 매핑
+            keyword_mapping = {
+                "psychology": "심리학",
+                "mental health": "정신건강",
+                "counseling psychology": "상담심리",
+                "clinical psychology": "임상심리",
+                "depression": "우울증",
+                "anxiety": "불안장애",
+                "trauma": "트라우마"
+            }
+            country_keywords = [keyword_mapping.get(k, k) for k in keywords if k.isascii()]
+    else:  # US
+        # 미국 뉴스: 영문 키워드 사용
+        country_keywords = [k for k in keywords if k.isascii()]
+        # 영문 키워드가 없으면 한글 키워드를 영문으로 변환하여 검색
+        if not country_keywords:
+            # 한글 키워드를 영문으로 매핑
+            keyword_mapping = {
+                "정신건강": "mental health",
+                "심리건강": "mental health",
+                "마음건강": "mental health",
+                "심리상담": "counseling",
+                "심리학이론": "psychology theory",
+                "심리학": "psychology",
+                "정신건강증진": "mental health promotion",
+                "우울증": "depression",
+                "불안장애": "anxiety disorder",
+                "트라우마": "trauma",
+                "상담심리": "counseling psychology",
+                "임상심리": "clinical psychology"
+            }
+            country_keywords = [keyword_mapping.get(k, "psychology") for k in keywords if not k.isascii()]
+    
+    return country_keywords
+
+
+async def collect_and_analyze_news_async(keywords: List[str] = None, countries: List[str] = None, max_per_keyword: int = 10, progress_callback=None):
+    """
+    뉴스 수집 및 AI 분석 (비동기 파이프라인)
+    
+    모든 국가/키워드의 RSS를 동시에 요청하고, 국가별로 본문 스크래핑이 끝나는 대로
+    배치 AI 분석을 시작하므로 전체 소요 시간은 가장 느린 호스트에 의해 결정됨
     
     Args:
         keywords: 검색 키워드 리스트 (기본값: 심리 관련 키워드)
         countries: 국가 코드 리스트 (기본값: ["KR", "US"])
         max_per_keyword: 키워드당 최대 수집 개수
+        progress_callback: 진행도 콜백 함수 (이벤트 루프 스레드에서 호출됨)
     """
     if keywords is None:
         keywords = ["정신건강", "심리건강", "마음건강", "심리상담", "심리학이론", "심리학", "정신건강증진", "우울증", "불안장애", "트라우마", "상담심리", "임상심리", "psychology", "mental health", "counseling psychology", "clinical psychology", "depression", "anxiety", "trauma"]
@@ -327,102 +459,133 @@ def collect_and_analyze_news(keywords: List[str] = None, countries: List[str] =
     if countries is None:
         countries = ["KR", "US"]
     
-    logger.info("=== 뉴스 수집 및 분석 시작 (병렬 처리) ===")
+    logger.info("=== 뉴스 수집 및 분석 시작 (비동기 처리) ===")
     
     total_collected = 0
     total_saved = 0
     
-    all_news_list = []  # 모든 수집된 뉴스
-    
-    for country in countries:
-        # 국가별 키워드 매핑 (같은 주제로 양쪽 모두 검색)
-        if country == "KR":
-            # 한국 뉴스: 한글 키워드 사용
-            country_keywords = [k for k in keywords if not k.isascii()]
-            # 한글 키워드가 없으면 영문 키워드를 한글로 변환하여 검색
-            if not country_keywords:
-                # 영문 키워드를 한글로 매핑
-                keyword_mapping = {
-                    "psychology": "심리학",
-                    "mental health": "정신건강",
-                    "counseling psychology": "상담심리",
-                    "clinical psychology": "임상심리",
-                    "depression": "우울증",
-                    "anxiety": "불안장애",
-                    "trauma": "트라우마"
-                }
-                country_keywords = [keyword_mapping.get(k, k) for k in keywords if k.isascii()]
-        else:  # US
-            # 미국 뉴스: 영문 키워드 사용
-            country_keywords = [k for k in keywords if k.isascii()]
-            # 영문 키워드가 없으면 한글 키워드를 영문으로 변환하여 검색
-            if not country_keywords:
-                # 한글 키워드를 영문으로 매핑
-                keyword_mapping = {
-                    "정신건강": "mental health",
-                    "심리건강": "mental health",
-                    "마음건강": "mental health",
-                    "심리상담": "counseling",
-                    "심리학이론": "psychology theory",
-                    "심리학": "psychology",
-                    "정신건강증진": "mental health promotion",
-                    "우울증": "depression",
-                    "불안장애": "anxiety disorder",
-                    "트라우마": "trauma",
-                    "상담심리": "counseling psychology",
-                    "임상심리": "clinical psychology"
-                }
-                country_keywords = [keyword_mapping.get(k, "psychology") for k in keywords if not k.isascii()]
+    countries = [country for country in countries if get_country_keywords(keywords, country)]
+    watermarks = await asyncio.to_thread(FeedWatermarks, "google_news")
+    duplicates = NearDuplicateIndex("articles")
+    
+    async with open_fetcher(conditional=True) as fetcher:
+        # RSS Feed에서 뉴스 수집 (모든 국가, 모든 키워드 동시 요청, 이전 수집 이후 항목만, 바뀌지 않은 피드는 304)
+        fetched_by_country = await asyncio.gather(*(
+            fetch_news_from_rss_async(fetcher, get_country_keywords(keywords, country), country, max_per_keyword,
+                                      watermarks=watermarks)
+            for country in countries
+        ))
         
-        if not country_keywords:
-            continue
+        # 배치 전체 중복 제거 (배치 내부 + DB, 한 번의 집합 쿼리) 후 새 URL만 처리
+        fetched_list = [news for news_list in fetched_by_country for news in news_list]
+        new_news_list = await asyncio.to_thread(filter_new_items, "articles", fetched_list)
+        news_by_country = [
+            [news for news in new_news_list if news.get("country") == country]
+            for country in countries
+        ]
         
-        # RSS Feed에서 뉴스 수집
-        news_list = fetch_news_from_rss(country_keywords, country, max_per_keyword)
-        # 국가 정보 추가
-        for news in news_list:
-            news["country"] = country
-        all_news_list.extend(news_list)
-    
-    # 전체 작업량 계산
-    total_work = len(all_news_list)
-    processed_count = 0
-    
-    logger.info(f"총 {total_work}개 뉴스 수집 완료. 병렬 처리 시작...")
-    
-    # 병렬 처리 (최대 5개 스레드 동시 실행)
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        # 모든 뉴스에 대해 병렬 처리 시작
-        future_to_news = {
-            executor.submit(process_single_news, news, news.get("country", "KR")): news 
-            for news in all_news_list
-        }
+        # 전체 작업량 계산 (본문 수집 + AI 분석 두 단계)
+        news_count = len(new_news_list)
+        total_work = news_count * 2
+        processed_count = 0
         
-        # 완료된 작업부터 처리
-        for future in as_completed(future_to_news):
-            processed_count += 1
-            news = future_to_news[future]
-            
+        logger.info(f"총 {len(fetched_list)}개 뉴스 수집 완료 (중복 {len(fetched_list) - news_count}개 제외). 비동기 처리 시작...")
+        
+        def report(message: str):
+            if progress_callback:
+                progress_callback(min(processed_count, total_work), total_work, message)
+        
+        def on_analyzed(count):
+            nonlocal processed_count
+            processed_count += count
+            report(f"AI 분석 중... ({processed_count - news_count}/{news_count})")
+        
+        async def prepare(news: Dict) -> Optional[Dict]:
             try:
-                result = future.result()
-                if result:
-                    total_collected += 1
-                    total_saved += 1
-                    
-                    # 진행도 업데이트
-                    if progress_callback:
-                        progress_callback(processed_count, total_work, 
-                                        f"처리 중... ({processed_count}/{total_work}) - {total_saved}개 저장됨")
+                return await prepare_single_news_async(fetcher, news, duplicates)
             except Exception as e:
                 logger.error(f"뉴스 처리 실패: {news.get('title', '')[:50]} - {e}")
-                if progress_callback:
-                    progress_callback(processed_count, total_work, 
-                                    f"처리 중... ({processed_count}/{total_work})")
+                return None
+        
+        async def process_country(country: str, news_list: List[Dict]):
+            nonlocal processed_count
+            
+            # 1단계: 본문 스크래핑 및 유사 중복 감지 (동시 실행, 호스트별 동시 요청 수 제한)
+            prepared_list = []
+            for future in asyncio.as_completed([prepare(news) for news in news_list]):
+                prepared = await future
+                processed_count += 1
+                if prepared:
+                    prepared_list.append(prepared)
+                report(f"본문 수집 중... ({min(processed_count, news_count)}/{news_count})")
+            
+            # 처리에 실패했거나 유사 중복인 항목은 분석 단계도 완료된 것으로 처리
+            processed_count += len(news_list) - len(prepared_list)
+            
+            # 2단계: 배치 AI 분석 (여러 기사를 한 번의 요청으로 분석, 다른 국가의 스크래핑과 병행)
+            items = [
+                {"id": str(idx), "title": prepared["news"].get("title", ""), "text": prepared["full_text"][:2000]}
+                for idx, prepared in enumerate(prepared_list)
+            ]
+            analyses = {}
+            if items:
+                try:
+                    analyses = await asyncio.to_thread(
+                        analyze_articles_batch, items,
+                        progress_callback=threadsafe_callback(on_analyzed),
+                        **get_analysis_options(country)
+                    )
+                except Exception as e:
+                    logger.error(f"AI 배치 분석 실패 ({country}): {e}")
+            
+            return [
+                (prepared, analyses.get(str(idx)))
+                for idx, prepared in enumerate(prepared_list)
+            ]
+        
+        results = await asyncio.gather(*(
+            process_country(country, news_list)
+            for country, news_list in zip(countries, news_by_country)
+        ))
+    
+    # 3단계: 일괄 저장 (쓰기 스레드가 한 트랜잭션으로 커밋)
+    articles = [
+        build_article_data(prepared["news"], prepared["full_text"], analysis, country)
+        for country, country_results in zip(countries, results)
+        for prepared, analysis in country_results
+    ]
+    total_saved = save_articles_to_db(articles)
+    total_collected = total_saved
+    
+    # 저장에 성공한 뒤에만 워터마크/피드 검증값/유사 중복 색인 갱신
+    # (저장이 실패하면 예외가 전달되어 아래를 건너뛰므로 다음 수집에서 같은 항목을 다시 읽음)
+    await asyncio.to_thread(watermarks.save)
+    await asyncio.to_thread(fetcher.validators.save)
+    await asyncio.to_thread(duplicates.save)
+    
+    if progress_callback:
+        progress_callback(total_work, total_work, f"처리 완료 - {total_saved}개 저장됨")
     
     logger.info(f"=== 뉴스 수집 완료: {total_collected}개 수집, {total_saved}개 저장 ===")
+    logger.info(f"유사 중복 통계: {duplicates.stats}")
+    logger.info(f"AI 엔진 통계: {get_ai_stats()}")
+    logger.info(f"페이지 캐시 통계: {page_cache.get_stats()}")
+    logger.info(f"본문 추출 통계: {scraper.get_stats()}")
     return total_collected, total_saved
 
 
+def collect_and_analyze_news(keywords: List[str] = None, countries: List[str] = None, max_per_keyword: int = 10, progress_callback=None):
+    """
+    뉴스 수집 및 AI 분석을 수행하는 메인 함수 (비동기 파이프라인의 동기 래퍼)
+    
+    Args:
+        keywords: 검색 키워드 리스트 (기본값: 심리 관련 키워드)
+        countries: 국가 코드 리스트 (기본값: ["KR", "US"])
+        max_per_keyword: 키워드당 최대 수집 개수
+    """
+    return run(collect_and_analyze_news_async(keywords, countries, max_per_keyword, progress_callback))
+
+
 # 테스트 코드
 if __name__ == "__main__":
     # 간단한 테스트 (한국 뉴스만, 키워드 1개만)
@@ -0,0 +1,365 @@
+"""
+페이지 캐시 모듈
+스크래핑한 기사 HTML을 압축하여 디스크(SQLite)에 저장하고, 추출한 본문도 함께 보관하여
+TTL 동안 같은 URL을 다시 내려받거나 다시 파싱하지 않도록 함
+
+- 페이지는 정규화한 URL로 찾고, HTML 본문은 내용 해시로 저장 (같은 HTML은 한 번만 저장)
+- 추출 본문은 (내용 해시, 추출기 이름)별로 저장 (추출 결과가 없었던 것도 기록)
+- 크기 제한을 넘으면 가장 오래 사용되지 않은 페이지부터 삭제
+"""
+
+import os
+import time
+import zlib
+import sqlite3
+import asyncio
+import hashlib
+import logging
+import threading
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+from modules.database import DB_DIR
+from modules.url_resolver import canonical_url
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 캐시 파일 경로 (본 데이터베이스와 잠금을 공유하지 않도록 별도 파일 사용)
+CACHE_FILE = DB_DIR / "page_cache.db"
+
+# 같은 URL을 다시 내려받기 전까지의 시간 (초)
+PAGE_TTL = int(os.getenv("PAGE_CACHE_TTL", str(24 * 60 * 60)))
+
+# 크기 제한 (초과 시 가장 오래 사용되지 않은 페이지부터 삭제, 바이트는 압축 후 기준)
+MAX_ENTRIES = int(os.getenv("PAGE_CACHE_MAX_ENTRIES", "20000"))
+MAX_BYTES = int(os.getenv("PAGE_CACHE_MAX_BYTES", str(300 * 1024 * 1024)))
+EVICTION_INTERVAL = 100  # 저장 N회마다 크기 제한 검사
+
+COMPRESSION_LEVEL = 6
+
+# 환경 변수로 캐시 전체 우회 가능 (PAGE_CACHE_BYPASS=1)
+CACHE_BYPASS = os.getenv("PAGE_CACHE_BYPASS", "").lower() in ("1", "true", "yes")
+
+_local = threading.local()
+_stats_lock = threading.Lock()
+_stats = {"hits": 0, "html_hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+_store_count = 0
+
+# 이벤트 루프별 진행 중인 다운로드 (같은 URL 동시 요청은 한 번만 내려받음)
+_inflight: Dict[Tuple[int, str], asyncio.Future] = {}
+
+
+def _get_cache_connection() -> sqlite3.Connection:
+    """스레드별 캐시 DB 연결 반환 (최초 호출 시 테이블 생성)"""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        DB_DIR.mkdir(exist_ok=True)
+        conn = sqlite3.connect(CACHE_FILE, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                last_accessed REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_pages_last_accessed ON pages (last_accessed);
+            CREATE INDEX IF NOT EXISTS idx_pages_content_hash ON pages (content_hash);
+            CREATE TABLE IF NOT EXISTS blobs (
+                content_hash TEXT PRIMARY KEY,
+                html BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                raw_size INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS texts (
+                content_hash TEXT NOT NULL,
+                extractor TEXT NOT NULL,
+                text TEXT,
+                PRIMARY KEY (content_hash, extractor)
+            ) WITHOUT ROWID;
+        """)
+        conn.commit()
+        _local.conn = conn
+    return conn
+
+
+def _increment(stat: str, amount: int = 1):
+    with _stats_lock:
+        _stats[stat] += amount
+
+
+def lookup(url: str, extractor: str) -> Dict:
+    """
+    캐시 조회 (TTL이 지난 페이지는 없는 것으로 취급)
+
+    Args:
+        url: 페이지 URL
+        extractor: 추출기 이름
+
+    Returns:
+        {"found": 페이지 존재 여부, "text_found": 추출 결과 존재 여부, "text": 본문 또는 None,
+         "html": 추출 결과가 없을 때만 압축 해제한 HTML, "content_hash"}
+    """
+    result = {"found": False, "text_found": False, "text": None, "html": None, "content_hash": None}
+    if CACHE_BYPASS:
+        return result
+    try:
+        conn = _get_cache_connection()
+        key = canonical_url(url)
+        row = conn.execute("SELECT content_hash, fetched_at FROM pages WHERE url = ?", (key,)).fetchone()
+        now = time.time()
+        if row is None or now - row[1] > PAGE_TTL:
+            _increment("misses")
+            return result
+
+        content_hash = row[0]
+        result.update(found=True, content_hash=content_hash)
+        text_row = conn.execute(
+            "SELECT text FROM texts WHERE content_hash = ? AND extractor = ?", (content_hash, extractor)
+        ).fetchone()
+        if text_row is not None:
+            result.update(text_found=True, text=text_row[0])
+            _increment("hits")
+        else:
+            # 다른 추출기로만 파싱했던 페이지: 저장된 HTML로 다시 추출
+            blob = conn.execute("SELECT html FROM blobs WHERE content_hash = ?", (content_hash,)).fetchone()
+            if blob is None:
+                _increment("misses")
+                return {**result, "found": False}
+            result["html"] = zlib.decompress(blob[0])
+            _increment("html_hits")
+
+        # LRU 갱신
+        conn.execute("UPDATE pages SET last_accessed = ? WHERE url = ?", (now, key))
+        conn.commit()
+        return result
+    except Exception as e:
+        logger.warning(f"페이지 캐시 조회 실패: {e}")
+        _increment("misses")
+        return result
+
+
+def store(url: str, html: Optional[bytes], extractor: str, text: Optional[str], content_hash: str = None):
+    """
+    페이지와 추출 본문 저장 (html이 None이면 content_hash의 기존 HTML에 본문만 추가)
+
+    Args:
+        url: 페이지 URL
+        html: 내려받은 HTML 바이트
+        extractor: 추출기 이름
+        text: 추출한 본문 (추출 실패도 None으로 기록하여 다시 파싱하지 않음)
+        content_hash: html 없이 본문만 추가할 때의 내용 해시
+    """
+    global _store_count
+
+    if CACHE_BYPASS:
+        return
+    try:
+        conn = _get_cache_connection()
+        now = time.time()
+        if html is not None:
+            content_hash = hashlib.sha256(html).hexdigest()
+            if conn.execute("SELECT 1 FROM blobs WHERE content_hash = ?", (content_hash,)).fetchone() is None:
+                compressed = zlib.compress(html, COMPRESSION_LEVEL)
+                conn.execute(
+                    "INSERT INTO blobs (content_hash, html, size, raw_size) VALUES (?, ?, ?, ?)",
+                    (content_hash, compressed, len(compressed), len(html))
+                )
+            conn.execute("""
+                INSERT OR REPLACE INTO pages (url, content_hash, fetched_at, last_accessed)
+                VALUES (?, ?, ?, ?)
+            """, (canonical_url(url), content_hash, now, now))
+        if content_hash:
+            conn.execute(
+                "INSERT OR REPLACE INTO texts (content_hash, extractor, text) VALUES (?, ?, ?)",
+                (content_hash, extractor, text)
+            )
+        conn.commit()
+        _increment("stores")
+
+        with _stats_lock:
+            _store_count += 1
+            should_evict = _store_count % EVICTION_INTERVAL == 0
+        if should_evict:
+            evict()
+    except Exception as e:
+        logger.warning(f"페이지 캐시 저장 실패: {e}")
+
+
+def evict() -> int:
+    """
+    TTL이 지난 페이지를 지우고, 크기 제한(페이지 수, 압축 바이트)을 초과하면
+    가장 오래 사용되지 않은 페이지부터 삭제 (어느 페이지도 참조하지 않는 HTML/본문도 정리)
+
+    Returns:
+        삭제된 페이지 수
+    """
+    try:
+        conn = _get_cache_connection()
+        removed = conn.execute("DELETE FROM pages WHERE fetched_at < ?", (time.time() - PAGE_TTL,)).rowcount
+
+        count = conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+        if count > MAX_ENTRIES:
+            removed += conn.execute("""
+                DELETE FROM pages WHERE url IN (
+                    SELECT url FROM pages ORDER BY last_accessed ASC LIMIT ?
+                )
+            """, (count - MAX_ENTRIES,)).rowcount
+
+        total_bytes = conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+        if total_bytes > MAX_BYTES:
+            # 누적 크기가 제한 이하가 될 때까지 오래된 페이지부터 삭제
+            # (같은 HTML을 가리키는 페이지가 모두 지워져야 그 크기만큼 줄어듦)
+            excess = total_bytes - MAX_BYTES
+            references = dict(conn.execute("SELECT content_hash, COUNT(*) FROM pages GROUP BY content_hash"))
+            freed = 0
+            stale_urls = []
+            for url, content_hash, size in conn.execute("""
+                SELECT p.url, p.content_hash, b.size FROM pages AS p JOIN blobs AS b ON b.content_hash = p.content_hash
+                ORDER BY p.last_accessed ASC
+            """).fetchall():
+                stale_urls.append((url,))
+                references[content_hash] -= 1
+                if references[content_hash] == 0:
+                    freed += size
+                if freed >= excess:
+                    break
+            conn.executemany("DELETE FROM pages WHERE url = ?", stale_urls)
+            removed += len(stale_urls)
+
+        conn.execute("DELETE FROM blobs WHERE content_hash NOT IN (SELECT content_hash FROM pages)")
+        conn.execute("DELETE FROM texts WHERE content_hash NOT IN (SELECT content_hash FROM pages)")
+        conn.commit()
+        if removed:
+            _increment("evictions", removed)
+            logger.info(f"페이지 캐시 정리: {removed}개 페이지 삭제")
+        return removed
+    except Exception as e:
+        logger.warning(f"페이지 캐시 정리 실패: {e}")
+        return 0
+
+
+def clear():
+    """캐시 비우기"""
+    conn = _get_cache_connection()
+    conn.executescript("DELETE FROM pages; DELETE FROM blobs; DELETE FROM texts;")
+    conn.commit()
+
+
+def get_stats() -> Dict:
+    """캐시 적중(본문/HTML)/미스/저장/삭제 횟수 및 적중률 반환"""
+    with _stats_lock:
+        stats = dict(_stats)
+    lookups = stats["hits"] + stats["html_hits"] + stats["misses"]
+    stats["hit_rate"] = round((stats["hits"] + stats["html_hits"]) / lookups, 3) if lookups else 0.0
+    return stats
+
+
+def iter_pages(limit: int = 200) -> Iterator[Tuple[str, bytes]]:
+    """
+    캐시된 페이지를 최근 사용 순으로 반환 (본문 추출기 벤치마크용)
+
+    Args:
+        limit: 최대 페이지 수
+
+    Returns:
+        (정규화한 URL, 압축 해제한 HTML) 반복자
+    """
+    conn = _get_cache_connection()
+    rows = conn.execute("""
+        SELECT p.url, b.html FROM pages AS p JOIN blobs AS b ON b.content_hash = p.content_hash
+        ORDER BY p.last_accessed DESC
+        LIMIT ?
+    """, (limit,)).fetchall()
+    for url, html in rows:
+        yield url, zlib.decompress(html)
+
+
+def get_text(url: str, extract: Callable[[bytes], Optional[str]], extractor: str,
+             download: Callable[[], Optional[bytes]]) -> Optional[str]:
+    """
+    캐시를 거쳐 페이지 본문 추출 (동기)
+
+    Args:
+        url: 페이지 URL
+        extract: HTML 바이트 -> 본문 (결과 없으면 None)
+        extractor: 추출기 이름 (추출 방식이 바뀌면 이름도 바꿔 이전 결과와 구분)
+        download: 캐시에 없을 때 HTML을 내려받는 함수 (실패 시 None)
+
+    Returns:
+        본문 텍스트 (실패 시 None)
+    """
+    cached = lookup(url, extractor)
+    if cached["text_found"]:
+        return cached["text"]
+    if cached["html"] is not None:
+        text = extract(cached["html"])
+        store(url, None, extractor, text, content_hash=cached["content_hash"])
+        return text
+
+    html = download()
+    if html is None:
+        return None
+    text = extract(html)
+    store(url, html, extractor, text)
+    return text
+
+
+async def get_text_async(fetcher, url: str, extract: Callable[[bytes], Optional[str]], extractor: str,
+                         **request_kwargs) -> Optional[str]:
+    """
+    캐시를 거쳐 페이지 본문 추출 (비동기, 캐시 조회/파싱은 스레드에서 수행)
+
+    같은 이벤트 루프에서 같은 URL을 동시에 요청하면 한 번만 내려받고 결과를 공유
+
+    Args:
+        fetcher: 공유 연결 풀 Fetcher
+        url: 페이지 URL
+        extract: HTML 바이트 -> 본문 (결과 없으면 None)
+        extractor: 추출기 이름
+        request_kwargs: fetcher.get_bytes에 넘길 인자 (max_retries, timeout 등)
+
+    Returns:
+        본문 텍스트 (실패 시 None)
+    """
+    key = (id(asyncio.get_running_loop()), f"{extractor} {canonical_url(url)}")
+    pending = _inflight.get(key)
+    if pending is not None:
+        return await asyncio.shield(pending)
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        text = await _get_text_async(fetcher, url, extract, extractor, request_kwargs)
+        future.set_result(text)
+        return text
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        # 기다리는 쪽이 없어도 "예외가 조회되지 않음" 경고가 나지 않도록 확인 처리
+        future.exception()
+        raise
+    finally:
+        _inflight.pop(key, None)
+
+
+async def _get_text_async(fetcher, url: str, extract: Callable[[bytes], Optional[str]], extractor: str,
+                          request_kwargs: Dict) -> Optional[str]:
+    cached = await asyncio.to_thread(lookup, url, extractor)
+    if cached["text_found"]:
+        return cached["text"]
+    if cached["html"] is not None:
+        text = await asyncio.to_thread(extract, cached["html"])
+        await asyncio.to_thread(store, url, None, extractor, text, cached["content_hash"])
+        return text
+
+    html = await fetcher.get_bytes(url, **request_kwargs)
+    if html is None:
+        return None
+    text = await asyncio.to_thread(extract, html)
+    await asyncio.to_thread(store, url, html, extractor, text)
+    return text
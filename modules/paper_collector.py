@@ -3,114 +3,252 @@
 arXiv, PubMed에서 심리학 관련 논문을 수집
 """
 
-import requests
 import logging
 from datetime import datetime
 from typing import List, Dict, Optional
-import time
 import json
+import asyncio
 import xml.etree.ElementTree as ET
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from modules.ai_engine import summarize_paper, translate_abstract, extract_keywords
-from modules.database import get_connection
+from modules.ai_engine import summarize_paper, translate_abstract, extract_keywords, extract_keywords_batch, get_ai_stats
+from modules.async_engine import Fetcher, open_fetcher, run, run_with_fetcher, threadsafe_callback
+from modules.database import db_connection, filter_new_items
+from modules.db_writer import get_writer, write_records
 from modules.journal_filter import is_reputable_journal, filter_papers_by_journal
+from modules.feed_state import FeedWatermarks
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def fetch_papers_from_arxiv(keywords: List[str], max_results: int = 20) -> List[Dict]:
+ARXIV_API_URL = "http://export.arxiv.org/api/query"
+ARXIV_PAGE_SIZE = 10  # 워터마크가 있을 때 한 번에 읽는 논문 수
+PUBMED_SEARCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
+PUBMED_FETCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
+
+
+def parse_arxiv_entries(content: bytes, keyword: str) -> List[Dict]:
     """
-    arXiv API에서 논문 수집
+    arXiv API 응답(Atom XML)을 논문 딕셔너리로 변환
     
     Args:
-        keywords: 검색 키워드 리스트
-        max_results: 최대 수집 개수
+        content: API 응답 바이트
+        keyword: 검색 키워드
+    
+    Returns:
+        논문 딕셔너리 리스트
+    """
+    papers = []
+    
+    # XML 파싱
+    root = ET.fromstring(content)
+    ns = {'atom': 'http://www.w3.org/2005/Atom'}
+    
+    entries = root.findall('atom:entry', ns)
+    
+    for entry in entries:
+        title = entry.find('atom:title', ns).text.strip() if entry.find('atom:title', ns) is not None else ""
+        summary = entry.find('atom:summary', ns).text.strip() if entry.find('atom:summary', ns) is not None else ""
+        link = entry.find('atom:id', ns).text if entry.find('atom:id', ns) is not None else ""
+        
+        # 저자 추출
+        authors = []
+        for author in entry.findall('atom:author', ns):
+            name = author.find('atom:name', ns)
+            if name is not None:
+                authors.append(name.text)
+        
+        # 발행일 추출 (published_at은 워터마크 비교용 UTC 시각)
+        published = entry.find('atom:published', ns)
+        published_date = published.text[:10] if published is not None else datetime.now().strftime("%Y-%m-%d")
+        
+        paper = {
+            "title": title,
+            "abstract": summary,
+            "authors": authors,
+            "url": link,
+            "date": published_date,
+            "published_at": published.text.strip() if published is not None else None,
+            "journal": "arXiv",
+            "keyword": keyword
+        }
+        papers.append(paper)
+    
+    return papers
+
+
+def parse_pubmed_articles(content: bytes, pmids: List[str], keyword: str) -> List[Dict]:
+    """
+    PubMed efetch 응답(XML)을 논문 딕셔너리로 변환
+    
+    Args:
+        content: API 응답 바이트
+        pmids: 조회한 PMID 리스트
+        keyword: 검색 키워드
     
     Returns:
         논문 딕셔너리 리스트
     """
-    all_papers = []
+    papers = []
+    
+    # XML 파싱 (간단 버전)
+    root = ET.fromstring(content)
+    
+    for article in root.findall(".//PubmedArticle"):
+        title_elem = article.find(".//ArticleTitle")
+        title = title_elem.text if title_elem is not None else ""
+        
+        abstract_elem = article.find(".//AbstractText")
+        abstract = abstract_elem.text if abstract_elem is not None else ""
+        
+        # 저자 추출
+        authors = []
+        for author in article.findall(".//Author"):
+            lastname = author.find("LastName")
+            firstname = author.find("FirstName")
+            if lastname is not None:
+                name = lastname.text
+                if firstname is not None:
+                    name += f" {firstname.text}"
+                authors.append(name)
+        
+        # DOI 추출
+        doi_elem = article.find(".//ArticleId[@IdType='doi']")
+        doi = doi_elem.text if doi_elem is not None else ""
+        
+        # 논문별 PMID로 URL 구성 (없으면 요청한 첫 PMID)
+        pmid_elem = article.find(".//MedlineCitation/PMID")
+        pmid = pmid_elem.text.strip() if pmid_elem is not None and pmid_elem.text else (pmids[0] if pmids else "")
+        url = f"https://pubmed.ncbi.nlm.nih.gov/{pmid}" if pmid else ""
+        
+        # PubMed 등록일 (워터마크 비교용, YYYY/MM/DD)
+        entrez = article.find(".//PubmedData/History/PubMedPubDate[@PubStatus='entrez']")
+        entrez_date = None
+        if entrez is not None and entrez.findtext("Year"):
+            entrez_date = "{}/{:0>2}/{:0>2}".format(
+                entrez.findtext("Year"), entrez.findtext("Month") or "1", entrez.findtext("Day") or "1"
+            )
+        
+        # 발행일
+        pub_date = article.find(".//PubDate/Year")
+        date = pub_date.text if pub_date is not None else datetime.now().strftime("%Y-%m-%d")
+        
+        # 학술지 이름 추출
+        journal_elem = article.find(".//Journal/Title")
+        journal_name = journal_elem.text if journal_elem is not None else "PubMed"
+        
+        paper = {
+            "title": title,
+            "abstract": abstract,
+            "authors": authors,
+            "url": url,
+            "date": date,
+            "pmid": pmid,
+            "published_at": entrez_date,
+            "journal": journal_name,
+            "keyword": keyword
+        }
+        papers.append(paper)
+    
+    return papers
+
+
+async def fetch_papers_from_arxiv_async(fetcher: Fetcher, keywords: List[str], max_results: int = 20,
+                                        watermarks: Optional[FeedWatermarks] = None) -> List[Dict]:
+    """
+    arXiv API에서 논문 수집 (비동기, arXiv 호스트는 동시 요청 1개로 제한됨)
+    
+    워터마크가 있는 키워드는 ARXIV_PAGE_SIZE개씩 최신순으로 읽다가 이전 수집에서 본 논문을
+    만나면 멈추므로, 새 논문이 적은 평상시에는 작은 페이지 하나만 받음
+    
+    Args:
+        fetcher: 공유 연결 풀 Fetcher
+        keywords: 검색 키워드 리스트
+        max_results: 최대 수집 개수
+        watermarks: 피드 워터마크 (주면 이전 수집 이후 논문만)
     
-    for keyword in keywords:
+    Returns:
+        논문 딕셔너리 리스트 (키워드 순서 유지)
+    """
+    async def fetch_keyword(keyword: str) -> List[Dict]:
         try:
-            # arXiv API URL
-            url = f"http://export.arxiv.org/api/query"
-            params = {
-                "search_query": f"all:{keyword}",
-                "start": 0,
-                "max_results": max_results,
-                "sortBy": "submittedDate",
-                "sortOrder": "descending"
-            }
-            
-            logger.info(f"arXiv API 호출 중: {keyword}")
-            
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
+            incremental = watermarks is not None and watermarks.get(keyword) is not None
+            page_size = min(max_results, ARXIV_PAGE_SIZE) if incremental else max_results
+            papers = []
+            start = 0
             
-            # XML 파싱
-            root = ET.fromstring(response.content)
-            ns = {'atom': 'http://www.w3.org/2005/Atom'}
-            
-            entries = root.findall('atom:entry', ns)
-            
-            for entry in entries:
-                title = entry.find('atom:title', ns).text.strip() if entry.find('atom:title', ns) is not None else ""
-                summary = entry.find('atom:summary', ns).text.strip() if entry.find('atom:summary', ns) is not None else ""
-                link = entry.find('atom:id', ns).text if entry.find('atom:id', ns) is not None else ""
+            while len(papers) < max_results:
+                params = {
+                    "search_query": f"all:{keyword}",
+                    "start": start,
+                    "max_results": page_size,
+                    "sortBy": "submittedDate",
+                    "sortOrder": "descending"
+                }
                 
-                # 저자 추출
-                authors = []
-                for author in entry.findall('atom:author', ns):
-                    name = author.find('atom:name', ns)
-                    if name is not None:
-                        authors.append(name.text)
+                logger.info(f"arXiv API 호출 중: {keyword} (start={start})")
                 
-                # 발행일 추출
-                published = entry.find('atom:published', ns)
-                published_date = published.text[:10] if published is not None else datetime.now().strftime("%Y-%m-%d")
+                content = await fetcher.get_bytes(ARXIV_API_URL, params=params, timeout=30)
+                if content is None:
+                    break
+                page = await asyncio.to_thread(parse_arxiv_entries, content, keyword)
                 
-                paper = {
-                    "title": title,
-                    "abstract": summary,
-                    "authors": authors,
-                    "url": link,
-                    "date": published_date,
-                    "journal": "arXiv",
-                    "keyword": keyword
-                }
-                all_papers.append(paper)
+                reached_seen = False
+                for paper in page:
+                    if watermarks is not None and watermarks.is_seen(keyword, "", paper["published_at"], paper["url"]):
+                        reached_seen = True
+                        break
+                    papers.append(paper)
+                
+                if reached_seen or len(page) < page_size:
+                    break
+                start += page_size
             
-            time.sleep(0.5)  # Rate limiting (병렬 처리로 인해 감소)
+            papers = papers[:max_results]
+            if watermarks is not None:
+                for paper in papers:
+                    watermarks.observe(keyword, "", paper["published_at"], paper["url"])
+                if incremental:
+                    logger.info(f"arXiv 새 논문 {len(papers)}개: {keyword}")
+            return papers
             
         except Exception as e:
             logger.error(f"arXiv API 호출 실패 ({keyword}): {e}")
-            continue
+            return []
+    
+    results = await asyncio.gather(*(fetch_keyword(keyword) for keyword in keywords))
+    all_papers = [paper for papers in results for paper in papers]
     
-    logger.info(f"총 {len(all_papers)}개의 논문 수집 완료")
+    logger.info(f"총 {len(all_papers)}개의 논문 수집 완료 (arXiv)")
     return all_papers
 
 
-def fetch_papers_from_pubmed(keywords: List[str], max_results: int = 20) -> List[Dict]:
+async def fetch_papers_from_pubmed_async(fetcher: Fetcher, keywords: List[str], max_results: int = 20,
+                                         watermarks: Optional[FeedWatermarks] = None) -> List[Dict]:
     """
-    PubMed API에서 논문 수집 (간단 버전)
+    PubMed API에서 논문 수집 (비동기)
+    
+    워터마크가 있는 키워드는 마지막으로 본 논문의 등록일(edat) 이후만 검색하고,
+    그 안에서 이미 본 PMID 이하는 제외하며 새 PMID가 max_results개 모일 때까지만 페이지를 넘김.
+    검색 결과는 발행일순이라 등록일 구간을 끝까지 읽은 경우에만 PMID를 워터마크에 기록
+    (다 읽지 못했으면 등록일만 기록하고 중복은 filter_new_items로 제거)
     
     Args:
+        fetcher: 공유 연결 풀 Fetcher
         keywords: 검색 키워드 리스트
         max_results: 최대 수집 개수
+        watermarks: 피드 워터마크 (주면 이전 수집 이후 논문만)
     
     Returns:
-        논문 딕셔너리 리스트
+        논문 딕셔너리 리스트 (키워드 순서 유지)
     """
-    all_papers = []
-    
-    for keyword in keywords:
+    async def fetch_keyword(keyword: str) -> List[Dict]:
         try:
+            watermark = watermarks.get(keyword) if watermarks is not None else None
+            last_pmid = int(watermark[1]) if watermark and (watermark[1] or "").isdigit() else 0
+            
             # PubMed E-utilities API
-            search_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
             search_params = {
                 "db": "pubmed",
                 "term": keyword,
@@ -118,149 +256,154 @@ def fetch_papers_from_pubmed(keywords: List[str], max_results: int = 20) -> List
                 "sort": "pub_date",
                 "retmode": "json"
             }
+            if watermark:
+                search_params.update({"datetype": "edat", "mindate": watermark[0], "maxdate": "3000"})
             
-            logger.info(f"PubMed API 호출 중: {keyword}")
-            
-            response = requests.get(search_url, params=search_params, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
-            pmids = data.get("esearchresult", {}).get("idlist", [])
+            pmids = []
+            retstart = 0
+            exhausted = False
+            while len(pmids) < max_results:
+                logger.info(f"PubMed API 호출 중: {keyword} (retstart={retstart})")
+                
+                content = await fetcher.get_bytes(PUBMED_SEARCH_URL, params={**search_params, "retstart": retstart},
+                                                  timeout=30)
+                if content is None:
+                    break
+                
+                result = json.loads(content).get("esearchresult", {})
+                page = result.get("idlist", [])
+                pmids.extend(pmid for pmid in page if int(pmid) > last_pmid)
+                
+                retstart += len(page)
+                exhausted = retstart >= int(result.get("count", 0))
+                if not watermark or not page or exhausted:
+                    break
+            pmids = pmids[:max_results]
             
             if not pmids:
-                continue
+                return []
             
             # 상세 정보 가져오기
-            fetch_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
             fetch_params = {
                 "db": "pubmed",
                 "id": ",".join(pmids[:max_results]),
                 "retmode": "xml"
             }
             
-            fetch_response = requests.get(fetch_url, params=fetch_params, timeout=30)
-            fetch_response.raise_for_status()
+            content = await fetcher.get_bytes(PUBMED_FETCH_URL, params=fetch_params, timeout=30)
+            if content is None:
+                return []
+            papers = await asyncio.to_thread(parse_pubmed_articles, content, pmids, keyword)
             
-            # XML 파싱 (간단 버전)
-            root = ET.fromstring(fetch_response.content)
-            
-            for article in root.findall(".//PubmedArticle"):
-                title_elem = article.find(".//ArticleTitle")
-                title = title_elem.text if title_elem is not None else ""
-                
-                abstract_elem = article.find(".//AbstractText")
-                abstract = abstract_elem.text if abstract_elem is not None else ""
-                
-                # 저자 추출
-                authors = []
-                for author in article.findall(".//Author"):
-                    lastname = author.find("LastName")
-                    firstname = author.find("FirstName")
-                    if lastname is not None:
-                        name = lastname.text
-                        if firstname is not None:
-                            name += f" {firstname.text}"
-                        authors.append(name)
-                
-                # DOI 추출
-                doi_elem = article.find(".//ArticleId[@IdType='doi']")
-                doi = doi_elem.text if doi_elem is not None else ""
-                url = f"https://pubmed.ncbi.nlm.nih.gov/{pmids[0]}" if pmids else ""
-                
-                # 발행일
-                pub_date = article.find(".//PubDate/Year")
-                date = pub_date.text if pub_date is not None else datetime.now().strftime("%Y-%m-%d")
-                
-                # 학술지 이름 추출
-                journal_elem = article.find(".//Journal/Title")
-                journal_name = journal_elem.text if journal_elem is not None else "PubMed"
-                
-                paper = {
-                    "title": title,
-                    "abstract": abstract,
-                    "authors": authors,
-                    "url": url,
-                    "date": date,
-                    "journal": journal_name,
-                    "keyword": keyword
-                }
-                all_papers.append(paper)
-            
-            time.sleep(0.5)  # Rate limiting (병렬 처리로 인해 감소)
+            # 가장 늦은 등록일과 가장 큰 PMID를 워터마크 후보로 (PMID는 등록 순서대로 증가)
+            # 구간을 다 읽지 못했으면 가져오지 못한 새 논문의 PMID가 더 작을 수 있으므로 등록일만 기록
+            if watermarks is not None:
+                dated = [paper for paper in papers if paper["published_at"] and paper["pmid"].isdigit()]
+                if dated:
+                    last_seen = str(max(int(paper["pmid"]) for paper in dated)) if exhausted else ""
+                    watermarks.observe(keyword, "", max(paper["published_at"] for paper in dated), last_seen)
+            return papers
             
         except Exception as e:
             logger.error(f"PubMed API 호출 실패 ({keyword}): {e}")
-            continue
+            return []
+    
+    results = await asyncio.gather(*(fetch_keyword(keyword) for keyword in keywords))
+    all_papers = [paper for papers in results for paper in papers]
     
-    logger.info(f"총 {len(all_papers)}개의 논문 수집 완료")
+    logger.info(f"총 {len(all_papers)}개의 논문 수집 완료 (PubMed)")
     return all_papers
 
 
+def fetch_papers_from_arxiv(keywords: List[str], max_results: int = 20) -> List[Dict]:
+    """
+    arXiv API에서 논문 수집
+    
+    Args:
+        keywords: 검색 키워드 리스트
+        max_results: 최대 수집 개수
+    
+    Returns:
+        논문 딕셔너리 리스트
+    """
+    return run_with_fetcher(fetch_papers_from_arxiv_async, keywords, max_results)
+
+
+def fetch_papers_from_pubmed(keywords: List[str], max_results: int = 20) -> List[Dict]:
+    """
+    PubMed API에서 논문 수집 (간단 버전)
+    
+    Args:
+        keywords: 검색 키워드 리스트
+        max_results: 최대 수집 개수
+    
+    Returns:
+        논문 딕셔너리 리스트
+    """
+    return run_with_fetcher(fetch_papers_from_pubmed_async, keywords, max_results)
+
+
 def check_duplicate_paper(url: str) -> bool:
     """논문 URL 중복 체크"""
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT id FROM papers WHERE url = ?", (url,))
-        result = cursor.fetchone()
-        conn.close()
+        with db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT id FROM papers WHERE url = ?", (url,))
+            result = cursor.fetchone()
         return result is not None
     except Exception as e:
         logger.error(f"중복 체크 실패: {e}")
         return False
 
 
+def paper_record(paper_data: Dict) -> Dict:
+    """논문 데이터를 papers 테이블 레코드로 변환"""
+    return {
+        "date": paper_data.get("date", datetime.now().strftime("%Y-%m-%d")),
+        "title": paper_data.get("title", ""),
+        "authors": json.dumps(paper_data.get("authors", []), ensure_ascii=False),
+        "journal": paper_data.get("journal", ""),
+        "url": paper_data.get("url", ""),
+        "abstract": paper_data.get("abstract", ""),
+        "summary": json.dumps(paper_data.get("summary", {}), ensure_ascii=False),
+        "keywords": json.dumps(paper_data.get("keywords", []), ensure_ascii=False),
+        "category": paper_data.get("category", "psychology")
+    }
+
+
 def save_paper_to_db(paper_data: Dict) -> bool:
-    """논문을 데이터베이스에 저장"""
+    """논문을 데이터베이스에 저장 (쓰기 스레드가 다른 요청과 묶어서 커밋, URL 중복이면 False)"""
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            INSERT INTO papers (
-                date, title, authors, journal, url, abstract, summary, keywords, category
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            paper_data.get("date", datetime.now().strftime("%Y-%m-%d")),
-            paper_data.get("title", ""),
-            json.dumps(paper_data.get("authors", []), ensure_ascii=False),
-            paper_data.get("journal", ""),
-            paper_data.get("url", ""),
-            paper_data.get("abstract", ""),
-            json.dumps(paper_data.get("summary", {}), ensure_ascii=False),
-            json.dumps(paper_data.get("keywords", []), ensure_ascii=False),
-            paper_data.get("category", "psychology")
-        ))
-        
-        conn.commit()
-        conn.close()
-        logger.info(f"논문 저장 완료: {paper_data.get('title', '')[:50]}")
-        return True
+        if get_writer().submit("papers", paper_record(paper_data)).result():
+            logger.info(f"논문 저장 완료: {paper_data.get('title', '')[:50]}")
+            return True
+        return False
         
     except Exception as e:
         logger.error(f"논문 저장 실패: {e}")
         return False
 
 
-def process_single_paper(paper: Dict) -> Optional[Dict]:
+def save_papers_to_db(papers: List[Dict]) -> int:
+    """여러 논문을 한 트랜잭션으로 저장하고 새로 저장된 개수 반환 (저장 실패 시 예외를 그대로 전달)"""
+    try:
+        return write_records("papers", [paper_record(paper) for paper in papers])
+    except Exception as e:
+        logger.error(f"논문 일괄 저장 실패: {e}")
+        raise
+
+
+def prepare_single_paper(paper: Dict) -> Optional[Dict]:
     """
-    단일 논문 처리 함수 (병렬 처리용)
+    단일 논문의 키워드 추출 전 단계 처리 (Abstract 번역, 중복 체크는 호출 측에서 수행)
     
     Args:
         paper: 논문 딕셔너리
     
     Returns:
-        처리된 논문 데이터 (실패 시 None)
+        {"paper": 논문 딕셔너리, "abstract_display": 번역 병기된 Abstract} (Abstract 없음이면 None)
     """
-    url = paper.get("url", "")
-    
-    # 중복 체크 (먼저 수행하여 불필요한 처리 방지)
-    if check_duplicate_paper(url):
-        logger.info(f"중복 논문 스킵: {url}")
-        return None
-    
     abstract = paper.get("abstract", "")
-    title = paper.get("title", "")
     journal = paper.get("journal", "")
     if not abstract:
         return None
@@ -268,41 +411,19 @@ def process_single_paper(paper: Dict) -> Optional[Dict]:
     # 논문이 외국 논문인지 확인 (arXiv, PubMed, 영문 저널명 등)
     is_foreign = journal.lower() in ["arxiv", "pubmed"] or (abstract and any(char.isascii() and char.isalpha() for char in abstract[:100]))
     
-    # AI 분석
-    try:
-        abstract_translated = ""
-        summary = {}  # 한국 논문은 해석 요약 없음
-        
-        if is_foreign and abstract:
-            # 외국 논문: Abstract 한글 번역
-            try:
-                abstract_translated = translate_abstract(abstract[:3000])
-                logger.info(f"Abstract 번역 완료: {len(abstract_translated)}자")
-            except Exception as e:
-                logger.error(f"Abstract 번역 실패: {e}")
-                abstract_translated = abstract  # 번역 실패 시 원문 사용
-            # 해석 요약은 제거하고 번역된 Abstract만 사용
-            summary = {}  # 빈 딕셔너리로 저장
-        else:
-            # 한국 논문: 해석 요약 없음, 원문 Abstract만 사용
-            abstract_translated = abstract
-            summary = {}
-        
-        # 키워드 추출
+    # Abstract 번역 (출력이 길어 배치로 묶지 않고 논문별로 요청)
+    if is_foreign and abstract:
+        # 외국 논문: Abstract 한글 번역
         try:
-            keywords_list = extract_keywords(abstract[:3000], max_keywords=5)
-        except:
-            keywords_list = extract_keywords(title[:500], max_keywords=5) if title else []
-            
-    except Exception as e:
-        logger.error(f"AI 분석 실패: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+            abstract_translated = translate_abstract(abstract[:3000])
+            logger.info(f"Abstract 번역 완료: {len(abstract_translated)}자")
+        except Exception as e:
+            logger.error(f"Abstract 번역 실패: {e}")
+            abstract_translated = abstract  # 번역 실패 시 원문 사용
+    else:
+        # 한국 논문: 원문 Abstract만 사용
         abstract_translated = abstract
-        summary = {}
-        keywords_list = extract_keywords(title[:500], max_keywords=5) if title else []
     
-    # 데이터베이스에 저장
     # Abstract에 번역 병기 (외국 논문인 경우)
     # 번역이 성공했는지 확인 (원문과 다르고, 길이가 충분하고, 한글이 포함되어 있는지)
     if is_foreign and abstract_translated:
@@ -322,32 +443,82 @@ def process_single_paper(paper: Dict) -> Optional[Dict]:
     else:
         abstract_display = abstract
     
-    paper_data = {
+    return {"paper": paper, "abstract_display": abstract_display}
+
+
+def build_paper_data(paper: Dict, abstract_display: str, keywords_list: List[str]) -> Dict:
+    """
+    저장할 논문 데이터 구성
+    
+    Args:
+        paper: 논문 딕셔너리
+        abstract_display: 번역 병기된 Abstract
+        keywords_list: 추출된 키워드 리스트
+    
+    Returns:
+        논문 데이터 딕셔너리
+    """
+    return {
         "date": paper.get("date", datetime.now().strftime("%Y-%m-%d")),
         "title": paper.get("title", ""),
         "authors": paper.get("authors", []),
         "journal": paper.get("journal", ""),
-        "url": url,
+        "url": paper.get("url", ""),
         "abstract": abstract_display[:5000],  # 번역 병기된 Abstract
-        "summary": summary,  # 빈 딕셔너리 (해석 요약 제거)
+        "summary": {},  # 빈 딕셔너리 (해석 요약 제거)
         "keywords": keywords_list,
         "category": paper.get("keyword", "psychology")
     }
+
+
+def process_single_paper(paper: Dict) -> Optional[Dict]:
+    """
+    단일 논문 처리 함수 (번역 → 키워드 추출 → 저장을 한 건씩 수행)
+    
+    Args:
+        paper: 논문 딕셔너리
+    
+    Returns:
+        처리된 논문 데이터 (실패 시 None)
+    """
+    url = paper.get("url", "")
+    
+    # 중복 체크 (먼저 수행하여 불필요한 처리 방지)
+    if check_duplicate_paper(url):
+        logger.info(f"중복 논문 스킵: {url}")
+        return None
+    
+    prepared = prepare_single_paper(paper)
+    if not prepared:
+        return None
+    
+    abstract = paper.get("abstract", "")
+    title = paper.get("title", "")
+    
+    # 키워드 추출
+    try:
+        keywords_list = extract_keywords(abstract[:3000], max_keywords=5)
+    except Exception:
+        keywords_list = extract_keywords(title[:500], max_keywords=5) if title else []
     
+    paper_data = build_paper_data(paper, prepared["abstract_display"], keywords_list)
     if save_paper_to_db(paper_data):
         return paper_data
     
     return None
 
 
-def collect_and_analyze_papers(keywords: List[str] = None, sources: List[str] = None, max_per_keyword: int = 10, progress_callback=None):
+async def collect_and_analyze_papers_async(keywords: List[str] = None, sources: List[str] = None, max_per_keyword: int = 10, progress_callback=None):
     """
-    논문 수집 및 AI 분석 메인 함수 (병렬 처리 최적화)
+    논문 수집 및 AI 분석 (비동기 파이프라인)
+    
+    소스별 API 호출을 동시에 수행하고, 논문별 Abstract 번역은 스레드에서 병행 처리
     
     Args:
         keywords: 검색 키워드 리스트
         sources: 수집 소스 (arxiv, pubmed)
         max_per_keyword: 키워드당 최대 수집 개수
+        progress_callback: 진행도 콜백 함수 (이벤트 루프 스레드에서 호출됨)
     """
     if keywords is None:
         keywords = ["psychology", "counseling", "correctional psychology", "criminal psychology"]
@@ -355,22 +526,33 @@ def collect_and_analyze_papers(keywords: List[str] = None, sources: List[str] =
     if sources is None:
         sources = ["arxiv"]  # 기본은 arxiv만 (pubmed는 선택)
     
-    logger.info("=== 논문 수집 및 분석 시작 (병렬 처리) ===")
+    logger.info("=== 논문 수집 및 분석 시작 (비동기 처리) ===")
     
     total_collected = 0
     total_saved = 0
     
-    all_papers = []
+    # 소스별 워터마크 (이전 수집에서 본 논문까지만 읽음)
+    watermarks = {
+        source: await asyncio.to_thread(FeedWatermarks, source)
+        for source in ("arxiv", "pubmed") if source in sources
+    }
+    
+    # arXiv, PubMed 수집 (소스 간 동시 요청)
+    async with open_fetcher() as fetcher:
+        source_tasks = []
+        if "arxiv" in sources:
+            source_tasks.append(fetch_papers_from_arxiv_async(fetcher, keywords, max_per_keyword, watermarks["arxiv"]))
+        # PubMed 수집 (선택)
+        if "pubmed" in sources:
+            source_tasks.append(fetch_papers_from_pubmed_async(fetcher, keywords, max_per_keyword, watermarks["pubmed"]))
+        results = await asyncio.gather(*source_tasks)
     
-    # arXiv 수집
-    if "arxiv" in sources:
-        arxiv_papers = fetch_papers_from_arxiv(keywords, max_per_keyword)
-        all_papers.extend(arxiv_papers)
+    all_papers = [paper for papers in results for paper in papers]
     
-    # PubMed 수집 (선택)
-    if "pubmed" in sources:
-        pubmed_papers = fetch_papers_from_pubmed(keywords, max_per_keyword)
-        all_papers.extend(pubmed_papers)
+    # 배치 전체 중복 제거 (배치 내부 + DB, 한 번의 집합 쿼리) 후 새 URL만 처리
+    fetched_count = len(all_papers)
+    all_papers = await asyncio.to_thread(filter_new_items, "papers", all_papers)
+    logger.info(f"중복 논문 {fetched_count - len(all_papers)}개 제외")
     
     # 저명 학술지 필터링 및 우선순위 정렬
     logger.info(f"저명 학술지 필터링 전: {len(all_papers)}개 논문")
@@ -395,36 +577,86 @@ def collect_and_analyze_papers(keywords: List[str] = None, sources: List[str] =
     total_work = len(all_papers)
     processed_count = 0
     
-    logger.info(f"총 {total_work}개 논문 수집 완료. 병렬 처리 시작...")
+    logger.info(f"총 {total_work}개 논문 수집 완료. 비동기 처리 시작...")
     
-    # 병렬 처리 (최대 5개 스레드 동시 실행)
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        # 모든 논문에 대해 병렬 처리 시작
-        future_to_paper = {
-            executor.submit(process_single_paper, paper): paper 
-            for paper in all_papers
-        }
+    # AI 단계 포함 전체 작업량 (번역 단계 + 키워드 추출 단계)
+    total_work = total_work * 2
+    
+    async def prepare(paper: Dict) -> Optional[Dict]:
+        try:
+            return await asyncio.to_thread(prepare_single_paper, paper)
+        except Exception as e:
+            logger.error(f"논문 처리 실패: {paper.get('title', '')[:50]} - {e}")
+            return None
+    
+    # 1단계: 중복 체크 및 Abstract 번역 (논문별 동시 실행, LLM 동시 호출 수는 rate_limiter가 제한)
+    prepared_list = []
+    for future in asyncio.as_completed([prepare(paper) for paper in all_papers]):
+        prepared = await future
+        processed_count += 1
+        if prepared:
+            prepared_list.append(prepared)
         
-        # 완료된 작업부터 처리
-        for future in as_completed(future_to_paper):
-            processed_count += 1
-            paper = future_to_paper[future]
-            
-            try:
-                result = future.result()
-                if result:
-                    total_collected += 1
-                    total_saved += 1
-                    
-                    # 진행도 업데이트
-                    if progress_callback:
-                        progress_callback(processed_count, total_work, 
-                                        f"처리 중... ({processed_count}/{total_work}) - {total_saved}개 저장됨")
-            except Exception as e:
-                logger.error(f"논문 처리 실패: {paper.get('title', '')[:50]} - {e}")
-                if progress_callback:
-                    progress_callback(processed_count, total_work, 
-                                    f"처리 중... ({processed_count}/{total_work})")
+        if progress_callback:
+            progress_callback(processed_count, total_work, 
+                            f"번역 중... ({processed_count}/{len(all_papers)})")
+    
+    # Abstract가 없거나 처리에 실패한 논문은 키워드 추출 단계를 건너뛴 것으로 처리
+    processed_count += len(all_papers) - len(prepared_list)
+    
+    # 2단계: 배치 키워드 추출 (여러 논문을 한 번의 요청으로 처리)
+    def on_analyzed(count):
+        nonlocal processed_count
+        processed_count += count
+        if progress_callback:
+            progress_callback(min(processed_count, total_work), total_work, 
+                            f"키워드 추출 중... ({processed_count}/{total_work})")
+    
+    items = [
+        {
+            "id": str(idx),
+            "title": prepared["paper"].get("title", ""),
+            "text": prepared["paper"].get("abstract", "")[:3000]
+        }
+        for idx, prepared in enumerate(prepared_list)
+    ]
+    try:
+        keywords_map = await asyncio.to_thread(
+            extract_keywords_batch, items, max_keywords=5,
+            progress_callback=threadsafe_callback(on_analyzed)
+        )
+    except Exception as e:
+        logger.error(f"키워드 배치 추출 실패: {e}")
+        keywords_map = {}
+    
+    # 3단계: 일괄 저장 (쓰기 스레드가 한 트랜잭션으로 커밋)
+    papers = [
+        build_paper_data(prepared["paper"], prepared["abstract_display"], keywords_map.get(str(idx), []))
+        for idx, prepared in enumerate(prepared_list)
+    ]
+    total_saved = save_papers_to_db(papers)
+    total_collected = total_saved
+    
+    # 저장에 성공한 뒤에만 워터마크 갱신
+    # (저장이 실패하면 예외가 전달되어 아래를 건너뛰므로 다음 수집에서 같은 논문을 다시 읽음)
+    for source_watermarks in watermarks.values():
+        await asyncio.to_thread(source_watermarks.save)
+    
+    if progress_callback and total_work:
+        progress_callback(total_work, total_work, f"처리 완료 - {total_saved}개 저장됨")
     
     logger.info(f"=== 논문 수집 완료: {total_collected}개 수집, {total_saved}개 저장 ===")
+    logger.info(f"AI 엔진 통계: {get_ai_stats()}")
     return total_collected, total_saved
+
+
+def collect_and_analyze_papers(keywords: List[str] = None, sources: List[str] = None, max_per_keyword: int = 10, progress_callback=None):
+    """
+    논문 수집 및 AI 분석 메인 함수 (비동기 파이프라인의 동기 래퍼)
+    
+    Args:
+        keywords: 검색 키워드 리스트
+        sources: 수집 소스 (arxiv, pubmed)
+        max_per_keyword: 키워드당 최대 수집 개수
+    """
+    return run(collect_and_analyze_papers_async(keywords, sources, max_per_keyword, progress_callback))
@@ -0,0 +1,315 @@
+"""
+화면 조회 쿼리 모듈
+app.py, cache.py, dashboard_utils.py, email_sender.py가 실행하는 SELECT 문과 목록 쿼리 구성 함수를 모아 두고,
+쿼리 플랜 점검(tests/test_query_plans.py, python -m modules.database --check-plans)이
+화면에서 실제로 실행하는 것과 같은 쿼리를 검사하도록 함
+"""
+
+import sqlite3
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# 통합 대시보드: 오늘 수집된 항목, 날짜별 뉴스/논문 수 (일별 집계 테이블)
+TODAY_ITEMS = {
+    table: f"""
+        SELECT title, url, date, keywords FROM {table}
+        WHERE date = ?
+        ORDER BY created_at DESC
+        LIMIT 10
+    """
+    for table in ("articles", "papers")
+}
+
+DAILY_COUNTS = """
+    SELECT item_type, date, SUM(count) FROM daily_stats
+    WHERE item_type IN ('articles', 'papers') AND date >= ?
+    GROUP BY item_type, date
+"""
+
+# 경제 아카이브 출처 필터 선택지
+ECONOMY_SOURCES = "SELECT DISTINCT source FROM economy_news WHERE source IS NOT NULL"
+
+# 팩토리 선택 목록: 테이블 -> 조회 컬럼
+RECENT_ITEM_COLUMNS = {
+    "articles": "id, title, content_summary",
+    "papers": "id, title, abstract",
+}
+
+# 콘텐츠 보관함 (최신순)
+GENERATED_CONTENTS = """
+    SELECT id, content_type, title, content, created_at
+    FROM generated_content
+    ORDER BY created_at DESC
+"""
+
+# 수집 내용 관리 (삭제 목록)
+MANAGE_ITEMS = {
+    "articles": """
+        SELECT id, date, title, url, country, validity_score
+        FROM articles
+        ORDER BY created_at DESC
+    """,
+    "papers": """
+        SELECT id, date, title, journal, category
+        FROM papers
+        ORDER BY created_at DESC
+    """,
+}
+
+# 경제 탭 최근 기간 뉴스 표
+ECONOMY_PERIOD = """
+    SELECT date, title, category, source, url
+    FROM economy_news
+    WHERE date BETWEEN ? AND ?
+    ORDER BY date DESC, created_at DESC
+    LIMIT 200
+"""
+
+# 테스트 수집 결과 확인 (가장 최근 항목)
+LATEST_ARTICLES_BY_COUNTRY = """
+    SELECT id, title, date, country, url, content_summary, keywords, validity_score
+    FROM articles
+    WHERE country = ?
+    ORDER BY created_at DESC
+    LIMIT 1
+"""
+
+LATEST_ARXIV_PAPERS = """
+    SELECT id, title, date, journal, url, abstract, keywords
+    FROM papers
+    WHERE (journal LIKE '%arXiv%' OR journal LIKE '%arxiv%' OR url LIKE '%arxiv%')
+    ORDER BY created_at DESC
+    LIMIT 2
+"""
+
+LATEST_PAPERS = """
+    SELECT id, title, date, journal, url, abstract, keywords
+    FROM papers
+    ORDER BY created_at DESC
+    LIMIT 2
+"""
+
+# 이메일 다이제스트 (해당 날짜 기사, 평점순)
+DIGEST_ARTICLES = """
+    SELECT date, title, url, content_summary, validity_score, country
+    FROM articles
+    WHERE date = ?
+    ORDER BY validity_score DESC
+    LIMIT ?
+"""
+
+# 경제 카테고리별 상위 키워드 (일별 키워드 집계)
+CATEGORY_KEYWORDS = """
+    SELECT category, name FROM (
+        SELECT s.category AS category, k.name AS name,
+               ROW_NUMBER() OVER (PARTITION BY s.category ORDER BY SUM(s.count) DESC, k.name) AS rn
+        FROM daily_keyword_stats AS s
+        JOIN keywords AS k ON k.id = s.keyword_id
+        WHERE s.item_type = 'economy_news' AND s.date BETWEEN ? AND ?
+        GROUP BY s.category, s.keyword_id
+    )
+    WHERE rn <= ?
+    ORDER BY category, rn
+"""
+
+# 아카이브 목록(트렌드 레이더, 논문 아카이브, 경제 아카이브) 조회 컬럼과 정렬 선택지
+ARCHIVE_COLUMNS = {
+    "articles": "id, date, title, url, content_summary, keywords, validity_score, country",
+    "papers": "id, date, title, authors, journal, url, abstract, summary, keywords, category",
+    "economy_news": "id, date, title, url, content_summary, keywords, source, category",
+}
+
+_DATE_SORTS = {"최신순": "created_at DESC", "오래된순": "created_at ASC"}
+
+SORT_ORDERS = {
+    "articles": {
+        **_DATE_SORTS,
+        "평점 높은순": "validity_score DESC, created_at DESC",
+        "평점 낮은순": "validity_score ASC, created_at DESC",
+    },
+    "papers": _DATE_SORTS,
+    "economy_news": _DATE_SORTS,
+}
+
+RELEVANCE_SORT = "관련도순"
+
+
+def recent_items_query(table: str) -> str:
+    """팩토리 선택 목록 쿼리 (파라미터: limit)"""
+    return f"SELECT {RECENT_ITEM_COLUMNS[table]} FROM {table} ORDER BY created_at DESC LIMIT ?"
+
+
+def category_counts_query(group_column: str) -> str:
+    """(그룹, 날짜)별 개수 집계 쿼리 (파라미터: item_type, end_date)"""
+    if group_column not in ("category", "country"):
+        raise ValueError(f"집계할 수 없는 컬럼: {group_column}")
+    return f"""
+        SELECT {group_column}, date, SUM(count)
+        FROM daily_stats
+        WHERE item_type = ? AND date <= ?
+        GROUP BY {group_column}, date
+    """
+
+
+def top_issues_query(with_category: bool) -> str:
+    """
+    경제 주요 이슈 쿼리 (키워드 수 x 제목 길이 가중치 점수 상위)
+
+    파라미터: start_date, end_date, [category], limit
+    """
+    category_condition = "AND e.category = ?" if with_category else ""
+    # GROUP BY e.id 대신 상관 서브쿼리로 키워드 수를 세어 기간 조건이 date 인덱스를 타도록 함
+    return f"""
+        SELECT title, url, date, keyword_count,
+               keyword_count * CASE WHEN length(title) BETWEEN 20 AND 100 THEN 1.0 ELSE 0.8 END AS score
+        FROM (
+            SELECT e.title, e.url, e.date, e.created_at,
+                   (SELECT COUNT(*) FROM item_keywords AS ik
+                    WHERE ik.item_type = 'economy_news' AND ik.item_id = e.id) AS keyword_count
+            FROM economy_news AS e
+            WHERE e.date BETWEEN ? AND ? {category_condition}
+        )
+        ORDER BY score DESC, created_at DESC
+        LIMIT ?
+    """
+
+
+def source_filter(sources: Sequence[str]) -> Tuple[str, List]:
+    """선택한 출처 중 하나인 경제 뉴스만 남기는 WHERE 조건과 파라미터"""
+    return "(" + " OR ".join("source = ?" for _ in sources) + ")", list(sources)
+
+
+def archive_order_by(table: str, sort_option: str, search: Optional[Dict] = None) -> str:
+    """
+    아카이브 정렬 선택지를 ORDER BY 식으로 변환
+
+    Args:
+        table: ARCHIVE_COLUMNS 중 하나
+        sort_option: SORT_ORDERS[table]의 키 또는 "관련도순"
+        search: build_search_clause 결과 (FTS를 쓰면 관련도순 정렬 가능)
+
+    Returns:
+        ORDER BY 식 (알 수 없는 선택지는 최신순)
+    """
+    if sort_option == RELEVANCE_SORT and search and search["rank"]:
+        return f"{search['rank']}, created_at DESC"
+    return SORT_ORDERS[table].get(sort_option, "created_at DESC")
+
+
+def build_archive_query(table: str, where_conditions: List[str], order_by: str, join: str = "") -> str:
+    """
+    아카이브 목록 쿼리 구성 (파라미터: join 파라미터, 조건 파라미터, 페이지 크기, 오프셋 순)
+
+    Args:
+        table: ARCHIVE_COLUMNS 중 하나
+        where_conditions: AND로 묶을 조건 목록 (비어 있으면 전체)
+        order_by: archive_order_by 결과
+        join: 검색 JOIN 절
+
+    Returns:
+        SELECT 문
+    """
+    where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
+    return f"""
+        SELECT {ARCHIVE_COLUMNS[table]}
+        FROM {table} {join}
+        WHERE {where_clause}
+        ORDER BY {order_by}
+        LIMIT ? OFFSET ?
+    """
+
+
+def plan_checks(conn: sqlite3.Connection) -> List[Tuple[str, str, List, bool]]:
+    """
+    쿼리 플랜 점검 대상 (화면에서 실행하는 쿼리와 필터/정렬 조합)
+
+    Args:
+        conn: 점검할 데이터베이스 연결 (검색 절 구성에 사용)
+
+    Returns:
+        [(설명, 쿼리, 파라미터, 정렬용 임시 B-트리 허용 여부), ...]
+        (FTS 검색, 키워드/출처 필터는 색인으로 찾은 행만, 집계 쿼리는 일별 집계 행이나
+        기간 안의 행만 정렬하므로 임시 B-트리 허용)
+    """
+    from modules.keywords import KEYWORD_OPTIONS, build_keyword_filter
+    from modules.search import build_search_clause
+
+    day, week_ago = "2024-01-07", "2024-01-01"
+    checks = [
+        ("대시보드 오늘의 뉴스", TODAY_ITEMS["articles"], [day], False),
+        ("대시보드 오늘의 논문", TODAY_ITEMS["papers"], [day], False),
+        ("대시보드 날짜별 뉴스/논문 수", DAILY_COUNTS, [week_ago], False),
+        ("경제 아카이브 출처 목록", ECONOMY_SOURCES, [], False),
+        ("콘텐츠 보관함", GENERATED_CONTENTS, [], False),
+        ("뉴스 삭제 목록", MANAGE_ITEMS["articles"], [], False),
+        ("논문 삭제 목록", MANAGE_ITEMS["papers"], [], False),
+        ("경제 탭 기간 조회", ECONOMY_PERIOD, [week_ago, day], False),
+        ("테스트 수집 국가별 최신 뉴스", LATEST_ARTICLES_BY_COUNTRY, ["KR"], False),
+        ("테스트 수집 최신 arXiv 논문", LATEST_ARXIV_PAPERS, [], False),
+        ("테스트 수집 최신 논문", LATEST_PAPERS, [], False),
+        ("이메일 다이제스트 기사", DIGEST_ARTICLES, [day, 20], False),
+        ("경제 카테고리별 상위 키워드", CATEGORY_KEYWORDS, [week_ago, day, 3], True),
+        ("경제 주요 이슈", top_issues_query(False), [week_ago, day, 5], True),
+        ("경제 주요 이슈 카테고리", top_issues_query(True), [week_ago, day, "거시경제", 5], True),
+    ]
+    for table in RECENT_ITEM_COLUMNS:
+        checks.append((f"팩토리 선택 목록 {table}", recent_items_query(table), [20], False))
+    for group_column in ("category", "country"):
+        checks.append((f"{group_column}x날짜 집계", category_counts_query(group_column),
+                       ["economy_news", day], True))
+
+    for table in ARCHIVE_COLUMNS:
+        checks.append((f"키워드 필터 선택지 {table}", KEYWORD_OPTIONS, [table], False))
+        keyword_condition, keyword_params = build_keyword_filter(table, ["우울증", "금리"])
+        # (필터 이름, 조건, 파라미터, 임시 B-트리 허용 여부)
+        filters = [("전체", [], [], False), ("키워드 필터", [keyword_condition], keyword_params, True)]
+        if table == "articles":
+            filters.append(("국가 필터", ["country = ?"], ["KR"], False))
+        if table == "economy_news":
+            filters.append(("카테고리 필터", ["category = ?"], ["거시경제"], False))
+            condition, params = source_filter(["한국은행", "KDI"])
+            filters.append(("출처 필터", [condition], params, True))
+        for filter_name, conditions, params, allow_temp_sort in filters:
+            for sort_option in SORT_ORDERS[table]:
+                query = build_archive_query(table, conditions, archive_order_by(table, sort_option))
+                checks.append((f"아카이브 {table} {filter_name} {sort_option}", query, [*params, 20, 0],
+                               allow_temp_sort))
+
+        for query_text in ("우울증", "금리"):
+            search = build_search_clause(conn, table, query_text)
+            conditions = [search["where"]] if search["where"] else []
+            for sort_option in (RELEVANCE_SORT, "최신순"):
+                order_by = archive_order_by(table, sort_option, search)
+                query = build_archive_query(table, conditions, order_by, search["join"])
+                params = [*search["join_params"], *search["where_params"], 20, 0]
+                # FTS 조인은 MATCH로 찾은 행만 정렬
+                checks.append((f"아카이브 {table} 검색 '{query_text}' {sort_option}", query, params,
+                               bool(search["join"])))
+    return checks
+
+
+def explain_problems(conn: sqlite3.Connection, query: str, params: Sequence,
+                     allow_temp_sort: bool = False) -> List[str]:
+    """
+    EXPLAIN QUERY PLAN 결과 중 인덱스 없이 테이블 전체를 스캔하거나 정렬용 임시 B-트리를 만드는 단계
+
+    Args:
+        conn: 데이터베이스 연결
+        query: 점검할 쿼리
+        params: 쿼리 파라미터
+        allow_temp_sort: 정렬용 임시 B-트리 허용 여부
+
+    Returns:
+        문제 단계 설명 목록 (비어 있으면 통과)
+    """
+    problems = []
+    for row in conn.execute(f"EXPLAIN QUERY PLAN {query}", list(params)):
+        detail = row[-1]
+        # FTS5 가상 테이블 조회(MATCH)와 서브쿼리 결과 순회는 SCAN으로 표시되지만 테이블 전체 스캔이 아님
+        full_scan = (detail.startswith("SCAN") and "USING" not in detail
+                     and "VIRTUAL TABLE" not in detail and not detail.startswith("SCAN (subquery"))
+        # RIGHT PART: 인덱스 순서로 읽은 앞 컬럼 그룹 안에서만 정렬 (LIMIT에 도달하면 중단)
+        temp_sort = ("USE TEMP B-TREE" in detail and "RIGHT PART" not in detail
+                     and not allow_temp_sort)
+        if full_scan or temp_sort:
+            problems.append(detail)
+    return problems
@@ -0,0 +1,206 @@
+"""
+Gemini API 호출 속도 제한 모듈
+분당 요청 수(RPM), 분당 토큰 수(TPM) 토큰 버킷과 동시 실행 수 제한을 프로세스 전체에서 공유
+"""
+
+import os
+import re
+import time
+import random
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 기본 한도 (환경 변수로 조정, 기본값은 Gemini 무료 등급 Flash 기준)
+GEMINI_RPM = int(os.getenv("GEMINI_RPM", "15"))
+GEMINI_TPM = int(os.getenv("GEMINI_TPM", "1000000"))
+GEMINI_MAX_IN_FLIGHT = int(os.getenv("GEMINI_MAX_IN_FLIGHT", "4"))
+
+# 429 응답에 재시도 힌트가 없을 때 적용할 대기 시간 (초)
+DEFAULT_COOLDOWN = 10.0
+
+
+class TokenBucket:
+    """
+    분당 보충량 기반 토큰 버킷
+
+    reserve()는 토큰을 즉시 차감(음수 허용)하고 대기해야 할 시간을 반환하므로,
+    호출자는 잠금 밖에서 대기하고 요청 순서대로 공정하게 처리됨
+    """
+
+    def __init__(self, per_minute: float, capacity: float = None):
+        self.rate = per_minute / 60.0
+        self.capacity = capacity if capacity is not None else per_minute
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def reserve(self, amount: float) -> float:
+        """토큰을 예약하고 사용 가능해질 때까지의 대기 시간(초)을 반환"""
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            # 한 번의 요청이 버킷 용량을 넘지 않도록 제한
+            amount = min(amount, self.capacity)
+            self.tokens -= amount
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def adjust(self, amount: float):
+        """예약량과 실제 사용량의 차이를 반영 (양수면 반환, 음수면 추가 차감)"""
+        with self.lock:
+            self._refill(time.monotonic())
+            self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class RateLimiter:
+    """RPM/TPM 버킷, 동시 실행 세마포어, Retry-After 대기를 결합한 호출 제어기"""
+
+    def __init__(self, rpm: int, tpm: int, max_in_flight: int):
+        self.request_bucket = TokenBucket(rpm)
+        self.token_bucket = TokenBucket(tpm)
+        self.semaphore = threading.BoundedSemaphore(max_in_flight)
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+        self.stats = {
+            "requests": 0,
+            "in_flight": 0,
+            "throttled": 0,
+            "total_wait": 0.0,
+            "max_wait": 0.0,
+        }
+
+    @contextmanager
+    def acquire(self, estimated_tokens: int = 0):
+        """
+        호출 슬롯 확보 (필요 시 대기)
+
+        Args:
+            estimated_tokens: 이번 요청의 예상 토큰 수 (TPM 버킷 차감용)
+        """
+        started = time.monotonic()
+
+        # 동시 실행 수 제한
+        self.semaphore.acquire()
+        try:
+            # Retry-After로 지정된 전역 대기
+            while True:
+                with self.lock:
+                    cooldown = self.blocked_until - time.monotonic()
+                if cooldown <= 0:
+                    break
+                time.sleep(cooldown)
+
+            wait = max(
+                self.request_bucket.reserve(1),
+                self.token_bucket.reserve(estimated_tokens)
+            )
+            if wait > 0:
+                time.sleep(wait)
+
+            waited = time.monotonic() - started
+            with self.lock:
+                self.stats["requests"] += 1
+                self.stats["in_flight"] += 1
+                self.stats["total_wait"] += waited
+                self.stats["max_wait"] = max(self.stats["max_wait"], waited)
+
+            try:
+                yield
+            finally:
+                with self.lock:
+                    self.stats["in_flight"] -= 1
+        finally:
+            self.semaphore.release()
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: Optional[int]):
+        """실제 토큰 사용량을 TPM 버킷에 반영"""
+        if actual_tokens is None:
+            return
+        self.token_bucket.adjust(estimated_tokens - actual_tokens)
+
+    def penalize(self, retry_after: float):
+        """쿼터 초과 응답 시 모든 호출자를 retry_after초 동안 대기시킴"""
+        with self.lock:
+            self.stats["throttled"] += 1
+            self.blocked_until = max(self.blocked_until, time.monotonic() + retry_after)
+        logger.warning(f"Gemini 쿼터 초과: {retry_after:.1f}초 동안 호출 대기")
+
+    def get_stats(self) -> Dict:
+        """요청 수, 대기 시간, 쿼터 초과 횟수 반환"""
+        with self.lock:
+            stats = dict(self.stats)
+        stats["avg_wait"] = round(stats["total_wait"] / stats["requests"], 3) if stats["requests"] else 0.0
+        stats["total_wait"] = round(stats["total_wait"], 3)
+        stats["max_wait"] = round(stats["max_wait"], 3)
+        return stats
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def get_limiter() -> RateLimiter:
+    """프로세스 전체에서 공유하는 Gemini 호출 제어기 반환"""
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                _limiter = RateLimiter(GEMINI_RPM, GEMINI_TPM, GEMINI_MAX_IN_FLIGHT)
+                logger.info(f"Gemini 호출 제한: {GEMINI_RPM} RPM, {GEMINI_TPM} TPM, 동시 {GEMINI_MAX_IN_FLIGHT}개")
+    return _limiter
+
+
+def estimate_tokens(prompt: str, generation_config: Optional[Dict] = None) -> int:
+    """프롬프트 길이와 최대 출력 토큰으로 요청 토큰 수를 보수적으로 추정 (한글 기준 약 2자당 1토큰)"""
+    max_output_tokens = (generation_config or {}).get("max_output_tokens", 0)
+    return len(prompt) // 2 + max_output_tokens
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """쿼터 초과(429) 오류인지 확인"""
+    if getattr(error, "code", None) == 429:
+        return True
+    message = str(error)
+    return "429" in message or "ResourceExhausted" in type(error).__name__ or "quota" in message.lower()
+
+
+def parse_retry_after(error: Exception) -> Optional[float]:
+    """
+    오류에서 재시도 대기 시간(초) 추출
+
+    Retry-After 헤더, google.rpc.RetryInfo(retry_delay { seconds: N }),
+    "Please retry in 12.3s" 형식의 메시지를 순서대로 확인
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    retry_after = headers.get("Retry-After") if hasattr(headers, "get") else None
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+
+    message = str(error)
+    match = re.search(r"retry_delay\s*\{\s*seconds:\s*(\d+)", message)
+    if match:
+        return float(match.group(1))
+    match = re.search(r"retry in ([\d.]+)\s*s", message, re.IGNORECASE)
+    if match:
+        return float(match.group(1))
+    return None
+
+
+def backoff_delay(attempt: int) -> float:
+    """쿼터 외 일시 오류에 대한 지수 백오프 대기 시간 (지터 포함)"""
+    return 2 ** attempt + random.uniform(0, 0.5)
@@ -0,0 +1,385 @@
+"""
+수집 스케줄러 데몬
+뉴스/논문/경제 뉴스 수집, 일일 경제 보고서, 이메일 다이제스트를 cron 형식 일정에 따라 실행
+
+한 프로세스에 상주하므로 이벤트 루프와 HTTP 연결 풀(SharedLoop), Gemini 모델 핸들,
+DB 쓰기 스레드를 실행마다 다시 만들지 않음. 실행은 jobs 모듈의 작업으로 등록되어
+앱 화면에서도 진행 상황이 보이고, 같은 종류 작업이 진행 중이면 겹쳐 실행하지 않음
+
+실행:
+    python -m modules.scheduler            # 데몬 실행
+    python -m modules.scheduler --list     # 일정과 다음 실행 시각 확인
+    python -m modules.scheduler --run news # 지정 일정 1회 즉시 실행 (완료까지 대기)
+"""
+
+import os
+import sys
+import time
+import random
+import signal
+import logging
+import argparse
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set
+
+from modules.database import db_connection, init_database
+from modules import jobs
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 실행 시각을 예정 시각에서 0~N초 사이로 무작위로 늦춤 (외부 서버에 정각 요청이 몰리지 않도록)
+DEFAULT_JITTER = int(os.getenv("SCHEDULER_JITTER", "300"))
+
+# 재시작 시 이 시간 이내에 놓친 실행만 한 번 보충 (더 오래된 것은 건너뜀)
+CATCHUP_WINDOW = timedelta(hours=int(os.getenv("SCHEDULER_CATCHUP_HOURS", "12")))
+
+# 일정 확인 최대 대기 간격 (초, 시계 변경/절전 복귀에 대응)
+MAX_SLEEP = 60
+
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# 일정 이름 -> 설정 (cron: "분 시 일 월 요일", 환경 변수 SCHEDULE_<이름>으로 변경, "off"면 사용 안 함)
+SCHEDULES = {
+    "news": {
+        "cron": "0 7 * * *",
+        "job_type": "news",
+        "params": {
+            "keywords": ["심리", "마음건강", "뇌과학", "상담", "psychology", "mental health", "neuroscience", "counseling"],
+            "countries": ["KR", "US"],
+            "max_per_keyword": 10,
+        },
+    },
+    "papers": {
+        "cron": "30 7 * * *",
+        "job_type": "papers",
+        "params": {
+            "keywords": ["psychology", "counseling", "correctional psychology", "criminal psychology"],
+            "sources": ["arxiv"],
+            "max_per_keyword": 10,
+        },
+    },
+    "economy": {
+        "cron": "0 6,12,18 * * *",
+        "job_type": "economy",
+        "params": {},
+    },
+    "economy_report": {
+        "cron": "30 18 * * *",
+        "job_type": "economy_report",
+        "params": {},
+    },
+    "digest": {
+        "cron": "0 8 * * *",
+        "job_type": "digest",
+        "params": {},
+        # 수집 직후 발송되도록 지연 폭을 줄임
+        "jitter": 60,
+    },
+}
+
+
+class CronSchedule:
+    """
+    5필드 cron 식 ("분 시 일 월 요일", 요일은 0/7=일요일)
+
+    각 필드는 *, 숫자, 범위(a-b), 목록(a,b), 간격(*/n, a-b/n)을 지원하며
+    일과 요일이 모두 지정되면 둘 중 하나만 맞아도 실행 (표준 cron과 동일)
+    """
+
+    FIELDS = (("분", 0, 59), ("시", 0, 23), ("일", 1, 31), ("월", 1, 12), ("요일", 0, 7))
+
+    def __init__(self, expr: str):
+        parts = expr.split()
+        if len(parts) != 5:
+            raise ValueError(f"cron 식은 5개 필드여야 합니다: {expr!r}")
+        self.expr = expr
+        values = [self._parse_field(part, *field) for part, field in zip(parts, self.FIELDS)]
+        self.minutes, self.hours, self.days, self.months, weekdays = values
+        self.weekdays = {day % 7 for day in weekdays}
+        self.day_restricted = parts[2] != "*"
+        self.weekday_restricted = parts[4] != "*"
+
+    @staticmethod
+    def _parse_field(part: str, name: str, low: int, high: int) -> Set[int]:
+        values = set()
+        for item in part.split(","):
+            base, _, step = item.partition("/")
+            if base == "*":
+                start, end = low, high
+            elif "-" in base:
+                start, end = (int(v) for v in base.split("-", 1))
+            else:
+                start = int(base)
+                end = high if step else start
+            step = int(step) if step else 1
+            if not (low <= start <= end <= high) or step < 1:
+                raise ValueError(f"cron {name} 필드 범위 오류: {part!r}")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, dt: datetime) -> bool:
+        if dt.month not in self.months:
+            return False
+        day_ok = dt.day in self.days
+        weekday_ok = (dt.weekday() + 1) % 7 in self.weekdays
+        if self.day_restricted and self.weekday_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, dt: datetime) -> Optional[datetime]:
+        """dt 이후(초과) 첫 예정 시각 (1년 안에 없으면 None)"""
+        t = dt.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = t + timedelta(days=366)
+        while t < limit:
+            if not self._day_matches(t):
+                t = t.replace(hour=0, minute=0) + timedelta(days=1)
+            elif t.hour not in self.hours:
+                t = t.replace(minute=0) + timedelta(hours=1)
+            elif t.minute not in self.minutes:
+                t += timedelta(minutes=1)
+            else:
+                return t
+        return None
+
+    def previous(self, dt: datetime) -> Optional[datetime]:
+        """dt 이전(이하) 마지막 예정 시각 (1년 안에 없으면 None)"""
+        t = dt.replace(second=0, microsecond=0)
+        limit = t - timedelta(days=366)
+        while t > limit:
+            if not self._day_matches(t):
+                t = t.replace(hour=23, minute=59) - timedelta(days=1)
+            elif t.hour not in self.hours:
+                t = t.replace(minute=59) - timedelta(hours=1)
+            elif t.minute not in self.minutes:
+                t -= timedelta(minutes=1)
+            else:
+                return t
+        return None
+
+
+def load_schedules() -> List[Dict]:
+    """
+    실행할 일정 목록 (SCHEDULES 기본값에 환경 변수 SCHEDULE_<이름> 적용)
+
+    Returns:
+        [{"name", "cron"(CronSchedule), "job_type", "params", "jitter"}, ...]
+    """
+    schedules = []
+    for name, config in SCHEDULES.items():
+        expr = os.getenv(f"SCHEDULE_{name.upper()}", config["cron"]).strip()
+        if expr.lower() in ("", "off", "none"):
+            logger.info(f"일정 사용 안 함: {name}")
+            continue
+        schedules.append({
+            "name": name,
+            "cron": CronSchedule(expr),
+            "job_type": config["job_type"],
+            "params": config["params"],
+            "jitter": config.get("jitter", DEFAULT_JITTER),
+        })
+    return schedules
+
+
+def load_state() -> Dict[str, datetime]:
+    """일정별 마지막으로 처리한 예정 시각"""
+    with db_connection() as conn:
+        rows = conn.execute("SELECT name, last_run FROM scheduler_state").fetchall()
+    return {name: datetime.strptime(last_run, TIME_FORMAT) for name, last_run in rows}
+
+
+def save_state(name: str, slot: datetime, job_id: int = None):
+    """일정의 예정 시각을 처리 완료로 기록 (실행, 중복으로 건너뜀, 오래되어 건너뜀 모두 포함)"""
+    with db_connection() as conn:
+        conn.execute("""
+            INSERT INTO scheduler_state (name, last_run, last_job_id, updated_at)
+            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(name) DO UPDATE SET
+                last_run = excluded.last_run,
+                last_job_id = COALESCE(excluded.last_job_id, scheduler_state.last_job_id),
+                updated_at = CURRENT_TIMESTAMP
+        """, (name, slot.strftime(TIME_FORMAT), job_id))
+
+
+def fire(schedule: Dict, slot: datetime) -> Optional[int]:
+    """
+    일정 실행 (작업 등록) 후 예정 시각 기록
+
+    Args:
+        schedule: load_schedules 항목
+        slot: 처리할 예정 시각
+
+    Returns:
+        등록한 작업 id (같은 종류 작업이 진행 중이라 건너뛰었으면 None)
+    """
+    name = schedule["name"]
+    try:
+        job_id, created = jobs.submit_job(schedule["job_type"], schedule["params"])
+    except Exception as e:
+        logger.error(f"일정 실행 실패: {name} ({slot:%Y-%m-%d %H:%M}) - {e}")
+        job_id, created = None, False
+    else:
+        if created:
+            logger.info(f"일정 실행: {name} ({slot:%Y-%m-%d %H:%M}) -> 작업 #{job_id}")
+        else:
+            logger.warning(f"이전 실행이 아직 진행 중이라 건너뜀: {name} (작업 #{job_id})")
+    save_state(name, slot, job_id if created else None)
+    return job_id if created else None
+
+
+def run_scheduler(stop_event: threading.Event):
+    """
+    stop_event가 설정될 때까지 일정 확인 및 실행
+
+    매 확인마다 일정별 마지막 예정 시각이 기록된 시각보다 뒤면 실행 대상으로 잡고,
+    예정 시각 + 무작위 지연이 지나면 실행. 재시작/절전 복귀로 여러 번 놓쳤어도 한 번만 보충 실행
+
+    Args:
+        stop_event: 종료 신호
+    """
+    schedules = load_schedules()
+    state = load_state()
+    pending: Dict[str, tuple] = {}  # 일정 이름 -> (예정 시각, 실행 시각)
+
+    now = datetime.now()
+    for schedule in schedules:
+        name = schedule["name"]
+        if name not in state:
+            # 처음 등록된 일정은 과거 실행을 보충하지 않고 다음 예정 시각부터 실행
+            latest = schedule["cron"].previous(now)
+            if latest:
+                save_state(name, latest)
+                state[name] = latest
+        next_run = schedule["cron"].next_after(now)
+        logger.info(f"일정 등록: {name} [{schedule['cron'].expr}] "
+                    f"마지막 {state.get(name, '-')}, 다음 {next_run}")
+
+    while not stop_event.is_set():
+        now = datetime.now()
+        wake_at = now + timedelta(seconds=MAX_SLEEP)
+
+        for schedule in schedules:
+            name = schedule["name"]
+            if name not in pending:
+                latest = schedule["cron"].previous(now)
+                if latest and latest > state.get(name, datetime.min):
+                    if now - latest > CATCHUP_WINDOW:
+                        logger.warning(f"놓친 실행이 너무 오래되어 건너뜀: {name} ({latest:%Y-%m-%d %H:%M})")
+                        save_state(name, latest)
+                        state[name] = latest
+                        continue
+                    due = latest + timedelta(seconds=random.uniform(0, schedule["jitter"]))
+                    if due < now:
+                        logger.info(f"놓친 실행 보충: {name} ({latest:%Y-%m-%d %H:%M})")
+                    pending[name] = (latest, due)
+
+            if name in pending:
+                slot, due = pending[name]
+                if due <= now:
+                    fire(schedule, slot)
+                    state[name] = slot
+                    del pending[name]
+                else:
+                    wake_at = min(wake_at, due)
+                    continue
+
+            next_run = schedule["cron"].next_after(now)
+            if next_run:
+                wake_at = min(wake_at, next_run)
+
+        stop_event.wait(max((wake_at - datetime.now()).total_seconds(), 0.5))
+
+
+def warm_up():
+    """데몬 시작 시 DB, 상주 이벤트 루프/연결 풀, Gemini 모델 핸들을 미리 준비"""
+    from modules.async_engine import SharedLoop
+
+    init_database()
+    shared_loop = SharedLoop().install()
+    try:
+        from modules.ai_engine import get_model
+        get_model()
+    except Exception as e:
+        # API 키가 없거나 일시적 오류여도 데몬은 시작 (첫 분석 호출 시 다시 시도)
+        logger.warning(f"Gemini 모델 준비 실패: {e}")
+    return shared_loop
+
+
+def run_once(name: str) -> int:
+    """
+    지정 일정을 즉시 한 번 실행하고 완료까지 대기 (예정 시각 기록은 바꾸지 않음)
+
+    Returns:
+        종료 코드 (성공 0)
+    """
+    schedule = next((s for s in load_schedules() if s["name"] == name), None)
+    if schedule is None:
+        logger.error(f"알 수 없거나 사용 안 하는 일정: {name}")
+        return 2
+
+    shared_loop = warm_up()
+    try:
+        job_id, created = jobs.submit_job(schedule["job_type"], schedule["params"])
+        if not created:
+            logger.warning(f"같은 종류 작업이 이미 진행 중: #{job_id}")
+        job = jobs.get_job(job_id)
+        while job and job["status"] in jobs.ACTIVE_STATUSES:
+            time.sleep(1)
+            job = jobs.get_job(job_id)
+        logger.info(f"작업 #{job_id} {job['status']}: {job['result'] or (job['error'] or '').splitlines()[0]}")
+        return 0 if job["status"] == "done" else 1
+    finally:
+        jobs.shutdown()
+        shared_loop.close()
+
+
+def print_schedules():
+    """일정별 cron 식, 마지막 처리 시각, 다음 실행 시각 출력"""
+    init_database()
+    state = load_state()
+    now = datetime.now()
+    for schedule in load_schedules():
+        last = state.get(schedule["name"])
+        print(f"{schedule['name']:<16} {schedule['cron'].expr:<18} "
+              f"마지막: {last or '-'}  다음: {schedule['cron'].next_after(now)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PsyInsight 수집 스케줄러")
+    parser.add_argument("--list", action="store_true", help="일정과 다음 실행 시각 출력")
+    parser.add_argument("--run", metavar="NAME", choices=list(SCHEDULES), help="지정 일정을 즉시 1회 실행")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s', force=True)
+
+    if args.list:
+        print_schedules()
+        return 0
+    if args.run:
+        return run_once(args.run)
+
+    stop_event = threading.Event()
+
+    def request_stop(signum, frame):
+        logger.info("종료 신호 수신")
+        stop_event.set()
+
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+
+    logger.info("=== 스케줄러 시작 ===")
+    shared_loop = warm_up()
+    try:
+        run_scheduler(stop_event)
+    finally:
+        logger.info("실행 중인 작업이 끝나면 종료합니다...")
+        jobs.shutdown()
+        shared_loop.close()
+        logger.info("=== 스케줄러 종료 ===")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,529 @@
+"""
+기사 본문 스크래핑 모듈
+뉴스/경제 뉴스 수집이 함께 쓰는 본문 다운로드(페이지 캐시 경유)와 HTML 본문 추출
+
+- 기본 추출기는 lxml로 파싱하고 불필요한 영역(스크립트, 메뉴, 댓글 등)을 지운 뒤
+  문단 점수(글자 수, 문장부호, 링크 비율, class/id 가중치)가 가장 높은 블록을 본문으로 선택
+- 사이트별 규칙(DOMAIN_RULES)이 있으면 먼저 적용하고, 점수로 찾은 본문 위치는 호스트별로 기억하여
+  같은 사이트의 다음 페이지에서 바로 사용
+- 추출기는 HTML_EXTRACTOR 환경 변수로 교체 가능 (lxml이 없으면 BeautifulSoup 추출기 사용)
+"""
+
+import os
+import re
+import json
+import time
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from bs4 import BeautifulSoup
+
+from modules import page_cache
+from modules.async_engine import Fetcher, run_with_fetcher
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:  # lxml이 없으면 BeautifulSoup 추출기만 사용
+    lxml = None
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 본문으로 인정하는 최소 길이 (선택한 블록이 이보다 짧으면 모든 문단으로 대체), 저장 최소/최대 길이
+MIN_BLOCK_LENGTH = 200
+MIN_TEXT_LENGTH = 100
+MAX_TEXT_LENGTH = 5000
+
+# 내려받을 페이지 최대 크기 (바이트, 기사 본문은 앞부분에 있으므로 넘는 부분은 읽지 않음)
+MAX_PAGE_BYTES = int(os.getenv("SCRAPE_MAX_PAGE_BYTES", str(2 * 1024 * 1024)))
+
+# 문단으로 셀 최소 글자 수
+MIN_PARAGRAPH_LENGTH = 25
+
+# 파싱 전에 통째로 지우는 태그
+BOILERPLATE_TAGS = ("script", "style", "noscript", "iframe", "form", "nav", "header", "footer", "aside",
+                    "button", "select", "svg", "figcaption", "template")
+
+# 줄바꿈을 넣을 블록 태그
+BLOCK_TAGS = ("p", "div", "br", "li", "section", "article", "h1", "h2", "h3", "h4", "tr", "blockquote")
+
+# 점수 후보가 되는 컨테이너 태그
+CONTAINER_TAGS = {"div", "section", "article", "main", "td"}
+
+# class/id 가중치 (본문일 가능성이 높은 이름 / 낮은 이름)
+POSITIVE_NAMES = re.compile(r"article|body|content|entry|main|news|post|story|text|view|본문", re.IGNORECASE)
+NEGATIVE_NAMES = re.compile(
+    r"\bad\b|ads|advert|banner|comment|copyright|footer|header|menu|nav|popular|rank|recommend|related|"
+    r"reply|share|sidebar|sns|social|sponsor|subscribe|tag|widget",
+    re.IGNORECASE
+)
+CLASS_WEIGHT = 25
+
+# 사이트별 본문 위치 (호스트 접미사 -> XPath, 앞에서부터 시도)
+DOMAIN_RULES: Dict[str, List[str]] = {
+    "yna.co.kr": ['//div[contains(@class, "story-news")]', '//article[contains(@class, "story-news")]'],
+    "n.news.naver.com": ['//*[@id="dic_area"]', '//*[@id="newsct_article"]'],
+    "news.naver.com": ['//*[@id="dic_area"]', '//*[@id="articleBodyContents"]'],
+    "v.daum.net": ['//div[contains(@class, "article_view")]'],
+    "hankyung.com": ['//*[@id="articletxt"]'],
+    "mk.co.kr": ['//div[contains(@class, "news_cnt_detail_wrap")]'],
+    "chosun.com": ['//section[contains(@class, "article-body")]'],
+    "joongang.co.kr": ['//*[@id="article_body"]'],
+    "donga.com": ['//section[contains(@class, "news_view")]', '//div[contains(@class, "article_txt")]'],
+    "hani.co.kr": ['//div[contains(@class, "article-text")]'],
+    "khan.co.kr": ['//div[contains(@class, "art_body")]'],
+    "newsis.com": ['//div[contains(@class, "viewer")]'],
+    "edaily.co.kr": ['//div[contains(@class, "news_body")]'],
+}
+
+# 벤치마크/테스트용 페이지 (index.json에 URL)
+# - 합성 페이지: DOMAIN_RULES의 국내 사이트와 규칙이 없는 해외 사이트 구조를 흉내 내 직접 작성한 페이지
+#   (실제 페이지가 아니므로 사이트 구조 변화나 실제 처리 시간은 반영하지 못함)
+# - 실제 페이지: --export-fixtures로 페이지 캐시에서 내보낸 페이지 (있으면 벤치마크 기본값)
+FIXTURE_ROOT = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+SYNTHETIC_FIXTURE_DIR = FIXTURE_ROOT / "synthetic_pages"
+CAPTURED_FIXTURE_DIR = FIXTURE_ROOT / "captured_pages"
+
+# 호스트별로 기억하는 본문 위치 수 (초과 시 가장 오래 쓰지 않은 호스트부터 삭제)
+MAX_LEARNED_RULES = 1000
+
+# 추출기 선택 (readability, soup)
+DEFAULT_EXTRACTOR = os.getenv("HTML_EXTRACTOR", "readability")
+
+_learned_rules: "OrderedDict[str, str]" = OrderedDict()
+_rules_lock = threading.Lock()
+_stats_lock = threading.Lock()
+_stats = {"domain_rule": 0, "learned_rule": 0, "scored": 0, "paragraphs": 0, "failed": 0}
+
+_CHARSET = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.IGNORECASE)
+_SPACES = re.compile(r"[ \t\r\f\v\u00a0]+")
+_XML_DECLARATION = re.compile(r"^\s*<\?xml[^>]*\?>")
+
+
+def _increment(stat: str):
+    with _stats_lock:
+        _stats[stat] += 1
+
+
+def get_stats() -> Dict:
+    """본문 추출 방식별 횟수 (사이트 규칙, 기억한 위치, 점수 선택, 문단 대체, 실패)"""
+    with _stats_lock:
+        return dict(_stats)
+
+
+def _host(url: str) -> str:
+    return (urlsplit(url).hostname or "").lower()
+
+
+def _domain_rules(host: str) -> List[str]:
+    """호스트에 해당하는 사이트별 규칙 (접미사 일치)"""
+    for suffix, rules in DOMAIN_RULES.items():
+        if host == suffix or host.endswith("." + suffix):
+            return rules
+    return []
+
+
+def _decode_html(content: bytes) -> str:
+    """meta charset 선언을 우선으로 HTML 바이트를 문자열로 변환 (선언이 없으면 UTF-8, 실패 시 CP949)"""
+    match = _CHARSET.search(content[:4096])
+    encodings = [match.group(1).decode("ascii", "ignore")] if match else []
+    for encoding in encodings + ["utf-8", "cp949"]:
+        try:
+            return content.decode(encoding)
+        except (LookupError, UnicodeDecodeError):
+            continue
+    return content.decode("utf-8", "replace")
+
+
+def _clean_text(text: str) -> str:
+    """줄 단위로 공백을 정리하고 빈 줄 제거"""
+    lines = (_SPACES.sub(" ", line).strip() for line in text.split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def _node_text(node) -> str:
+    """블록 태그 경계에 줄바꿈을 넣은 노드 텍스트"""
+    for child in node.iter(*BLOCK_TAGS):
+        child.tail = "\n" + (child.tail or "")
+    return _clean_text(node.text_content())
+
+
+def _class_weight(node) -> int:
+    names = f"{node.get('class', '')} {node.get('id', '')}"
+    weight = 0
+    if POSITIVE_NAMES.search(names):
+        weight += CLASS_WEIGHT
+    if NEGATIVE_NAMES.search(names):
+        weight -= CLASS_WEIGHT
+    return weight
+
+
+def _link_density(node) -> float:
+    text_length = len(node.text_content()) or 1
+    link_length = sum(len(link.text_content()) for link in node.iter("a"))
+    return min(link_length / text_length, 1.0)
+
+
+def _paragraph_score(text: str) -> float:
+    """문단 점수 (기본 1점 + 100자당 1점(최대 3점) + 문장부호 수)"""
+    return 1 + min(len(text) / 100, 3) + len(re.findall(r"[,.，。]", text))
+
+
+def _score_candidates(body) -> Dict:
+    """
+    문단(p 태그, 또는 div 등에 br로 나뉘어 직접 들어 있는 텍스트)의 점수를 부모(전부)와 조부모(절반)에 더해
+    컨테이너별 점수 계산 (class/id 가중치와 링크 비율 반영)
+    """
+    scores = {}
+    for node in body.iter():
+        if not isinstance(node.tag, str):
+            continue
+        if node.tag == "p":
+            text, owner = node.text_content().strip(), node.getparent()
+        elif node.tag in CONTAINER_TAGS:
+            direct = (node.text or "") + "".join(child.tail or "" for child in node)
+            text, owner = direct.strip(), node
+        else:
+            continue
+        if owner is None or len(text) < MIN_PARAGRAPH_LENGTH:
+            continue
+
+        score = _paragraph_score(text)
+        for target, share in ((owner, 1.0), (owner.getparent(), 0.5)):
+            if target is None or not isinstance(target.tag, str):
+                continue
+            if target not in scores:
+                scores[target] = _class_weight(target)
+            scores[target] += score * share
+
+    return {node: score * (1 - _link_density(node)) for node, score in scores.items()}
+
+
+def _node_rule(node) -> Optional[str]:
+    """다음 페이지에서 같은 위치를 찾을 XPath (id 또는 class가 없으면 None)"""
+    for attribute in ("id", "class"):
+        value = node.get(attribute)
+        if value and '"' not in value and not re.search(r"\d{4,}", value):
+            return f'//{node.tag}[@{attribute}="{value}"]'
+    return None
+
+
+def _learned_rule(host: str) -> Optional[str]:
+    with _rules_lock:
+        rule = _learned_rules.get(host)
+        if rule:
+            _learned_rules.move_to_end(host)
+        return rule
+
+
+def _learn_rule(host: str, rule: Optional[str]):
+    if not host or not rule:
+        return
+    with _rules_lock:
+        _learned_rules[host] = rule
+        _learned_rules.move_to_end(host)
+        while len(_learned_rules) > MAX_LEARNED_RULES:
+            _learned_rules.popitem(last=False)
+
+
+def _apply_rule(doc, rule: str) -> Optional[str]:
+    """규칙에 맞는 노드의 텍스트 (너무 짧으면 None)"""
+    try:
+        nodes = doc.xpath(rule)
+    except etree.XPathError:
+        return None
+    text = "\n".join(_node_text(node) for node in nodes if isinstance(node.tag, str))
+    return text if len(text) >= MIN_BLOCK_LENGTH else None
+
+
+def extract_readability(content: bytes, url: str = "") -> Optional[str]:
+    """
+    lxml 파싱 + 문단 점수 기반 본문 추출 (사이트 규칙 → 호스트별로 기억한 위치 → 점수 선택 → 모든 문단)
+
+    Args:
+        content: HTML 바이트
+        url: 페이지 URL (사이트 규칙 선택용)
+
+    Returns:
+        본문 텍스트 (너무 짧으면 None)
+    """
+    try:
+        html = _XML_DECLARATION.sub("", _decode_html(content))
+        doc = lxml.html.document_fromstring(html)
+    except (etree.ParserError, ValueError):
+        return None
+    etree.strip_elements(doc, *BOILERPLATE_TAGS, with_tail=False)
+    etree.strip_elements(doc, etree.Comment, with_tail=False)
+
+    host = _host(url)
+    text = None
+    for rule in _domain_rules(host):
+        text = _apply_rule(doc, rule)
+        if text:
+            _increment("domain_rule")
+            break
+
+    if not text:
+        rule = _learned_rule(host)
+        if rule:
+            text = _apply_rule(doc, rule)
+            if text:
+                _increment("learned_rule")
+
+    if not text:
+        candidates = _score_candidates(doc.body if doc.find("body") is not None else doc)
+        if candidates:
+            best = max(candidates, key=candidates.get)
+            text = _node_text(best)
+            if len(text) >= MIN_BLOCK_LENGTH:
+                _increment("scored")
+                _learn_rule(host, _node_rule(best))
+            else:
+                text = None
+
+    if not text:
+        # 본문 블록을 찾지 못하면 모든 문단 사용
+        text = "\n".join(_clean_text(p.text_content()) for p in doc.iter("p"))
+        _increment("paragraphs")
+
+    return text
+
+
+def extract_soup(content: bytes, url: str = "") -> Optional[str]:
+    """
+    BeautifulSoup(html.parser) 기반 본문 추출 (이전 방식, lxml이 없을 때와 비교용)
+
+    Args:
+        content: HTML 바이트
+        url: 페이지 URL (사용 안 함)
+
+    Returns:
+        본문 텍스트 (너무 짧으면 None)
+    """
+    soup = BeautifulSoup(content, 'html.parser')
+
+    # 본문 추출 시도 (다양한 태그 시도)
+    text = None
+    for tag in ['article', 'div[class*="article"]', 'div[class*="content"]', 'main']:
+        elements = soup.select(tag)
+        if elements:
+            text = ' '.join([elem.get_text(strip=True) for elem in elements])
+            if len(text) > MIN_BLOCK_LENGTH:
+                break
+
+    # 위 방법이 실패하면 모든 p 태그 수집
+    if not text or len(text) < MIN_BLOCK_LENGTH:
+        paragraphs = soup.find_all('p')
+        text = ' '.join([p.get_text(strip=True) for p in paragraphs])
+    return text
+
+
+# 추출기 이름 -> (버전, 추출 함수(HTML 바이트, URL) -> 본문)
+# 추출 방식을 바꾸면 버전을 올려 페이지 캐시에 저장된 이전 결과를 쓰지 않도록 함
+EXTRACTORS: Dict[str, Tuple[int, Callable[[bytes, str], Optional[str]]]] = {
+    "readability": (1, extract_readability),
+    "soup": (1, extract_soup),
+}
+
+
+def resolve_extractor(name: str = None) -> str:
+    """사용할 추출기 이름 (알 수 없는 이름이거나 lxml이 없으면 soup)"""
+    name = name or DEFAULT_EXTRACTOR
+    if name not in EXTRACTORS:
+        logger.warning(f"알 수 없는 본문 추출기: {name}, soup 사용")
+        return "soup"
+    if name == "readability" and lxml is None:
+        return "soup"
+    return name
+
+
+def extract_text(content: bytes, url: str = "", extractor: str = None) -> Optional[str]:
+    """
+    HTML에서 본문 추출
+
+    Args:
+        content: HTML 바이트
+        url: 페이지 URL (사이트 규칙 선택 및 로그용)
+        extractor: EXTRACTORS 중 하나 (없으면 HTML_EXTRACTOR 설정)
+
+    Returns:
+        본문 텍스트 (MAX_TEXT_LENGTH자까지, MIN_TEXT_LENGTH자 이하면 None)
+    """
+    _, extract = EXTRACTORS[resolve_extractor(extractor)]
+    text = extract(content, url)
+    if text and len(text) > MIN_TEXT_LENGTH:
+        return text[:MAX_TEXT_LENGTH]
+    _increment("failed")
+    logger.warning(f"본문이 너무 짧음: {url}")
+    return None
+
+
+def _cache_name(extractor: str) -> str:
+    """페이지 캐시에 저장할 추출 결과 이름"""
+    version, _ = EXTRACTORS[extractor]
+    return f"{extractor}_v{version}"
+
+
+def scrape(url: str, max_retries: int = 2, retry_delay: float = 1.0, extractor: str = None) -> Optional[str]:
+    """
+    페이지 본문 스크래핑 (동기 진입점, 호스트별 스케줄러를 거치도록 scrape_async를 실행)
+
+    Args:
+        url: 페이지 URL
+        max_retries: 최대 재시도 횟수
+        retry_delay: 재시도 전 대기 시간 (초, 재시도마다 지수 증가)
+        extractor: EXTRACTORS 중 하나
+
+    Returns:
+        본문 텍스트 (실패 시 None)
+    """
+    try:
+        return run_with_fetcher(scrape_async, url, max_retries=max_retries, retry_delay=retry_delay,
+                                extractor=extractor)
+    except Exception as e:
+        logger.error(f"본문 스크래핑 중 오류: {e}")
+        return None
+
+
+async def scrape_async(fetcher: Fetcher, url: str, max_retries: int = 2, retry_delay: float = 1.0,
+                       extractor: str = None) -> Optional[str]:
+    """
+    페이지 본문 스크래핑 (비동기, 페이지 캐시에 있으면 다시 내려받지 않고 HTML 파싱은 스레드에서 수행)
+
+    Args:
+        fetcher: 공유 연결 풀 Fetcher
+        url: 페이지 URL
+        max_retries: 최대 재시도 횟수
+        retry_delay: 재시도 전 대기 시간 (초, 재시도마다 지수 증가)
+        extractor: EXTRACTORS 중 하나
+
+    Returns:
+        본문 텍스트 (실패 시 None)
+    """
+    extractor = resolve_extractor(extractor)
+    try:
+        return await page_cache.get_text_async(
+            fetcher, url, lambda content: extract_text(content, url, extractor), _cache_name(extractor),
+            max_retries=max_retries, retry_delay=retry_delay, timeout=10, max_bytes=MAX_PAGE_BYTES
+        )
+    except Exception as e:
+        logger.error(f"본문 스크래핑 중 오류: {e}")
+        return None
+
+
+def load_fixtures(directory: str) -> List[Tuple[str, bytes]]:
+    """
+    벤치마크용 저장 페이지 읽기 (디렉토리의 *.html, index.json이 있으면 {파일 이름: URL}로 URL 지정)
+
+    Args:
+        directory: 저장 페이지 디렉토리 (없으면 빈 리스트)
+
+    Returns:
+        [(URL, HTML 바이트), ...]
+    """
+    path = Path(directory)
+    if not path.is_dir():
+        return []
+    index_file = path / "index.json"
+    index = json.loads(index_file.read_text(encoding="utf-8")) if index_file.exists() else {}
+    return [(index.get(file.name, ""), file.read_bytes()) for file in sorted(path.glob("*.htm*"))]
+
+
+def export_fixtures(directory: str = CAPTURED_FIXTURE_DIR, limit: int = 200) -> int:
+    """
+    페이지 캐시에 저장된 페이지를 벤치마크용 파일로 내보내기 (index.json에 URL 기록)
+
+    Args:
+        directory: 저장할 디렉토리 (기본값: 저장소의 CAPTURED_FIXTURE_DIR)
+        limit: 최대 페이지 수
+
+    Returns:
+        내보낸 페이지 수
+    """
+    path = Path(directory)
+    path.mkdir(parents=True, exist_ok=True)
+    index = {}
+    for number, (url, html) in enumerate(page_cache.iter_pages(limit), start=1):
+        name = f"page_{number:04d}.html"
+        (path / name).write_bytes(html)
+        index[name] = url
+    (path / "index.json").write_text(json.dumps(index, ensure_ascii=False, indent=2), encoding="utf-8")
+    return len(index)
+
+
+def benchmark(pages: List[Tuple[str, bytes]], extractors: List[str] = None, rounds: int = 3) -> Dict[str, Dict]:
+    """
+    추출기별 처리 시간과 추출 결과 비교 (가장 빠른 회차 기준)
+
+    Args:
+        pages: [(URL, HTML 바이트), ...]
+        extractors: 비교할 추출기 이름 (기본값: 사용 가능한 전체)
+        rounds: 반복 횟수
+
+    Returns:
+        {추출기: {"pages", "extracted", "avg_chars", "total_ms", "ms_per_page"}}
+    """
+    extractors = extractors or [name for name in EXTRACTORS if resolve_extractor(name) == name]
+    results = {}
+    for name in extractors:
+        _, extract = EXTRACTORS[name]
+        best = None
+        for _ in range(rounds):
+            with _rules_lock:
+                _learned_rules.clear()
+            started = time.perf_counter()
+            texts = [extract(html, url) or "" for url, html in pages]
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        extracted = [text for text in texts if len(text) > MIN_TEXT_LENGTH]
+        results[name] = {
+            "pages": len(pages),
+            "extracted": len(extracted),
+            "avg_chars": round(sum(len(text) for text in extracted) / len(extracted)) if extracted else 0,
+            "total_ms": round(best * 1000, 1),
+            "ms_per_page": round(best * 1000 / len(pages), 2) if pages else 0.0,
+        }
+    return results
+
+
+if __name__ == "__main__":
+    import sys
+
+    if "--export-fixtures" in sys.argv:
+        # 페이지 캐시 → 벤치마크용 저장 페이지
+        # python -m modules.scraper --export-fixtures [디렉토리]
+        position = sys.argv.index("--export-fixtures") + 1
+        directory = sys.argv[position] if position < len(sys.argv) else CAPTURED_FIXTURE_DIR
+        print(f"저장 페이지 {export_fixtures(directory)}개 내보내기 완료: {directory}")
+        sys.exit(0)
+
+    if "--benchmark" in sys.argv:
+        # 추출기 비교 (기본값은 저장소의 실제 페이지, 없으면 합성 페이지. 디렉토리를 주면 그 페이지,
+        # cache면 페이지 캐시의 페이지)
+        # python -m modules.scraper --benchmark [디렉토리|cache]
+        position = sys.argv.index("--benchmark") + 1
+        source = sys.argv[position] if position < len(sys.argv) else None
+        if source == "cache":
+            corpus = list(page_cache.iter_pages(200))
+        elif source:
+            corpus = load_fixtures(source)
+        else:
+            corpus = load_fixtures(CAPTURED_FIXTURE_DIR)
+            if not corpus:
+                corpus = load_fixtures(SYNTHETIC_FIXTURE_DIR)
+                print(f"실제 페이지가 없어 합성 페이지 {len(corpus)}개로 비교합니다 (실제 처리 시간과 다를 수 있음).")
+        if not corpus:
+            print("벤치마크할 페이지가 없습니다.")
+            sys.exit(1)
+        for name, result in benchmark(corpus).items():
+            print(f"{name}: {result['ms_per_page']}ms/페이지, 추출 {result['extracted']}/{result['pages']}개, "
+                  f"평균 {result['avg_chars']}자 (총 {result['total_ms']}ms)")
+        sys.exit(0)
+
+    print("사용법: python -m modules.scraper --benchmark [디렉토리|cache] | --export-fixtures [디렉토리]")
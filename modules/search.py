@@ -0,0 +1,179 @@
+"""
+전문 검색 모듈
+FTS5(trigram) 인덱스로 뉴스/논문/경제 뉴스를 검색하고 bm25 관련도와 하이라이트 스니펫 제공
+(trigram으로 찾을 수 없는 2글자 이하 검색어는 FTS5 단어 색인에서 단어 접두사로 검색)
+"""
+
+import html
+import logging
+import sqlite3
+from typing import Dict, List, Optional, Tuple
+
+from modules.database import FTS_TABLES, FTS_WORD_SUFFIX
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# trigram 토크나이저는 3글자 미만 검색어를 색인으로 찾을 수 없음
+MIN_TERM_LENGTH = 3
+
+# FTS 인덱스가 없을 때 사용하는 LIKE 검색 대상 컬럼 (FTS 색인과 같은 컬럼을 검색해야 결과가 일관됨)
+LIKE_COLUMNS = {table: columns for table, (columns, _) in FTS_TABLES.items()}
+
+# 스니펫 하이라이트 표시 (HTML 이스케이프 후 <mark>로 치환)
+_MARK_START = "\x02"
+_MARK_END = "\x03"
+
+_fts_tables = None
+
+
+def has_fts(conn: sqlite3.Connection, table: str, suffix: str = "fts") -> bool:
+    """
+    테이블의 FTS5 인덱스 존재 여부 (프로세스당 한 번 조회)
+
+    Args:
+        conn: 데이터베이스 연결
+        table: FTS_TABLES 중 하나
+        suffix: "fts"(trigram) 또는 FTS_WORD_SUFFIX(단어 색인)
+    """
+    global _fts_tables
+    if _fts_tables is None:
+        rows = conn.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND sql LIKE 'CREATE VIRTUAL TABLE%'")
+        _fts_tables = {row[0] for row in rows}
+    return f"{table}_{suffix}" in _fts_tables
+
+
+def build_match_query(query: str) -> Optional[str]:
+    """
+    사용자 검색어를 FTS5 MATCH 식으로 변환 (공백으로 나눈 각 단어를 모두 포함)
+
+    Args:
+        query: 사용자 검색어
+
+    Returns:
+        MATCH 식 (trigram으로 찾을 수 없는 짧은 단어가 있으면 None)
+    """
+    terms = query.split()
+    if not terms or any(len(term) < MIN_TERM_LENGTH for term in terms):
+        return None
+    # 따옴표로 감싸 FTS5 연산자(AND, OR, *, - 등)를 일반 문자로 취급
+    return " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+def build_prefix_query(query: str) -> Optional[str]:
+    """
+    사용자 검색어를 단어 색인용 MATCH 식으로 변환 (각 단어로 시작하는 토큰을 모두 포함)
+
+    "우울"은 "우울증", "우울감을" 같은 토큰과 일치 (토큰 중간의 "산후우울"은 찾지 못함)
+
+    Args:
+        query: 사용자 검색어
+
+    Returns:
+        MATCH 식 (검색어가 비어 있으면 None)
+    """
+    terms = query.split()
+    if not terms:
+        return None
+    return " ".join('"' + term.replace('"', '""') + '"*' for term in terms)
+
+
+def _match_source(conn: sqlite3.Connection, table: str, query: str) -> Optional[Tuple[str, str]]:
+    """
+    검색어에 쓸 FTS 테이블과 MATCH 식 (3글자 이상이면 trigram, 짧은 단어가 있으면 단어 색인)
+
+    Returns:
+        (FTS 테이블 이름, MATCH 식) (쓸 수 있는 FTS 색인이 없으면 None)
+    """
+    match_query = build_match_query(query)
+    if match_query and has_fts(conn, table):
+        return f"{table}_fts", match_query
+    prefix_query = build_prefix_query(query)
+    if prefix_query and has_fts(conn, table, FTS_WORD_SUFFIX):
+        return f"{table}_{FTS_WORD_SUFFIX}", prefix_query
+    return None
+
+
+def build_search_clause(conn: sqlite3.Connection, table: str, query: str) -> Dict:
+    """
+    검색어에 해당하는 JOIN/WHERE 절 구성
+
+    FTS 인덱스(trigram 또는 짧은 검색어용 단어 색인)를 쓸 수 있으면 MATCH 결과와 조인하여
+    fts.fts_rank(bm25, 작을수록 관련도 높음)로 정렬할 수 있게 하고, 그렇지 않으면 LIKE 조건으로 대체
+
+    Args:
+        conn: 데이터베이스 연결
+        table: FTS_TABLES 중 하나
+        query: 사용자 검색어
+
+    Returns:
+        {"join", "join_params", "where", "where_params", "rank"} (rank는 FTS 사용 시에만 정렬식, 아니면 None)
+    """
+    if table not in FTS_TABLES:
+        raise ValueError(f"검색을 지원하지 않는 테이블: {table}")
+
+    source = _match_source(conn, table, query)
+    if source:
+        fts, match_query = source
+        return {
+            "join": f"JOIN (SELECT rowid AS fts_id, rank AS fts_rank FROM {fts} WHERE {fts} MATCH ?) AS fts "
+                    f"ON fts.fts_id = {table}.id",
+            "join_params": [match_query],
+            "where": None,
+            "where_params": [],
+            "rank": "fts.fts_rank",
+        }
+
+    columns = LIKE_COLUMNS[table]
+    search_param = f"%{query.strip()}%"
+    return {
+        "join": "",
+        "join_params": [],
+        "where": "(" + " OR ".join(f"{table}.{column} LIKE ?" for column in columns) + ")",
+        "where_params": [search_param] * len(columns),
+        "rank": None,
+    }
+
+
+def fetch_snippets(conn: sqlite3.Connection, table: str, query: str, ids: List[int],
+                   max_tokens: int = 32) -> Dict[int, str]:
+    """
+    화면에 표시할 행의 일치 구간 스니펫 조회 (검색어는 <mark>로 강조, 나머지는 HTML 이스케이프)
+
+    Args:
+        conn: 데이터베이스 연결
+        table: FTS_TABLES 중 하나
+        query: 사용자 검색어
+        ids: 스니펫이 필요한 행 id 목록 (현재 페이지)
+        max_tokens: 스니펫 길이 (trigram 기준 대략 글자 수)
+
+    Returns:
+        {id: 스니펫 HTML} (FTS를 쓸 수 없으면 빈 딕셔너리)
+    """
+    source = _match_source(conn, table, query) if ids else None
+    if not source:
+        return {}
+
+    fts, match_query = source
+    if not fts.endswith("_fts"):
+        # 단어 색인은 토큰이 단어 단위이므로 trigram과 비슷한 길이가 되도록 토큰 수를 줄임
+        max_tokens = max(8, max_tokens // 4)
+    placeholders = ", ".join("?" * len(ids))
+    try:
+        rows = conn.execute(
+            f"SELECT rowid, snippet({fts}, -1, ?, ?, '…', ?) FROM {fts} "
+            f"WHERE {fts} MATCH ? AND rowid IN ({placeholders})",
+            [_MARK_START, _MARK_END, max_tokens, match_query, *ids]
+        ).fetchall()
+    except sqlite3.Error as e:
+        logger.error(f"스니펫 조회 실패 ({table}): {e}")
+        return {}
+
+    snippets = {}
+    for row_id, snippet in rows:
+        if snippet:
+            snippets[row_id] = (html.escape(snippet)
+                                .replace(_MARK_START, "<mark>")
+                                .replace(_MARK_END, "</mark>"))
+    return snippets
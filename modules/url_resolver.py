@@ -0,0 +1,232 @@
+"""
+URL 정규화 모듈
+Google News RSS의 link는 기사마다 불투명한 리다이렉트 URL이라 같은 기사라도 피드마다 URL이 달라
+url UNIQUE 중복 제거가 동작하지 않으므로, 언론사 원문 URL로 해석하고 추적 파라미터를 제거한 URL을
+정규 URL로 사용 (해석 결과는 url_resolutions 테이블에 캐시)
+"""
+
+import re
+import base64
+import asyncio
+import logging
+from typing import Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from modules.database import db_connection
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 정규화 시 제거할 추적용 쿼리 파라미터 (utm_*는 접두사로 제거)
+TRACKING_PARAMS = {"fbclid", "gclid", "ocid", "mc_cid", "mc_eid", "igshid"}
+
+GOOGLE_NEWS_HOST = "news.google.com"
+
+# 해석에 실패한 URL을 다시 시도하기까지의 시간 (시간)
+FAILED_RETRY_HOURS = 24
+
+# IN 절 하나에 넣을 최대 파라미터 수
+LOOKUP_CHUNK_SIZE = 500
+
+# Google News 중간 페이지에 들어 있는 원문 URL
+_PAGE_URL_PATTERNS = (
+    re.compile(rb'data-n-au="([^"]+)"'),
+    re.compile(rb'http-equiv="refresh"[^>]*url=([^"\'>]+)', re.IGNORECASE),
+)
+
+
+def canonical_url(url: str) -> str:
+    """
+    URL 정규화 (스킴/호스트 소문자, 기본 포트와 프래그먼트 제거,
+    utm_* 등 추적 파라미터 제거, 나머지 쿼리 파라미터 정렬)
+
+    Args:
+        url: 원래 URL
+
+    Returns:
+        정규화한 URL
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if (scheme, netloc.rpartition(":")[2]) in (("http", "80"), ("https", "443")):
+        netloc = netloc.rpartition(":")[0]
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    )
+    return urlunsplit((scheme, netloc, parts.path or "/", urlencode(query), ""))
+
+
+def is_google_news_url(url: str) -> bool:
+    """Google News 리다이렉트(기사) URL인지"""
+    parts = urlsplit(url)
+    return (parts.hostname or "").lower() == GOOGLE_NEWS_HOST and "/articles/" in parts.path
+
+
+def _resolution_key(url: str) -> str:
+    """해석 캐시 키 (Google News URL은 hl/gl/oc 등 피드별 파라미터를 빼고 기사 경로만 사용)"""
+    parts = urlsplit(url.strip())
+    return urlunsplit(("https", GOOGLE_NEWS_HOST, parts.path, "", ""))
+
+
+def decode_google_news_url(url: str) -> Optional[str]:
+    """
+    Google News 기사 ID(base64 protobuf)에 원문 URL이 그대로 들어 있는 경우 네트워크 없이 추출
+
+    Args:
+        url: Google News 기사 URL
+
+    Returns:
+        원문 URL (새 형식이라 ID만으로 알 수 없으면 None)
+    """
+    article_id = urlsplit(url).path.rstrip("/").rpartition("/")[2]
+    try:
+        decoded = base64.urlsafe_b64decode(article_id + "=" * (-len(article_id) % 4))
+    except (ValueError, TypeError):
+        return None
+
+    start = decoded.find(b"http")
+    if start < 1:
+        return None
+    # URL 앞의 길이 필드 (varint 1~2바이트)
+    length = decoded[start - 1]
+    if start >= 2 and decoded[start - 2] & 0x80:
+        length = (decoded[start - 2] & 0x7F) | (decoded[start - 1] << 7)
+    raw = decoded[start:start + length]
+    if len(raw) != length:
+        match = re.match(rb"https?://[\x21-\x7e]+", decoded[start:])
+        raw = match.group(0) if match else b""
+    try:
+        resolved = raw.decode("ascii")
+    except UnicodeDecodeError:
+        return None
+    return resolved if resolved.startswith(("http://", "https://")) else None
+
+
+async def _resolve_remote(fetcher, url: str) -> Optional[str]:
+    """리다이렉트를 따라가거나 중간 페이지에서 원문 URL 찾기"""
+    response = await fetcher.resolve(url, max_retries=1)
+    if response is None:
+        return None
+    final_url, body = response
+    if (urlsplit(final_url).hostname or "").lower() != GOOGLE_NEWS_HOST:
+        return final_url
+    for pattern in _PAGE_URL_PATTERNS:
+        match = pattern.search(body)
+        if match:
+            candidate = match.group(1).decode("utf-8", "ignore").replace("&amp;", "&")
+            if candidate.startswith(("http://", "https://")) and GOOGLE_NEWS_HOST not in candidate:
+                return candidate
+    return None
+
+
+def _load_resolutions(keys: List[str]) -> Dict[str, Optional[str]]:
+    """캐시된 해석 결과 {키: 정규 URL} (재시도 시간이 지난 실패 기록은 제외)"""
+    cached = {}
+    with db_connection() as conn:
+        for start in range(0, len(keys), LOOKUP_CHUNK_SIZE):
+            chunk = keys[start:start + LOOKUP_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(f"""
+                SELECT url, canonical_url FROM url_resolutions
+                WHERE url IN ({placeholders})
+                  AND (canonical_url IS NOT NULL OR resolved_at >= datetime('now', ?))
+            """, [*chunk, f"-{FAILED_RETRY_HOURS} hours"]).fetchall()
+            cached.update(rows)
+    return cached
+
+
+def _save_resolutions(resolutions: Dict[str, tuple]):
+    """해석 결과 저장 {키: (정규 URL 또는 None, 방법)}"""
+    with db_connection() as conn:
+        conn.executemany("""
+            INSERT OR REPLACE INTO url_resolutions (url, canonical_url, method, resolved_at)
+            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+        """, [(key, resolved, method) for key, (resolved, method) in resolutions.items()])
+
+
+async def resolve_urls_async(fetcher, urls: List[str]) -> Dict[str, str]:
+    """
+    URL 목록을 정규 URL로 변환 (Google News URL은 캐시 → ID 디코딩 → 리다이렉트 순서로 원문 URL 해석)
+
+    Args:
+        fetcher: 공유 연결 풀 Fetcher
+        urls: 원래 URL 목록
+
+    Returns:
+        {원래 URL: 정규 URL} (해석하지 못한 Google News URL은 파라미터를 뺀 기사 URL)
+    """
+    result = {}
+    google_keys = {}
+    for url in urls:
+        if not url or url in result:
+            continue
+        if is_google_news_url(url):
+            google_keys[url] = _resolution_key(url)
+        else:
+            result[url] = canonical_url(url)
+    if not google_keys:
+        return result
+
+    keys = sorted(set(google_keys.values()))
+    try:
+        cached = await asyncio.to_thread(_load_resolutions, keys)
+    except Exception as e:
+        logger.error(f"URL 해석 캐시 조회 실패: {e}")
+        cached = {}
+
+    resolved = {}
+    remote_keys = []
+    for key in keys:
+        if key in cached:
+            continue
+        decoded = decode_google_news_url(key)
+        if decoded:
+            resolved[key] = (canonical_url(decoded), "decoded")
+        else:
+            remote_keys.append(key)
+
+    async def resolve_remote(key: str):
+        try:
+            remote = await _resolve_remote(fetcher, key)
+        except Exception as e:
+            logger.warning(f"URL 해석 실패: {key} - {e}")
+            remote = None
+        resolved[key] = (canonical_url(remote), "redirect") if remote else (None, "failed")
+
+    await asyncio.gather(*(resolve_remote(key) for key in remote_keys))
+
+    if resolved:
+        try:
+            await asyncio.to_thread(_save_resolutions, resolved)
+        except Exception as e:
+            logger.error(f"URL 해석 캐시 저장 실패: {e}")
+        failed = sum(1 for value, _ in resolved.values() if value is None)
+        logger.info(f"Google News URL 해석: 캐시 {len(cached)}개, 새로 해석 {len(resolved) - failed}개, 실패 {failed}개")
+
+    for url, key in google_keys.items():
+        canonical = cached.get(key) or resolved.get(key, (None,))[0]
+        result[url] = canonical or key
+    return result
+
+
+async def canonicalize_items_async(fetcher, items: List[Dict], url_key: str = "url") -> List[Dict]:
+    """
+    수집 항목의 URL을 정규 URL로 바꾸고 원래 URL은 original_url에 보관 (항목을 직접 수정)
+
+    Args:
+        fetcher: 공유 연결 풀 Fetcher
+        items: 수집 항목 리스트
+        url_key: URL이 들어 있는 키
+
+    Returns:
+        같은 항목 리스트
+    """
+    resolutions = await resolve_urls_async(fetcher, [item.get(url_key, "") for item in items])
+    for item in items:
+        original = item.get(url_key, "")
+        item.setdefault("original_url", original)
+        item[url_key] = resolutions.get(original, original)
+    return items
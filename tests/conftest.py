@@ -0,0 +1,29 @@
+"""
+테스트 공용 설정
+저장소 루트를 import 경로에 추가하고, 임시 디렉토리에 새 데이터베이스를 만드는 fixture 제공
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture
+def temp_db(tmp_path, monkeypatch):
+    """임시 디렉토리의 data/psyinsight.db를 초기화하고 현재 스레드의 풀 연결 반환"""
+    from modules import database, search
+
+    # DB 경로는 작업 디렉토리 기준 상대 경로이므로 임시 디렉토리로 이동
+    monkeypatch.chdir(tmp_path)
+    database.close_connection()
+    monkeypatch.setattr(database, "_schema_ready", False)
+    monkeypatch.setattr(search, "_fts_tables", None)
+
+    database.init_database()
+    yield database.get_connection()
+    database.close_connection()
@@ -0,0 +1,76 @@
+"""
+수집 파이프라인 저장 순서 테스트
+일괄 저장이 실패하면 워터마크/피드 검증값/유사 중복 색인을 갱신하지 않고, 중복뿐이라 0건 저장된 실행은 정상적으로 갱신하는지 확인
+"""
+
+import pytest
+
+from modules import db_writer, news_collector
+from modules.feed_state import FeedValidators, FeedWatermarks
+from modules.near_duplicates import NearDuplicateIndex
+
+
+@pytest.fixture
+def writer(temp_db, monkeypatch):
+    # 공유 쓰기 스레드의 연결은 이전 테스트의 임시 DB를 가리키므로 테스트마다 새로 만듦
+    monkeypatch.setattr(db_writer, "_writer", db_writer.BatchWriter())
+    return db_writer._writer
+
+
+@pytest.fixture
+def saved_state(monkeypatch):
+    """실행이 끝난 뒤 저장된 상태 이름 목록 (save() 호출 기록)"""
+    calls = []
+    monkeypatch.setattr(FeedWatermarks, "save", lambda self: calls.append("watermarks"))
+    monkeypatch.setattr(FeedValidators, "save", lambda self: calls.append("validators"))
+    monkeypatch.setattr(NearDuplicateIndex, "save", lambda self: calls.append("duplicates"))
+    return calls
+
+
+@pytest.fixture
+def news_pipeline(writer, monkeypatch):
+    """RSS/본문/AI 분석을 고정값으로 바꾼 뉴스 수집 파이프라인"""
+    async def fetch(fetcher, keywords, country="KR", max_results=20, watermarks=None):
+        return [{"title": f"{country} 우울증 연구", "url": f"https://example.com/{country}/1",
+                 "source": "Example", "country": country, "published": ""}]
+
+    async def prepare(fetcher, news, duplicates=None):
+        return {"news": news, "full_text": "본문 " * 100}
+
+    monkeypatch.setattr(news_collector, "fetch_news_from_rss_async", fetch)
+    monkeypatch.setattr(news_collector, "prepare_single_news_async", prepare)
+    monkeypatch.setattr(news_collector, "analyze_articles_batch", lambda items, **kwargs: {})
+
+    def collect():
+        return news_collector.collect_and_analyze_news(keywords=["우울증"], countries=["KR", "US"])
+    return collect
+
+
+def test_write_records_raises_on_failed_record(writer, temp_db):
+    good = {"date": "2024-05-14", "category": "psychology", "title": "저장됨", "url": "https://example.com/ok"}
+    bad = {"date": "2024-05-14", "category": "psychology", "title": None, "url": "https://example.com/bad"}
+
+    with pytest.raises(RuntimeError):
+        db_writer.write_records("articles", [good, bad])
+
+    urls = {row[0] for row in temp_db.execute("SELECT url FROM articles")}
+    assert urls == {"https://example.com/ok"}
+
+
+def test_failed_write_keeps_state(news_pipeline, saved_state, monkeypatch):
+    def fail(table, records):
+        raise RuntimeError("disk I/O error")
+    monkeypatch.setattr(news_collector, "write_records", fail)
+
+    with pytest.raises(RuntimeError):
+        news_pipeline()
+    assert saved_state == []
+
+
+def test_successful_write_saves_state(news_pipeline, saved_state):
+    assert news_pipeline() == (2, 2)
+    assert saved_state == ["watermarks", "validators", "duplicates"]
+
+    # 전부 이미 저장된 항목이라 0건 저장된 실행도 성공한 실행
+    assert news_pipeline() == (0, 0)
+    assert saved_state == ["watermarks", "validators", "duplicates"] * 2
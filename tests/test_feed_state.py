@@ -0,0 +1,76 @@
+"""
+피드 상태 테스트
+새 ETag/Last-Modified는 save() 전까지 조건부 요청에 쓰이지 않고 실행마다 따로 저장되는지,
+관련도순 피드는 발행 시각과 관계없이 처음 보는 항목을 고르는지 확인
+"""
+
+from modules.async_engine import SharedLoop, open_fetcher
+from modules.feed_state import FeedValidators, FeedWatermarks
+
+URL = "https://example.com/feed.xml"
+
+
+def test_unsaved_validators_are_not_used(temp_db):
+    validators = FeedValidators()
+    validators.load()
+    validators.record_response(URL, '"v1"', "Mon, 01 Jan 2024 00:00:00 GMT", 1000)
+
+    # 실행이 저장 전에 실패하면 다음 요청은 본문을 다시 받아야 함
+    assert validators.request_headers(URL) == {}
+    retry = FeedValidators()
+    retry.load()
+    assert retry.request_headers(URL) == {}
+
+
+def test_saved_validators_are_used(temp_db):
+    validators = FeedValidators()
+    validators.load()
+    validators.record_response(URL, '"v1"', None, 1000)
+    assert validators.save() == 1
+    assert validators.request_headers(URL) == {"If-None-Match": '"v1"'}
+
+    next_run = FeedValidators()
+    next_run.load()
+    assert next_run.request_headers(URL) == {"If-None-Match": '"v1"'}
+    assert next_run.record_not_modified(URL) == 1000
+
+
+def test_shared_loop_gives_each_run_its_own_validators(temp_db):
+    async def open_two():
+        async with open_fetcher(conditional=True) as first, open_fetcher(conditional=True) as second:
+            return first, second
+
+    shared = SharedLoop()
+    try:
+        first, second = shared.submit(open_two())
+    finally:
+        shared.close()
+
+    assert first.validators is not second.validators
+    assert first.session is second.session is shared.fetcher.session
+    assert shared.fetcher.validators is None
+
+
+def _entries(*links, published=(2024, 5, 14, 0, 0, 0, 0, 0, 0)):
+    return [{"link": link, "published_parsed": published} for link in links]
+
+
+def test_relevance_feed_takes_unseen_entries_regardless_of_time(temp_db):
+    first = FeedWatermarks("google_news")
+    taken = first.take_new_entries(_entries("a", "b", "c"), "우울증", "KR", limit=2)
+    assert [entry["link"] for entry in taken] == ["a", "b"]
+    first.save()
+
+    # 이전 실행보다 오래된 기사가 검색 결과에 새로 올라와도, limit에 밀렸던 기사도 가져옴
+    second = FeedWatermarks("google_news")
+    older = (2024, 5, 1, 0, 0, 0, 0, 0, 0)
+    feed = _entries("b", "a") + _entries("d", published=older) + _entries("c")
+    taken = second.take_new_entries(feed, "우울증", "KR", limit=5)
+    assert [entry["link"] for entry in taken] == ["d", "c"]
+
+
+def test_unsaved_seen_entries_are_taken_again(temp_db):
+    FeedWatermarks("google_news").take_new_entries(_entries("a"), "우울증", "KR", limit=5)
+
+    retry = FeedWatermarks("google_news")
+    assert [entry["link"] for entry in retry.take_new_entries(_entries("a"), "우울증", "KR", limit=5)] == ["a"]
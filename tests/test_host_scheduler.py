@@ -0,0 +1,47 @@
+"""
+호스트별 요청 스케줄러 테스트
+응답 상태별로 동시 요청 한도/초당 요청 수가 어떻게 조절되는지 확인
+"""
+
+from modules.host_scheduler import HostState
+
+
+def _limits(state):
+    return state.limit, state.rate, state.latency
+
+
+def test_success_increases_limit():
+    state = HostState("example.com")
+    limit, rate, _ = _limits(state)
+    state.rate = rate / 2
+
+    state.record(200, 0.1)
+
+    assert state.limit > limit
+    assert state.rate > rate / 2
+
+
+def test_client_errors_are_neutral():
+    state = HostState("example.com")
+    state.rate = state.base_rate / 2
+    state.record(200, 0.1)
+    before = _limits(state)
+
+    for status in (403, 404, 410):
+        state.record(status, 5.0)
+
+    assert _limits(state) == before
+    assert state.stats["client_errors"] == 3
+    assert state.stats["errors"] == 0
+
+
+def test_throttle_decreases_limit():
+    state = HostState("example.com")
+    limit, rate, _ = _limits(state)
+
+    state.record(429, 0.1, retry_after=1)
+
+    assert state.rate < rate
+    assert state.limit <= limit
+    assert state.stats["throttled"] == 1
+    assert state.blocked_until > 0
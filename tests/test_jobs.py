@@ -0,0 +1,59 @@
+"""
+백그라운드 작업 정리 테스트
+재시작/다른 호스트로 끊긴 대기·실행 중 작업이 조회 시점에 실패로 정리되는지 확인
+"""
+
+import socket
+
+import pytest
+
+from modules import jobs
+
+
+@pytest.fixture
+def jobs_db(temp_db, monkeypatch):
+    # 조회 함수가 매번 정리를 시도하도록 간격 제한 해제
+    monkeypatch.setattr(jobs, "RECOVERY_CHECK_INTERVAL", 0)
+    return temp_db
+
+
+def _insert_job(conn, job_type, worker, status="running", updated_minutes_ago=0):
+    cursor = conn.execute("""
+        INSERT INTO jobs (job_type, status, worker, started_at, updated_at)
+        VALUES (?, ?, ?, CURRENT_TIMESTAMP, datetime('now', ?))
+    """, (job_type, status, worker, f"-{updated_minutes_ago} minutes"))
+    conn.commit()
+    return cursor.lastrowid
+
+
+def _dead_pid():
+    pid = 999999
+    while jobs._pid_alive(pid):
+        pid -= 1
+    return pid
+
+
+def test_dead_local_worker_is_recovered_on_lookup(jobs_db):
+    job_id = _insert_job(jobs_db, "news", f"{socket.gethostname()}:{_dead_pid()}")
+
+    assert jobs.get_active_job("news") is None
+    job = jobs.get_job(job_id)
+    assert job["status"] == "failed"
+    assert job["finished_at"] is not None
+
+
+def test_stale_heartbeat_from_other_host_is_recovered(jobs_db):
+    job_id = _insert_job(
+        jobs_db, "papers", "other-host:1", updated_minutes_ago=jobs.JOB_STALE_MINUTES + 5
+    )
+
+    assert jobs.get_latest_job("papers")["status"] == "failed"
+    assert "응답" in jobs.get_job(job_id)["error"]
+
+
+def test_live_jobs_are_kept(jobs_db):
+    _insert_job(jobs_db, "economy", "other-host:1", status="queued", updated_minutes_ago=1)
+    _insert_job(jobs_db, "news", jobs.WORKER_NAME)
+
+    assert jobs.get_active_job("economy")["status"] == "queued"
+    assert jobs.get_active_job("news")["status"] == "running"
@@ -0,0 +1,63 @@
+"""
+PubMed 증분 수집 테스트
+발행일순 검색 결과를 다 읽지 못한 실행은 PMID 워터마크를 올리지 않는지 확인
+"""
+
+import asyncio
+import json
+
+from modules import paper_collector
+from modules.feed_state import FeedWatermarks
+
+KEYWORD = "depression"
+
+
+class FakeFetcher:
+    """esearch는 고정 PMID 목록의 retstart 구간을, efetch는 요청한 PMID의 논문을 돌려주는 Fetcher"""
+
+    def __init__(self, pmids):
+        self.pmids = pmids
+
+    async def get_bytes(self, url, params=None, **kwargs):
+        if url == paper_collector.PUBMED_SEARCH_URL:
+            start = params["retstart"]
+            page = self.pmids[start:start + params["retmax"]]
+            return json.dumps({"esearchresult": {"count": str(len(self.pmids)), "idlist": page}}).encode()
+        articles = "".join(f"""
+            <PubmedArticle>
+              <MedlineCitation><PMID>{pmid}</PMID>
+                <Article><ArticleTitle>Paper {pmid}</ArticleTitle><Abstract><AbstractText>Text</AbstractText></Abstract></Article>
+              </MedlineCitation>
+              <PubmedData><History>
+                <PubMedPubDate PubStatus="entrez"><Year>2024</Year><Month>5</Month><Day>14</Day></PubMedPubDate>
+              </History></PubmedData>
+            </PubmedArticle>""" for pmid in params["id"].split(","))
+        return f"<PubmedArticleSet>{articles}</PubmedArticleSet>".encode()
+
+
+def _observe(temp_db, pmids, max_results):
+    temp_db.execute(
+        "INSERT INTO feed_state (source, keyword, country, last_published, last_id) VALUES (?, ?, '', ?, ?)",
+        ("pubmed", KEYWORD, "2024/05/01", "100")
+    )
+    temp_db.commit()
+    watermarks = FeedWatermarks("pubmed")
+    papers = asyncio.run(paper_collector.fetch_papers_from_pubmed_async(
+        FakeFetcher(pmids), [KEYWORD], max_results, watermarks
+    ))
+    return papers, watermarks.observed[(KEYWORD, "")]
+
+
+def test_partial_window_keeps_pmid_out_of_watermark(temp_db):
+    # 발행일순이라 PMID가 뒤섞여 있고, 새 논문 4개 중 2개만 가져옴
+    papers, observed = _observe(temp_db, ["300", "150", "200", "120"], max_results=2)
+
+    assert [paper["pmid"] for paper in papers] == ["300", "150"]
+    assert observed == ("2024/05/14", "")
+
+
+def test_consumed_window_records_pmid(temp_db):
+    papers, observed = _observe(temp_db, ["300", "150"], max_results=2)
+
+    assert len(papers) == 2
+    assert observed == ("2024/05/14", "300")
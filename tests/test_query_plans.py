@@ -0,0 +1,39 @@
+"""
+화면 조회 쿼리의 EXPLAIN QUERY PLAN 회귀 테스트
+app.py/cache.py/dashboard_utils.py가 실행하는 쿼리(modules.queries)가 인덱스 없이
+테이블 전체를 스캔하거나 정렬용 임시 B-트리를 만들지 않는지 확인
+"""
+
+from modules.database import check_query_plans
+from modules.queries import explain_problems, plan_checks
+
+
+def test_plan_checks_cover_archive_queries(temp_db):
+    descriptions = [description for description, *_ in plan_checks(temp_db)]
+    for table in ("articles", "papers", "economy_news"):
+        assert any(description.startswith(f"아카이브 {table} ") for description in descriptions)
+    assert len(descriptions) == len(set(descriptions))
+
+
+def test_queries_execute(temp_db):
+    # 쿼리 문법과 파라미터 개수가 맞는지 (빈 DB에서 실행)
+    for description, query, params, _ in plan_checks(temp_db):
+        temp_db.execute(query, params).fetchall()
+
+
+def test_queries_use_indexes(temp_db):
+    problems = []
+    for description, query, params, allow_temp_sort in plan_checks(temp_db):
+        problems.extend(f"{description}: {detail}"
+                        for detail in explain_problems(temp_db, query, params, allow_temp_sort))
+    assert problems == []
+
+
+def test_check_query_plans_cli_matches(temp_db):
+    assert check_query_plans(temp_db) == []
+
+
+def test_full_scan_is_reported(temp_db):
+    # 인덱스가 없는 컬럼 정렬은 문제로 잡혀야 함
+    problems = explain_problems(temp_db, "SELECT id FROM articles ORDER BY title LIMIT 20", [])
+    assert problems
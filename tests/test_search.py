@@ -0,0 +1,69 @@
+"""
+전문 검색 테스트
+3글자 이상 검색어는 trigram 색인, 2글자 검색어는 단어 색인을 쓰고 어느 쪽이든 같은 컬럼을 검색하는지 확인
+"""
+
+from modules.search import LIKE_COLUMNS, build_search_clause, fetch_snippets
+from modules.database import FTS_TABLES
+
+
+def _insert_articles(conn):
+    rows = [
+        ("우울증 치료 동향", "요약", "산후 우울감을 겪는 환자가 늘고 있다", "[]"),
+        ("기준 금리 동결", "한국은행 발표", "금리를 유지하기로 했다", "[]"),
+        ("불안 장애 연구", "요약", "본문", "[]"),
+    ]
+    for index, (title, summary, full_text, keywords) in enumerate(rows):
+        conn.execute("""
+            INSERT INTO articles (date, category, title, url, content_summary, full_text, keywords)
+            VALUES ('2024-01-01', 'news', ?, ?, ?, ?, ?)
+        """, (title, f"http://example.com/{index}", summary, full_text, keywords))
+    conn.commit()
+
+
+def _search_titles(conn, query):
+    search = build_search_clause(conn, "articles", query)
+    conditions = f"WHERE {search['where']}" if search["where"] else ""
+    rows = conn.execute(
+        f"SELECT title FROM articles {search['join']} {conditions} ORDER BY articles.id",
+        search["join_params"] + search["where_params"]
+    ).fetchall()
+    return search, [row[0] for row in rows]
+
+
+def test_like_columns_match_fts_columns():
+    for table, (columns, _) in FTS_TABLES.items():
+        assert LIKE_COLUMNS[table] == columns
+
+
+def test_long_term_uses_trigram_index(temp_db):
+    _insert_articles(temp_db)
+    search, titles = _search_titles(temp_db, "우울증")
+    assert "articles_fts" in search["join"]
+    assert titles == ["우울증 치료 동향"]
+
+
+def test_short_term_uses_word_index(temp_db):
+    _insert_articles(temp_db)
+    search, titles = _search_titles(temp_db, "우울")
+    assert "articles_words" in search["join"]
+    assert search["rank"]
+    # 제목의 "우울증"과 본문의 "우울감을" 모두 단어 접두사로 일치
+    assert titles == ["우울증 치료 동향"]
+
+    _, titles = _search_titles(temp_db, "금리")
+    assert titles == ["기준 금리 동결"]
+
+
+def test_short_term_searches_full_text(temp_db):
+    _insert_articles(temp_db)
+    _, titles = _search_titles(temp_db, "우울감")
+    assert titles == ["우울증 치료 동향"]
+    _, titles = _search_titles(temp_db, "겪는")
+    assert titles == ["우울증 치료 동향"]
+
+
+def test_short_term_snippets(temp_db):
+    _insert_articles(temp_db)
+    snippets = fetch_snippets(temp_db, "articles", "금리", [2])
+    assert "<mark>" in snippets[2]